@@ -10,8 +10,11 @@ from ..types import (
     Operation,
 )
 from .graphql import GraphQL
+from .monitor import EventLoopMonitor, EventLoopStall
 
 __all__ = [
+    "EventLoopMonitor",
+    "EventLoopStall",
     "Extensions",
     "GraphQL",
     "MiddlewareList",
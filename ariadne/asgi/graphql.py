@@ -22,6 +22,7 @@ from .handlers import (
     GraphQLWebsocketHandlerBase,
     GraphQLWSHandler,
 )
+from .monitor import EventLoopMonitor
 
 
 class GraphQL:
@@ -49,6 +50,7 @@ class GraphQL:
         execution_context_class: type[ExecutionContext] | None = None,
         http_handler: GraphQLHTTPHandler | None = None,
         websocket_handler: GraphQLWebsocketHandlerBase | None = None,
+        loop_monitor: EventLoopMonitor | None = None,
     ) -> None:
         """Initializes the ASGI app and it's http and websocket handlers.
 
@@ -110,7 +112,13 @@ class GraphQL:
         implementing the websocket connections handling logic for this server.
         If not set, `GraphQLWSHandler` will be used, implementing older
         version of GraphQL subscriptions protocol.
+
+        `loop_monitor`: an instance of `EventLoopMonitor` to detect stalls of
+        the event loop and resolvers causing them. Monitoring starts when
+        the first request is handled. Defaults to `None`.
         """
+        self.loop_monitor = loop_monitor
+
         if http_handler:
             self.http_handler = http_handler
         else:
@@ -159,7 +167,7 @@ class GraphQL:
     async def __call__(self, scope: Scope, receive: Receive, send: Send):
         """An entrypoint to the ASGI application.
 
-        Supports both HTTP and WebSocket connections.
+        Supports HTTP and WebSocket connections, and lifespan events.
 
         # Required arguments
 
@@ -178,13 +186,56 @@ class GraphQL:
 
         https://asgi.readthedocs.io/en/latest/specs/main.html
         """
+        if self.loop_monitor:
+            self.loop_monitor.ensure_started()
+
         if scope["type"] == "http":
             await self.http_handler.handle(scope=scope, receive=receive, send=send)
         elif scope["type"] == "websocket":
             await self.websocket_handler.handle(scope=scope, receive=receive, send=send)
+        elif scope["type"] == "lifespan":
+            await self.handle_lifespan(receive, send)
         else:
             raise ValueError("Unknown scope type: {!r}".format(scope["type"]))
 
+    async def handle_lifespan(self, receive: Receive, send: Send) -> None:
+        """Handles lifespan events of the ASGI server.
+
+        Starts pools used by the HTTP handler on startup, and stops them and
+        the `loop_monitor` on shutdown.
+
+        # Required arguments
+
+        `receive`: an awaitable callable that will yield a new event dictionary
+        when one is available.
+
+        `send`: an awaitable callable taking a single event dictionary as a
+        positional argument that will return once the send has been completed.
+        """
+        while True:
+            message = await receive()
+            if message["type"] == "lifespan.startup":
+                try:
+                    self.http_handler.startup()
+                except Exception as error:
+                    await send(
+                        {"type": "lifespan.startup.failed", "message": str(error)}
+                    )
+                    raise
+                await send({"type": "lifespan.startup.complete"})
+            elif message["type"] == "lifespan.shutdown":
+                try:
+                    self.http_handler.shutdown()
+                    if self.loop_monitor:
+                        self.loop_monitor.stop()
+                except Exception as error:
+                    await send(
+                        {"type": "lifespan.shutdown.failed", "message": str(error)}
+                    )
+                    raise
+                await send({"type": "lifespan.shutdown.complete"})
+                return
+
     async def handle_request(self, request: Request) -> Response:
         """Shortcut for `graphql_app.http_handler.handle_request(...)`."""
         return await self.http_handler.handle_request(request)
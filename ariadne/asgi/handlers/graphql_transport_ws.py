@@ -10,6 +10,7 @@ from graphql.language import OperationType
 from starlette.types import Receive, Scope, Send
 from starlette.websockets import WebSocket, WebSocketDisconnect, WebSocketState
 
+from ...codecs import Codec, get_codec_for_subprotocol
 from ...graphql import parse_query, subscribe, validate_data
 from ...logger import log_error
 from ...types import (
@@ -48,10 +49,13 @@ class GraphQLTransportWSHandler(GraphQLWebsocketHandlerBase):
     GQL_ERROR = "error"  # Server -> Client
     GQL_COMPLETE = "complete"  # Client -> Server, Server -> Client
 
+    SUBPROTOCOL = "graphql-transport-ws"
+
     def __init__(
         self,
         *args,
         connection_init_wait_timeout: timedelta = timedelta(minutes=1),
+        codecs: list[Codec] | None = None,
         **kwargs,
     ) -> None:
         """Initializes the websocket handler.
@@ -61,10 +65,15 @@ class GraphQLTransportWSHandler(GraphQLWebsocketHandlerBase):
         `connection_init_wait_timeout`: a `timedelta` with timeout for new
         websocket connections before first message is received. Defaults to
         60 seconds.
+
+        `codecs`: a list of `Codec` instances with binary wire formats. Every
+        codec adds a subprotocol variant using binary frames, named after the
+        codec, eg. `graphql-transport-ws+msgpack`.
         """
         super().__init__(*args, **kwargs)
 
         self.connection_init_wait_timeout = connection_init_wait_timeout
+        self.codecs: list[Codec] = codecs or []
 
     async def handle(self, scope: Scope, receive: Receive, send: Send):
         """An entrypoint for the GraphQL WebSocket handler.
@@ -105,7 +114,18 @@ class GraphQLTransportWSHandler(GraphQLWebsocketHandlerBase):
 
         `websocket`: the `WebSocket` instance from Starlette or FastAPI.
         """
-        await websocket.accept("graphql-transport-ws")
+        subprotocol = self.SUBPROTOCOL
+        if self.codecs:
+            negotiated = get_codec_for_subprotocol(
+                self.codecs,
+                self.SUBPROTOCOL,
+                websocket.scope.get("subprotocols") or [],
+            )
+            if negotiated:
+                subprotocol, codec = negotiated
+                websocket.scope["ariadne.codec"] = codec
+
+        await websocket.accept(subprotocol)
 
         client_context = ClientContext()
         timeout_handler = self.handle_connection_init_timeout(websocket, client_context)
@@ -118,7 +138,7 @@ class GraphQLTransportWSHandler(GraphQLWebsocketHandlerBase):
                 websocket.client_state,
                 websocket.application_state,
             ):
-                message = await websocket.receive_json()
+                message = await self.receive_message(websocket)
                 await self.handle_websocket_message(websocket, message, client_context)
         except WebSocketDisconnect:
             pass
@@ -138,6 +158,36 @@ class GraphQLTransportWSHandler(GraphQLWebsocketHandlerBase):
                     error = GraphQLError(str(error), original_error=error)
                 log_error(error, self.logger)
 
+    async def receive_message(self, websocket: WebSocket) -> Any:
+        """Receives and decodes message from the websocket.
+
+        Messages are received as text frames with JSON, or binary frames if
+        subprotocol variant with binary wire format was negotiated.
+
+        # Required arguments
+
+        `websocket`: the `WebSocket` instance from Starlette or FastAPI.
+        """
+        codec = get_websocket_codec(websocket)
+        if codec:
+            return codec.decode(await websocket.receive_bytes())
+        return await websocket.receive_json()
+
+    async def send_message(self, websocket: WebSocket, message: dict) -> None:
+        """Encodes and sends message to the websocket.
+
+        # Required arguments
+
+        `websocket`: the `WebSocket` instance from Starlette or FastAPI.
+
+        `message`: a JSON-serializable `dict` with message to send.
+        """
+        codec = get_websocket_codec(websocket)
+        if codec:
+            await websocket.send_bytes(codec.encode(message))
+        else:
+            await websocket.send_json(message)
+
     async def handle_connection_init_timeout(
         self, websocket: WebSocket, client_context: ClientContext
     ):
@@ -221,8 +271,8 @@ class GraphQLTransportWSHandler(GraphQLWebsocketHandlerBase):
                 if result and isawaitable(result):
                     await result
 
-            await websocket.send_json(
-                {"type": GraphQLTransportWSHandler.GQL_CONNECTION_ACK}
+            await self.send_message(
+                websocket, {"type": GraphQLTransportWSHandler.GQL_CONNECTION_ACK}
             )
             client_context.connection_acknowledged = True
         except Exception as error:
@@ -243,7 +293,7 @@ class GraphQLTransportWSHandler(GraphQLWebsocketHandlerBase):
         `client_context`: a `ClientContext` object with extra state of current
         websocket connection.
         """
-        await websocket.send_json({"type": GraphQLTransportWSHandler.GQL_PONG})
+        await self.send_message(websocket, {"type": GraphQLTransportWSHandler.GQL_PONG})
 
     async def handle_websocket_pong_message(
         self,
@@ -324,12 +374,13 @@ class GraphQLTransportWSHandler(GraphQLWebsocketHandlerBase):
             )
         except GraphQLError as error:
             log_error(error, self.logger)
-            await websocket.send_json(
+            await self.send_message(
+                websocket,
                 {
                     "type": GraphQLTransportWSHandler.GQL_ERROR,
                     "id": operation_id,
                     "payload": [self.error_formatter(error, self.debug)],
-                }
+                },
             )
             return
 
@@ -380,12 +431,13 @@ class GraphQLTransportWSHandler(GraphQLWebsocketHandlerBase):
             else:
                 error_payload = results_producer
 
-            await websocket.send_json(
+            await self.send_message(
+                websocket,
                 {
                     "type": GraphQLTransportWSHandler.GQL_ERROR,
                     "id": operation_id,
                     "payload": error_payload,
-                }
+                },
             )
         else:
             results_producer = cast(
@@ -518,12 +570,13 @@ class GraphQLTransportWSHandler(GraphQLWebsocketHandlerBase):
                 else:
                     payload = result
 
-                await websocket.send_json(
+                await self.send_message(
+                    websocket,
                     {
                         "type": GraphQLTransportWSHandler.GQL_NEXT,
                         "id": operation_id,
                         "payload": payload,
-                    }
+                    },
                 )
         except asyncio.CancelledError:
             # if asyncio Task is cancelled then CancelledError
@@ -535,12 +588,13 @@ class GraphQLTransportWSHandler(GraphQLWebsocketHandlerBase):
             log_error(error, self.logger)
             payload = {"errors": [self.error_formatter(error, self.debug)]}
 
-            await websocket.send_json(
+            await self.send_message(
+                websocket,
                 {
                     "type": GraphQLTransportWSHandler.GQL_NEXT,
                     "id": operation_id,
                     "payload": payload,
-                }
+                },
             )
 
         operation = client_context.operations.pop(operation_id)
@@ -551,6 +605,12 @@ class GraphQLTransportWSHandler(GraphQLWebsocketHandlerBase):
             websocket.client_state,
             websocket.application_state,
         ):
-            await websocket.send_json(
-                {"type": GraphQLTransportWSHandler.GQL_COMPLETE, "id": operation_id}
+            await self.send_message(
+                websocket,
+                {"type": GraphQLTransportWSHandler.GQL_COMPLETE, "id": operation_id},
             )
+
+
+def get_websocket_codec(websocket: WebSocket) -> Codec | None:
+    """Returns `Codec` negotiated for the websocket or `None` for JSON."""
+    return websocket.scope.get("ariadne.codec")
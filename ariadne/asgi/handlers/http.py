@@ -1,26 +1,42 @@
 from __future__ import annotations
 
 import json
+from asyncio import FIRST_COMPLETED, CancelledError, ensure_future, wait
+from collections.abc import Callable
+from contextlib import suppress
 from http import HTTPStatus
 from inspect import isawaitable
 from typing import TYPE_CHECKING, Any, cast
 
-from graphql import DocumentNode, MiddlewareManager
+from graphql import DocumentNode, GraphQLError, MiddlewareManager
 from starlette.datastructures import UploadFile
 from starlette.requests import Request
 from starlette.responses import HTMLResponse, JSONResponse, PlainTextResponse, Response
 from starlette.types import Receive, Scope, Send
 
+from ...codecs import Codec, get_codec_for_content_type, negotiate_codec
+from ...compression import ResponseCompression
+from ...concurrency import ConcurrencyLimits
 from ...constants import (
+    CLIENT_CLOSED_REQUEST,
     DATA_TYPE_JSON,
     DATA_TYPE_MULTIPART,
 )
+from ...deadlines import OperationDeadlines
 from ...exceptions import HttpBadRequestError, HttpError
 from ...explorer import Explorer
+from ...extensions import NO_PHASE_HOOKS, ExtensionManager
 from ...file_uploads import combine_multipart_data
-from ...graphql import graphql
+from ...graphql import graphql, parse_query
+from ...http_cache import HttpCache
+from ...introspection import CachedIntrospection, IntrospectionCache
+from ...normalization import NORMALIZED, ResultNormalization
+from ...processes import ResolverProcessPool
+from ...slow_log import SlowOperationLog
+from ...threads import ResolverThreadPool
 from ...types import (
     ContextValue,
+    Extension,
     ExtensionList,
     Extensions,
     GraphQLResult,
@@ -46,6 +62,17 @@ class GraphQLHTTPHandler(GraphQLHttpHandlerBase):
         middleware: Middlewares | None = None,
         middleware_manager_class: type[MiddlewareManager] | None = None,
         subscription_handlers: list[SubscriptionHandler] | None = None,
+        introspection_cache: bool = False,
+        http_cache: HttpCache | None = None,
+        compression: ResponseCompression | None = None,
+        codecs: list[Codec] | None = None,
+        normalization: ResultNormalization | None = None,
+        slow_operation_log: SlowOperationLog | None = None,
+        resolver_thread_pool: ResolverThreadPool | None = None,
+        resolver_process_pool: ResolverProcessPool | None = None,
+        concurrency_limits: ConcurrencyLimits | None = None,
+        operation_deadlines: OperationDeadlines | None = None,
+        cancel_on_disconnect: bool = False,
     ) -> None:
         """Initializes the HTTP handler.
 
@@ -67,6 +94,52 @@ class GraphQLHTTPHandler(GraphQLHttpHandlerBase):
         `subscription_handlers`: a list of `SubscriptionHandler` instances to
         handle GraphQL subscriptions. Handlers are tried in order; the first
         handler whose `supports()` method returns `True` handles the request.
+
+        `introspection_cache`: a `bool` controlling if results of introspection
+        queries should be cached and served without executing them again.
+        Cached results skip the context, extensions, middleware and custom
+        validation rules, so this shouldn't be enabled if introspection
+        availability depends on the request. Defaults to `False`.
+
+        `http_cache`: a `HttpCache` with HTTP caching policy for results of
+        queries sent with `GET` method. Defaults to `None`, which disables
+        HTTP caching.
+
+        `compression`: a `ResponseCompression` to use for compressing JSON and
+        explorer's HTML responses. Defaults to `None`, which disables
+        the compression.
+
+        `codecs`: a list of `Codec` instances with binary wire formats, like
+        MessagePack or CBOR, supported by the server in addition to JSON.
+        Format of request's body is selected using the `Content-Type` header,
+        and format of response's body is negotiated using the `Accept` header.
+
+        `normalization`: a `ResultNormalization` to use for results of clients
+        requesting the normalized format. Defaults to `None`, which disables
+        the normalized format.
+
+        `slow_operation_log`: a `SlowOperationLog` to log operations exceeding
+        its thresholds with. Defaults to `None`, which disables the log.
+
+        `resolver_thread_pool`: a `ResolverThreadPool` to run blocking sync
+        resolvers in, instead of the event loop. Defaults to `None`, which
+        runs all resolvers in the event loop.
+
+        `resolver_process_pool`: a `ResolverProcessPool` to run CPU-bound sync
+        resolvers in. Defaults to `None`, which runs all resolvers in the
+        server's process.
+
+        `concurrency_limits`: a `ConcurrencyLimits` to limit number of async
+        resolvers running at same time with. Defaults to `None`, which doesn't
+        limit them.
+
+        `operation_deadlines`: an `OperationDeadlines` with deadlines of
+        operations and timeouts of fields. Defaults to `None`, which doesn't
+        limit execution time.
+
+        `cancel_on_disconnect`: a `bool` controlling if query's execution
+        should be cancelled when the client disconnects before it completes.
+        Defaults to `False`.
         """
         super().__init__()
 
@@ -76,6 +149,39 @@ class GraphQLHTTPHandler(GraphQLHttpHandlerBase):
         self.subscription_handlers: list[SubscriptionHandler] = (
             subscription_handlers or []
         )
+        self.introspection_cache: IntrospectionCache | None = (
+            IntrospectionCache() if introspection_cache else None
+        )
+        self.http_cache = http_cache
+        self.compression = compression
+        self.codecs: list[Codec] = codecs or []
+        self.normalization = normalization
+        self.slow_operation_log = slow_operation_log
+        self.resolver_thread_pool = resolver_thread_pool
+        self.resolver_process_pool = resolver_process_pool
+        self.concurrency_limits = concurrency_limits
+        self.operation_deadlines = operation_deadlines
+        self.cancel_on_disconnect = cancel_on_disconnect
+
+    def startup(self) -> None:
+        """Starts pools used by the handler.
+
+        Called by the ASGI GraphQL application on lifespan's startup.
+        """
+        if self.resolver_process_pool:
+            self.resolver_process_pool.start()
+
+    def shutdown(self) -> None:
+        """Stops pools used by the handler, waiting for running resolvers.
+
+        Called by the ASGI GraphQL application on lifespan's shutdown.
+        """
+        if self.resolver_process_pool:
+            self.resolver_process_pool.shutdown()
+        if self.resolver_thread_pool:
+            self.resolver_thread_pool.shutdown()
+        if self.slow_operation_log:
+            self.slow_operation_log.close()
 
     async def handle(self, scope: Scope, receive: Receive, send: Send) -> None:
         """An entrypoint for the GraphQL HTTP handler.
@@ -171,7 +277,7 @@ class GraphQLHTTPHandler(GraphQLHttpHandlerBase):
         if isawaitable(explorer_html):
             explorer_html = await explorer_html
         if explorer_html:
-            return HTMLResponse(explorer_html)
+            return self.compress_response(request, HTMLResponse(explorer_html))
 
         return self.handle_not_allowed_method(request)
 
@@ -220,8 +326,102 @@ class GraphQLHTTPHandler(GraphQLHttpHandlerBase):
                         error_formatter=self.error_formatter,
                     )
 
-        success, result = await self.execute_graphql_query(request, data)
-        return await self.create_json_response(request, result, success)
+        codec = self.get_response_codec(request)
+        normalize = self.is_normalized_result_requested(request)
+        if normalize:
+            cached_introspection = None
+        else:
+            cached_introspection = self.get_cached_introspection(data)
+        if cached_introspection and not codec:
+            result = cached_introspection.result
+            response = self.compress_response(
+                request,
+                Response(cached_introspection.json, media_type=DATA_TYPE_JSON),
+            )
+        else:
+            if cached_introspection:
+                success, result = True, cached_introspection.result
+            else:
+                execution = await self.execute_graphql_query_until_disconnect(
+                    request, data
+                )
+                if execution is None:
+                    return Response(status_code=CLIENT_CLOSED_REQUEST)
+                success, result = execution
+            if normalize and self.normalization:
+                result = self.normalization.normalize(result)
+            async with self.get_serialization_phase(request):
+                if codec:
+                    response = self.create_encoded_response(
+                        request, result, success, codec
+                    )
+                else:
+                    response = await self.create_json_response(request, result, success)
+            self.log_slow_operation(request, response)
+
+        if self.codecs:
+            response.headers.add_vary_header("Accept")
+        if self.normalization:
+            response.headers.add_vary_header(self.normalization.header)
+            if normalize:
+                response.headers[self.normalization.header] = NORMALIZED
+
+        if self.http_cache and request.method == "GET":
+            return self.apply_http_cache(request, result, response)
+
+        return response
+
+    async def execute_graphql_query_until_disconnect(
+        self, request: Request, data: Any
+    ) -> GraphQLResult | None:
+        """Executes GraphQL query, cancelling it if the client disconnects.
+
+        Returns a `GraphQLResult` from `execute_graphql_query`, or `None` if
+        the client disconnected before the execution completed. Execution
+        isn't cancelled unless `cancel_on_disconnect` option is set.
+
+        Extensions' `request_cancelled` hooks are called after the execution
+        is cancelled.
+
+        # Required arguments
+
+        `request`: the `Request` instance from Starlette or FastAPI.
+
+        `data`: a GraphQL data from HTTP request.
+        """
+        if not self.cancel_on_disconnect:
+            return await self.execute_graphql_query(request, data)
+
+        execution = ensure_future(self.execute_graphql_query(request, data))
+        disconnect = ensure_future(self.wait_for_disconnect(request))
+        try:
+            await wait((execution, disconnect), return_when=FIRST_COMPLETED)
+        finally:
+            disconnect.cancel()
+            if not execution.done():
+                execution.cancel()
+                with suppress(CancelledError):
+                    await execution
+
+        if not execution.cancelled():
+            return execution.result()
+
+        extension_manager = request.scope.get("ariadne.extension_manager")
+        if extension_manager:
+            extension_manager.request_cancelled()
+        return None
+
+    async def wait_for_disconnect(self, request: Request) -> None:
+        """Returns when the client disconnects.
+
+        # Required arguments
+
+        `request`: the `Request` instance from Starlette or FastAPI.
+        """
+        while True:
+            message = await request.receive()
+            if message["type"] == "http.disconnect":
+                return
 
     async def extract_data_from_request(self, request: Request) -> Any:
         """Extracts GraphQL request data from request.
@@ -239,6 +439,9 @@ class GraphQLHTTPHandler(GraphQLHttpHandlerBase):
             return await self.extract_data_from_json_request(request)
         if content_type == DATA_TYPE_MULTIPART:
             return await self.extract_data_from_multipart_request(request)
+        codec = get_codec_for_content_type(self.codecs, content_type)
+        if codec:
+            return await self.extract_data_from_encoded_request(request, codec)
         if (
             request.method == "GET"
             and self.execute_get_queries
@@ -264,6 +467,26 @@ class GraphQLHTTPHandler(GraphQLHttpHandlerBase):
         except (TypeError, ValueError) as ex:
             raise HttpBadRequestError("Request body is not a valid JSON") from ex
 
+    async def extract_data_from_encoded_request(
+        self, request: Request, codec: Codec
+    ) -> Any:
+        """Extracts GraphQL data from request with body in binary wire format.
+
+        Returns GraphQL query data that was not yet validated.
+
+        # Required arguments
+
+        `request`: the `Request` instance from Starlette or FastAPI.
+
+        `codec`: a `Codec` to decode request's body with.
+        """
+        try:
+            return codec.decode(await request.body())
+        except ValueError as ex:
+            raise HttpBadRequestError(
+                f"Request body is not a valid {codec.media_type}"
+            ) from ex
+
     async def extract_data_from_multipart_request(
         self, request: Request
     ) -> dict | list:
@@ -358,10 +581,15 @@ class GraphQLHTTPHandler(GraphQLHttpHandlerBase):
         `query_document`: an already parsed GraphQL query. Setting this option
         will prevent `graphql` from parsing `query` string from `data` second time.
         """
+        cached_introspection = self.get_cached_introspection(data)
+        if cached_introspection:
+            return True, dict(cached_introspection.result)
+
         if context_value is None:
             context_value = await self.get_context_for_request(request, data)
 
         extensions = await self.get_extensions_for_request(request, context_value)
+        extensions = self.add_server_extensions(request, extensions)
         middleware = await self.get_middleware_for_request(request, context_value)
 
         if self.schema is None:
@@ -372,7 +600,24 @@ class GraphQLHTTPHandler(GraphQLHttpHandlerBase):
         else:
             require_query = False
 
-        return await graphql(
+        introspection_cache = self.get_introspection_cache(data)
+        if introspection_cache and query_document is None:
+            try:
+                query_document = parse_query(context_value, self.query_parser, data)
+            except GraphQLError:
+                pass  # graphql() will report the syntax error
+        if introspection_cache and query_document:
+            cached_introspection = introspection_cache.get_for_document(
+                self.schema, data, query_document
+            )
+            if cached_introspection:
+                return True, dict(cached_introspection.result)
+
+        extension_manager = ExtensionManager(extensions, context_value)
+        if isinstance(request, Request):
+            request.scope["ariadne.extension_manager"] = extension_manager
+
+        success, result = await graphql(
             self.schema,
             data,
             context_value=context_value,
@@ -386,12 +631,219 @@ class GraphQLHTTPHandler(GraphQLHttpHandlerBase):
             introspection=self.introspection,
             logger=self.logger,
             error_formatter=self.error_formatter,
-            extensions=extensions,
+            extension_manager=extension_manager,
             middleware=middleware,
             middleware_manager_class=self.middleware_manager_class,
             execution_context_class=self.execution_context_class,
         )
 
+        if success and introspection_cache and query_document:
+            introspection_cache.set(self.schema, data, query_document, result)
+
+        return success, result
+
+    def get_introspection_cache(self, data: Any) -> IntrospectionCache | None:
+        """Returns `IntrospectionCache` to use for GraphQL request's data.
+
+        Returns `None` if introspection cache is disabled or `data` can't
+        be an introspection query.
+
+        # Required arguments
+
+        `data`: a GraphQL data.
+        """
+        if (
+            self.introspection_cache
+            and self.introspection
+            and self.schema
+            and self.introspection_cache.is_candidate(data)
+        ):
+            return self.introspection_cache
+        return None
+
+    def get_cached_introspection(self, data: Any) -> CachedIntrospection | None:
+        """Returns cached result of introspection query from request's data.
+
+        Returns `CachedIntrospection` or `None` if query's result is not cached.
+
+        # Required arguments
+
+        `data`: a GraphQL data.
+        """
+        introspection_cache = self.get_introspection_cache(data)
+        if introspection_cache and self.schema:
+            return introspection_cache.get(self.schema, data)
+        return None
+
+    def apply_http_cache(
+        self, request: Request, result: dict, response: Response
+    ) -> Response:
+        """Applies HTTP caching policy to the response for `GET` query.
+
+        Returns the `response` with caching headers or `304 Not Modified`
+        response if client's cached result is still valid.
+
+        # Required arguments
+
+        `request`: the `Request` instance from Starlette or FastAPI.
+
+        `result`: a `dict` with GraphQL result.
+
+        `response`: a `Response` with encoded result.
+        """
+        if not self.http_cache:
+            return response
+
+        etag = self.http_cache.get_etag(
+            request,
+            result,
+            response.body,
+            content_type=response.headers.get("Content-Type"),
+            content_encoding=response.headers.get("Content-Encoding"),
+        )
+        for header, value in self.http_cache.get_headers(etag).items():
+            if header == "Vary":
+                response.headers.add_vary_header(value)
+            else:
+                response.headers[header] = value
+
+        if self.http_cache.is_not_modified(request.headers.get("If-None-Match"), etag):
+            return Response(
+                status_code=HTTPStatus.NOT_MODIFIED,
+                headers={
+                    header: response.headers[header]
+                    for header in ("Cache-Control", "ETag", "Vary")
+                    if header in response.headers
+                },
+            )
+
+        return response
+
+    def get_serialization_phase(self, request: Request) -> Any:
+        """Returns a context manager running extensions' serialization hooks.
+
+        # Required arguments
+
+        `request`: the `Request` instance from Starlette or FastAPI.
+        """
+        extension_manager = request.scope.get("ariadne.extension_manager")
+        if extension_manager:
+            return extension_manager.phase("serialization")
+        return NO_PHASE_HOOKS
+
+    def get_deadline_extension(
+        self, request: Request, operation_deadlines: OperationDeadlines
+    ) -> Callable[[], Extension]:
+        """Returns extension enforcing request's deadline.
+
+        # Required arguments
+
+        `request`: the `Request` instance from Starlette or FastAPI.
+
+        `operation_deadlines`: an `OperationDeadlines` of the handler.
+        """
+        requested_timeout = None
+        if operation_deadlines.header:
+            requested_timeout = request.headers.get(operation_deadlines.header)
+        return operation_deadlines.get_extension(requested_timeout)
+
+    def log_slow_operation(self, request: Request, response: Response) -> None:
+        """Logs the operation if it exceeded thresholds of `slow_operation_log`.
+
+        # Required arguments
+
+        `request`: the `Request` instance from Starlette or FastAPI.
+
+        `response`: a `Response` with operation's result.
+        """
+        if self.slow_operation_log:
+            self.slow_operation_log.finish(
+                request.scope.get("ariadne.extension_manager"), len(response.body)
+            )
+
+    def get_response_codec(self, request: Request) -> Codec | None:
+        """Returns `Codec` to encode response's body with or `None` for JSON.
+
+        # Required arguments
+
+        `request`: the `Request` instance from Starlette or FastAPI.
+        """
+        if not self.codecs:
+            return None
+
+        content_type = request.headers.get("Content-Type", "").split(";")[0]
+        request_codec = get_codec_for_content_type(self.codecs, content_type)
+        return negotiate_codec(
+            self.codecs, request.headers.get("Accept"), request_codec
+        )
+
+    def is_normalized_result_requested(self, request: Request) -> bool:
+        """Returns `True` if client requested result in normalized format.
+
+        # Required arguments
+
+        `request`: the `Request` instance from Starlette or FastAPI.
+        """
+        if not self.normalization:
+            return False
+
+        return self.normalization.is_requested(
+            request.headers.get(self.normalization.header)
+        )
+
+    def create_encoded_response(
+        self, request: Request, result: dict, success: bool, codec: Codec
+    ) -> Response:
+        """Creates response with GraphQL's query result in binary wire format.
+
+        Uses same status codes as `create_json_response`.
+
+        # Required arguments
+
+        `request`: the `Request` instance from Starlette or FastAPI.
+
+        `result`: a `dict` with query result.
+
+        `success`: a `bool` specifying if query execution was successful.
+
+        `codec`: a `Codec` to encode the result with.
+        """
+        if success or result.get("data") is not None:
+            status_code = HTTPStatus.OK
+        else:
+            status_code = HTTPStatus.BAD_REQUEST
+        response = Response(
+            codec.encode(result), status_code=status_code, media_type=codec.media_type
+        )
+        return self.compress_response(request, response)
+
+    def compress_response(self, request: Request, response: Response) -> Response:
+        """Compresses response's body with encoding accepted by the client.
+
+        Returns the `response` with compressed body and `Content-Encoding`
+        header, or unchanged `response` if compression is disabled, client
+        doesn't accept supported encodings or the body is too small.
+
+        # Required arguments
+
+        `request`: the `Request` instance from Starlette or FastAPI.
+
+        `response`: a `Response` to compress.
+        """
+        if not self.compression or "Content-Encoding" in response.headers:
+            return response
+
+        response.headers.add_vary_header("Accept-Encoding")
+        body, encoding = self.compression.compress_body(
+            bytes(response.body), request.headers.get("Accept-Encoding")
+        )
+        if encoding:
+            response.body = body
+            response.headers["Content-Encoding"] = encoding
+            response.headers["Content-Length"] = str(len(body))
+
+        return response
+
     async def get_extensions_for_request(
         self, request: Any, context: ContextValue | None
     ) -> ExtensionList:
@@ -406,12 +858,39 @@ class GraphQLHTTPHandler(GraphQLHttpHandlerBase):
         `context`: a `ContextValue` for this request.
         """
         if callable(self.extensions):
-            extensions = self.extensions(request, context)  # ty: ignore
+            extensions = self.extensions(request, context)
             if isawaitable(extensions):
                 extensions = await extensions
             return cast(ExtensionList, extensions)
         return self.extensions
 
+    def add_server_extensions(
+        self, request: Any, extensions: ExtensionList
+    ) -> ExtensionList:
+        """Returns request's extensions with extensions of handler's options.
+
+        # Required arguments
+
+        `request`: the `Request` instance from Starlette or FastAPI.
+
+        `extensions`: an `ExtensionList` returned by
+        `get_extensions_for_request`.
+        """
+        if self.slow_operation_log:
+            extensions = [self.slow_operation_log.extension, *(extensions or [])]
+        if self.operation_deadlines:
+            extensions = [
+                *(extensions or []),
+                self.get_deadline_extension(request, self.operation_deadlines),
+            ]
+        if self.concurrency_limits:
+            extensions = [*(extensions or []), self.concurrency_limits.extension]
+        if self.resolver_thread_pool:
+            extensions = [*(extensions or []), self.resolver_thread_pool.extension]
+        if self.resolver_process_pool:
+            extensions = [*(extensions or []), self.resolver_process_pool.extension]
+        return extensions
+
     async def get_middleware_for_request(
         self, request: Any, context: ContextValue | None
     ) -> MiddlewareList:
@@ -427,7 +906,7 @@ class GraphQLHTTPHandler(GraphQLHttpHandlerBase):
         """
         middleware = self.middleware
         if callable(middleware):
-            middleware = middleware(request, context)  # ty: ignore
+            middleware = middleware(request, context)
             if isawaitable(middleware):
                 middleware = await middleware
         if middleware:
@@ -459,7 +938,8 @@ class GraphQLHTTPHandler(GraphQLHttpHandlerBase):
             status_code = HTTPStatus.OK
         else:
             status_code = HTTPStatus.BAD_REQUEST
-        return JSONResponse(result, status_code=status_code)
+        response = JSONResponse(result, status_code=status_code)
+        return self.compress_response(request, response)
 
     def handle_not_allowed_method(self, request: Request):
         """Handles request for unsupported HTTP method.
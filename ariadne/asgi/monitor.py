@@ -0,0 +1,210 @@
+import logging
+import sys
+from asyncio import AbstractEventLoop, TimerHandle, get_running_loop
+from collections import deque
+from threading import Event, Thread, get_ident
+from time import monotonic
+from typing import TYPE_CHECKING
+
+from graphql import GraphQLResolveInfo
+
+if TYPE_CHECKING:
+    from ..contrib.tracing.metrics import GraphQLMetrics
+
+__all__ = ["EventLoopMonitor", "EventLoopStall"]
+
+
+class EventLoopStall:
+    """Event loop stall detected by `EventLoopMonitor`.
+
+    # Attributes
+
+    `duration`: a `float` with duration of the stall in seconds.
+
+    `field`: a `tuple` with names of parent type and field which resolver
+    was running when the stall was detected, or `None` if event loop was
+    blocked outside of resolvers.
+
+    `path`: a `str` with path of the field in result, or `None`.
+
+    `location`: a `str` with file name and line of code which was running
+    when the stall was detected, or `None`.
+    """
+
+    __slots__ = ("duration", "field", "location", "path")
+
+    def __init__(
+        self,
+        duration: float,
+        field: tuple[str, str] | None = None,
+        path: str | None = None,
+        location: str | None = None,
+    ) -> None:
+        self.duration = duration
+        self.field = field
+        self.path = path
+        self.location = location
+
+
+class EventLoopMonitor:
+    """Monitor of event loop lag, attributing stalls to resolvers.
+
+    Event loop schedules a heartbeat every `interval` seconds. A watchdog
+    thread checks if the heartbeat is late by more than `threshold` seconds.
+    When it is, watchdog inspects the stack of the event loop's thread and
+    finds the resolver running at that moment. Stall is reported when the
+    event loop runs the late heartbeat.
+
+    Stalls are logged as warnings, kept in `stalls` and, if `metrics` are
+    set, recorded in the `GraphQLMetrics`.
+    """
+
+    def __init__(
+        self,
+        *,
+        threshold: float = 0.1,
+        interval: float = 0.05,
+        logger: None | str | logging.Logger | logging.LoggerAdapter = None,
+        metrics: "GraphQLMetrics | None" = None,
+        max_stalls: int = 100,
+    ) -> None:
+        """Initializes the event loop monitor.
+
+        # Optional arguments
+
+        `threshold`: a `float` with minimal lag of event loop in seconds to
+        report as a stall. Defaults to 0.1.
+
+        `interval`: a `float` with interval of heartbeat in seconds. Defaults
+        to 0.05.
+
+        `logger`: a `str` with name of logger or logger instance to report
+        stalls with. Defaults to `ariadne` logger.
+
+        `metrics`: a `GraphQLMetrics` to record durations of stalls in.
+
+        `max_stalls`: an `int` with number of most recent stalls to keep in
+        `stalls`. Defaults to 100.
+        """
+        if not logger:
+            logger = "ariadne"
+        if isinstance(logger, str):
+            logger = logging.getLogger(logger)
+
+        self.threshold = threshold
+        self.interval = interval
+        self.logger = logger
+        self.metrics = metrics
+        self.stalls: deque[EventLoopStall] = deque(maxlen=max_stalls)
+
+        self._loop: AbstractEventLoop | None = None
+        self._thread_id = 0
+        self._last_beat = 0.0
+        self._detected: EventLoopStall | None = None
+        self._handle: TimerHandle | None = None
+        self._stopped = Event()
+        self._watchdog: Thread | None = None
+
+    def ensure_started(self) -> None:
+        """Starts monitoring the running event loop, if not started already."""
+        loop = get_running_loop()
+        if self._loop is not loop:
+            self.start(loop)
+
+    def start(self, loop: AbstractEventLoop) -> None:
+        """Starts monitoring the event loop.
+
+        Must be called from the event loop's thread.
+        """
+        self.stop()
+
+        self._loop = loop
+        self._thread_id = get_ident()
+        self._last_beat = monotonic()
+        self._detected = None
+        self._stopped = Event()
+        self._handle = loop.call_later(self.interval, self.beat)
+        self._watchdog = Thread(
+            target=self.watch, name="ariadne-event-loop-monitor", daemon=True
+        )
+        self._watchdog.start()
+
+    def stop(self) -> None:
+        """Stops monitoring the event loop."""
+        self._stopped.set()
+        if self._handle:
+            self._handle.cancel()
+            self._handle = None
+        if self._watchdog and self._watchdog.ident != get_ident():
+            self._watchdog.join()
+        self._watchdog = None
+        self._loop = None
+
+    def beat(self) -> None:
+        now = monotonic()
+        lag = now - self._last_beat - self.interval
+        self._last_beat = now
+
+        detected, self._detected = self._detected, None
+        if lag >= self.threshold:
+            self.report(lag, detected)
+
+        if not self._stopped.is_set() and self._loop:
+            self._handle = self._loop.call_later(self.interval, self.beat)
+
+    def watch(self) -> None:
+        check_interval = min(self.interval, self.threshold / 2)
+        while not self._stopped.wait(check_interval):
+            loop = self._loop
+            if not loop or loop.is_closed():
+                return
+            if not loop.is_running() or self._detected:
+                continue
+
+            if monotonic() - self._last_beat - self.interval >= self.threshold:
+                self._detected = self.inspect_event_loop_thread()
+
+    def inspect_event_loop_thread(self) -> EventLoopStall:
+        """Returns stall with resolver running in the event loop's thread."""
+        stall = EventLoopStall(0.0)
+        frame = sys._current_frames().get(self._thread_id)
+        if frame is None:
+            return stall
+
+        stall.location = f"{frame.f_code.co_filename}:{frame.f_lineno}"
+        while frame:
+            info = frame.f_locals.get("info")
+            if isinstance(info, GraphQLResolveInfo):
+                stall.field = (info.parent_type.name, info.field_name)
+                stall.path = ".".join(map(str, info.path.as_list()))
+                break
+            frame = frame.f_back
+        return stall
+
+    def report(self, duration: float, detected: EventLoopStall | None) -> None:
+        """Reports stall of event loop."""
+        stall = detected or EventLoopStall(0.0)
+        stall.duration = duration
+        self.stalls.append(stall)
+
+        if stall.field:
+            self.logger.warning(
+                "Event loop was blocked for %.3f seconds by the %s.%s resolver "
+                "(path: %s, at %s).",
+                duration,
+                stall.field[0],
+                stall.field[1],
+                stall.path,
+                stall.location,
+            )
+        else:
+            self.logger.warning(
+                "Event loop was blocked for %.3f seconds (at %s).",
+                duration,
+                stall.location or "unknown location",
+            )
+
+        if self.metrics:
+            self.metrics.observe_event_loop_stall(
+                stall.field, int(duration * 1_000_000_000)
+            )
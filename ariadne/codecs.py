@@ -0,0 +1,186 @@
+from abc import ABC, abstractmethod
+from collections.abc import Sequence
+from typing import Any
+
+from .constants import DATA_TYPE_JSON
+from .utils import parse_header_qualities
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+try:
+    import cbor2
+except ImportError:
+    cbor2 = None
+
+__all__ = [
+    "CBORCodec",
+    "Codec",
+    "MessagePackCodec",
+    "get_codec_for_content_type",
+    "get_codec_for_subprotocol",
+    "negotiate_codec",
+]
+
+
+class Codec(ABC):
+    """Base class for binary wire formats supported by GraphQL servers.
+
+    # Attributes
+
+    `name`: a `str` with short name of the format. Used as suffix of
+    websocket subprotocols using this format, eg. `graphql-transport-ws+msgpack`.
+
+    `media_type`: a `str` with media type of HTTP requests and responses
+    using this format.
+    """
+
+    name: str
+    media_type: str
+
+    @abstractmethod
+    def encode(self, value: Any) -> bytes:
+        """Encodes a JSON-serializable value to `bytes`."""
+
+    @abstractmethod
+    def decode(self, data: bytes) -> Any:
+        """Decodes `bytes` to a value.
+
+        Raises `ValueError` if data is not valid.
+        """
+
+
+class MessagePackCodec(Codec):
+    """MessagePack wire format. Requires the `msgpack` package."""
+
+    name = "msgpack"
+    media_type = "application/msgpack"
+
+    def __init__(self) -> None:
+        if msgpack is None:
+            raise NotImplementedError(
+                "MessagePack wire format requires 'msgpack' library."
+            )
+
+        # packb creates new packer for every call, which is thread-safe
+        self._packb = msgpack.packb
+        self._unpackb = msgpack.unpackb
+
+    def encode(self, value: Any) -> bytes:
+        return self._packb(value, use_bin_type=True)
+
+    def decode(self, data: bytes) -> Any:
+        try:
+            return self._unpackb(data, raw=False)
+        except Exception as error:
+            raise ValueError(f"Data is not a valid MessagePack: {error}") from error
+
+
+class CBORCodec(Codec):
+    """CBOR wire format. Requires the `cbor2` package."""
+
+    name = "cbor"
+    media_type = "application/cbor"
+
+    def __init__(self) -> None:
+        if cbor2 is None:
+            raise NotImplementedError("CBOR wire format requires 'cbor2' library.")
+
+        self._dumps = cbor2.dumps
+        self._loads = cbor2.loads
+
+    def encode(self, value: Any) -> bytes:
+        return self._dumps(value)
+
+    def decode(self, data: bytes) -> Any:
+        try:
+            return self._loads(data)
+        except Exception as error:
+            raise ValueError(f"Data is not a valid CBOR: {error}") from error
+
+
+def get_codec_for_content_type(
+    codecs: Sequence[Codec], content_type: str
+) -> Codec | None:
+    """Returns codec for request's media type or `None`.
+
+    # Required arguments
+
+    `codecs`: a sequence of `Codec` instances supported by the server.
+
+    `content_type`: a `str` with request's media type, without parameters.
+    """
+    for codec in codecs:
+        if codec.media_type == content_type:
+            return codec
+    return None
+
+
+def get_codec_for_subprotocol(
+    codecs: Sequence[Codec], base_subprotocol: str, subprotocols: Sequence[str]
+) -> tuple[str, Codec | None] | None:
+    """Returns first websocket subprotocol requested by the client and its codec.
+
+    Returns a `tuple` with name of subprotocol and `Codec`, or `None` codec for
+    base JSON subprotocol. Returns `None` if client requested none of
+    supported subprotocols.
+
+    # Required arguments
+
+    `codecs`: a sequence of `Codec` instances supported by the server.
+
+    `base_subprotocol`: a `str` with name of JSON subprotocol.
+
+    `subprotocols`: a sequence of `str` with subprotocols requested by client.
+    """
+    for subprotocol in subprotocols:
+        if subprotocol == base_subprotocol:
+            return subprotocol, None
+        for codec in codecs:
+            if subprotocol == f"{base_subprotocol}+{codec.name}":
+                return subprotocol, codec
+    return None
+
+
+def negotiate_codec(
+    codecs: Sequence[Codec], accept: str | None, default: Codec | None = None
+) -> Codec | None:
+    """Returns codec for response's body or `None` for JSON.
+
+    Codec is selected from media types listed in the `Accept` header of
+    request. If header is missing or lists only wildcards, `default` is
+    returned.
+
+    # Required arguments
+
+    `codecs`: a sequence of `Codec` instances supported by the server.
+
+    `accept`: a `str` with value of `Accept` header or `None`.
+
+    # Optional arguments
+
+    `default`: a `Codec` to return if client accepts any media type.
+    Should be codec of request's body.
+    """
+    if not codecs or not accept:
+        return default
+
+    qualities = parse_header_qualities(accept)
+    if not any(media_type != "*/*" for media_type in qualities):
+        return default
+
+    best_codec = None
+    best_quality = max(
+        qualities.get(DATA_TYPE_JSON, 0.0),
+        qualities.get("application/*", 0.0),
+        qualities.get("*/*", 0.0),
+    )
+    for codec in codecs:
+        quality = qualities.get(codec.media_type, 0.0)
+        if quality > best_quality:
+            best_codec = codec
+            best_quality = quality
+
+    return best_codec
@@ -0,0 +1,286 @@
+import zlib
+from collections.abc import Callable, Sequence
+from time import thread_time
+
+from .utils import parse_header_qualities
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+__all__ = [
+    "CompressionStats",
+    "ResponseCompression",
+    "StreamCompressor",
+    "get_available_encodings",
+]
+
+DEFAULT_LEVELS = {"zstd": 3, "br": 4, "gzip": 6}
+
+# zlib window size producing gzip header and trailer
+GZIP_WBITS = 16 + zlib.MAX_WBITS
+
+
+def get_available_encodings() -> list[str]:
+    """Returns a list of supported content encodings, best first.
+
+    `gzip` is always available. `br` requires the `brotli` package and `zstd`
+    requires the `zstandard` package.
+    """
+    encodings = []
+    if zstandard:
+        encodings.append("zstd")
+    if brotli:
+        encodings.append("br")
+    encodings.append("gzip")
+    return encodings
+
+
+class CompressionStats:
+    """CPU cost and effectiveness of compression with single encoding and level.
+
+    # Attributes
+
+    `responses`: an `int` with number of compressed responses.
+
+    `input_size`: an `int` with total size of data before compression.
+
+    `output_size`: an `int` with total size of compressed data.
+
+    `cpu_time`: a `float` with total CPU time spent compressing, in seconds.
+    """
+
+    __slots__ = ("cpu_time", "input_size", "output_size", "responses")
+
+    def __init__(self) -> None:
+        self.responses = 0
+        self.input_size = 0
+        self.output_size = 0
+        self.cpu_time = 0.0
+
+    @property
+    def ratio(self) -> float:
+        """Ratio of compressed to original data size."""
+        if not self.input_size:
+            return 1.0
+        return self.output_size / self.input_size
+
+    @property
+    def cpu_time_per_mb(self) -> float:
+        """CPU time in seconds spent compressing a megabyte of data."""
+        if not self.input_size:
+            return 0.0
+        return self.cpu_time / self.input_size * 1_000_000
+
+
+class StreamCompressor:
+    """Compressor for streaming responses.
+
+    Every compressed chunk is flushed so client can decode it without waiting
+    for the rest of the stream.
+    """
+
+    def __init__(self, encoding: str, level: int, stats: CompressionStats) -> None:
+        self.encoding = encoding
+        self.stats = stats
+        stats.responses += 1
+
+        # Every encoding's compressor has different API, so its methods are
+        # wrapped in functions with same signatures
+        self._compress: Callable[[bytes], bytes]
+        self._finish: Callable[[], bytes]
+        if encoding == "gzip":
+            gzip_compressor = zlib.compressobj(level, zlib.DEFLATED, GZIP_WBITS)
+            self._compress = lambda chunk: (
+                gzip_compressor.compress(chunk)
+                + gzip_compressor.flush(zlib.Z_SYNC_FLUSH)
+            )
+            self._finish = gzip_compressor.flush
+        elif encoding == "br" and brotli:
+            brotli_compressor = brotli.Compressor(quality=level)
+            self._compress = lambda chunk: (
+                brotli_compressor.process(chunk) + brotli_compressor.flush()
+            )
+            self._finish = brotli_compressor.finish
+        elif encoding == "zstd" and zstandard:
+            zstd_compressor = zstandard.ZstdCompressor(level=level).compressobj()
+            flush_block = zstandard.COMPRESSOBJ_FLUSH_BLOCK
+            self._compress = lambda chunk: (
+                zstd_compressor.compress(chunk) + zstd_compressor.flush(flush_block)
+            )
+            self._finish = zstd_compressor.flush
+        else:
+            raise ValueError(f"Unsupported content encoding: {encoding}")
+
+    def compress(self, chunk: bytes) -> bytes:
+        """Compresses and flushes a chunk of the stream."""
+        start = thread_time()
+        data = self._compress(chunk)
+        self._record(chunk, data, start)
+        return data
+
+    def finish(self) -> bytes:
+        """Returns the end of compressed stream."""
+        start = thread_time()
+        data = self._finish()
+        self._record(b"", data, start)
+        return data
+
+    def _record(self, chunk: bytes, data: bytes, start: float) -> None:
+        self.stats.cpu_time += thread_time() - start
+        self.stats.input_size += len(chunk)
+        self.stats.output_size += len(data)
+
+
+class ResponseCompression:
+    """Compression of HTTP responses negotiated with `Accept-Encoding` header.
+
+    Supports `gzip`, and `br` and `zstd` if `brotli` and `zstandard` packages
+    are installed. When client accepts many encodings with same quality,
+    `zstd` is preferred over `br`, and `br` is preferred over `gzip`.
+
+    # Attributes
+
+    `stats`: a `dict` with `CompressionStats` for every used encoding and
+    level, keyed by `(encoding, level)` tuples. Updates of stats are not
+    synchronized between threads, so values may be approximate in
+    multi-threaded servers.
+    """
+
+    def __init__(
+        self,
+        *,
+        minimum_size: int = 1024,
+        levels: dict[str, int] | None = None,
+        encodings: Sequence[str] | None = None,
+    ) -> None:
+        """Initializes the response compression.
+
+        # Optional arguments
+
+        `minimum_size`: an `int` with minimum size of response's body in bytes
+        to compress. Smaller responses are sent uncompressed. Defaults to 1024.
+
+        `levels`: a `dict` with compression levels to use for encodings.
+        Defaults to 6 for `gzip`, 4 for `br` and 3 for `zstd`.
+
+        `encodings`: a sequence of `str` with names of encodings to use, best
+        first. Defaults to all available encodings. Unavailable encodings are
+        skipped.
+        """
+        available = get_available_encodings()
+        if encodings is None:
+            encodings = available
+
+        self.minimum_size = minimum_size
+        self.levels = {**DEFAULT_LEVELS, **(levels or {})}
+        self.encodings = [encoding for encoding in encodings if encoding in available]
+        self.stats: dict[tuple[str, int], CompressionStats] = {}
+
+    def get_encoding(self, accept_encoding: str | None) -> str | None:
+        """Returns best encoding accepted by the client or `None`.
+
+        # Required arguments
+
+        `accept_encoding`: a `str` with value of `Accept-Encoding` request's
+        header or `None`.
+        """
+        if not accept_encoding:
+            return None
+
+        qualities = parse_header_qualities(accept_encoding)
+        wildcard = qualities.get("*", 0.0)
+
+        best_encoding = None
+        best_quality = 0.0
+        for encoding in self.encodings:
+            quality = qualities.get(encoding, wildcard)
+            if quality > best_quality:
+                best_encoding = encoding
+                best_quality = quality
+
+        return best_encoding
+
+    def compress(self, body: bytes, encoding: str) -> bytes:
+        """Returns `body` compressed with `encoding`.
+
+        # Required arguments
+
+        `body`: a `bytes` with data to compress.
+
+        `encoding`: a `str` with name of encoding to use.
+        """
+        level = self.levels[encoding]
+        stats = self.get_stats(encoding, level)
+
+        start = thread_time()
+        if encoding == "gzip":
+            gzip_compressor = zlib.compressobj(level, zlib.DEFLATED, GZIP_WBITS)
+            data = gzip_compressor.compress(body) + gzip_compressor.flush()
+        elif encoding == "br" and brotli:
+            data = brotli.compress(body, quality=level)
+        elif encoding == "zstd" and zstandard:
+            data = zstandard.ZstdCompressor(level=level).compress(body)
+        else:
+            raise ValueError(f"Unsupported content encoding: {encoding}")
+
+        stats.cpu_time += thread_time() - start
+        stats.responses += 1
+        stats.input_size += len(body)
+        stats.output_size += len(data)
+        return data
+
+    def compress_body(
+        self, body: bytes, accept_encoding: str | None
+    ) -> tuple[bytes, str | None]:
+        """Compresses response's body with best encoding accepted by client.
+
+        Returns a `tuple` with body and name of used encoding. If body was not
+        compressed, returns unchanged `body` and `None`.
+
+        # Required arguments
+
+        `body`: a `bytes` with response's body.
+
+        `accept_encoding`: a `str` with value of `Accept-Encoding` request's
+        header or `None`.
+        """
+        if len(body) < self.minimum_size:
+            return body, None
+
+        encoding = self.get_encoding(accept_encoding)
+        if not encoding:
+            return body, None
+
+        return self.compress(body, encoding), encoding
+
+    def create_stream_compressor(
+        self, accept_encoding: str | None
+    ) -> StreamCompressor | None:
+        """Returns `StreamCompressor` for streaming response or `None`.
+
+        `None` is returned if client doesn't accept any of supported encodings.
+
+        # Required arguments
+
+        `accept_encoding`: a `str` with value of `Accept-Encoding` request's
+        header or `None`.
+        """
+        encoding = self.get_encoding(accept_encoding)
+        if not encoding:
+            return None
+
+        level = self.levels[encoding]
+        return StreamCompressor(encoding, level, self.get_stats(encoding, level))
+
+    def get_stats(self, encoding: str, level: int) -> CompressionStats:
+        stats = self.stats.get((encoding, level))
+        if stats is None:
+            stats = self.stats.setdefault((encoding, level), CompressionStats())
+        return stats
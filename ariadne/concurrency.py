@@ -0,0 +1,328 @@
+from asyncio import Semaphore
+from collections.abc import Awaitable, Callable
+from contextlib import AsyncExitStack
+from functools import partial
+from inspect import iscoroutine
+from time import perf_counter
+from typing import Any
+from weakref import WeakKeyDictionary
+
+from graphql import (
+    GraphQLField,
+    GraphQLInterfaceType,
+    GraphQLObjectType,
+    GraphQLResolveInfo,
+)
+from graphql.pyutils import is_awaitable
+
+from .schema_visitor import SchemaDirectiveVisitor
+from .types import Extension, Resolver
+from .utils import type_get_extension, type_set_extension
+
+__all__ = [
+    "ConcurrencyLimitDirective",
+    "ConcurrencyLimiter",
+    "ConcurrencyLimits",
+    "ConcurrencyLimitsExtension",
+    "ConcurrencyStats",
+    "concurrency_limit_directive",
+    "get_field_concurrency_limit",
+    "set_field_concurrency_limit",
+]
+
+CONCURRENCY_LIMIT = "__concurrency_limit__"
+
+concurrency_limit_directive = """
+directive @concurrencyLimit(
+    limit: Int!
+    perRequest: Boolean = false
+) on FIELD_DEFINITION
+"""
+
+
+def set_field_concurrency_limit(
+    field: GraphQLField, limit: int, *, per_request: bool = False
+) -> None:
+    """Limits number of field's async resolvers running at same time.
+
+    # Required arguments
+
+    `field`: a `GraphQLField` to limit.
+
+    `limit`: an `int` with maximum number of field's resolvers running at
+    same time.
+
+    # Optional arguments
+
+    `per_request`: a `bool` controlling if the limit applies to resolvers of
+    single request, instead of all requests handled by the process. Defaults
+    to `False`.
+    """
+    type_set_extension(
+        field,  # ty: ignore
+        CONCURRENCY_LIMIT,
+        {"limit": limit, "per_request": per_request},
+    )
+
+
+def get_field_concurrency_limit(field: GraphQLField) -> dict | None:
+    """Returns a `dict` with field's concurrency limit or `None`."""
+    return type_get_extension(field, CONCURRENCY_LIMIT)  # ty: ignore
+
+
+class ConcurrencyLimitDirective(SchemaDirectiveVisitor):
+    """Schema directive limiting concurrency of field's async resolvers.
+
+    Concurrency of field's resolvers is limited by servers configured with
+    `ConcurrencyLimits`:
+
+    ```python
+    schema = make_executable_schema(
+        [concurrency_limit_directive, type_defs],
+        query_type,
+        directives={"concurrencyLimit": ConcurrencyLimitDirective},
+    )
+    ```
+    """
+
+    def visit_field_definition(
+        self,
+        field: GraphQLField,
+        object_type: GraphQLObjectType | GraphQLInterfaceType,
+    ) -> GraphQLField:
+        set_field_concurrency_limit(
+            field,
+            self.args["limit"],
+            per_request=bool(self.args.get("perRequest")),
+        )
+        return field
+
+
+class ConcurrencyStats:
+    """Usage of concurrency limit shared by one or more limiters.
+
+    Stats of per-request limits are combined for all requests.
+
+    # Attributes
+
+    `limit`: an `int` with maximum number of resolvers running at same time.
+
+    `active`: an `int` with number of resolvers running now.
+
+    `waiting`: an `int` with number of resolvers waiting for the limit now.
+
+    `max_waiting`: an `int` with highest number of resolvers waiting for the
+    limit at same time.
+
+    `waited`: an `int` with total number of resolvers which had to wait.
+
+    `wait_time`: a `float` with total time resolvers waited, in seconds.
+    """
+
+    __slots__ = ("active", "limit", "max_waiting", "wait_time", "waited", "waiting")
+
+    def __init__(self, limit: int) -> None:
+        self.limit = limit
+        self.active = 0
+        self.waiting = 0
+        self.max_waiting = 0
+        self.waited = 0
+        self.wait_time = 0.0
+
+
+class ConcurrencyLimiter:
+    """Async context manager limiting number of resolvers running at once."""
+
+    def __init__(self, stats: ConcurrencyStats) -> None:
+        self.stats = stats
+        self._semaphore = Semaphore(stats.limit)
+
+    async def __aenter__(self) -> None:
+        stats = self.stats
+        if self._semaphore.locked():
+            stats.waiting += 1
+            stats.waited += 1
+            stats.max_waiting = max(stats.max_waiting, stats.waiting)
+            start = perf_counter()
+            try:
+                await self._semaphore.acquire()
+            finally:
+                stats.waiting -= 1
+                stats.wait_time += perf_counter() - start
+        else:
+            await self._semaphore.acquire()
+        stats.active += 1
+
+    async def __aexit__(self, *_) -> None:
+        self.stats.active -= 1
+        self._semaphore.release()
+
+
+class ConcurrencyLimits:
+    """Limits of async resolvers running at same time.
+
+    Resolvers returning awaitables, like async resolvers, are awaited only
+    when allowed by all their limits:
+
+    - the global limit of all resolvers run by the process,
+    - the limit of all resolvers of single request,
+    - the limit of field's resolvers, set with the `field_limits` option,
+      the `@concurrencyLimit` directive or `set_field_concurrency_limit`.
+      Field's limit applies to all requests handled by the process, unless
+      it's set per request.
+
+    Resolvers over the limit wait in the event loop. Limits don't apply to
+    sync resolvers.
+
+    Single instance should be shared by all requests handled by the process.
+    """
+
+    def __init__(
+        self,
+        *,
+        global_limit: int | None = None,
+        request_limit: int | None = None,
+        field_limits: dict[str, int] | None = None,
+        request_field_limits: dict[str, int] | None = None,
+    ) -> None:
+        """Initializes the concurrency limits.
+
+        # Optional arguments
+
+        `global_limit`: an `int` with maximum number of async resolvers of all
+        requests running at same time.
+
+        `request_limit`: an `int` with maximum number of async resolvers of
+        single request running at same time.
+
+        `field_limits`: a `dict` with maximum numbers of async resolvers of
+        all requests running at same time, for fields coordinates like
+        `User.avatar`. Overrides limits set in the schema.
+
+        `request_field_limits`: a `dict` with maximum numbers of async
+        resolvers of single request running at same time, for fields
+        coordinates. Overrides limits set in the schema.
+        """
+        self.global_limit = global_limit
+        self.request_limit = request_limit
+        self.field_limits = field_limits or {}
+        self.request_field_limits = request_field_limits or {}
+        self.extension: Callable[[], ConcurrencyLimitsExtension] = partial(
+            ConcurrencyLimitsExtension, limits=self
+        )
+
+        self.stats: dict[str, ConcurrencyStats] = {}
+        self._limiters: dict[str, ConcurrencyLimiter] = {}
+        self._fields: WeakKeyDictionary[Any, dict[str, tuple[int, bool] | None]] = (
+            WeakKeyDictionary()
+        )
+
+    def get_stats(self, name: str, limit: int) -> ConcurrencyStats:
+        """Returns `ConcurrencyStats` for limit's name.
+
+        Names are `global`, `request` and fields coordinates.
+        """
+        stats = self.stats.get(name)
+        if stats is None:
+            stats = self.stats.setdefault(name, ConcurrencyStats(limit))
+        return stats
+
+    def get_limiter(self, name: str, limit: int) -> ConcurrencyLimiter:
+        """Returns `ConcurrencyLimiter` shared by all requests."""
+        limiter = self._limiters.get(name)
+        if limiter is None:
+            limiter = self._limiters.setdefault(
+                name, ConcurrencyLimiter(self.get_stats(name, limit))
+            )
+        return limiter
+
+    def get_field_limit(self, info: GraphQLResolveInfo) -> tuple[int, bool] | None:
+        """Returns field's limit and `True` if it's per request, or `None`."""
+        parent_type = info.parent_type
+        fields = self._fields.get(parent_type)
+        if fields is None:
+            fields = self._fields.setdefault(parent_type, {})
+
+        if info.field_name not in fields:
+            coordinate = f"{parent_type.name}.{info.field_name}"
+            field = parent_type.fields.get(info.field_name)
+            options = get_field_concurrency_limit(field) if field else None
+            if coordinate in self.request_field_limits:
+                fields[info.field_name] = (self.request_field_limits[coordinate], True)
+            elif coordinate in self.field_limits:
+                fields[info.field_name] = (self.field_limits[coordinate], False)
+            elif options:
+                fields[info.field_name] = (options["limit"], options["per_request"])
+            else:
+                fields[info.field_name] = None
+        return fields[info.field_name]
+
+    def reset_stats(self) -> None:
+        """Resets `max_waiting`, `waited` and `wait_time` of all limits."""
+        for stats in self.stats.values():
+            stats.max_waiting = stats.waiting
+            stats.waited = 0
+            stats.wait_time = 0.0
+
+
+class ConcurrencyLimitsExtension(Extension):
+    """Extension limiting async resolvers with `ConcurrencyLimits`.
+
+    Is added to request's extensions by servers configured with
+    `concurrency_limits`.
+    """
+
+    def __init__(self, *, limits: ConcurrencyLimits) -> None:
+        self._limits = limits
+        self._limiters: dict[str, ConcurrencyLimiter] = {}
+
+    def resolve(
+        self, next_: Resolver, obj: Any, info: GraphQLResolveInfo, **kwargs
+    ) -> Any:
+        result = next_(obj, info, **kwargs)
+        if not is_awaitable(result):
+            return result
+
+        limiters = self.get_limiters(info)
+        if not limiters:
+            return result
+        return self.limit(result, limiters)
+
+    def get_limiters(self, info: GraphQLResolveInfo) -> list[ConcurrencyLimiter]:
+        """Returns limiters of field, in order they should be acquired."""
+        limits = self._limits
+        limiters = []
+        if limits.global_limit:
+            limiters.append(limits.get_limiter("global", limits.global_limit))
+        if limits.request_limit:
+            limiters.append(self.get_request_limiter("request", limits.request_limit))
+
+        field_limit = limits.get_field_limit(info)
+        if field_limit:
+            limit, per_request = field_limit
+            coordinate = f"{info.parent_type.name}.{info.field_name}"
+            if per_request:
+                limiters.append(self.get_request_limiter(coordinate, limit))
+            else:
+                limiters.append(limits.get_limiter(coordinate, limit))
+        return limiters
+
+    def get_request_limiter(self, name: str, limit: int) -> ConcurrencyLimiter:
+        limiter = self._limiters.get(name)
+        if limiter is None:
+            limiter = ConcurrencyLimiter(self._limits.get_stats(name, limit))
+            self._limiters[name] = limiter
+        return limiter
+
+    async def limit(
+        self, awaitable: Awaitable, limiters: list[ConcurrencyLimiter]
+    ) -> Any:
+        async with AsyncExitStack() as stack:
+            try:
+                for limiter in limiters:
+                    await stack.enter_async_context(limiter)
+            except BaseException:
+                if iscoroutine(awaitable):
+                    awaitable.close()
+                raise
+            return await awaitable
@@ -8,8 +8,12 @@ CONTENT_TYPE_JSON = "application/json; charset=UTF-8"
 CONTENT_TYPE_TEXT_HTML = "text/html; charset=UTF-8"
 CONTENT_TYPE_TEXT_PLAIN = "text/plain; charset=UTF-8"
 
+# Non-standard status of responses to requests of disconnected clients
+CLIENT_CLOSED_REQUEST = 499
+
 
 class HttpStatusResponse(Enum):
     OK = f"{HTTPStatus.OK} OK"
+    NOT_MODIFIED = f"{HTTPStatus.NOT_MODIFIED} NOT MODIFIED"
     BAD_REQUEST = f"{HTTPStatus.BAD_REQUEST} BAD REQUEST"
     METHOD_NOT_ALLOWED = f"{HTTPStatus.METHOD_NOT_ALLOWED} METHOD NOT ALLOWED"
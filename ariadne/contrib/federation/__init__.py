@@ -7,5 +7,11 @@
 from .interfaces import FederatedInterfaceType
 from .objects import FederatedObjectType
 from .schema import make_federated_schema
+from .tracing import FederatedTracingExtension
 
-__all__ = ["FederatedInterfaceType", "FederatedObjectType", "make_federated_schema"]
+__all__ = [
+    "FederatedInterfaceType",
+    "FederatedObjectType",
+    "FederatedTracingExtension",
+    "make_federated_schema",
+]
@@ -0,0 +1,237 @@
+import json
+from base64 import b64encode
+from time import perf_counter_ns, time_ns
+from typing import Any
+
+from graphql import GraphQLError, GraphQLResolveInfo
+from graphql.pyutils import is_awaitable
+
+from ...types import ContextValue, Extension, Resolver
+from ..tracing.utils import get_request_header
+
+__all__ = ["FederatedTracingExtension", "encode_trace"]
+
+TRACE_HEADER = "apollo-federation-include-trace"
+TRACE_FORMAT = "ftv1"
+
+# Protobuf wire types
+VARINT = 0
+LENGTH_DELIMITED = 2
+
+
+class TraceNode:
+    """Node of Apollo's `Trace` message, representing field or list item.
+
+    `start_time` and `end_time` are offsets in nanoseconds from the start of
+    the trace.
+    """
+
+    __slots__ = (
+        "children",
+        "end_time",
+        "errors",
+        "index",
+        "original_field_name",
+        "parent_type",
+        "response_name",
+        "start_time",
+        "type",
+    )
+
+    def __init__(self, key: str | int | None = None) -> None:
+        self.response_name: str | None = None
+        self.index: int | None = None
+        if isinstance(key, int):
+            self.index = key
+        else:
+            self.response_name = key
+
+        self.original_field_name = ""
+        self.type = ""
+        self.parent_type = ""
+        self.start_time = 0
+        self.end_time = 0
+        self.errors: list[GraphQLError] = []
+        self.children: list[TraceNode] = []
+
+    def encode(self) -> bytes:
+        data = bytearray()
+        if self.response_name is not None:
+            encode_string_field(data, 1, self.response_name)
+        if self.index is not None:
+            # Index is a member of oneof, so it's encoded even when it's 0
+            encode_varint(data, 2 << 3 | VARINT)
+            encode_varint(data, self.index)
+        encode_string_field(data, 3, self.type)
+        encode_varint_field(data, 8, self.start_time)
+        encode_varint_field(data, 9, self.end_time)
+        for error in self.errors:
+            encode_message_field(data, 11, encode_error(error))
+        for child in self.children:
+            encode_message_field(data, 12, child.encode())
+        encode_string_field(data, 13, self.parent_type)
+        encode_string_field(data, 14, self.original_field_name)
+        return bytes(data)
+
+
+def encode_trace(
+    root: TraceNode, start_time: int, end_time: int, duration: int
+) -> bytes:
+    """Encodes Apollo's `Trace` protobuf message.
+
+    # Required arguments
+
+    `root`: a `TraceNode` with root of the trace's tree of fields.
+
+    `start_time`: an `int` with Unix time of the trace's start in nanoseconds.
+
+    `end_time`: an `int` with Unix time of the trace's end in nanoseconds.
+
+    `duration`: an `int` with duration of the trace in nanoseconds.
+    """
+    data = bytearray()
+    encode_message_field(data, 3, encode_timestamp(end_time))
+    encode_message_field(data, 4, encode_timestamp(start_time))
+    encode_varint_field(data, 11, duration)
+    encode_message_field(data, 14, root.encode())
+    return bytes(data)
+
+
+def encode_timestamp(time: int) -> bytes:
+    data = bytearray()
+    seconds, nanos = divmod(time, 1_000_000_000)
+    encode_varint_field(data, 1, seconds)
+    encode_varint_field(data, 2, nanos)
+    return bytes(data)
+
+
+def encode_error(error: GraphQLError) -> bytes:
+    data = bytearray()
+    encode_string_field(data, 1, error.message)
+    for location in error.locations or []:
+        location_data = bytearray()
+        encode_varint_field(location_data, 1, location.line)
+        encode_varint_field(location_data, 2, location.column)
+        encode_message_field(data, 2, bytes(location_data))
+    encode_string_field(data, 4, json.dumps(error.formatted))
+    return bytes(data)
+
+
+def encode_varint(data: bytearray, value: int) -> None:
+    while value > 0x7F:
+        data.append((value & 0x7F) | 0x80)
+        value >>= 7
+    data.append(value)
+
+
+def encode_varint_field(data: bytearray, field: int, value: int) -> None:
+    if value:
+        encode_varint(data, field << 3 | VARINT)
+        encode_varint(data, value)
+
+
+def encode_message_field(data: bytearray, field: int, value: bytes) -> None:
+    encode_varint(data, field << 3 | LENGTH_DELIMITED)
+    encode_varint(data, len(value))
+    data.extend(value)
+
+
+def encode_string_field(data: bytearray, field: int, value: str) -> None:
+    if value:
+        encode_message_field(data, field, value.encode("utf-8"))
+
+
+class FederatedTracingExtension(Extension):
+    """Extension adding Apollo Federation inline traces (`ftv1`) to results.
+
+    Trace with timings and errors of all resolved fields is encoded with
+    Apollo's `Trace` protobuf message and included in the result's
+    `extensions.ftv1` key. Trace is recorded only if the gateway requested it
+    with the `apollo-federation-include-trace: ftv1` header. Fields are
+    resolved without any tracing overhead otherwise.
+
+    Context value must be a `dict` with the request under the `request` key,
+    like in the default context of ASGI and WSGI applications. Override
+    `should_include_trace` to support other context values.
+    """
+
+    def __init__(self) -> None:
+        self._enabled = False
+        self._start_time = 0
+        self._start_counter = 0
+        self._root = TraceNode()
+        self._nodes: dict[tuple[str | int, ...], TraceNode] = {}
+
+    def should_include_trace(self, context: ContextValue) -> bool:
+        """Returns `True` if gateway requested inline trace for the request."""
+        return get_request_header(context, TRACE_HEADER) == TRACE_FORMAT
+
+    def request_started(self, context: ContextValue) -> None:
+        self._enabled = self.should_include_trace(context)
+        if self._enabled:
+            self._start_time = time_ns()
+            self._start_counter = perf_counter_ns()
+
+    def resolve(
+        self, next_: Resolver, obj: Any, info: GraphQLResolveInfo, **kwargs
+    ) -> Any:
+        if not self._enabled:
+            return next_(obj, info, **kwargs)
+
+        node = self.get_node(tuple(info.path.as_list()))
+        node.type = str(info.return_type)
+        node.parent_type = info.parent_type.name
+        if info.field_name != node.response_name:
+            node.original_field_name = info.field_name
+
+        node.start_time = perf_counter_ns() - self._start_counter
+        try:
+            result = next_(obj, info, **kwargs)
+        except Exception:
+            node.end_time = perf_counter_ns() - self._start_counter
+            raise
+
+        if is_awaitable(result):
+
+            async def await_traced_result():
+                try:
+                    return await result
+                finally:
+                    node.end_time = perf_counter_ns() - self._start_counter
+
+            return await_traced_result()
+
+        node.end_time = perf_counter_ns() - self._start_counter
+        return result
+
+    def has_errors(self, errors: list[GraphQLError], context: ContextValue) -> None:
+        if not self._enabled:
+            return
+
+        for error in errors:
+            if error.path:
+                self.get_node(tuple(error.path)).errors.append(error)
+            else:
+                self._root.errors.append(error)
+
+    def get_node(self, path: tuple[str | int, ...]) -> TraceNode:
+        node = self._nodes.get(path)
+        if node is None:
+            parent = self.get_node(path[:-1]) if len(path) > 1 else self._root
+            node = TraceNode(path[-1])
+            parent.children.append(node)
+            self._nodes[path] = node
+        return node
+
+    def format(self, context: ContextValue) -> dict:
+        if not self._enabled:
+            return {}
+
+        duration = perf_counter_ns() - self._start_counter
+        trace = encode_trace(
+            self._root,
+            self._start_time,
+            self._start_time + duration,
+            duration,
+        )
+        return {TRACE_FORMAT: b64encode(trace).decode("ascii")}
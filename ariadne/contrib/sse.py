@@ -22,11 +22,13 @@ from anyio import (
     sleep,
 )
 from graphql import DocumentNode, GraphQLSchema, MiddlewareManager
+from starlette.datastructures import MutableHeaders
 from starlette.requests import Request
 from starlette.responses import Response
 from starlette.types import Receive, Scope, Send
 
 from ..asgi.handlers import GraphQLHTTPHandler
+from ..compression import ResponseCompression, StreamCompressor
 from ..exceptions import HttpError
 from ..format_error import format_error
 from ..graphql import (
@@ -143,6 +145,7 @@ class ServerSentEventResponse(Response):
         send_timeout: int | None = None,
         ping_interval: int | None = None,
         headers: dict[str, str] | None = None,
+        compressor: StreamCompressor | None = None,
         **kwargs,
     ):
         """Initializes an SSE Response that sends events generated by an async generator
@@ -156,12 +159,14 @@ class ServerSentEventResponse(Response):
         overrides the DEFAULT_PING_INTERVAL of 15 seconds
         `headers`: a dictionary of headers to be sent with the response
         `encoding`: the encoding to use for the response
+        `compressor`: a `StreamCompressor` to compress the events with
         """
         super().__init__(*args, **kwargs)
         self.generator = generator
         self.status_code = HTTPStatus.OK
         self.send_timeout = send_timeout
         self.ping_interval = ping_interval or self.DEFAULT_PING_INTERVAL
+        self.compressor = compressor
         self.body = None
 
         _headers: dict[str, str] = {}
@@ -174,8 +179,12 @@ class ServerSentEventResponse(Response):
         _headers.setdefault("Connection", "keep-alive")
         _headers.setdefault("X-Accel-Buffering", "no")
         _headers.setdefault("Transfer-Encoding", "chunked")
+        if compressor:
+            _headers["Content-Encoding"] = compressor.encoding
         self.media_type = "text/event-stream"
         self.init_headers(_headers)
+        if compressor:
+            add_vary_header(self.headers, "Accept-Encoding")
 
         self._send_lock = Lock()
 
@@ -218,7 +227,7 @@ class ServerSentEventResponse(Response):
                         "type": "http.response.body",
                         # always encode as utf-8 as per
                         # https://html.spec.whatwg.org/multipage/server-sent-events.html#sse-processing-model
-                        "body": b":\r\n\r\n",
+                        "body": self.compress(b":\r\n\r\n"),
                         "more_body": True,
                     }
                 )
@@ -246,7 +255,7 @@ class ServerSentEventResponse(Response):
                         await send(
                             {
                                 "type": "http.response.body",
-                                "body": self.encode_event(event),
+                                "body": self.compress(self.encode_event(event)),
                                 "more_body": True,
                             }
                         )
@@ -260,9 +269,25 @@ class ServerSentEventResponse(Response):
             with CancelScope(shield=True):
                 async with self._send_lock:
                     await send(
-                        {"type": "http.response.body", "body": b"", "more_body": False}
+                        {
+                            "type": "http.response.body",
+                            "body": self.compressor.finish()
+                            if self.compressor
+                            else b"",
+                            "more_body": False,
+                        }
                     )
 
+    def compress(self, body: bytes) -> bytes:
+        """Compresses the chunk of response's body if compressor is set
+
+        # Required arguments
+        `body`: the bytes to send to the client
+        """
+        if self.compressor:
+            return self.compressor.compress(body)
+        return body
+
     @staticmethod
     async def listen_for_disconnect(receive: Receive) -> None:
         """Listens for the client disconnect event and stops the streaming by exiting
@@ -335,6 +360,7 @@ class SSESubscriptionHandler(SubscriptionHandler):
         send_timeout: int | None = None,
         ping_interval: int | None = None,
         default_response_headers: dict[str, str] | None = None,
+        compression: ResponseCompression | None = None,
     ) -> None:
         """Initialize the SSE subscription handler.
 
@@ -348,10 +374,14 @@ class SSESubscriptionHandler(SubscriptionHandler):
 
         `default_response_headers`: a dictionary of additional headers to be
         sent with the SSE response.
+
+        `compression`: a `ResponseCompression` to use for compressing the
+        event stream. Events are flushed individually.
         """
         self.send_timeout = send_timeout
         self.ping_interval = ping_interval
         self.default_response_headers = default_response_headers
+        self.compression = compression
 
     def supports(self, request: Request, data: dict) -> bool:
         """Determine if this handler supports the given request.
@@ -409,6 +439,7 @@ class SSESubscriptionHandler(SubscriptionHandler):
             ping_interval=self.ping_interval,
             send_timeout=self.send_timeout,
             headers=self.default_response_headers,
+            compressor=create_stream_compressor(self.compression, request),
         )
 
     async def _sse_event_generator(
@@ -432,6 +463,14 @@ class SSESubscriptionHandler(SubscriptionHandler):
             # KEEP_ALIVE is handled by ServerSentEventResponse._ping()
 
 
+def add_vary_header(headers: MutableHeaders, value: str) -> None:
+    vary = headers.get("Vary")
+    if vary is None:
+        headers["Vary"] = value
+    elif value.lower() not in (item.strip().lower() for item in vary.split(",")):
+        headers["Vary"] = f"{vary}, {value}"
+
+
 class GraphQLHTTPSSEHandler(GraphQLHTTPHandler):
     """Extension to the default GraphQLHTTPHandler to also handle Server-Sent Events
     as per the GraphQL SSE Protocol specification. This handler only supports the
@@ -449,8 +488,11 @@ class GraphQLHTTPSSEHandler(GraphQLHTTPHandler):
         send_timeout: int | None = None,
         ping_interval: int | None = None,
         default_response_headers: dict[str, str] | None = None,
+        compression: ResponseCompression | None = None,
     ):
-        super().__init__(extensions, middleware, middleware_manager_class)
+        super().__init__(
+            extensions, middleware, middleware_manager_class, compression=compression
+        )
         self.send_timeout = send_timeout
         self.ping_interval = ping_interval
         self.default_response_headers = default_response_headers
@@ -495,6 +537,7 @@ class GraphQLHTTPSSEHandler(GraphQLHTTPHandler):
                 ping_interval=self.ping_interval,
                 send_timeout=self.send_timeout,
                 headers=self.default_response_headers,
+                compressor=create_stream_compressor(self.compression, request),
             )
         except (HttpError, TypeError, GraphQLError) as error:
             log_error(error, self.logger)
@@ -510,6 +553,7 @@ class GraphQLHTTPSSEHandler(GraphQLHTTPHandler):
                 ping_interval=self.ping_interval,
                 send_timeout=self.send_timeout,
                 headers=self.default_response_headers,
+                compressor=create_stream_compressor(self.compression, request),
             )
 
     async def get_query_from_sse_request(
@@ -607,3 +651,13 @@ class GraphQLHTTPSSEHandler(GraphQLHTTPHandler):
             event="next", result=ExecutionResult(errors=errors)
         )
         yield GraphQLServerSentEvent(event="complete")
+
+
+def create_stream_compressor(
+    compression: ResponseCompression | None, request: Request
+) -> StreamCompressor | None:
+    if compression:
+        return compression.create_stream_compressor(
+            request.headers.get("Accept-Encoding")
+        )
+    return None
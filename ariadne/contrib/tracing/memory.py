@@ -0,0 +1,316 @@
+import tracemalloc
+from collections.abc import Callable
+from functools import partial
+from random import random
+from threading import Lock
+from types import CodeType
+from typing import Any
+
+from graphql import FragmentDefinitionNode, GraphQLResolveInfo, OperationDefinitionNode
+
+from ...types import ContextValue, Extension, Resolver
+from .profiling import ProfilingRateLimit
+from .utils import get_operation_signature, get_signature_hash
+
+__all__ = [
+    "AllocationSite",
+    "MemoryProfilingExtension",
+    "MemoryStats",
+    "OperationMemory",
+    "memory_profiling_extension",
+]
+
+
+class AllocationSite:
+    """Line of code which allocated memory during the operation.
+
+    # Attributes
+
+    `filename`: a `str` with name of the file.
+
+    `lineno`: an `int` with number of the line.
+
+    `size`: an `int` with size of memory allocated by the line, in bytes,
+    and not released before the end of the operation.
+
+    `count`: an `int` with number of allocated memory blocks.
+
+    `field`: a `str` with name of field (eg. `Query.users`) which resolver
+    called this line, or `None` if it was called outside of resolvers.
+    """
+
+    __slots__ = ("count", "field", "filename", "lineno", "size")
+
+    def __init__(
+        self, filename: str, lineno: int, size: int, count: int, field: str | None
+    ) -> None:
+        self.filename = filename
+        self.lineno = lineno
+        self.size = size
+        self.count = count
+        self.field = field
+
+
+class OperationMemory:
+    """Memory allocations of operations with the same signature.
+
+    # Attributes
+
+    `signature`: a `str` with operation's signature.
+
+    `operation_name`: a `str` with name of the operation or `None`.
+
+    `profiles`: an `int` with number of profiled requests.
+
+    `max_peak`: an `int` with highest peak of memory allocated by single
+    request, in bytes.
+
+    `max_net`: an `int` with highest size of memory allocated by single
+    request and not released before its end, in bytes.
+
+    `sites`: a `list` of `AllocationSite` with top allocation sites of the
+    most recently profiled request.
+    """
+
+    __slots__ = (
+        "max_net",
+        "max_peak",
+        "operation_name",
+        "profiles",
+        "signature",
+        "sites",
+    )
+
+    def __init__(self, signature: str, operation_name: str | None) -> None:
+        self.signature = signature
+        self.operation_name = operation_name
+        self.profiles = 0
+        self.max_peak = 0
+        self.max_net = 0
+        self.sites: list[AllocationSite] = []
+
+
+class MemoryStats:
+    """Memory allocations of profiled operations, keyed by signature's hash.
+
+    Single instance should be shared by all requests handled by the process.
+    """
+
+    def __init__(self) -> None:
+        self._lock = Lock()
+        self._operations: dict[str, OperationMemory] = {}
+
+    def observe(
+        self,
+        signature: str,
+        operation_name: str | None,
+        peak: int,
+        net: int,
+        sites: list[AllocationSite],
+    ) -> None:
+        """Records memory allocations of profiled request.
+
+        # Required arguments
+
+        `signature`: a `str` with operation's signature.
+
+        `operation_name`: a `str` with name of the operation or `None`.
+
+        `peak`: an `int` with peak of allocated memory, in bytes.
+
+        `net`: an `int` with size of memory allocated and not released, in bytes.
+
+        `sites`: a `list` of `AllocationSite` with top allocation sites.
+        """
+        key = get_signature_hash(signature)[:16]
+        with self._lock:
+            operation = self._operations.get(key)
+            if operation is None:
+                operation = OperationMemory(signature, operation_name)
+                self._operations[key] = operation
+
+            operation.profiles += 1
+            operation.max_peak = max(peak, operation.max_peak)
+            operation.max_net = max(net, operation.max_net)
+            operation.sites = sites
+
+    def get_operations(self) -> dict[str, OperationMemory]:
+        """Returns a `dict` with `OperationMemory`, keyed by signature's hash."""
+        with self._lock:
+            return dict(self._operations)
+
+
+def get_resolver_code(resolver: Any) -> CodeType | None:
+    while isinstance(resolver, partial):
+        resolver = resolver.func
+    resolver = getattr(resolver, "__func__", resolver)
+    return getattr(resolver, "__code__", None)
+
+
+class MemoryProfilingExtension(Extension):
+    """Extension recording memory allocations of sampled operations.
+
+    Uses `tracemalloc` to measure peak and net memory allocated by 1 in
+    `sample_every` requests, and finds top allocation sites. Sites are
+    attributed to fields which resolvers called them. Results are recorded
+    in `stats` for operation's signature.
+
+    `tracemalloc` measures allocations of the whole process, so at most one
+    request is profiled at a time, within limits of `rate_limit`. Concurrent
+    requests may still affect results. Share `rate_limit` with
+    `ProfilingExtension` to never run both profilers for the same request.
+    """
+
+    def __init__(
+        self,
+        *,
+        stats: MemoryStats,
+        rate_limit: ProfilingRateLimit,
+        sample_every: int = 100,
+        top_sites: int = 10,
+        frames: int = 25,
+    ) -> None:
+        self._stats = stats
+        self._rate_limit = rate_limit
+        self._sample_every = sample_every
+        self._top_sites = top_sites
+        self._frames = frames
+
+        self._profiling = False
+        self._started_tracing = False
+        self._start_memory = 0
+        self._start_snapshot: tracemalloc.Snapshot | None = None
+        self._operation: OperationDefinitionNode | None = None
+        self._fragments: dict[str, FragmentDefinitionNode] = {}
+        self._resolvers: dict[str, list[tuple[int, int, str]]] = {}
+        self._traced_fields: set[str] = set()
+
+    def should_profile(self, context: ContextValue) -> bool:
+        """Returns `True` if request was selected for profiling."""
+        return random() * self._sample_every < 1
+
+    def request_started(self, context: ContextValue) -> None:
+        if not self.should_profile(context) or not self._rate_limit.acquire():
+            return
+
+        self._profiling = True
+        self._started_tracing = not tracemalloc.is_tracing()
+        if self._started_tracing:
+            tracemalloc.start(self._frames)
+        self._start_snapshot = tracemalloc.take_snapshot()
+        tracemalloc.reset_peak()
+        self._start_memory = tracemalloc.get_traced_memory()[0]
+
+    def request_finished(self, context: ContextValue) -> None:
+        if not self._profiling:
+            return
+
+        self._profiling = False
+        try:
+            current, peak = tracemalloc.get_traced_memory()
+            sites = self.get_allocation_sites()
+
+            if self._operation:
+                signature = get_operation_signature(self._operation, self._fragments)
+                operation_name = (
+                    self._operation.name.value if self._operation.name else None
+                )
+            else:
+                signature = ""  # Operation failed before execution
+                operation_name = None
+
+            self._stats.observe(
+                signature,
+                operation_name,
+                peak - self._start_memory,
+                current - self._start_memory,
+                sites,
+            )
+        finally:
+            if self._started_tracing:
+                tracemalloc.stop()
+            self._rate_limit.release()
+
+    def resolve(
+        self, next_: Resolver, obj: Any, info: GraphQLResolveInfo, **kwargs
+    ) -> Any:
+        if self._profiling:
+            if not self._operation:
+                self._operation = info.operation
+                self._fragments = info.fragments
+            self.trace_resolver(info)
+        return next_(obj, info, **kwargs)
+
+    def trace_resolver(self, info: GraphQLResolveInfo) -> None:
+        """Records location of field's resolver code for attribution."""
+        field_name = f"{info.parent_type.name}.{info.field_name}"
+        if field_name in self._traced_fields:
+            return
+
+        self._traced_fields.add(field_name)
+        field = info.parent_type.fields.get(info.field_name)
+        code = get_resolver_code(field.resolve if field else None)
+        if code:
+            last_line = max(
+                (line for _, _, line in code.co_lines() if line),
+                default=code.co_firstlineno,
+            )
+            self._resolvers.setdefault(code.co_filename, []).append(
+                (code.co_firstlineno, last_line, field_name)
+            )
+
+    def get_allocation_sites(self) -> list[AllocationSite]:
+        """Returns top sites of memory allocated during the request."""
+        if self._start_snapshot is None:
+            return []
+
+        snapshot = tracemalloc.take_snapshot().filter_traces(
+            [tracemalloc.Filter(False, tracemalloc.__file__)]
+        )
+
+        sites: list[AllocationSite] = []
+        for diff in snapshot.compare_to(self._start_snapshot, "traceback"):
+            if len(sites) >= self._top_sites:
+                break
+            if diff.size_diff <= 0:
+                continue
+
+            frame = diff.traceback[-1]
+            sites.append(
+                AllocationSite(
+                    frame.filename,
+                    frame.lineno,
+                    diff.size_diff,
+                    diff.count_diff,
+                    self.get_resolver_field(diff.traceback),
+                )
+            )
+        return sites
+
+    def get_resolver_field(self, traceback: tracemalloc.Traceback) -> str | None:
+        """Returns name of field which resolver is innermost in traceback."""
+        for frame in reversed(traceback):
+            for first_line, last_line, field_name in self._resolvers.get(
+                frame.filename, ()
+            ):
+                if first_line <= frame.lineno <= last_line:
+                    return field_name
+        return None
+
+
+def memory_profiling_extension(
+    stats: MemoryStats,
+    *,
+    rate_limit: ProfilingRateLimit | None = None,
+    sample_every: int = 100,
+    top_sites: int = 10,
+    frames: int = 25,
+) -> Callable[[], MemoryProfilingExtension]:
+    return partial(
+        MemoryProfilingExtension,
+        stats=stats,
+        rate_limit=rate_limit or ProfilingRateLimit(),
+        sample_every=sample_every,
+        top_sites=top_sites,
+        frames=frames,
+    )
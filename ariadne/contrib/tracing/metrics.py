@@ -0,0 +1,803 @@
+from bisect import bisect_left
+from collections.abc import Callable, Iterable, Sequence
+from functools import partial
+from threading import Lock, RLock, local
+from time import perf_counter_ns
+from typing import Any
+from weakref import finalize
+
+from graphql import GraphQLError, GraphQLResolveInfo
+from graphql.pyutils import is_awaitable
+
+from ...compression import ResponseCompression
+from ...concurrency import ConcurrencyLimits
+from ...introspection import IntrospectionCache
+from ...resolvers import is_default_resolver
+from ...types import ContextValue, Extension, Resolver
+from .memory import MemoryStats
+
+try:
+    from opentelemetry.metrics import (  # type: ignore[import-untyped]
+        CallbackOptions,
+        Meter,
+        Observation,
+        get_meter,
+    )
+except ImportError:
+    CallbackOptions = Meter = Observation = get_meter = None
+
+__all__ = [
+    "GraphQLMetrics",
+    "Histogram",
+    "MetricsExtension",
+    "PrometheusASGIApp",
+    "PrometheusWSGIApp",
+    "metrics_extension",
+]
+
+DEFAULT_BUCKETS = (
+    0.0001,
+    0.00025,
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+FieldKey = tuple[str, str]
+
+
+class Histogram:
+    """Histogram of durations with preallocated buckets.
+
+    # Attributes
+
+    `bounds`: a `tuple` of `int` with upper bounds of buckets in nanoseconds.
+
+    `counts`: a `list` of `int` with number of observations in every bucket.
+    Last item counts observations greater than the last bound.
+
+    `sum`: an `int` with total of observed durations in nanoseconds.
+
+    `count`: an `int` with number of observations.
+    """
+
+    __slots__ = ("bounds", "count", "counts", "sum")
+
+    def __init__(self, bounds: tuple[int, ...]) -> None:
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)
+        self.sum = 0
+        self.count = 0
+
+    def observe(self, duration: int) -> None:
+        """Records duration in nanoseconds."""
+        self.counts[bisect_left(self.bounds, duration)] += 1
+        self.sum += duration
+        self.count += 1
+
+    def merge(self, other: "Histogram") -> None:
+        """Adds observations from other histogram with same bounds."""
+        for i, count in enumerate(other.counts):
+            self.counts[i] += count
+        self.sum += other.sum
+        self.count += other.count
+
+
+class MetricsShard:
+    """Metrics recorded by single thread.
+
+    Every thread writes only to its own shard, so recording metrics doesn't
+    need locks. Shards of finished threads are merged into single shard.
+    """
+
+    __slots__ = (
+        "field_errors",
+        "fields",
+        "phases",
+        "request_errors",
+        "requests",
+    )
+
+    def __init__(self) -> None:
+        self.fields: dict[FieldKey, Histogram] = {}
+        self.field_errors: dict[FieldKey, int] = {}
+        self.phases: dict[str, Histogram] = {}
+        self.requests = 0
+        self.request_errors = 0
+
+    def merge(self, other: "MetricsShard", bounds: tuple[int, ...]) -> None:
+        """Adds metrics from other shard with histograms with same bounds."""
+        merge_histograms(self.fields, other.fields, bounds)
+        merge_histograms(self.phases, other.phases, bounds)
+        for key, count in other.field_errors.items():
+            self.field_errors[key] = self.field_errors.get(key, 0) + count
+        self.requests += other.requests
+        self.request_errors += other.request_errors
+
+
+def merge_histograms(
+    target: dict[Any, Histogram],
+    source: dict[Any, Histogram],
+    bounds: tuple[int, ...],
+) -> None:
+    # Copy items because other threads may add keys to their shards
+    for key, histogram in list(source.items()):
+        if key not in target:
+            target[key] = Histogram(bounds)
+        target[key].merge(histogram)
+
+
+class ShardOwner:
+    """Thread-local reference to thread's shard.
+
+    Is released when its thread finishes, which retires the shard.
+    """
+
+    __slots__ = ("__weakref__", "shard")
+
+    def __init__(self, shard: MetricsShard) -> None:
+        self.shard = shard
+
+
+class GraphQLMetrics:
+    """Registry of GraphQL server's metrics.
+
+    Records latency histograms of resolvers and request phases, and numbers
+    of requests and errors. Metrics are recorded to per-thread shards which
+    are merged when they are read.
+
+    Single instance should be shared by all requests handled by the process.
+    """
+
+    def __init__(
+        self,
+        *,
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+        prefix: str = "ariadne",
+    ) -> None:
+        """Initializes the metrics registry.
+
+        # Optional arguments
+
+        `buckets`: a sequence of `float` with upper bounds of histogram buckets
+        in seconds. Defaults to buckets from 100 microseconds to 10 seconds.
+
+        `prefix`: a `str` with prefix for names of exported metrics. Defaults
+        to `ariadne`.
+        """
+        self.buckets = tuple(sorted(buckets))
+        self.bounds = tuple(int(bucket * 1_000_000_000) for bucket in self.buckets)
+        self.prefix = prefix
+
+        self._local = local()
+        self._retired_shard = MetricsShard()
+        self._shards: list[MetricsShard] = [self._retired_shard]
+        # Reentrant because shards can be retired by garbage collector
+        self._shards_lock = RLock()
+        self._introspection_caches: list[IntrospectionCache] = []
+        self._compressions: list[ResponseCompression] = []
+        self._concurrency_limits: list[ConcurrencyLimits] = []
+        self._memory_stats: list[MemoryStats] = []
+        self._stalls: dict[FieldKey, Histogram] = {}
+        self._stalls_lock = Lock()
+
+    def get_shard(self) -> MetricsShard:
+        """Returns metrics shard of current thread."""
+        try:
+            return self._local.owner.shard
+        except AttributeError:
+            shard = MetricsShard()
+            with self._shards_lock:
+                self._shards.append(shard)
+            owner = ShardOwner(shard)
+            finalize(owner, self._retire_shard, shard)
+            self._local.owner = owner
+            return shard
+
+    def _retire_shard(self, shard: MetricsShard) -> None:
+        # Thread finished, so it doesn't write to the shard anymore
+        with self._shards_lock:
+            self._retired_shard.merge(shard, self.bounds)
+            self._shards.remove(shard)
+
+    def observe_field(self, key: FieldKey, duration: int, error: bool) -> None:
+        """Records duration of field's resolver.
+
+        # Required arguments
+
+        `key`: a `tuple` with names of parent type and field.
+
+        `duration`: an `int` with duration in nanoseconds.
+
+        `error`: a `bool` with `True` if resolver raised an error.
+        """
+        shard = self.get_shard()
+        histogram = shard.fields.get(key)
+        if histogram is None:
+            histogram = shard.fields[key] = Histogram(self.bounds)
+        histogram.observe(duration)
+        if error:
+            shard.field_errors[key] = shard.field_errors.get(key, 0) + 1
+
+    def observe_phase(self, phase: str, duration: int) -> None:
+        """Records duration of request's phase.
+
+        # Required arguments
+
+        `phase`: a `str` with name of phase, eg. `request` or `parsing`.
+
+        `duration`: an `int` with duration in nanoseconds.
+        """
+        shard = self.get_shard()
+        histogram = shard.phases.get(phase)
+        if histogram is None:
+            histogram = shard.phases[phase] = Histogram(self.bounds)
+        histogram.observe(duration)
+
+    def observe_request(self, duration: int, errors: int) -> None:
+        """Records finished GraphQL request.
+
+        # Required arguments
+
+        `duration`: an `int` with duration of request in nanoseconds.
+
+        `errors`: an `int` with number of errors in request's result.
+        """
+        self.observe_phase("request", duration)
+        shard = self.get_shard()
+        shard.requests += 1
+        if errors:
+            shard.request_errors += 1
+
+    def observe_event_loop_stall(self, key: FieldKey | None, duration: int) -> None:
+        """Records duration of event loop stall.
+
+        # Required arguments
+
+        `key`: a `tuple` with names of parent type and field which resolver
+        blocked the event loop, or `None` if it's unknown.
+
+        `duration`: an `int` with duration in nanoseconds.
+        """
+        with self._stalls_lock:
+            key = key or ("", "")
+            histogram = self._stalls.get(key)
+            if histogram is None:
+                histogram = self._stalls[key] = Histogram(self.bounds)
+            histogram.observe(duration)
+
+    def track_introspection_cache(self, cache: IntrospectionCache | None) -> None:
+        """Includes hits and misses of introspection cache in metrics.
+
+        # Required arguments
+
+        `cache`: an `IntrospectionCache` used by the server, eg.
+        `GraphQLHTTPHandler.introspection_cache`. `None` is ignored.
+        """
+        if cache is not None:
+            self._introspection_caches.append(cache)
+
+    def track_compression(self, compression: ResponseCompression | None) -> None:
+        """Includes stats of response compression in metrics.
+
+        # Required arguments
+
+        `compression`: a `ResponseCompression` used by the server. `None`
+        is ignored.
+        """
+        if compression is not None:
+            self._compressions.append(compression)
+
+    def track_concurrency(self, limits: ConcurrencyLimits | None) -> None:
+        """Includes usage of concurrency limits in metrics.
+
+        # Required arguments
+
+        `limits`: a `ConcurrencyLimits` used by the server. `None` is ignored.
+        """
+        if limits is not None:
+            self._concurrency_limits.append(limits)
+
+    def track_memory(self, stats: MemoryStats | None) -> None:
+        """Includes memory allocations of profiled operations in metrics.
+
+        # Required arguments
+
+        `stats`: a `MemoryStats` used by `MemoryProfilingExtension`. `None`
+        is ignored.
+        """
+        if stats is not None:
+            self._memory_stats.append(stats)
+
+    def get_field_histograms(self) -> dict[FieldKey, Histogram]:
+        """Returns latency histograms of fields merged from all threads."""
+        with self._shards_lock:
+            return self._merge_histograms(shard.fields for shard in self._shards)
+
+    def get_phase_histograms(self) -> dict[str, Histogram]:
+        """Returns latency histograms of request phases merged from all threads."""
+        with self._shards_lock:
+            return self._merge_histograms(shard.phases for shard in self._shards)
+
+    def get_field_errors(self) -> dict[FieldKey, int]:
+        """Returns numbers of errors raised by fields' resolvers."""
+        errors: dict[FieldKey, int] = {}
+        with self._shards_lock:
+            for shard in self._shards:
+                for key, count in list(shard.field_errors.items()):
+                    errors[key] = errors.get(key, 0) + count
+        return errors
+
+    def get_event_loop_stalls(self) -> dict[FieldKey, Histogram]:
+        """Returns histograms of event loop stalls, keyed by blocking field.
+
+        Stalls which happened outside of resolvers have `("", "")` key.
+        """
+        with self._stalls_lock:
+            return self._merge_histograms([self._stalls])
+
+    def get_requests(self) -> tuple[int, int]:
+        """Returns a `tuple` with numbers of all requests and requests with errors."""
+        with self._shards_lock:
+            return (
+                sum(shard.requests for shard in self._shards),
+                sum(shard.request_errors for shard in self._shards),
+            )
+
+    def get_cache_stats(self) -> dict[str, tuple[int, int]]:
+        """Returns a `dict` with `(hits, misses)` tuples of tracked caches."""
+        stats: dict[str, tuple[int, int]] = {}
+        if self._introspection_caches:
+            stats["introspection"] = (
+                sum(cache.hits for cache in self._introspection_caches),
+                sum(cache.misses for cache in self._introspection_caches),
+            )
+        return stats
+
+    def _merge_histograms(self, sources: Iterable[dict[Any, Histogram]]) -> dict:
+        merged: dict[Any, Histogram] = {}
+        for source in sources:
+            merge_histograms(merged, source, self.bounds)
+        return merged
+
+    def render_prometheus(self) -> str:
+        """Returns metrics in Prometheus text exposition format."""
+        lines: list[str] = []
+        prefix = self.prefix
+
+        name = f"{prefix}_request_phase_duration_seconds"
+        lines.append(f"# HELP {name} Duration of GraphQL request phases.")
+        lines.append(f"# TYPE {name} histogram")
+        for phase, histogram in sorted(self.get_phase_histograms().items()):
+            self._render_histogram(lines, name, f'phase="{phase}"', histogram)
+
+        name = f"{prefix}_field_duration_seconds"
+        lines.append(f"# HELP {name} Duration of GraphQL field resolvers.")
+        lines.append(f"# TYPE {name} histogram")
+        for (type_name, field), histogram in sorted(
+            self.get_field_histograms().items()
+        ):
+            labels = f'type="{type_name}",field="{field}"'
+            self._render_histogram(lines, name, labels, histogram)
+
+        name = f"{prefix}_field_errors_total"
+        lines.append(f"# HELP {name} Errors raised by GraphQL field resolvers.")
+        lines.append(f"# TYPE {name} counter")
+        for (type_name, field), count in sorted(self.get_field_errors().items()):
+            lines.append(f'{name}{{type="{type_name}",field="{field}"}} {count}')
+
+        requests, request_errors = self.get_requests()
+        name = f"{prefix}_requests_total"
+        lines.append(f"# HELP {name} Executed GraphQL requests.")
+        lines.append(f"# TYPE {name} counter")
+        lines.append(f"{name} {requests}")
+        name = f"{prefix}_request_errors_total"
+        lines.append(f"# HELP {name} GraphQL requests with errors in result.")
+        lines.append(f"# TYPE {name} counter")
+        lines.append(f"{name} {request_errors}")
+
+        cache_stats = self.get_cache_stats()
+        if cache_stats:
+            for metric, index in (("hits", 0), ("misses", 1)):
+                name = f"{prefix}_cache_{metric}_total"
+                lines.append(f"# HELP {name} Cache {metric}.")
+                lines.append(f"# TYPE {name} counter")
+                for cache, stats in sorted(cache_stats.items()):
+                    lines.append(f'{name}{{cache="{cache}"}} {stats[index]}')
+
+        if self._compressions:
+            self._render_compression(lines)
+
+        if self._concurrency_limits:
+            self._render_concurrency(lines)
+
+        if self._memory_stats:
+            self._render_memory(lines)
+
+        stalls = self.get_event_loop_stalls()
+        if stalls:
+            name = f"{prefix}_event_loop_stall_duration_seconds"
+            lines.append(f"# HELP {name} Duration of event loop stalls.")
+            lines.append(f"# TYPE {name} histogram")
+            for (type_name, field), histogram in sorted(stalls.items()):
+                labels = f'type="{type_name}",field="{field}"'
+                self._render_histogram(lines, name, labels, histogram)
+
+        return "\n".join(lines) + "\n"
+
+    def _render_histogram(
+        self, lines: list[str], name: str, labels: str, histogram: Histogram
+    ) -> None:
+        cumulative = 0
+        for bucket, count in zip(self.buckets, histogram.counts, strict=False):
+            cumulative += count
+            lines.append(f'{name}_bucket{{{labels},le="{bucket}"}} {cumulative}')
+        lines.append(f'{name}_bucket{{{labels},le="+Inf"}} {histogram.count}')
+        lines.append(f"{name}_sum{{{labels}}} {histogram.sum / 1_000_000_000}")
+        lines.append(f"{name}_count{{{labels}}} {histogram.count}")
+
+    def _render_compression(self, lines: list[str]) -> None:
+        stats: dict[tuple[str, int], list[float]] = {}
+        for compression in self._compressions:
+            for key, value in list(compression.stats.items()):
+                totals = stats.setdefault(key, [0, 0, 0.0])
+                totals[0] += value.input_size
+                totals[1] += value.output_size
+                totals[2] += value.cpu_time
+
+        for metric, index, description in (
+            ("input_bytes", 0, "Size of response bodies before compression."),
+            ("output_bytes", 1, "Size of compressed response bodies."),
+            ("cpu_seconds", 2, "CPU time spent compressing responses."),
+        ):
+            name = f"{self.prefix}_compression_{metric}_total"
+            lines.append(f"# HELP {name} {description}")
+            lines.append(f"# TYPE {name} counter")
+            for (encoding, level), totals in sorted(stats.items()):
+                labels = f'encoding="{encoding}",level="{level}"'
+                lines.append(f"{name}{{{labels}}} {totals[index]}")
+
+    def _render_concurrency(self, lines: list[str]) -> None:
+        stats: dict[str, list[float]] = {}
+        for limits in self._concurrency_limits:
+            for limit_name, value in list(limits.stats.items()):
+                totals = stats.setdefault(limit_name, [0, 0, 0, 0, 0, 0.0])
+                totals[0] += value.limit
+                totals[1] += value.active
+                totals[2] += value.waiting
+                totals[3] = max(totals[3], value.max_waiting)
+                totals[4] += value.waited
+                totals[5] += value.wait_time
+
+        for metric, index, metric_type, description in (
+            ("limit", 0, "gauge", "Maximum number of resolvers running at once."),
+            ("active", 1, "gauge", "Resolvers running now."),
+            ("waiting", 2, "gauge", "Resolvers waiting for the limit now."),
+            (
+                "max_waiting",
+                3,
+                "gauge",
+                "Highest number of resolvers waiting for the limit at once.",
+            ),
+            ("waited_total", 4, "counter", "Resolvers which waited for the limit."),
+            (
+                "wait_seconds_total",
+                5,
+                "counter",
+                "Time resolvers waited for the limit.",
+            ),
+        ):
+            name = f"{self.prefix}_concurrency_{metric}"
+            lines.append(f"# HELP {name} {description}")
+            lines.append(f"# TYPE {name} {metric_type}")
+            for limit_name, totals in sorted(stats.items()):
+                lines.append(f'{name}{{limit="{limit_name}"}} {totals[index]}')
+
+    def _render_memory(self, lines: list[str]) -> None:
+        operations = {}
+        for stats in self._memory_stats:
+            operations.update(stats.get_operations())
+
+        for metric, attr, metric_type, description in (
+            ("profiles_total", "profiles", "counter", "Profiled operations."),
+            (
+                "peak_bytes",
+                "max_peak",
+                "gauge",
+                "Highest peak of memory allocated by operation.",
+            ),
+            (
+                "net_bytes",
+                "max_net",
+                "gauge",
+                "Highest size of memory allocated and not released by operation.",
+            ),
+        ):
+            name = f"{self.prefix}_operation_memory_{metric}"
+            lines.append(f"# HELP {name} {description}")
+            lines.append(f"# TYPE {name} {metric_type}")
+            for key, operation in sorted(operations.items()):
+                labels = (
+                    f'signature="{key}",operation="{operation.operation_name or ""}"'
+                )
+                lines.append(f"{name}{{{labels}}} {getattr(operation, attr)}")
+
+    def export_to_opentelemetry(self, meter: "Meter | None" = None) -> None:
+        """Registers observable OpenTelemetry instruments reporting metrics.
+
+        Field and request phase durations are reported as sums and counts of
+        observations, because OpenTelemetry has no observable histograms.
+
+        Requires the `opentelemetry-api` package.
+
+        # Optional arguments
+
+        `meter`: a `Meter` to create instruments with. Defaults to meter
+        named `ariadne` from global meter provider.
+        """
+        if get_meter is None:
+            raise NotImplementedError(
+                "OpenTelemetry metrics export requires 'opentelemetry-api' library."
+            )
+
+        if meter is None:
+            meter = get_meter("ariadne")
+
+        prefix = self.prefix
+        meter.create_observable_counter(
+            f"{prefix}.field.duration",
+            callbacks=[self._observe_field_durations],
+            unit="s",
+            description="Total duration of GraphQL field resolvers.",
+        )
+        meter.create_observable_counter(
+            f"{prefix}.field.calls",
+            callbacks=[self._observe_field_calls],
+            description="Calls of GraphQL field resolvers.",
+        )
+        meter.create_observable_counter(
+            f"{prefix}.field.errors",
+            callbacks=[self._observe_field_errors],
+            description="Errors raised by GraphQL field resolvers.",
+        )
+        meter.create_observable_counter(
+            f"{prefix}.request.phase.duration",
+            callbacks=[self._observe_phase_durations],
+            unit="s",
+            description="Total duration of GraphQL request phases.",
+        )
+        meter.create_observable_counter(
+            f"{prefix}.requests",
+            callbacks=[self._observe_requests],
+            description="Executed GraphQL requests.",
+        )
+        meter.create_observable_counter(
+            f"{prefix}.cache.hits",
+            callbacks=[partial(self._observe_cache, 0)],
+            description="Cache hits.",
+        )
+        meter.create_observable_counter(
+            f"{prefix}.cache.misses",
+            callbacks=[partial(self._observe_cache, 1)],
+            description="Cache misses.",
+        )
+
+    def _observe_field_durations(self, _options: "CallbackOptions") -> list:
+        return [
+            create_observation(
+                histogram.sum / 1_000_000_000,
+                {"graphql.type": type_name, "graphql.field": field},
+            )
+            for (type_name, field), histogram in self.get_field_histograms().items()
+        ]
+
+    def _observe_field_calls(self, _options: "CallbackOptions") -> list:
+        return [
+            create_observation(
+                histogram.count, {"graphql.type": type_name, "graphql.field": field}
+            )
+            for (type_name, field), histogram in self.get_field_histograms().items()
+        ]
+
+    def _observe_field_errors(self, _options: "CallbackOptions") -> list:
+        return [
+            create_observation(
+                count, {"graphql.type": type_name, "graphql.field": field}
+            )
+            for (type_name, field), count in self.get_field_errors().items()
+        ]
+
+    def _observe_phase_durations(self, _options: "CallbackOptions") -> list:
+        return [
+            create_observation(histogram.sum / 1_000_000_000, {"graphql.phase": phase})
+            for phase, histogram in self.get_phase_histograms().items()
+        ]
+
+    def _observe_requests(self, _options: "CallbackOptions") -> list:
+        requests, request_errors = self.get_requests()
+        return [
+            create_observation(requests - request_errors, {"graphql.errors": False}),
+            create_observation(request_errors, {"graphql.errors": True}),
+        ]
+
+    def _observe_cache(self, index: int, _options: "CallbackOptions") -> list:
+        return [
+            create_observation(stats[index], {"cache": cache})
+            for cache, stats in self.get_cache_stats().items()
+        ]
+
+
+def create_observation(value: float, attributes: dict[str, Any]) -> Any:
+    if Observation is None:
+        raise NotImplementedError(
+            "OpenTelemetry metrics export requires 'opentelemetry-api' library."
+        )
+    return Observation(value, attributes)
+
+
+class MetricsExtension(Extension):
+    """Extension recording request and resolver metrics in `GraphQLMetrics`.
+
+    Records durations of `request`, `parsing`, `validation`, `execution` and
+    `serialization` phases. Resolvers are timed with `perf_counter_ns`.
+    Default resolvers and introspection fields are not timed unless
+    `trace_default_resolver` is set.
+    """
+
+    def __init__(
+        self, *, metrics: GraphQLMetrics, trace_default_resolver: bool = False
+    ) -> None:
+        self._metrics = metrics
+        self._trace_default_resolver = trace_default_resolver
+        self._start = 0
+        self._phase_start = 0
+        self._errors = 0
+
+    def request_started(self, context: ContextValue) -> None:
+        self._start = perf_counter_ns()
+
+    def request_finished(self, context: ContextValue) -> None:
+        self._metrics.observe_request(perf_counter_ns() - self._start, self._errors)
+
+    def has_errors(self, errors: list[GraphQLError], context: ContextValue) -> None:
+        self._errors += len(errors)
+
+    def parsing_started(self, context: ContextValue) -> None:
+        self._phase_start = perf_counter_ns()
+
+    def parsing_finished(self, context: ContextValue) -> None:
+        self._metrics.observe_phase("parsing", perf_counter_ns() - self._phase_start)
+
+    def validation_started(self, context: ContextValue) -> None:
+        self._phase_start = perf_counter_ns()
+
+    def validation_finished(self, context: ContextValue) -> None:
+        self._metrics.observe_phase("validation", perf_counter_ns() - self._phase_start)
+
+    def execution_started(self, context: ContextValue) -> None:
+        self._phase_start = perf_counter_ns()
+
+    def execution_finished(self, context: ContextValue) -> None:
+        self._metrics.observe_phase("execution", perf_counter_ns() - self._phase_start)
+
+    def serialization_started(self, context: ContextValue) -> None:
+        self._phase_start = perf_counter_ns()
+
+    def serialization_finished(self, context: ContextValue) -> None:
+        self._metrics.observe_phase(
+            "serialization", perf_counter_ns() - self._phase_start
+        )
+
+    def resolve(
+        self, next_: Resolver, obj: Any, info: GraphQLResolveInfo, **kwargs
+    ) -> Any:
+        if not self.should_observe(info):
+            return next_(obj, info, **kwargs)
+
+        key = (info.parent_type.name, info.field_name)
+        start = perf_counter_ns()
+        try:
+            result = next_(obj, info, **kwargs)
+        except Exception:
+            self._metrics.observe_field(key, perf_counter_ns() - start, True)
+            raise
+
+        if is_awaitable(result):
+            return self.resolve_async(key, start, result)
+
+        self._metrics.observe_field(key, perf_counter_ns() - start, False)
+        return result
+
+    async def resolve_async(self, key: FieldKey, start: int, result: Any) -> Any:
+        try:
+            value = await result
+        except Exception:
+            self._metrics.observe_field(key, perf_counter_ns() - start, True)
+            raise
+
+        self._metrics.observe_field(key, perf_counter_ns() - start, False)
+        return value
+
+    def should_observe(self, info: GraphQLResolveInfo) -> bool:
+        parent_type = info.parent_type
+        if parent_type.name.startswith("__"):
+            return False
+
+        field = parent_type.fields.get(info.field_name)
+        if field is None:
+            return False  # __typename, __schema and __type
+
+        return self._trace_default_resolver or not is_default_resolver(field.resolve)
+
+
+def metrics_extension(
+    metrics: GraphQLMetrics, *, trace_default_resolver: bool = False
+) -> Callable[[], MetricsExtension]:
+    return partial(
+        MetricsExtension,
+        metrics=metrics,
+        trace_default_resolver=trace_default_resolver,
+    )
+
+
+class PrometheusASGIApp:
+    """ASGI application serving metrics in Prometheus text format.
+
+    Can be mounted next to the ASGI `GraphQL` application, eg. using
+    Starlette's `Mount`.
+    """
+
+    def __init__(self, metrics: GraphQLMetrics) -> None:
+        self.metrics = metrics
+
+    async def __call__(self, scope: dict, receive: Callable, send: Callable) -> None:
+        if scope["type"] != "http":
+            raise ValueError("Prometheus metrics are only served over HTTP.")
+
+        body = self.metrics.render_prometheus().encode("utf-8")
+        await send(
+            {
+                "type": "http.response.start",
+                "status": 200,
+                "headers": [
+                    (b"content-type", PROMETHEUS_CONTENT_TYPE.encode("latin-1")),
+                    (b"content-length", str(len(body)).encode("latin-1")),
+                ],
+            }
+        )
+        await send({"type": "http.response.body", "body": body})
+
+
+class PrometheusWSGIApp:
+    """WSGI application serving metrics in Prometheus text format.
+
+    Can be mounted next to the WSGI `GraphQL` application, eg. using
+    Werkzeug's `DispatcherMiddleware`.
+    """
+
+    def __init__(self, metrics: GraphQLMetrics) -> None:
+        self.metrics = metrics
+
+    def __call__(self, environ: dict, start_response: Callable) -> list[bytes]:
+        body = self.metrics.render_prometheus().encode("utf-8")
+        start_response(
+            "200 OK",
+            [
+                ("Content-Type", PROMETHEUS_CONTENT_TYPE),
+                ("Content-Length", str(len(body))),
+            ],
+        )
+        return [body]
@@ -1,33 +1,102 @@
 from collections.abc import Callable
 from functools import partial
 from inspect import iscoroutinefunction
+from random import random
+from time import perf_counter_ns, time_ns
 from typing import Any
 
-from graphql import GraphQLResolveInfo
+from graphql import GraphQLError, GraphQLResolveInfo
 from graphql.pyutils import is_awaitable
 from opentelemetry.trace import (  # type: ignore[import-untyped]
     Context,
     Span,
+    Status,
+    StatusCode,
     Tracer,
     get_tracer,
     set_span_in_context,
 )
 
 from ...types import ContextValue, Extension, Resolver
-from .utils import copy_args_for_tracing, format_path, should_trace
+from .utils import (
+    copy_args_for_tracing,
+    format_aggregated_path,
+    format_path,
+    is_traced_field,
+)
 
 ArgFilter = Callable[[dict[str, Any], GraphQLResolveInfo], dict[str, Any]]
 RootSpanName = str | Callable[[ContextValue], str]
+Sampler = float | Callable[[ContextValue], bool]
 
 DEFAULT_OPERATION_NAME = "GraphQL Operation"
 
 
+class FieldRecord:
+    """Timing of resolver recorded for tail sampling."""
+
+    __slots__ = ("end", "error", "info", "kwargs", "start")
+
+    def __init__(self, info: GraphQLResolveInfo, kwargs: dict, start: int) -> None:
+        self.info = info
+        self.kwargs = kwargs
+        self.start = start
+        self.end = start
+        self.error: BaseException | None = None
+
+
+class FieldAggregate:
+    """Timings of resolver called for many items of a list."""
+
+    __slots__ = (
+        "count",
+        "end",
+        "error",
+        "info",
+        "max_duration",
+        "min_duration",
+        "start",
+        "total_duration",
+    )
+
+    def __init__(self, info: GraphQLResolveInfo, start: int) -> None:
+        self.info = info
+        self.start = start
+        self.end = start
+        self.count = 0
+        self.min_duration = 0
+        self.max_duration = 0
+        self.total_duration = 0
+        self.error: BaseException | None = None
+
+    def observe(self, start: int, end: int, error: BaseException | None) -> None:
+        duration = end - start
+        if not self.count or duration < self.min_duration:
+            self.min_duration = duration
+        self.max_duration = max(duration, self.max_duration)
+        self.total_duration += duration
+        self.count += 1
+        self.end = max(end, self.end)
+        if error and not self.error:
+            self.error = error
+
+
 class OpenTelemetryExtension(Extension):
     _arg_filter: ArgFilter | None
     _root_context: Context | None
     _root_span: Span
     _root_span_name: RootSpanName | None
     _tracer: Tracer
+    _sampler: Sampler | None
+    _tail_sampling: bool
+    _latency_threshold: int | None
+    _sampled: bool
+    _has_errors: bool
+    _records: list[FieldRecord]
+    _aggregate_lists: bool
+    _aggregates: dict[str, FieldAggregate]
+    _start_time: int
+    _start_counter: int
 
     def __init__(
         self,
@@ -36,6 +105,10 @@ class OpenTelemetryExtension(Extension):
         arg_filter: ArgFilter | None = None,
         root_context: Context | None = None,
         root_span_name: RootSpanName | None = None,
+        sampler: Sampler | None = None,
+        tail_sampling: bool = False,
+        latency_threshold: float | None = None,
+        aggregate_lists: bool = False,
     ) -> None:
         if tracer:
             self._tracer = tracer
@@ -45,52 +118,102 @@ class OpenTelemetryExtension(Extension):
         self._arg_filter = arg_filter
         self._root_context = root_context
         self._root_span_name = root_span_name
+        self._sampler = sampler
+        self._tail_sampling = tail_sampling or latency_threshold is not None
+        if latency_threshold is None:
+            self._latency_threshold = None
+        else:
+            self._latency_threshold = int(latency_threshold * 1_000_000_000)
+
+        self._sampled = True
+        self._has_errors = False
+        self._records = []
+        self._aggregate_lists = aggregate_lists
+        self._aggregates = {}
 
     def request_started(self, context: ContextValue):
-        if self._root_span_name:
-            if callable(self._root_span_name):
-                root_span_name = self._root_span_name(context)  # ty: ignore
-            else:
-                root_span_name = self._root_span_name
-        else:
-            root_span_name = DEFAULT_OPERATION_NAME
+        self._sampled = self.should_sample(context)
+        if not self._sampled:
+            return
 
-        span_context: Context | None = None
-        if self._root_context:
-            span_context = self._root_context
+        self._start_time = time_ns()
+        self._start_counter = perf_counter_ns()
+        if self._tail_sampling:
+            return
 
-        root_span = self._tracer.start_span(root_span_name, context=span_context)
+        root_span = self._tracer.start_span(
+            self.get_root_span_name(context), context=self._root_context
+        )
         root_span.set_attribute("component", "GraphQL")
         self._root_span = root_span
 
     def request_finished(self, context: ContextValue):
+        if not self._sampled:
+            return
+
+        if self._tail_sampling:
+            end = perf_counter_ns()
+            if self.should_keep_trace(end - self._start_counter):
+                self.export_records(context, end)
+            self._records = []
+            self._aggregates = {}
+            return
+
+        if self._aggregates:
+            self.export_aggregates(set_span_in_context(self._root_span))
+            self._aggregates = {}
         self._root_span.end()
 
+    def has_errors(self, errors: list[GraphQLError], context: ContextValue) -> None:
+        self._has_errors = True
+
+    def should_sample(self, context: ContextValue) -> bool:
+        """Returns `True` if request should be traced (head sampling)."""
+        if self._sampler is None:
+            return True
+        if callable(self._sampler):
+            return bool(self._sampler(context))
+        return random() < self._sampler
+
+    def should_keep_trace(self, duration: int) -> bool:
+        """Returns `True` if buffered trace should be exported (tail sampling).
+
+        Traces of requests with errors, or which took longer than latency
+        threshold, are kept.
+        """
+        if self._has_errors:
+            return True
+        return self._latency_threshold is not None and (
+            duration >= self._latency_threshold
+        )
+
+    def get_root_span_name(self, context: ContextValue) -> str:
+        if self._root_span_name:
+            if callable(self._root_span_name):
+                return self._root_span_name(context)  # ty: ignore
+            return self._root_span_name
+        return DEFAULT_OPERATION_NAME
+
     def resolve(
         self, next_: Resolver, obj: Any, info: GraphQLResolveInfo, **kwargs
     ) -> Any:
-        if not should_trace(info):
+        if not self._sampled or not is_traced_field(info):
             return next_(obj, info, **kwargs)
 
-        graphql_path = ".".join(map(str, format_path(info.path)))
+        if self._aggregate_lists:
+            aggregated_path = format_aggregated_path(info.path)
+            if aggregated_path is not None:
+                return self.resolve_aggregated(
+                    aggregated_path, next_, obj, info, **kwargs
+                )
+
+        if self._tail_sampling:
+            return self.resolve_recorded(next_, obj, info, **kwargs)
 
         with self._tracer.start_as_current_span(
             info.field_name, context=set_span_in_context(self._root_span)
         ) as span:
-            span.set_attribute("component", "GraphQL")
-
-            if info.operation.name:
-                span.set_attribute("graphql.operation.name", info.operation.name.value)
-            else:
-                span.set_attribute("graphql.operation.name", DEFAULT_OPERATION_NAME)
-
-            span.set_attribute("graphql.parentType", info.parent_type.name)
-            span.set_attribute("graphql.path", graphql_path)
-
-            if kwargs:
-                filtered_kwargs = self.filter_resolver_args(kwargs, info)
-                for key, value in filtered_kwargs.items():
-                    span.set_attribute(f"graphql.arg[{key}]", value)
+            self.set_field_span_attributes(span, info, kwargs)
 
             if iscoroutinefunction(next_):
                 return self.resolve_async(span, next_, obj, info, **kwargs)
@@ -131,6 +254,141 @@ class OpenTelemetryExtension(Extension):
 
             return result
 
+    def resolve_recorded(
+        self, next_: Resolver, obj: Any, info: GraphQLResolveInfo, **kwargs
+    ) -> Any:
+        record = FieldRecord(info, kwargs, perf_counter_ns())
+        self._records.append(record)
+        try:
+            result = next_(obj, info, **kwargs)
+        except Exception as error:
+            record.end = perf_counter_ns()
+            record.error = error
+            raise
+
+        if is_awaitable(result):
+
+            async def await_recorded_result():
+                try:
+                    return await result
+                except Exception as error:
+                    record.error = error
+                    raise
+                finally:
+                    record.end = perf_counter_ns()
+
+            return await_recorded_result()
+
+        record.end = perf_counter_ns()
+        return result
+
+    def resolve_aggregated(
+        self,
+        aggregated_path: str,
+        next_: Resolver,
+        obj: Any,
+        info: GraphQLResolveInfo,
+        **kwargs,
+    ) -> Any:
+        start = perf_counter_ns()
+        aggregate = self._aggregates.get(aggregated_path)
+        if aggregate is None:
+            aggregate = FieldAggregate(info, start)
+            self._aggregates[aggregated_path] = aggregate
+
+        try:
+            result = next_(obj, info, **kwargs)
+        except Exception as error:
+            aggregate.observe(start, perf_counter_ns(), error)
+            raise
+
+        if is_awaitable(result):
+
+            async def await_aggregated_result():
+                try:
+                    value = await result
+                except Exception as error:
+                    aggregate.observe(start, perf_counter_ns(), error)
+                    raise
+                aggregate.observe(start, perf_counter_ns(), None)
+                return value
+
+            return await_aggregated_result()
+
+        aggregate.observe(start, perf_counter_ns(), None)
+        return result
+
+    def export_records(self, context: ContextValue, end: int) -> None:
+        """Creates spans for request and its resolvers from buffered records."""
+        root_span = self._tracer.start_span(
+            self.get_root_span_name(context),
+            context=self._root_context,
+            start_time=self._start_time,
+        )
+        root_span.set_attribute("component", "GraphQL")
+        root_context = set_span_in_context(root_span)
+
+        for record in self._records:
+            span = self._tracer.start_span(
+                record.info.field_name,
+                context=root_context,
+                start_time=self.get_record_time(record.start),
+            )
+            self.set_field_span_attributes(span, record.info, record.kwargs)
+            if record.error:
+                span.record_exception(record.error)
+                span.set_status(Status(StatusCode.ERROR))
+            span.end(end_time=self.get_record_time(record.end))
+
+        self.export_aggregates(root_context)
+
+        if self._has_errors:
+            root_span.set_status(Status(StatusCode.ERROR))
+        root_span.end(end_time=self.get_record_time(end))
+
+    def export_aggregates(self, root_context: Context) -> None:
+        """Creates single span for every field path aggregated from lists."""
+        for aggregated_path, aggregate in self._aggregates.items():
+            info = aggregate.info
+            span = self._tracer.start_span(
+                info.field_name,
+                context=root_context,
+                start_time=self.get_record_time(aggregate.start),
+            )
+            span.set_attribute("component", "GraphQL")
+            span.set_attribute("graphql.operation.name", self.get_operation_name(info))
+            span.set_attribute("graphql.parentType", info.parent_type.name)
+            span.set_attribute("graphql.path", aggregated_path)
+            span.set_attribute("graphql.count", aggregate.count)
+            span.set_attribute("graphql.duration.min", aggregate.min_duration)
+            span.set_attribute("graphql.duration.max", aggregate.max_duration)
+            span.set_attribute("graphql.duration.total", aggregate.total_duration)
+            if aggregate.error:
+                span.record_exception(aggregate.error)
+                span.set_status(Status(StatusCode.ERROR))
+            span.end(end_time=self.get_record_time(aggregate.end))
+
+    def get_record_time(self, counter: int) -> int:
+        return self._start_time + counter - self._start_counter
+
+    def set_field_span_attributes(
+        self, span: Span, info: GraphQLResolveInfo, kwargs: dict
+    ) -> None:
+        span.set_attribute("component", "GraphQL")
+        span.set_attribute("graphql.operation.name", self.get_operation_name(info))
+        span.set_attribute("graphql.parentType", info.parent_type.name)
+        span.set_attribute("graphql.path", ".".join(map(str, format_path(info.path))))
+
+        if kwargs:
+            filtered_kwargs = self.filter_resolver_args(kwargs, info)
+            for key, value in filtered_kwargs.items():
+                span.set_attribute(f"graphql.arg[{key}]", value)
+
+    def get_operation_name(self, info: GraphQLResolveInfo) -> str:
+        if info.operation.name:
+            return info.operation.name.value
+        return DEFAULT_OPERATION_NAME
+
     def filter_resolver_args(
         self, args: dict[str, Any], info: GraphQLResolveInfo
     ) -> dict[str, Any]:
@@ -148,6 +406,10 @@ def opentelemetry_extension(
     arg_filter: ArgFilter | None = None,
     root_context: Context | None = None,
     root_span_name: RootSpanName | None = None,
+    sampler: Sampler | None = None,
+    tail_sampling: bool = False,
+    latency_threshold: float | None = None,
+    aggregate_lists: bool = False,
 ):
     return partial(
         OpenTelemetryExtension,
@@ -155,4 +417,8 @@ def opentelemetry_extension(
         arg_filter=arg_filter,
         root_context=root_context,
         root_span_name=root_span_name,
+        sampler=sampler,
+        tail_sampling=tail_sampling,
+        latency_threshold=latency_threshold,
+        aggregate_lists=aggregate_lists,
     )
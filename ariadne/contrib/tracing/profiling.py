@@ -0,0 +1,270 @@
+import cProfile
+import os
+import sys
+from abc import ABC, abstractmethod
+from collections import deque
+from collections.abc import Callable
+from functools import partial
+from random import random
+from threading import Event, Lock, Thread, get_ident
+from time import monotonic, strftime
+from typing import Any
+
+from graphql import FragmentDefinitionNode, GraphQLResolveInfo, OperationDefinitionNode
+
+from ...types import ContextValue, Extension, Resolver
+from .utils import (
+    get_operation_signature,
+    get_request_header,
+    get_signature_hash,
+    verify_debug_token,
+)
+
+__all__ = [
+    "CProfileProfiler",
+    "Profiler",
+    "ProfilingExtension",
+    "ProfilingRateLimit",
+    "SamplingProfiler",
+    "profiling_extension",
+]
+
+DEFAULT_HEADER = "X-Ariadne-Profile"
+
+
+class Profiler(ABC):
+    """Base class for profilers used by `ProfilingExtension`.
+
+    # Attributes
+
+    `suffix`: a `str` with suffix of files written by the profiler.
+    """
+
+    suffix: str
+
+    @abstractmethod
+    def start(self) -> None:
+        """Starts profiling the current thread."""
+
+    @abstractmethod
+    def stop(self) -> None:
+        """Stops profiling."""
+
+    @abstractmethod
+    def write(self, path: str) -> None:
+        """Writes profile to the file."""
+
+
+class CProfileProfiler(Profiler):
+    """Deterministic profiler using `cProfile`.
+
+    Profiles are written in `pstats` format, readable by `snakeviz` or
+    `python -m pstats`.
+    """
+
+    suffix = ".prof"
+
+    def __init__(self) -> None:
+        self._profile = cProfile.Profile()
+
+    def start(self) -> None:
+        self._profile.enable()
+
+    def stop(self) -> None:
+        self._profile.disable()
+
+    def write(self, path: str) -> None:
+        self._profile.dump_stats(path)
+
+
+class SamplingProfiler(Profiler):
+    """Sampling profiler recording stacks of the profiled thread.
+
+    Stacks are sampled from a separate thread every `interval` seconds and
+    written in collapsed stacks format, readable by `flamegraph.pl` or
+    speedscope. Sampling adds less overhead than `cProfile`, but short
+    functions may be missing from the profile.
+    """
+
+    suffix = ".folded"
+
+    def __init__(self, interval: float = 0.001) -> None:
+        self.interval = interval
+        self.stacks: dict[str, int] = {}
+        self._thread_id = 0
+        self._stopped = Event()
+        self._thread: Thread | None = None
+
+    def start(self) -> None:
+        self._thread_id = get_ident()
+        self._thread = Thread(target=self.sample, daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stopped.set()
+        if self._thread:
+            self._thread.join()
+
+    def sample(self) -> None:
+        while not self._stopped.wait(self.interval):
+            frame = sys._current_frames().get(self._thread_id)
+            stack = []
+            while frame:
+                code = frame.f_code
+                stack.append(
+                    f"{code.co_name} ({code.co_filename}:{code.co_firstlineno})"
+                )
+                frame = frame.f_back
+            if stack:
+                key = ";".join(reversed(stack))
+                self.stacks[key] = self.stacks.get(key, 0) + 1
+
+    def write(self, path: str) -> None:
+        with open(path, "w", encoding="utf-8") as fp:
+            for stack, count in self.stacks.items():
+                fp.write(f"{stack} {count}\n")
+
+
+class ProfilingRateLimit:
+    """Limit of profiled requests, shared by all requests of the server.
+
+    At most one request is profiled at a time, and no more than
+    `max_profiles` requests are profiled in `period` seconds.
+    """
+
+    def __init__(self, *, max_profiles: int = 10, period: float = 60.0) -> None:
+        self.max_profiles = max_profiles
+        self.period = period
+        self._lock = Lock()
+        self._active = False
+        self._started: deque[float] = deque()
+
+    def acquire(self) -> bool:
+        """Returns `True` if new request can be profiled.
+
+        `release` must be called when profiling of request is finished.
+        """
+        with self._lock:
+            if self._active:
+                return False
+
+            now = monotonic()
+            while self._started and self._started[0] <= now - self.period:
+                self._started.popleft()
+            if len(self._started) >= self.max_profiles:
+                return False
+
+            self._started.append(now)
+            self._active = True
+            return True
+
+    def release(self) -> None:
+        with self._lock:
+            self._active = False
+
+
+class ProfilingExtension(Extension):
+    """Extension profiling single GraphQL operations.
+
+    Request is profiled when it has the debug header with token signed with
+    `secret`, or is randomly sampled with 1 in `sample_every` chance, and
+    `rate_limit` allows it. Profiles are written to subdirectories of
+    `output_dir` named after hashes of operations' signatures, next to the
+    `signature.graphql` file with operation's signature.
+
+    Profiler runs in the thread executing the request. In async servers this
+    thread also runs other requests, which will be included in the profile.
+    """
+
+    def __init__(
+        self,
+        *,
+        output_dir: str,
+        rate_limit: ProfilingRateLimit,
+        secret: str | bytes | None = None,
+        header: str = DEFAULT_HEADER,
+        sample_every: int | None = None,
+        profiler: Callable[[], Profiler] = CProfileProfiler,
+    ) -> None:
+        self._output_dir = output_dir
+        self._rate_limit = rate_limit
+        self._secret = secret
+        self._header = header
+        self._sample_every = sample_every
+        self._profiler_factory = profiler
+        self._profiler: Profiler | None = None
+        self._operation: OperationDefinitionNode | None = None
+        self._fragments: dict[str, FragmentDefinitionNode] = {}
+
+    def should_profile(self, context: ContextValue) -> bool:
+        """Returns `True` if request was selected for profiling."""
+        if self._secret and verify_debug_token(
+            self._secret, get_request_header(context, self._header)
+        ):
+            return True
+        return bool(self._sample_every) and random() * self._sample_every < 1
+
+    def request_started(self, context: ContextValue) -> None:
+        if not self.should_profile(context) or not self._rate_limit.acquire():
+            return
+
+        self._profiler = self._profiler_factory()
+        self._profiler.start()
+
+    def request_finished(self, context: ContextValue) -> None:
+        profiler = self._profiler
+        if not profiler:
+            return
+
+        self._profiler = None
+        try:
+            profiler.stop()
+            self.write_profile(profiler)
+        finally:
+            self._rate_limit.release()
+
+    def resolve(
+        self, next_: Resolver, obj: Any, info: GraphQLResolveInfo, **kwargs
+    ) -> Any:
+        if self._profiler and not self._operation:
+            self._operation = info.operation
+            self._fragments = info.fragments
+        return next_(obj, info, **kwargs)
+
+    def write_profile(self, profiler: Profiler) -> None:
+        """Writes profile to the directory of operation's signature."""
+        if self._operation:
+            signature = get_operation_signature(self._operation, self._fragments)
+        else:
+            signature = ""  # Operation failed before execution
+
+        directory = os.path.join(self._output_dir, get_signature_hash(signature)[:16])
+        os.makedirs(directory, exist_ok=True)
+
+        signature_path = os.path.join(directory, "signature.graphql")
+        if not os.path.exists(signature_path):
+            with open(signature_path, "w", encoding="utf-8") as fp:
+                fp.write(signature)
+
+        file_name = f"{strftime('%Y%m%d-%H%M%S')}-{id(profiler):x}{profiler.suffix}"
+        profiler.write(os.path.join(directory, file_name))
+
+
+def profiling_extension(
+    *,
+    output_dir: str,
+    rate_limit: ProfilingRateLimit | None = None,
+    secret: str | bytes | None = None,
+    header: str = DEFAULT_HEADER,
+    sample_every: int | None = None,
+    profiler: Callable[[], Profiler] = CProfileProfiler,
+) -> Callable[[], ProfilingExtension]:
+    return partial(
+        ProfilingExtension,
+        output_dir=output_dir,
+        rate_limit=rate_limit or ProfilingRateLimit(),
+        secret=secret,
+        header=header,
+        sample_every=sample_every,
+        profiler=profiler,
+    )
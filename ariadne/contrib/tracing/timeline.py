@@ -0,0 +1,376 @@
+import json
+import os
+from collections.abc import Callable, Generator
+from contextlib import contextmanager
+from contextvars import ContextVar, Token
+from functools import partial
+from random import random
+from time import perf_counter_ns, strftime
+from typing import Any
+
+from graphql import GraphQLResolveInfo
+from graphql.pyutils import is_awaitable
+
+from ...types import ContextValue, Extension, Resolver
+from .utils import format_path, get_request_header, verify_debug_token
+
+__all__ = [
+    "TimelineExtension",
+    "timeline_extension",
+    "timeline_span",
+]
+
+CHROME = "chrome"
+SPEEDSCOPE = "speedscope"
+
+DEFAULT_HEADER = "X-Ariadne-Timeline"
+DEFAULT_OPERATION_NAME = "GraphQL Operation"
+SPEEDSCOPE_SCHEMA = "https://www.speedscope.app/file-format-schema.json"
+
+
+class TimelineSpan:
+    """Single span of request's timeline.
+
+    `start` and `end` are offsets in nanoseconds from the start of request.
+    """
+
+    __slots__ = ("args", "category", "end", "name", "start")
+
+    def __init__(self, name: str, category: str, start: int) -> None:
+        self.name = name
+        self.category = category
+        self.start = start
+        self.end = start
+        self.args: dict[str, Any] = {}
+
+
+class Timeline:
+    """Spans recorded for single request."""
+
+    def __init__(self) -> None:
+        self.start = perf_counter_ns()
+        self.spans: list[TimelineSpan] = []
+
+    def now(self) -> int:
+        return perf_counter_ns() - self.start
+
+    def start_span(self, name: str, category: str) -> TimelineSpan:
+        span = TimelineSpan(name, category, self.now())
+        self.spans.append(span)
+        return span
+
+    def get_lanes(self) -> list[list[TimelineSpan]]:
+        """Returns spans split into lanes with correctly nested spans.
+
+        Spans of concurrently running resolvers overlap without being nested
+        and are put in separate lanes.
+        """
+        lanes: list[list[TimelineSpan]] = []
+        stacks: list[list[TimelineSpan]] = []
+        for span in sorted(self.spans, key=lambda s: (s.start, -s.end)):
+            for lane, stack in zip(lanes, stacks, strict=True):
+                while stack and stack[-1].end <= span.start:
+                    stack.pop()
+                if not stack or span.end <= stack[-1].end:
+                    lane.append(span)
+                    stack.append(span)
+                    break
+            else:
+                lanes.append([span])
+                stacks.append([span])
+        return lanes
+
+    def to_chrome_trace(self) -> dict:
+        """Returns timeline in Chrome's trace event format."""
+        events: list[dict] = []
+        for lane_id, lane in enumerate(self.get_lanes()):
+            events.append(
+                {
+                    "name": "thread_name",
+                    "ph": "M",
+                    "pid": 1,
+                    "tid": lane_id,
+                    "args": {"name": f"Lane {lane_id}"},
+                }
+            )
+            events.extend(
+                {
+                    "name": span.name,
+                    "cat": span.category,
+                    "ph": "X",
+                    "ts": span.start / 1000,
+                    "dur": (span.end - span.start) / 1000,
+                    "pid": 1,
+                    "tid": lane_id,
+                    "args": span.args,
+                }
+                for span in lane
+            )
+        return {"traceEvents": events, "displayTimeUnit": "ns"}
+
+    def to_speedscope(self, name: str) -> dict:
+        """Returns timeline in speedscope's file format."""
+        frames: list[dict] = []
+        frames_ids: dict[str, int] = {}
+        profiles: list[dict] = []
+        end = max((span.end for span in self.spans), default=0)
+
+        for lane_id, lane in enumerate(self.get_lanes()):
+            events: list[dict] = []
+            stack: list[tuple[TimelineSpan, int]] = []
+            for span in lane:
+                while stack and stack[-1][0].end <= span.start:
+                    closed, frame = stack.pop()
+                    events.append({"type": "C", "frame": frame, "at": closed.end})
+
+                frame = frames_ids.get(span.name)
+                if frame is None:
+                    frame = frames_ids[span.name] = len(frames)
+                    frames.append({"name": span.name})
+
+                events.append({"type": "O", "frame": frame, "at": span.start})
+                stack.append((span, frame))
+
+            while stack:
+                closed, frame = stack.pop()
+                events.append({"type": "C", "frame": frame, "at": closed.end})
+
+            profiles.append(
+                {
+                    "type": "evented",
+                    "name": f"Lane {lane_id}",
+                    "unit": "nanoseconds",
+                    "startValue": 0,
+                    "endValue": end,
+                    "events": events,
+                }
+            )
+
+        return {
+            "$schema": SPEEDSCOPE_SCHEMA,
+            "name": name,
+            "exporter": "ariadne",
+            "activeProfileIndex": 0,
+            "shared": {"frames": frames},
+            "profiles": profiles,
+        }
+
+
+current_timeline: ContextVar[Timeline | None] = ContextVar(
+    "ariadne_timeline", default=None
+)
+
+
+@contextmanager
+def timeline_span(name: str, category: str = "custom") -> Generator[None, None, None]:
+    """Records custom span, eg. DataLoader's batch, on the request's timeline.
+
+    Does nothing if current request is not being recorded.
+
+    # Required arguments
+
+    `name`: a `str` with name of the span.
+
+    # Optional arguments
+
+    `category`: a `str` with category of the span. Defaults to `custom`.
+    """
+    timeline = current_timeline.get()
+    if timeline is None:
+        yield
+        return
+
+    span = timeline.start_span(name, category)
+    try:
+        yield
+    finally:
+        span.end = timeline.now()
+
+
+class TimedAwaitable:
+    """Awaitable measuring time spent running the wrapped awaitable.
+
+    Time between steps of the awaitable is the time it spent awaiting.
+    """
+
+    __slots__ = ("awaitable", "running")
+
+    def __init__(self, awaitable: Any) -> None:
+        self.awaitable = awaitable
+        self.running = 0
+
+    def __await__(self) -> Generator[Any, Any, Any]:
+        iterator = self.awaitable.__await__()
+        send_value: Any = None
+        throw_value: BaseException | None = None
+        while True:
+            start = perf_counter_ns()
+            try:
+                if throw_value is not None:
+                    yielded = iterator.throw(throw_value)
+                else:
+                    yielded = iterator.send(send_value)
+            except StopIteration as stop:
+                self.running += perf_counter_ns() - start
+                return stop.value
+            except BaseException:
+                self.running += perf_counter_ns() - start
+                raise
+            self.running += perf_counter_ns() - start
+
+            try:
+                send_value = yield yielded
+                throw_value = None
+            except BaseException as error:
+                send_value = None
+                throw_value = error
+
+
+class TimelineExtension(Extension):
+    """Extension recording timeline of resolvers executed by single request.
+
+    Timeline is recorded when request has the debug header with token signed
+    with `secret`, or is randomly sampled with `sampler` rate. It is written
+    to `output_dir` in Chrome's trace event format (viewable in Perfetto or
+    `chrome://tracing`) or in speedscope's format.
+
+    Spans of resolvers include their path, `sync` or `async` kind, and for
+    async resolvers the time they spent running and awaiting. Concurrently
+    running resolvers are placed in separate lanes.
+    """
+
+    def __init__(
+        self,
+        *,
+        output_dir: str,
+        output_format: str = CHROME,
+        secret: str | bytes | None = None,
+        header: str = DEFAULT_HEADER,
+        sampler: float | None = None,
+    ) -> None:
+        if output_format not in (CHROME, SPEEDSCOPE):
+            raise ValueError(f"Unsupported timeline format: {output_format}")
+
+        self._output_dir = output_dir
+        self._output_format = output_format
+        self._secret = secret
+        self._header = header
+        self._sampler = sampler
+        self._timeline: Timeline | None = None
+        self._root_span: TimelineSpan | None = None
+        self._operation_name: str | None = None
+        self._token: Token[Timeline | None] | None = None
+
+    def should_record(self, context: ContextValue) -> bool:
+        """Returns `True` if timeline should be recorded for the request."""
+        if self._secret and verify_debug_token(
+            self._secret, get_request_header(context, self._header)
+        ):
+            return True
+        return bool(self._sampler) and random() < self._sampler
+
+    def request_started(self, context: ContextValue) -> None:
+        if not self.should_record(context):
+            return
+
+        self._timeline = Timeline()
+        self._root_span = self._timeline.start_span("request", "request")
+        self._token = current_timeline.set(self._timeline)
+
+    def request_finished(self, context: ContextValue) -> None:
+        if not self._timeline or not self._root_span:
+            return
+
+        self._root_span.end = self._timeline.now()
+        if self._token is not None:
+            current_timeline.reset(self._token)
+            self._token = None
+        self.write_timeline(self._timeline)
+        self._timeline = None
+
+    def resolve(
+        self, next_: Resolver, obj: Any, info: GraphQLResolveInfo, **kwargs
+    ) -> Any:
+        timeline = self._timeline
+        if not timeline:
+            return next_(obj, info, **kwargs)
+
+        if self._operation_name is None:
+            operation = info.operation
+            self._operation_name = (
+                operation.name.value if operation.name else DEFAULT_OPERATION_NAME
+            )
+
+        span = timeline.start_span(
+            f"{info.parent_type.name}.{info.field_name}", "resolver"
+        )
+        span.args["path"] = ".".join(map(str, format_path(info.path)))
+        try:
+            result = next_(obj, info, **kwargs)
+        except Exception:
+            span.end = timeline.now()
+            span.args["kind"] = "sync"
+            raise
+
+        if is_awaitable(result):
+            span.args["kind"] = "async"
+            return self.resolve_async(timeline, span, result)
+
+        span.end = timeline.now()
+        span.args["kind"] = "sync"
+        return result
+
+    async def resolve_async(
+        self, timeline: Timeline, span: TimelineSpan, result: Any
+    ) -> Any:
+        timed_result = TimedAwaitable(result)
+        try:
+            return await timed_result
+        finally:
+            span.end = timeline.now()
+            running = timed_result.running
+            span.args["running_ns"] = running
+            span.args["awaiting_ns"] = max(span.end - span.start - running, 0)
+
+    def get_file_name(self) -> str:
+        name = (self._operation_name or DEFAULT_OPERATION_NAME).replace(" ", "_")
+        suffix = "json" if self._output_format == CHROME else "speedscope.json"
+        return f"{strftime('%Y%m%d-%H%M%S')}-{name}-{id(self):x}.{suffix}"
+
+    def write_timeline(self, timeline: Timeline) -> None:
+        """Writes recorded timeline to file in `output_dir`.
+
+        Called by `request_finished`, which is synchronous, so the file is
+        written in the thread running the request. In ASGI servers this
+        blocks the event loop for the duration of the write. Override this
+        method to write timelines in the background, eg. with an executor.
+        """
+        if self._output_format == CHROME:
+            data = timeline.to_chrome_trace()
+        else:
+            data = timeline.to_speedscope(
+                self._operation_name or DEFAULT_OPERATION_NAME
+            )
+
+        os.makedirs(self._output_dir, exist_ok=True)
+        path = os.path.join(self._output_dir, self.get_file_name())
+        with open(path, "w", encoding="utf-8") as fp:
+            json.dump(data, fp)
+
+
+def timeline_extension(
+    *,
+    output_dir: str,
+    output_format: str = CHROME,
+    secret: str | bytes | None = None,
+    header: str = DEFAULT_HEADER,
+    sampler: float | None = None,
+) -> Callable[[], TimelineExtension]:
+    return partial(
+        TimelineExtension,
+        output_dir=output_dir,
+        output_format=output_format,
+        secret=secret,
+        header=header,
+        sampler=sampler,
+    )
@@ -1,10 +1,36 @@
+import hmac
 import os
+from copy import copy
+from hashlib import sha256
+from time import time
 from typing import Any
+from weakref import WeakKeyDictionary
 
-from graphql import GraphQLResolveInfo, ResponsePath
+from graphql import (
+    DocumentNode,
+    ExecutableDefinitionNode,
+    FloatValueNode,
+    FragmentDefinitionNode,
+    GraphQLObjectType,
+    GraphQLResolveInfo,
+    GraphQLSchema,
+    InlineFragmentNode,
+    IntValueNode,
+    ListValueNode,
+    Node,
+    ObjectValueNode,
+    OperationDefinitionNode,
+    ResponsePath,
+    SelectionSetNode,
+    StringValueNode,
+    Visitor,
+    print_ast,
+    visit,
+)
 from starlette.datastructures import UploadFile
 
 from ...resolvers import is_default_resolver
+from ...types import ContextValue
 
 try:
     from python_multipart.multipart import File  # type: ignore[import-untyped]
@@ -66,6 +92,76 @@ def format_path(path: ResponsePath):
     return elements[::-1]
 
 
+def format_aggregated_path(path: ResponsePath) -> str | None:
+    """Returns path of field in list with indexes replaced by `[]`.
+
+    Returns `None` if field is not in a list.
+    """
+    elements: list[str] = []
+    in_list = False
+    current: ResponsePath | None = path
+    while current:
+        if isinstance(current.key, int):
+            elements.append("[]")
+            in_list = True
+        else:
+            elements.append(current.key)
+        current = current.prev
+    if not in_list:
+        return None
+    return ".".join(reversed(elements))
+
+
+TracedFields = dict[str, frozenset[str]]
+
+_traced_fields: "WeakKeyDictionary[GraphQLSchema, dict[bool, TracedFields]]" = (
+    WeakKeyDictionary()
+)
+
+
+def get_traced_fields(
+    schema: GraphQLSchema, trace_default_resolver: bool = False
+) -> TracedFields:
+    """Returns names of fields to trace, keyed by name of their type.
+
+    Default resolvers (unless `trace_default_resolver` is set) and fields of
+    introspection types are excluded. Result is computed once per schema.
+    """
+    schema_fields = _traced_fields.get(schema)
+    if schema_fields is None:
+        schema_fields = _traced_fields.setdefault(schema, {})
+
+    traced_fields = schema_fields.get(trace_default_resolver)
+    if traced_fields is None:
+        traced_fields = {}
+        for type_name, graphql_type in schema.type_map.items():
+            if type_name.startswith("__") or not isinstance(
+                graphql_type, GraphQLObjectType
+            ):
+                continue
+            traced_fields[type_name] = frozenset(
+                field_name
+                for field_name, field in graphql_type.fields.items()
+                if trace_default_resolver or not is_default_resolver(field.resolve)
+            )
+        schema_fields[trace_default_resolver] = traced_fields
+
+    return traced_fields
+
+
+def is_traced_field(
+    info: GraphQLResolveInfo, trace_default_resolver: bool = False
+) -> bool:
+    """Returns `True` if field should be traced.
+
+    Same as `should_trace`, but uses fields precomputed for the schema by
+    `get_traced_fields` instead of walking the field's path.
+    """
+    traced_fields = get_traced_fields(info.schema, trace_default_resolver)
+    type_fields = traced_fields.get(info.parent_type.name)
+    return type_fields is not None and info.field_name in type_fields
+
+
 def should_trace(info: GraphQLResolveInfo, trace_default_resolver: bool = False):
     if info.field_name not in info.parent_type.fields:
         return False
@@ -98,3 +194,151 @@ def is_introspection_key(key: str):
         "__enumvalue",
         "__typekind",
     ]  # from graphql.type.introspection.introspection_types
+
+
+def get_request_header(context: ContextValue, name: str) -> str | None:
+    """Returns value of HTTP request's header from default context or `None`.
+
+    Supports Starlette's `Request` and WSGI environ stored in the context
+    under the `request` key.
+    """
+    if not isinstance(context, dict):
+        return None
+
+    request = context.get("request")
+    if isinstance(request, dict):
+        return request.get("HTTP_" + name.upper().replace("-", "_"))
+
+    headers = getattr(request, "headers", None)
+    if headers is None:
+        return None
+    return headers.get(name)
+
+
+def create_debug_token(secret: str | bytes, expires_in: int = 300) -> str:
+    """Returns token signed with `secret`, valid for `expires_in` seconds.
+
+    Token is sent in debug headers to enable tracing or profiling of single
+    request in production.
+    """
+    expires = str(int(time()) + expires_in)
+    return f"{expires}.{sign_debug_token(secret, expires)}"
+
+
+def verify_debug_token(secret: str | bytes, token: str | None) -> bool:
+    """Returns `True` if token was signed with `secret` and didn't expire."""
+    if not token:
+        return False
+
+    expires, _, signature = token.partition(".")
+    try:
+        if int(expires) < time():
+            return False
+    except ValueError:
+        return False
+
+    return hmac.compare_digest(sign_debug_token(secret, expires), signature)
+
+
+def sign_debug_token(secret: str | bytes, expires: str) -> str:
+    if isinstance(secret, str):
+        secret = secret.encode("utf-8")
+    return hmac.new(secret, expires.encode("utf-8"), sha256).hexdigest()
+
+
+class SignatureVisitor(Visitor):
+    """Visitor normalizing GraphQL document for operation's signature."""
+
+    def leave_field(self, node, *_):
+        node = copy(node)
+        node.alias = None
+        node.arguments = sort_nodes(node.arguments)
+        return node
+
+    def leave_directive(self, node, *_):
+        node = copy(node)
+        node.arguments = sort_nodes(node.arguments)
+        return node
+
+    def leave_selection_set(self, node, *_):
+        return SelectionSetNode(selections=sort_nodes(node.selections))
+
+    def leave_int_value(self, *_):
+        return IntValueNode(value="0")
+
+    def leave_float_value(self, *_):
+        return FloatValueNode(value="0")
+
+    def leave_string_value(self, *_):
+        return StringValueNode(value="")
+
+    def leave_list_value(self, *_):
+        return ListValueNode(values=())
+
+    def leave_object_value(self, *_):
+        return ObjectValueNode(fields=())
+
+
+def sort_nodes(nodes) -> tuple:
+    return tuple(sorted(nodes or (), key=get_node_sort_key))
+
+
+def get_node_sort_key(node: Node) -> tuple[str, str]:
+    if isinstance(node, InlineFragmentNode):
+        if node.type_condition:
+            return node.kind, node.type_condition.name.value
+        return node.kind, ""
+    return node.kind, node.name.value  # ty: ignore
+
+
+def get_operation_signature(
+    operation: OperationDefinitionNode,
+    fragments: dict[str, FragmentDefinitionNode],
+) -> str:
+    """Returns normalized signature of GraphQL operation.
+
+    Operations that differ only in values of literals, aliases, order of
+    fields and arguments, or formatting have the same signature. Only
+    fragments used by the operation are included.
+
+    # Required arguments
+
+    `operation`: an `OperationDefinitionNode` with operation's definition.
+
+    `fragments`: a `dict` with fragments' definitions, keyed by their names.
+    """
+    used_fragments: set[str] = set()
+    pending: list[ExecutableDefinitionNode] = [operation]
+    while pending:
+        node = pending.pop()
+        for name in find_fragment_spreads(node):
+            if name not in used_fragments and name in fragments:
+                used_fragments.add(name)
+                pending.append(fragments[name])
+
+    document = DocumentNode(
+        definitions=(operation, *(fragments[name] for name in sorted(used_fragments)))
+    )
+    return " ".join(print_ast(visit(document, SignatureVisitor())).split())
+
+
+class FragmentSpreadVisitor(Visitor):
+    """Visitor collecting names of fragments spread in visited node."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.names: list[str] = []
+
+    def enter_fragment_spread(self, spread, *_):
+        self.names.append(spread.name.value)
+
+
+def find_fragment_spreads(node: Node) -> list[str]:
+    visitor = FragmentSpreadVisitor()
+    visit(node, visitor)
+    return visitor.names
+
+
+def get_signature_hash(signature: str) -> str:
+    """Returns SHA-256 hex digest of operation's signature."""
+    return sha256(signature.encode("utf-8")).hexdigest()
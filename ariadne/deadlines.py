@@ -0,0 +1,339 @@
+from asyncio import TimeoutError as AsyncTimeoutError
+from asyncio import wait_for
+from collections.abc import Awaitable, Callable, MutableMapping
+from contextvars import ContextVar
+from functools import partial
+from time import monotonic
+from typing import Any
+from weakref import WeakKeyDictionary
+
+from graphql import (
+    GraphQLField,
+    GraphQLInterfaceType,
+    GraphQLObjectType,
+    GraphQLResolveInfo,
+)
+from graphql.pyutils import is_awaitable
+
+from .schema_visitor import SchemaDirectiveVisitor
+from .types import ContextValue, Extension, Resolver
+from .utils import type_get_extension, type_set_extension
+
+__all__ = [
+    "Deadline",
+    "DeadlineExceededError",
+    "DeadlineExtension",
+    "OperationDeadlines",
+    "TimeoutDirective",
+    "get_current_deadline",
+    "get_field_timeout",
+    "set_field_timeout",
+    "timeout_directive",
+]
+
+FIELD_TIMEOUT = "__timeout__"
+
+timeout_directive = """
+directive @timeout(seconds: Float!) on FIELD_DEFINITION
+"""
+
+current_deadline: ContextVar["Deadline | None"] = ContextVar(
+    "current_deadline", default=None
+)
+
+
+def get_current_deadline() -> "Deadline | None":
+    """Returns `Deadline` of currently executed operation or `None`."""
+    return current_deadline.get()
+
+
+def set_field_timeout(field: GraphQLField, seconds: float) -> None:
+    """Sets number of seconds after which field's async resolver is cancelled.
+
+    # Required arguments
+
+    `field`: a `GraphQLField` to set timeout for.
+
+    `seconds`: a `float` with field's timeout.
+    """
+    type_set_extension(field, FIELD_TIMEOUT, seconds)  # ty: ignore
+
+
+def get_field_timeout(field: GraphQLField) -> float | None:
+    """Returns field's timeout in seconds or `None`."""
+    return type_get_extension(field, FIELD_TIMEOUT)  # ty: ignore
+
+
+class TimeoutDirective(SchemaDirectiveVisitor):
+    """Schema directive setting timeouts of fields async resolvers.
+
+    Async resolvers of fields with the `@timeout` directive are cancelled
+    after directive's number of seconds by servers configured with
+    `OperationDeadlines`:
+
+    ```python
+    schema = make_executable_schema(
+        [timeout_directive, type_defs],
+        query_type,
+        directives={"timeout": TimeoutDirective},
+    )
+    ```
+    """
+
+    def visit_field_definition(
+        self,
+        field: GraphQLField,
+        object_type: GraphQLObjectType | GraphQLInterfaceType,
+    ) -> GraphQLField:
+        set_field_timeout(field, self.args["seconds"])
+        return field
+
+
+class DeadlineExceededError(TimeoutError):
+    """Raised by fields resolved after operation's deadline."""
+
+    def __init__(self, timeout: float) -> None:
+        super().__init__(f"Operation exceeded its deadline of {timeout} seconds.")
+        self.timeout = timeout
+
+
+class Deadline:
+    """Point in time after which operation's fields aren't resolved.
+
+    # Attributes
+
+    `started_at`: a `float` with `time.monotonic()` of operation's start.
+
+    `timeout`: a `float` with number of seconds operation can run for.
+    """
+
+    __slots__ = ("started_at", "timeout")
+
+    def __init__(self, timeout: float, started_at: float | None = None) -> None:
+        self.timeout = timeout
+        self.started_at = monotonic() if started_at is None else started_at
+
+    @property
+    def expires_at(self) -> float:
+        """`time.monotonic()` of the deadline."""
+        return self.started_at + self.timeout
+
+    @property
+    def expired(self) -> bool:
+        """`True` if the deadline has passed."""
+        return monotonic() >= self.expires_at
+
+    def remaining(self) -> float:
+        """Returns number of seconds left until the deadline, or `0`.
+
+        Can be used to set timeouts of database queries or HTTP requests.
+        """
+        return max(self.expires_at - monotonic(), 0.0)
+
+    def check(self) -> None:
+        """Raises `DeadlineExceededError` if the deadline has passed."""
+        if self.expired:
+            raise DeadlineExceededError(self.timeout)
+
+
+class OperationDeadlines:
+    """Deadlines of operations executed by the server.
+
+    Fields resolved after operation's deadline fail with
+    `DeadlineExceededError`. Async resolvers still running at the deadline
+    are cancelled. Fields of async resolvers running longer than their
+    timeout, set with the `@timeout` directive or `set_field_timeout`, fail
+    with `TimeoutError`. Sync resolvers can't be cancelled, and complete
+    even when they run past the deadline.
+
+    Operation's `Deadline` is set in the context under the `context_key`,
+    and can be retrieved with `get_current_deadline`.
+
+    Single instance should be shared by all requests handled by the process.
+    """
+
+    def __init__(
+        self,
+        *,
+        timeout: float | None = None,
+        query_timeout: float | None = None,
+        mutation_timeout: float | None = None,
+        header: str | None = "X-Request-Timeout",
+        context_key: str = "deadline",
+    ) -> None:
+        """Initializes operation deadlines.
+
+        # Optional arguments
+
+        `timeout`: a `float` with number of seconds operations can run for.
+        Defaults to `None`, which doesn't limit them.
+
+        `query_timeout`: a `float` with number of seconds queries can run for.
+        Overrides `timeout`.
+
+        `mutation_timeout`: a `float` with number of seconds mutations can run
+        for. Overrides `timeout`.
+
+        `header`: a `str` with name of the HTTP header clients can set to
+        shorten operation's timeout with, in seconds. Timeouts longer than
+        the server's timeout are ignored. Defaults to `X-Request-Timeout`.
+        Set to `None` to ignore timeouts requested by clients.
+
+        `context_key`: a `str` with name of the context's key or attribute to
+        set operation's `Deadline` under. Defaults to `deadline`.
+        """
+        self.timeout = timeout
+        self.query_timeout = query_timeout
+        self.mutation_timeout = mutation_timeout
+        self.header = header
+        self.context_key = context_key
+
+        self._fields: WeakKeyDictionary[Any, dict[str, float | None]] = (
+            WeakKeyDictionary()
+        )
+
+    def get_extension(
+        self, requested_timeout: str | None = None
+    ) -> Callable[[], "DeadlineExtension"]:
+        """Returns extension type enforcing deadline of single request.
+
+        # Optional arguments
+
+        `requested_timeout`: a `str` with value of request's `header`.
+        """
+        return partial(
+            DeadlineExtension,
+            deadlines=self,
+            requested_timeout=self.parse_requested_timeout(requested_timeout),
+        )
+
+    def parse_requested_timeout(self, value: str | None) -> float | None:
+        """Returns timeout from header's value, or `None` if it's invalid."""
+        if not value:
+            return None
+        try:
+            timeout = float(value)
+        except ValueError:
+            return None
+        if timeout <= 0 or timeout != timeout:  # NaN
+            return None
+        return timeout
+
+    def get_timeout(
+        self, operation_type: str | None, requested_timeout: float | None
+    ) -> float | None:
+        """Returns operation's timeout in seconds or `None`.
+
+        # Required arguments
+
+        `operation_type`: a `str` with operation's type, like `query`, or
+        `None` if it's not known yet.
+
+        `requested_timeout`: a `float` with timeout requested by the client.
+        """
+        timeout = self.timeout
+        if operation_type == "query" and self.query_timeout is not None:
+            timeout = self.query_timeout
+        elif operation_type == "mutation" and self.mutation_timeout is not None:
+            timeout = self.mutation_timeout
+
+        if requested_timeout is not None and (
+            timeout is None or requested_timeout < timeout
+        ):
+            return requested_timeout
+        return timeout
+
+    def get_field_timeout(self, info: GraphQLResolveInfo) -> float | None:
+        """Returns field's timeout in seconds or `None`."""
+        parent_type = info.parent_type
+        fields = self._fields.get(parent_type)
+        if fields is None:
+            fields = self._fields.setdefault(parent_type, {})
+
+        if info.field_name not in fields:
+            field = parent_type.fields.get(info.field_name)
+            fields[info.field_name] = get_field_timeout(field) if field else None
+        return fields[info.field_name]
+
+
+class DeadlineExtension(Extension):
+    """Extension enforcing operation's deadline and fields timeouts.
+
+    Is added to request's extensions by servers configured with
+    `operation_deadlines`.
+    """
+
+    def __init__(
+        self,
+        *,
+        deadlines: OperationDeadlines,
+        requested_timeout: float | None = None,
+    ) -> None:
+        self._deadlines = deadlines
+        self._requested_timeout = requested_timeout
+        self._deadline = Deadline(float("inf"))
+        self._operation_type: str | None = None
+        self._token = None
+
+    def request_started(self, context: ContextValue) -> None:
+        timeout = self._deadlines.get_timeout(None, self._requested_timeout)
+        if timeout is not None:
+            self._deadline.timeout = timeout
+
+        key = self._deadlines.context_key
+        if isinstance(context, MutableMapping):
+            context[key] = self._deadline
+        elif context is not None:
+            setattr(context, key, self._deadline)
+        self._token = current_deadline.set(self._deadline)
+
+    def request_finished(self, context: ContextValue) -> None:
+        if self._token is not None:
+            current_deadline.reset(self._token)
+            self._token = None
+
+    def resolve(
+        self, next_: Resolver, obj: Any, info: GraphQLResolveInfo, **kwargs
+    ) -> Any:
+        if self._operation_type is None:
+            self.set_operation_type(info.operation.operation.value)
+
+        deadline = self._deadline
+        deadline.check()
+
+        result = next_(obj, info, **kwargs)
+        if not is_awaitable(result):
+            return result
+
+        field_timeout = self._deadlines.get_field_timeout(info)
+        if field_timeout is None and deadline.timeout == float("inf"):
+            return result
+        return self.wait_for_result(result, info, field_timeout)
+
+    def set_operation_type(self, operation_type: str) -> None:
+        self._operation_type = operation_type
+        timeout = self._deadlines.get_timeout(operation_type, self._requested_timeout)
+        if timeout is not None:
+            self._deadline.timeout = timeout
+
+    async def wait_for_result(
+        self,
+        awaitable: Awaitable,
+        info: GraphQLResolveInfo,
+        field_timeout: float | None,
+    ) -> Any:
+        deadline = self._deadline
+        remaining = deadline.remaining()
+        if field_timeout is None or remaining <= field_timeout:
+            try:
+                return await wait_for(awaitable, remaining)
+            except AsyncTimeoutError as error:
+                raise DeadlineExceededError(deadline.timeout) from error
+
+        try:
+            return await wait_for(awaitable, field_timeout)
+        except AsyncTimeoutError as error:
+            raise TimeoutError(
+                f"Resolver for {info.parent_type.name}.{info.field_name} "
+                f"timed out after {field_timeout} seconds."
+            ) from error
@@ -0,0 +1,138 @@
+import os
+from asyncio import (
+    AbstractEventLoop,
+    Task,
+    all_tasks,
+    current_task,
+    gather,
+    new_event_loop,
+)
+from collections.abc import Coroutine, Iterable
+from concurrent.futures import Future
+from contextvars import copy_context
+from threading import Lock, Thread
+from typing import Any, TypeVar
+
+__all__ = ["BackgroundEventLoop"]
+
+T = TypeVar("T")
+
+
+class BackgroundEventLoop:
+    """Event loop running in a background thread.
+
+    Lets sync code, like WSGI applications, run coroutines: the coroutine is
+    run in the background loop, and the calling thread waits for its result.
+    Coroutines of all threads share the loop, so they run concurrently.
+
+    Single instance should be shared by all threads of the process. Loop is
+    started in a new thread when first coroutine is run, and restarted in
+    the child process after fork.
+    """
+
+    def __init__(self, *, thread_name: str = "ariadne-event-loop") -> None:
+        """Initializes the background event loop.
+
+        # Optional arguments
+
+        `thread_name`: a `str` with name of the loop's thread.
+        """
+        self.thread_name = thread_name
+
+        self._loop: AbstractEventLoop | None = None
+        self._thread: Thread | None = None
+        self._pid: int | None = None
+        self._lock = Lock()
+
+    @property
+    def loop(self) -> AbstractEventLoop:
+        """The `AbstractEventLoop` running in the background thread.
+
+        Starts the loop if it's not running in the current process.
+        """
+        if self._loop is None or self._pid != os.getpid():
+            with self._lock:
+                if self._loop is None or self._pid != os.getpid():
+                    self.start_loop()
+        return self._loop  # ty: ignore
+
+    def start_loop(self) -> None:
+        loop = new_event_loop()
+        thread = Thread(target=loop.run_forever, name=self.thread_name, daemon=True)
+        thread.start()
+
+        self._loop = loop
+        self._thread = thread
+        self._pid = os.getpid()
+
+    def run(self, coroutine: Coroutine[Any, Any, T]) -> T:
+        """Runs coroutine in the background loop and returns its result.
+
+        Blocks the calling thread until the coroutine completes. Context
+        variables are copied to the coroutine. Coroutine is cancelled if
+        waiting for it is interrupted.
+
+        # Required arguments
+
+        `coroutine`: a coroutine to run.
+        """
+        loop = self.loop
+        future: Future = Future()
+        tasks: list[Task] = []
+
+        def create_task() -> None:
+            task = loop.create_task(coroutine)
+            task.add_done_callback(lambda _: set_future_result(task, future))
+            tasks.append(task)
+
+        loop.call_soon_threadsafe(create_task, context=copy_context())
+
+        try:
+            return future.result()
+        except BaseException:
+            loop.call_soon_threadsafe(cancel_tasks, tasks)
+            raise
+
+    def stop(self, timeout: float | None = None) -> None:
+        """Stops the loop and waits for its thread to finish.
+
+        Tasks still running in the loop are cancelled. Loop is started again
+        when next coroutine is run.
+
+        # Optional arguments
+
+        `timeout`: a `float` with maximum number of seconds to wait for the
+        loop's thread.
+        """
+        with self._lock:
+            loop, self._loop = self._loop, None
+            thread, self._thread = self._thread, None
+            pid, self._pid = self._pid, None
+        if loop is None or thread is None or pid != os.getpid():
+            return
+
+        async def stop_loop() -> None:
+            tasks = all_tasks(loop) - {current_task(loop)}
+            cancel_tasks(tasks)
+            await gather(*tasks, return_exceptions=True)
+            await loop.shutdown_asyncgens()
+            loop.stop()
+
+        loop.call_soon_threadsafe(loop.create_task, stop_loop())
+        thread.join(timeout)
+        if not thread.is_alive():
+            loop.close()
+
+
+def set_future_result(task: Task, future: Future) -> None:
+    if task.cancelled():
+        future.cancel()
+    elif task.exception() is not None:
+        future.set_exception(task.exception())
+    else:
+        future.set_result(task.result())
+
+
+def cancel_tasks(tasks: Iterable[Task]) -> None:
+    for task in tasks:
+        task.cancel()
@@ -0,0 +1,13 @@
+from .buffers import BufferListExecutionContext, NonFinitePolicy
+from .cancellation import CancellingExecutionContext
+from .fast import FastExecutionContext
+from .parallel import ParallelExecutionContext, parallel_execution_context
+
+__all__ = [
+    "BufferListExecutionContext",
+    "CancellingExecutionContext",
+    "FastExecutionContext",
+    "NonFinitePolicy",
+    "ParallelExecutionContext",
+    "parallel_execution_context",
+]
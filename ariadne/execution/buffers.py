@@ -0,0 +1,197 @@
+from math import isfinite
+from typing import Any, Literal
+
+from graphql import (
+    ExecutionContext,
+    FieldNode,
+    GraphQLFloat,
+    GraphQLInt,
+    GraphQLList,
+    GraphQLNonNull,
+    GraphQLOutputType,
+    GraphQLResolveInfo,
+)
+from graphql.pyutils import AwaitableOrValue, Path
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+GRAPHQL_MIN_INT = -(2**31)
+GRAPHQL_MAX_INT = 2**31 - 1
+
+# Formats of memoryview items that `memoryview.tolist()` converts to Python
+# `int` and `float` values. `?` (bool) is excluded because GraphQL serializes
+# booleans in numeric fields as `0` and `1`, not `false` and `true`.
+INT_FORMATS = frozenset("bBhHiIlLqQnN")
+FLOAT_FORMATS = frozenset("efd")
+
+# Policy for non-finite floats (`NaN`, `Infinity` and `-Infinity`) found in
+# buffers returned for lists of `Float`.
+#
+# `"error"`: non-finite values are reported as field errors, exactly like
+# GraphQL's `Float` scalar does for them.
+#
+# `"null"`: non-finite values are replaced with `null` if list's items are
+# nullable. Non-nullable items fall back to `"error"` behavior.
+NonFinitePolicy = Literal["error", "null"]
+
+
+class BufferListExecutionContext(ExecutionContext):
+    """`ExecutionContext` that completes lists of numeric scalars from buffers.
+
+    Resolvers for fields typed as lists of `Int` or `Float` may return
+    one-dimensional objects implementing Python's buffer protocol, like NumPy
+    arrays, `array.array` or `memoryview`. Instead of completing every item
+    separately, the whole buffer is converted to a list of Python numbers with
+    a single C-level call. Values that GraphQL's scalars would reject
+    (non-finite floats or integers outside of 32-bit range) make the list fall
+    back to the standard per-item completion, which reports them as errors.
+
+    NumPy is not required: buffers are read through `memoryview`, which
+    supports one-dimensional arrays of native numeric types. If NumPy is
+    installed, its arrays are read with `ndarray.tolist()` instead, which also
+    supports arrays with non-native byte order.
+
+    Values that aren't buffers, multi-dimensional buffers and buffers of
+    non-numeric types are completed by the default logic.
+
+    # Example
+
+    ```python
+    from ariadne.asgi import GraphQL
+    from ariadne.execution import BufferListExecutionContext
+
+    app = GraphQL(schema, execution_context_class=BufferListExecutionContext)
+    ```
+
+    # Attributes
+
+    `non_finite_policy`: a `NonFinitePolicy` for `NaN` and infinite floats.
+    Defaults to `"error"`. Override it in a subclass to change it.
+    """
+
+    non_finite_policy: NonFinitePolicy = "error"
+
+    def complete_list_value(
+        self,
+        return_type: GraphQLList[GraphQLOutputType],
+        field_nodes: list[FieldNode],
+        info: GraphQLResolveInfo,
+        path: Path,
+        result: Any,
+    ) -> AwaitableOrValue[list[Any]]:
+        if not isinstance(result, list | tuple):
+            item_type = return_type.of_type
+            if isinstance(item_type, GraphQLNonNull):
+                nullable_items = False
+                scalar_type = item_type.of_type
+            else:
+                nullable_items = True
+                scalar_type = item_type
+
+            if scalar_type is GraphQLFloat or scalar_type is GraphQLInt:
+                buffer = read_buffer(result)
+                if buffer is not None:
+                    values, kind = buffer
+                    completed = self.complete_buffer_values(
+                        values, kind, scalar_type is GraphQLFloat, nullable_items
+                    )
+                    if completed is not None:
+                        return completed
+                    # Let per-item completion report invalid values as errors
+                    result = values
+
+        return super().complete_list_value(return_type, field_nodes, info, path, result)
+
+    def complete_buffer_values(
+        self, values: list, kind: str, is_float: bool, nullable_items: bool
+    ) -> list | None:
+        """Validates numbers read from a buffer against GraphQL's scalar.
+
+        Returns a `list` with completed values, or `None` if list contains
+        values that should be completed item by item instead.
+
+        # Required arguments
+
+        `values`: a `list` with Python numbers read from buffer.
+
+        `kind`: a `str` with kind of buffer's values: `"i"` for integers and
+        `"f"` for floats.
+
+        `is_float`: a `bool` telling if list items are `Float` or `Int`.
+
+        `nullable_items`: a `bool` telling if list items can be `null`.
+        """
+        if not values:
+            return values
+
+        if not is_float:
+            if kind != "i":
+                # Int scalar accepts only floats without fractional part
+                return None
+            if min(values) < GRAPHQL_MIN_INT or max(values) > GRAPHQL_MAX_INT:
+                return None
+            return values
+
+        if kind == "i":
+            return list(map(float, values))
+
+        if all(map(isfinite, values)):
+            return values
+
+        if self.non_finite_policy == "null" and nullable_items:
+            return [value if isfinite(value) else None for value in values]
+
+        return None
+
+
+def read_buffer(value: Any) -> tuple[list, str] | None:
+    """Reads numbers from one-dimensional buffer to a list.
+
+    Returns a tuple with `list` of Python `int` or `float` values and a `str`
+    with their kind (`"i"` or `"f"`), or `None` if value is not a buffer that
+    can be read.
+
+    # Required arguments
+
+    `value`: a value to read.
+    """
+    if isinstance(value, str | bytes | bytearray):
+        return None  # Not lists in GraphQL, even though bytes are buffers
+    if numpy is not None and isinstance(value, numpy.ndarray):
+        return read_ndarray(value)
+
+    try:
+        view = memoryview(value)
+    except (TypeError, ValueError):
+        return None
+
+    with view:
+        if view.ndim != 1:
+            return None
+        if view.format in FLOAT_FORMATS:
+            return view.tolist(), "f"
+        if view.format in INT_FORMATS:
+            return view.tolist(), "i"
+
+    return None
+
+
+def read_ndarray(value: Any) -> tuple[list, str] | None:
+    """Reads numbers from one-dimensional NumPy array to a list.
+
+    Unlike `memoryview`, `ndarray.tolist()` supports arrays with non-native
+    byte order.
+    """
+    if value.ndim != 1:
+        return None
+
+    kind = value.dtype.kind
+    if kind == "f":
+        return value.tolist(), "f"
+    if kind in "iu":
+        return value.tolist(), "i"
+
+    return None
@@ -0,0 +1,129 @@
+from asyncio import Task, ensure_future, get_running_loop
+from collections.abc import Awaitable
+from typing import Any, cast
+
+from graphql import (
+    ExecutionContext,
+    FieldNode,
+    GraphQLError,
+    GraphQLObjectType,
+    GraphQLOutputType,
+    OperationDefinitionNode,
+)
+from graphql.pyutils import AwaitableOrValue, Path
+
+
+class CancellingExecutionContext(ExecutionContext):
+    """`ExecutionContext` cancelling resolvers which results are unreachable.
+
+    When a non-nullable field fails, the error is propagated to its nearest
+    nullable parent, which is resolved to `null`. By default, async resolvers
+    of fields under that parent keep running, and their results are
+    discarded. This context cancels them, and doesn't resolve fields under
+    `null` parents.
+
+    Async fields are run as tasks, so they can be cancelled. Resolvers run
+    in thread or process pools complete, but their results are discarded.
+
+    # Attributes
+
+    `cancelled_fields`: an `int` with number of cancelled fields.
+    """
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.cancelled_fields = 0
+        self._tasks: dict[Task, Path] = {}
+        self._nulled_paths: dict[int, Path] = {}
+
+    def execute_operation(
+        self, operation: OperationDefinitionNode, root_value: Any
+    ) -> AwaitableOrValue[Any] | None:
+        try:
+            result = super().execute_operation(operation, root_value)
+        except BaseException:
+            self.cancel_tasks(None)
+            raise
+
+        if not self.is_awaitable(result):
+            return result
+
+        awaitable_result = cast(Awaitable, result)
+
+        async def await_result() -> Any:
+            try:
+                return await awaitable_result
+            except BaseException:
+                # Error of non-nullable root field nulls the operation's data
+                self.cancel_tasks(None)
+                raise
+
+        return await_result()
+
+    def execute_field(
+        self,
+        parent_type: GraphQLObjectType,
+        source: Any,
+        field_nodes: list[FieldNode],
+        path: Path,
+    ) -> AwaitableOrValue[Any]:
+        if self._nulled_paths and self.is_nulled(path):
+            return None
+
+        result = super().execute_field(parent_type, source, field_nodes, path)
+        if not self.is_awaitable(result):
+            return result
+
+        try:
+            get_running_loop()
+        except RuntimeError:
+            return result  # graphql_sync reports awaitable results as errors
+
+        task = ensure_future(result)
+        self._tasks[task] = path
+        task.add_done_callback(self.forget_task)
+        return task
+
+    def handle_field_error(
+        self,
+        error: GraphQLError,
+        return_type: GraphQLOutputType,
+        path: Path,
+    ) -> None:
+        super().handle_field_error(error, return_type, path)
+
+        # Error propagated from field's descendant nulls the field's subtree
+        if error.path and len(error.path) > len(path.as_list()):
+            self._nulled_paths[id(path)] = path
+            if self._tasks:
+                self.cancel_tasks(path)
+
+    def is_nulled(self, path: Path | None) -> bool:
+        """Returns `True` if the path is in subtree resolved to `null`."""
+        nulled_paths = self._nulled_paths
+        while path is not None:
+            if nulled_paths.get(id(path)) is path:
+                return True
+            path = path.prev
+        return False
+
+    def cancel_tasks(self, path: Path | None) -> None:
+        """Cancels pending fields under the path, or all if path is `None`."""
+        for task, task_path in list(self._tasks.items()):
+            if path is None or is_descendant(task_path, path):
+                if task.cancel():
+                    self.cancelled_fields += 1
+
+    def forget_task(self, task: Task) -> None:
+        self._tasks.pop(task, None)
+        if not task.cancelled():
+            task.exception()  # Mark exception of discarded task as retrieved
+
+
+def is_descendant(path: Path | None, ancestor: Path) -> bool:
+    path = path.prev if path else None
+    while path is not None:
+        if path is ancestor:
+            return True
+        path = path.prev
+    return False
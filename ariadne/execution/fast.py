@@ -0,0 +1,284 @@
+import sys
+from asyncio import get_running_loop
+from collections.abc import Awaitable, Mapping
+from inspect import iscoroutine
+from typing import Any, cast
+from weakref import WeakKeyDictionary
+
+from graphql import (
+    ExecutionContext,
+    FieldNode,
+    GraphQLField,
+    GraphQLLeafType,
+    GraphQLObjectType,
+    default_field_resolver,
+    get_argument_values,
+    get_nullable_type,
+    is_leaf_type,
+    is_non_null_type,
+    is_object_type,
+    located_error,
+)
+from graphql.pyutils import AwaitableOrValue, Path, Undefined
+from graphql.pyutils import is_awaitable as default_is_awaitable
+
+from ..resolvers import resolve_parent_field
+
+if sys.version_info >= (3, 12):
+    from asyncio import eager_task_factory
+else:
+    eager_task_factory = None
+
+# Types of values resolvers return most often, which are never awaitable
+NOT_AWAITABLE_TYPES = frozenset((str, int, float, bool, type(None), dict, list, tuple))
+
+
+def is_awaitable(value: Any) -> bool:
+    """Returns `True` if value can be awaited.
+
+    Skips the `__await__` lookup for values of most common types.
+    """
+    if type(value) in NOT_AWAITABLE_TYPES:
+        return False
+    return default_is_awaitable(value)
+
+
+class FieldPlan:
+    """How field using the default resolver is resolved and completed."""
+
+    __slots__ = ("attr_name", "field", "leaf_type", "nested", "non_null", "object_type")
+
+    def __init__(self, field: GraphQLField, attr_name: str) -> None:
+        self.field = field
+        self.attr_name = attr_name
+        self.nested = "." in attr_name
+        self.non_null = is_non_null_type(field.type)
+
+        return_type = get_nullable_type(field.type)  # ty: ignore
+        self.leaf_type: GraphQLLeafType | None = (
+            return_type if is_leaf_type(return_type) else None
+        )
+        self.object_type: GraphQLObjectType | None = (
+            return_type
+            if is_object_type(return_type) and not return_type.is_type_of
+            else None
+        )
+
+
+class FastExecutionContext(ExecutionContext):
+    """`ExecutionContext` with fast paths for fields using default resolvers.
+
+    Fields without resolvers, and fields with resolvers created by
+    `resolve_to`, like the ones set for aliases and converted names, read
+    values from their parent objects directly. Values of scalars, enums and
+    objects are completed without creating `GraphQLResolveInfo` for the
+    field. Callable values, lists, abstract types and errors are completed
+    by the default logic.
+
+    Fast paths are used only when the operation is executed without
+    middleware, which includes extensions, and with the default field
+    resolver. Results and errors are the same as with the default execution
+    context.
+
+    On Python 3.12 and later, coroutines of async fields are started
+    eagerly: fields which complete without suspending don't create tasks
+    and their results aren't gathered.
+    """
+
+    is_awaitable = staticmethod(is_awaitable)
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self._use_fast_paths = (
+            self.middleware_manager is None
+            and self.field_resolver is default_field_resolver
+        )
+
+    def execute_field(
+        self,
+        parent_type: GraphQLObjectType,
+        source: Any,
+        field_nodes: list[FieldNode],
+        path: Path,
+    ) -> AwaitableOrValue[Any]:
+        plan = None
+        if self._use_fast_paths:
+            plan = get_field_plan(parent_type, field_nodes[0].name.value)
+        if plan is None:
+            result = super().execute_field(parent_type, source, field_nodes, path)
+            if eager_task_factory and iscoroutine(result):
+                return start_eagerly(result)
+            return result
+
+        try:
+            if plan.nested:
+                value = resolve_parent_field(source, plan.attr_name)
+            elif isinstance(source, Mapping):
+                value = source.get(plan.attr_name)
+            else:
+                value = getattr(source, plan.attr_name, None)
+        except Exception as raw_error:
+            error = located_error(raw_error, field_nodes, path.as_list())
+            self.handle_field_error(error, plan.field.type, path)
+            return None
+
+        if value is None:
+            if not plan.non_null:
+                return None
+        elif (
+            not callable(value)
+            and not isinstance(value, Exception)
+            and not self.is_awaitable(value)
+        ):
+            if plan.leaf_type is not None:
+                try:
+                    serialized = plan.leaf_type.serialize(value)
+                except Exception:
+                    pass  # Error is reported by the default logic
+                else:
+                    if serialized is not None and serialized is not Undefined:
+                        return serialized
+            elif plan.object_type is not None:
+                return self.complete_object_field(
+                    plan.field, plan.object_type, field_nodes, path, value
+                )
+
+        return self.complete_field(plan.field, field_nodes, parent_type, path, value)
+
+    def complete_object_field(
+        self,
+        field: GraphQLField,
+        object_type: GraphQLObjectType,
+        field_nodes: list[FieldNode],
+        path: Path,
+        value: Any,
+    ) -> AwaitableOrValue[Any]:
+        """Executes fields of object which type has no `is_type_of`."""
+        return_type = field.type
+        try:
+            completed = self.execute_fields(
+                object_type,
+                value,
+                path,
+                self.collect_subfields(object_type, field_nodes),
+            )
+        except Exception as raw_error:
+            error = located_error(raw_error, field_nodes, path.as_list())
+            self.handle_field_error(error, return_type, path)
+            return None
+
+        if not self.is_awaitable(completed):
+            return completed
+
+        awaitable_completed = cast(Awaitable, completed)
+
+        async def await_completed() -> Any:
+            try:
+                return await awaitable_completed
+            except Exception as raw_error:
+                error = located_error(raw_error, field_nodes, path.as_list())
+                self.handle_field_error(error, return_type, path)
+                return None
+
+        return await_completed()
+
+    def complete_field(
+        self,
+        field: GraphQLField,
+        field_nodes: list[FieldNode],
+        parent_type: GraphQLObjectType,
+        path: Path,
+        value: Any,
+    ) -> AwaitableOrValue[Any]:
+        """Completes value read by the default resolver with the default logic.
+
+        Callable values are called with field's resolve info and arguments,
+        like the default resolver does.
+        """
+        return_type = field.type
+        info = self.build_resolve_info(field, field_nodes, parent_type, path)
+        try:
+            if callable(value):
+                args = get_argument_values(field, field_nodes[0], self.variable_values)
+                value = value(info, **args)
+
+            if self.is_awaitable(value):
+                result = value
+
+                async def await_result() -> Any:
+                    try:
+                        completed = self.complete_value(
+                            return_type, field_nodes, info, path, await result
+                        )
+                        if self.is_awaitable(completed):
+                            return await completed
+                        return completed
+                    except Exception as raw_error:
+                        error = located_error(raw_error, field_nodes, path.as_list())
+                        self.handle_field_error(error, return_type, path)
+                        return None
+
+                return await_result()
+
+            completed = self.complete_value(return_type, field_nodes, info, path, value)
+            if self.is_awaitable(completed):
+
+                async def await_completed() -> Any:
+                    try:
+                        return await completed
+                    except Exception as raw_error:
+                        error = located_error(raw_error, field_nodes, path.as_list())
+                        self.handle_field_error(error, return_type, path)
+                        return None
+
+                return await_completed()
+
+            return completed
+        except Exception as raw_error:
+            error = located_error(raw_error, field_nodes, path.as_list())
+            self.handle_field_error(error, return_type, path)
+            return None
+
+
+field_plans: WeakKeyDictionary[Any, dict[str, FieldPlan | None]] = WeakKeyDictionary()
+
+
+def get_field_plan(parent_type: GraphQLObjectType, field_name: str) -> FieldPlan | None:
+    """Returns `FieldPlan` of field using the default resolver, or `None`."""
+    plans = field_plans.get(parent_type)
+    if plans is None:
+        plans = field_plans.setdefault(parent_type, {})
+
+    try:
+        return plans[field_name]
+    except KeyError:
+        pass
+
+    plan = None
+    field = parent_type.fields.get(field_name)
+    if field is not None and not field.args:
+        if field.resolve is None or field.resolve is default_field_resolver:
+            plan = FieldPlan(field, field_name)
+        else:
+            attr_name = getattr(field.resolve, "_ariadne_alias_name", None)
+            if attr_name is not None:
+                plan = FieldPlan(field, attr_name)
+
+    plans[field_name] = plan
+    return plan
+
+
+def start_eagerly(coroutine: Any) -> Any:
+    """Runs field's coroutine until it suspends, and returns its result or task.
+
+    Returns the coroutine if there's no running event loop.
+    """
+    try:
+        loop = get_running_loop()
+    except RuntimeError:
+        return coroutine
+
+    task = eager_task_factory(loop, coroutine)  # ty: ignore
+    if task.done():
+        return task.result()
+    return task
@@ -0,0 +1,208 @@
+from asyncio import gather
+from concurrent.futures import Executor, Future, ThreadPoolExecutor, wait
+from contextvars import copy_context
+from threading import local
+from typing import Any
+
+from graphql import (
+    ExecutionContext,
+    FieldNode,
+    GraphQLError,
+    GraphQLObjectType,
+    GraphQLOutputType,
+    is_non_null_type,
+)
+from graphql.pyutils import AwaitableOrValue, Path, Undefined
+
+from ..resolvers import is_default_resolver
+
+FieldErrors = list[tuple[GraphQLError, Path]]
+FieldOutcome = tuple[Any, FieldErrors, Exception | None]
+
+
+class ParallelExecutionContext(ExecutionContext):
+    """`ExecutionContext` resolving sibling fields concurrently in threads.
+
+    Fields of the same selection set which have custom resolvers are
+    resolved in threads of the `executor`, while fields using default
+    resolvers are resolved in the calling thread. Root fields of mutations
+    are still resolved one after another.
+
+    Results and errors are the same as when fields are resolved serially:
+    result's keys are in the order of the query, errors are reported in the
+    order of fields, and error of a non-nullable field discards errors of
+    fields after it.
+
+    Thread waiting for a field which resolution didn't start yet resolves it
+    itself, so nested selection sets can't exhaust the executor's threads.
+
+    Use `parallel_execution_context` to create this type with an executor.
+    Resolvers, middleware and extensions must be thread-safe. On CPython
+    builds without the GIL, resolvers doing CPU work also run in parallel.
+    """
+
+    executor: Executor | None = None
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self._local = local()
+
+    def execute_fields(
+        self,
+        parent_type: GraphQLObjectType,
+        source_value: Any,
+        path: Path | None,
+        fields: dict[str, list[FieldNode]],
+    ) -> AwaitableOrValue[dict[str, Any]]:
+        executor = self.executor
+        if executor is None:
+            return super().execute_fields(parent_type, source_value, path, fields)
+
+        parallel_fields = [
+            response_name
+            for response_name, field_nodes in fields.items()
+            if self.should_resolve_in_thread(parent_type, field_nodes)
+        ]
+        if len(parallel_fields) < 2:
+            return super().execute_fields(parent_type, source_value, path, fields)
+
+        # First field is resolved in the calling thread
+        futures: dict[str, Future] = {}
+        for response_name in parallel_fields[1:]:
+            futures[response_name] = executor.submit(
+                copy_context().run,
+                self.execute_field_task,
+                parent_type,
+                source_value,
+                fields[response_name],
+                Path(path, response_name, parent_type.name),
+            )
+
+        results: dict[str, Any] = {}
+        awaitable_fields: list[str] = []
+        try:
+            for response_name, field_nodes in fields.items():
+                field_path = Path(path, response_name, parent_type.name)
+                future = futures.pop(response_name, None)
+                if future is None or future.cancel():
+                    outcome = self.execute_field_task(
+                        parent_type, source_value, field_nodes, field_path
+                    )
+                else:
+                    outcome = future.result()
+
+                result = self.complete_field_task(outcome)
+                if result is not Undefined:
+                    results[response_name] = result
+                    if self.is_awaitable(result):
+                        awaitable_fields.append(response_name)
+        except Exception:
+            # Error of non-nullable field discards results of remaining fields
+            for future in futures.values():
+                future.cancel()
+            wait(futures.values())
+            raise
+
+        if not awaitable_fields:
+            return results
+
+        async def get_results() -> dict[str, Any]:
+            results.update(
+                zip(
+                    awaitable_fields,
+                    await gather(*(results[field] for field in awaitable_fields)),
+                    strict=True,
+                )
+            )
+            return results
+
+        return get_results()
+
+    def should_resolve_in_thread(
+        self, parent_type: GraphQLObjectType, field_nodes: list[FieldNode]
+    ) -> bool:
+        """Returns `True` if field should be resolved in executor's thread.
+
+        Fields using default resolvers are resolved in the calling thread.
+        """
+        field = parent_type.fields.get(field_nodes[0].name.value)
+        if field is None or field.resolve is None:
+            return False  # __typename, __schema, __type and default resolver
+        return not is_default_resolver(field.resolve)
+
+    def execute_field_task(
+        self,
+        parent_type: GraphQLObjectType,
+        source: Any,
+        field_nodes: list[FieldNode],
+        path: Path,
+    ) -> FieldOutcome:
+        """Resolves the field, collecting its errors separately."""
+        state = self._local
+        parent_errors = getattr(state, "errors", None)
+        state.errors = errors = []
+        try:
+            return (
+                self.execute_field(parent_type, source, field_nodes, path),
+                errors,
+                None,
+            )
+        except Exception as error:
+            return None, errors, error
+        finally:
+            state.errors = parent_errors
+
+    def complete_field_task(self, outcome: FieldOutcome) -> Any:
+        """Adds errors of resolved field to the operation's errors.
+
+        Re-raises error of non-nullable field.
+        """
+        result, errors, error = outcome
+        for field_error, path in errors:
+            self.add_field_error(field_error, path)
+        if error:
+            raise error
+        return result
+
+    def handle_field_error(
+        self,
+        error: GraphQLError,
+        return_type: GraphQLOutputType,
+        path: Path,
+    ) -> None:
+        if is_non_null_type(return_type):
+            raise error
+        self.add_field_error(error, path)
+
+    def add_field_error(self, error: GraphQLError, path: Path) -> None:
+        errors: FieldErrors | None = getattr(self._local, "errors", None)
+        if errors is None:
+            self.collected_errors.add(error, path)
+        else:
+            errors.append((error, path))
+
+
+def parallel_execution_context(
+    *,
+    max_workers: int | None = None,
+    executor: Executor | None = None,
+) -> type[ParallelExecutionContext]:
+    """Returns `ParallelExecutionContext` type using a bounded thread pool.
+
+    # Optional arguments
+
+    `max_workers`: an `int` with maximum number of threads resolving fields
+    of all operations. Defaults to the `ThreadPoolExecutor`'s default.
+
+    `executor`: an `Executor` to use instead of creating a new thread pool.
+    """
+    if executor is None:
+        executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="ariadne-execution"
+        )
+
+    class _ParallelExecutionContext(ParallelExecutionContext):
+        pass
+
+    _ParallelExecutionContext.executor = executor
+    return _ParallelExecutionContext
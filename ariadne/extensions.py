@@ -1,9 +1,13 @@
 from contextlib import contextmanager
+from functools import cache
+from typing import Any
 
 from graphql import GraphQLError
 from graphql.execution import MiddlewareManager
 
-from .types import ContextValue, ExtensionList, MiddlewareList
+from .types import ContextValue, Extension, ExtensionList, MiddlewareList
+
+PHASES = ("parsing", "validation", "execution", "serialization")
 
 
 class ExtensionManager:
@@ -16,9 +20,12 @@ class ExtensionManager:
     `extensions`: a `tuple` with instances of initialized extensions.
 
     `extensions_reversed`: a `tuple` created from reversing `extensions`.
+
+    `phase_extensions`: a `dict` with `tuple`s of extensions overriding
+    hooks of request's phases, keyed by phase's name.
     """
 
-    __slots__ = ("context", "extensions", "extensions_reversed")
+    __slots__ = ("context", "extensions", "extensions_reversed", "phase_extensions")
 
     def __init__(
         self,
@@ -41,6 +48,14 @@ class ExtensionManager:
         else:
             self.extensions_reversed = self.extensions = tuple()
 
+        self.phase_extensions: dict[str, tuple] = {}
+        for ext in self.extensions:
+            for phase in get_extension_phases(type(ext)):
+                self.phase_extensions[phase] = (
+                    *self.phase_extensions.get(phase, ()),
+                    ext,
+                )
+
     def as_middleware_manager(
         self,
         middleware: MiddlewareList = None,
@@ -82,6 +97,31 @@ class ExtensionManager:
             for ext in self.extensions_reversed:
                 ext.request_finished(self.context)
 
+    def request_cancelled(self) -> None:
+        """Runs `request_cancelled` hooks after request's execution was cancelled."""
+        for ext in self.extensions_reversed:
+            ext.request_cancelled(self.context)
+
+    def phase(self, name: str) -> "ExtensionPhase | NoPhaseHooks":
+        """Returns a context manager that should wrap request's phase.
+
+        Runs `{name}_started` hooks at beginning and `{name}_finished` hooks
+        at the end of the phase. Can be used with `async with` to run
+        `{name}_started_async` and `{name}_finished_async` hooks instead.
+
+        Returns shared context manager that does nothing if none of extensions
+        overrides phase's hooks.
+
+        # Required arguments
+
+        `name`: a `str` with name of phase: `parsing`, `validation`,
+        `execution` or `serialization`.
+        """
+        extensions = self.phase_extensions.get(name)
+        if not extensions:
+            return NO_PHASE_HOOKS
+        return ExtensionPhase(name, extensions, self.context)
+
     def has_errors(self, errors: list[GraphQLError]):
         """Propagates GraphQL errors returned by GraphQL server to extensions.
 
@@ -103,3 +143,85 @@ class ExtensionManager:
             if ext_data:
                 data.update(ext_data)
         return data
+
+
+class ExtensionPhase:
+    """Context manager running extensions' hooks of request's phase."""
+
+    __slots__ = ("context", "extensions", "finished", "started")
+
+    def __init__(self, name: str, extensions: tuple, context: Any) -> None:
+        self.started = f"{name}_started"
+        self.finished = f"{name}_finished"
+        self.extensions = extensions
+        self.context = context
+
+    def __enter__(self) -> None:
+        for ext in self.extensions:
+            hook = getattr(ext, self.started, None)
+            if hook:
+                hook(self.context)
+
+    def __exit__(self, *_) -> None:
+        for ext in reversed(self.extensions):
+            hook = getattr(ext, self.finished, None)
+            if hook:
+                hook(self.context)
+
+    async def __aenter__(self) -> None:
+        for ext in self.extensions:
+            await run_async_hook(ext, self.started, self.context)
+
+    async def __aexit__(self, *_) -> None:
+        for ext in reversed(self.extensions):
+            await run_async_hook(ext, self.finished, self.context)
+
+
+class NoPhaseHooks:
+    """Context manager used for phases which hooks aren't overridden."""
+
+    __slots__ = ()
+
+    def __enter__(self) -> None:
+        pass
+
+    def __exit__(self, *_) -> None:
+        pass
+
+    async def __aenter__(self) -> None:
+        pass
+
+    async def __aexit__(self, *_) -> None:
+        pass
+
+
+NO_PHASE_HOOKS = NoPhaseHooks()
+
+
+async def run_async_hook(extension: Any, name: str, context: Any) -> None:
+    hook = getattr(extension, f"{name}_async", None)
+    if hook:
+        await hook(context)
+        return
+
+    hook = getattr(extension, name, None)
+    if hook:
+        hook(context)
+
+
+@cache
+def get_extension_phases(extension_type: type) -> tuple[str, ...]:
+    """Returns names of phases which hooks are overridden by extension type."""
+    phases = []
+    for phase in PHASES:
+        for hook in (
+            f"{phase}_started",
+            f"{phase}_finished",
+            f"{phase}_started_async",
+            f"{phase}_finished_async",
+        ):
+            method = getattr(extension_type, hook, None)
+            if method is not None and method is not getattr(Extension, hook):
+                phases.append(phase)
+                break
+    return tuple(phases)
@@ -62,6 +62,7 @@ async def graphql(
     middleware: MiddlewareList = None,
     middleware_manager_class: type[MiddlewareManager] | None = None,
     extensions: ExtensionList | None = None,
+    extension_manager: ExtensionManager | None = None,
     execution_context_class: type[ExecutionContext] | None = None,
     **kwargs,
 ) -> GraphQLResult:
@@ -126,6 +127,10 @@ async def graphql(
     `extensions`: a `list` of or callable returning list of extensions
     to use during query execution.
 
+    `extension_manager`: an `ExtensionManager` to use instead of creating
+    new one for `extensions`. Lets servers run extensions' hooks after query
+    execution, eg. serialization hooks.
+
     `execution_context_class`: `ExecutionContext` class to use by query
     executor.
 
@@ -134,7 +139,8 @@ async def graphql(
     """
     result_update: BaseProxyRootValue | None = None
 
-    extension_manager = ExtensionManager(extensions, context_value)
+    if extension_manager is None:
+        extension_manager = ExtensionManager(extensions, context_value)
 
     with extension_manager.request():
         try:
@@ -147,21 +153,29 @@ async def graphql(
             if query_document:
                 document = query_document
             else:
-                document = parse_query(context_value, query_parser, data)
+                async with extension_manager.phase("parsing"):
+                    document = parse_query(context_value, query_parser, data)
+
+            async with extension_manager.phase("validation"):
+                if callable(validation_rules):
+                    validation_rules = cast(
+                        Collection[type[ASTValidationRule]] | None,
+                        validation_rules(context_value, document, data),
+                    )
 
-            if callable(validation_rules):
-                validation_rules = cast(
-                    Collection[type[ASTValidationRule]] | None,
-                    validation_rules(context_value, document, data),  # ty: ignore
+                validation_errors = validate_query(
+                    schema,
+                    document,
+                    validation_rules,
+                    enable_introspection=introspection,
+                    query_validator=query_validator,
                 )
+                if not validation_errors:
+                    if require_query:
+                        validate_operation_is_query(document, operation_name)
+                    else:
+                        validate_operation_is_not_subscription(document, operation_name)
 
-            validation_errors = validate_query(
-                schema,
-                document,
-                validation_rules,
-                enable_introspection=introspection,
-                query_validator=query_validator,
-            )
             if validation_errors:
                 return handle_graphql_errors(
                     validation_errors,
@@ -171,39 +185,35 @@ async def graphql(
                     extension_manager=extension_manager,
                 )
 
-            if require_query:
-                validate_operation_is_query(document, operation_name)
-            else:
-                validate_operation_is_not_subscription(document, operation_name)
+            async with extension_manager.phase("execution"):
+                if callable(root_value):
+                    root_value = root_value(
+                        context_value, operation_name, variables, document
+                    )
 
-            if callable(root_value):
-                root_value = root_value(
-                    context_value, operation_name, variables, document
+                    if isawaitable(root_value):
+                        root_value = await root_value
+
+                if isinstance(root_value, BaseProxyRootValue):
+                    result_update = root_value
+                    root_value = root_value.root_value
+
+                exec_result = execute(
+                    schema,
+                    document,
+                    root_value=root_value,
+                    context_value=context_value,
+                    variable_values=variables,
+                    operation_name=operation_name,
+                    execution_context_class=execution_context_class,
+                    middleware=extension_manager.as_middleware_manager(
+                        middleware, middleware_manager_class
+                    ),
+                    **kwargs,
                 )
 
-                if isawaitable(root_value):
-                    root_value = await root_value
-
-            if isinstance(root_value, BaseProxyRootValue):
-                result_update = root_value
-                root_value = root_value.root_value
-
-            exec_result = execute(
-                schema,
-                document,
-                root_value=root_value,
-                context_value=context_value,
-                variable_values=variables,
-                operation_name=operation_name,
-                execution_context_class=execution_context_class,
-                middleware=extension_manager.as_middleware_manager(
-                    middleware, middleware_manager_class
-                ),
-                **kwargs,
-            )
-
-            if isawaitable(exec_result):
-                exec_result = await exec_result
+                if isawaitable(exec_result):
+                    exec_result = await exec_result
         except GraphQLError as error:
             error_result = handle_graphql_errors(
                 [error],
@@ -250,6 +260,7 @@ def graphql_sync(
     middleware: MiddlewareList = None,
     middleware_manager_class: type[MiddlewareManager] | None = None,
     extensions: ExtensionList | None = None,
+    extension_manager: ExtensionManager | None = None,
     execution_context_class: type[ExecutionContext] | None = None,
     **kwargs,
 ) -> GraphQLResult:
@@ -314,6 +325,10 @@ def graphql_sync(
     `extensions`: a `list` of or callable returning list of extensions
     to use during query execution.
 
+    `extension_manager`: an `ExtensionManager` to use instead of creating
+    new one for `extensions`. Lets servers run extensions' hooks after query
+    execution, eg. serialization hooks.
+
     `execution_context_class`: `ExecutionContext` class to use by query
     executor.
 
@@ -322,7 +337,8 @@ def graphql_sync(
     """
     result_update: BaseProxyRootValue | None = None
 
-    extension_manager = ExtensionManager(extensions, context_value)
+    if extension_manager is None:
+        extension_manager = ExtensionManager(extensions, context_value)
 
     with extension_manager.request():
         try:
@@ -335,21 +351,29 @@ def graphql_sync(
             if query_document:
                 document = query_document
             else:
-                document = parse_query(context_value, query_parser, data)
+                with extension_manager.phase("parsing"):
+                    document = parse_query(context_value, query_parser, data)
+
+            with extension_manager.phase("validation"):
+                if callable(validation_rules):
+                    validation_rules = cast(
+                        Collection[type[ASTValidationRule]] | None,
+                        validation_rules(context_value, document, data),
+                    )
 
-            if callable(validation_rules):
-                validation_rules = cast(
-                    Collection[type[ASTValidationRule]] | None,
-                    validation_rules(context_value, document, data),  # ty: ignore
+                validation_errors = validate_query(
+                    schema,
+                    document,
+                    validation_rules,
+                    enable_introspection=introspection,
+                    query_validator=query_validator,
                 )
+                if not validation_errors:
+                    if require_query:
+                        validate_operation_is_query(document, operation_name)
+                    else:
+                        validate_operation_is_not_subscription(document, operation_name)
 
-            validation_errors = validate_query(
-                schema,
-                document,
-                validation_rules,
-                enable_introspection=introspection,
-                query_validator=query_validator,
-            )
             if validation_errors:
                 return handle_graphql_errors(
                     validation_errors,
@@ -359,46 +383,44 @@ def graphql_sync(
                     extension_manager=extension_manager,
                 )
 
-            if require_query:
-                validate_operation_is_query(document, operation_name)
-            else:
-                validate_operation_is_not_subscription(document, operation_name)
+            with extension_manager.phase("execution"):
+                if callable(root_value):
+                    root_value = root_value(
+                        context_value, operation_name, variables, document
+                    )
 
-            if callable(root_value):
-                root_value = root_value(
-                    context_value, operation_name, variables, document
+                    if isawaitable(root_value):
+                        ensure_future(root_value).cancel()
+                        raise RuntimeError(
+                            "Root value resolver can't be asynchronous "
+                            "in synchronous query executor."
+                        )
+
+                if isinstance(root_value, BaseProxyRootValue):
+                    result_update = root_value
+                    root_value = root_value.root_value
+
+                exec_result = execute_sync(
+                    schema,
+                    document,
+                    root_value=root_value,
+                    context_value=context_value,
+                    variable_values=variables,
+                    operation_name=operation_name,
+                    execution_context_class=execution_context_class,
+                    middleware=extension_manager.as_middleware_manager(
+                        middleware, middleware_manager_class
+                    ),
+                    **kwargs,
                 )
 
-                if isawaitable(root_value):
-                    ensure_future(root_value).cancel()
+                if isawaitable(exec_result):
+                    ensure_future(
+                        cast(Awaitable[ExecutionResult], exec_result)
+                    ).cancel()
                     raise RuntimeError(
-                        "Root value resolver can't be asynchronous "
-                        "in synchronous query executor."
+                        "GraphQL execution failed to complete synchronously."
                     )
-
-            if isinstance(root_value, BaseProxyRootValue):
-                result_update = root_value
-                root_value = root_value.root_value
-
-            exec_result = execute_sync(
-                schema,
-                document,
-                root_value=root_value,
-                context_value=context_value,
-                variable_values=variables,
-                operation_name=operation_name,
-                execution_context_class=execution_context_class,
-                middleware=extension_manager.as_middleware_manager(
-                    middleware, middleware_manager_class
-                ),
-                **kwargs,
-            )
-
-            if isawaitable(exec_result):
-                ensure_future(cast(Awaitable[ExecutionResult], exec_result)).cancel()
-                raise RuntimeError(
-                    "GraphQL execution failed to complete synchronously."
-                )
         except GraphQLError as error:
             error_result = handle_graphql_errors(
                 [error],
@@ -441,6 +463,7 @@ async def subscribe(
     logger: None | str | Logger | LoggerAdapter = None,
     validation_rules: ValidationRules | None = None,
     error_formatter: ErrorFormatter = format_error,
+    extensions: ExtensionList | None = None,
     **kwargs,
 ) -> SubscriptionResult:
     """Subscribe to GraphQL updates.
@@ -491,67 +514,83 @@ async def subscribe(
     `error_formatter`: an `ErrorFormatter` callable to use to convert GraphQL
     errors encountered during query execution to JSON-serializable format.
 
+    `extensions`: a `list` of or callable returning list of extensions to
+    use during subscription's setup. Extensions' `resolve` hooks are not
+    used for subscriptions.
+
     `**kwargs`: any kwargs not used by `subscribe` are passed to
     `graphql.subscribe`.
     """
-    try:
-        validate_data(data)
-        variables, operation_name = (
-            data.get("variables"),
-            data.get("operationName"),
-        )
-
-        if query_document:
-            document = query_document
-        else:
-            document = parse_query(context_value, query_parser, data)
+    extension_manager = ExtensionManager(extensions, context_value)
 
-        if callable(validation_rules):
-            validation_rules = cast(
-                Collection[type[ASTValidationRule]] | None,
-                validation_rules(context_value, document, data),  # ty: ignore
+    with extension_manager.request():
+        try:
+            validate_data(data)
+            variables, operation_name = (
+                data.get("variables"),
+                data.get("operationName"),
             )
 
-        validation_errors = validate_query(
-            schema,
-            document,
-            validation_rules,
-            enable_introspection=introspection,
-            query_validator=query_validator,
-        )
-        if validation_errors:
-            for error_ in validation_errors:  # mypy issue #5080
-                log_error(error_, logger)
-            return (
-                False,
-                [error_formatter(error, debug) for error in validation_errors],
-            )
+            if query_document:
+                document = query_document
+            else:
+                async with extension_manager.phase("parsing"):
+                    document = parse_query(context_value, query_parser, data)
+
+            async with extension_manager.phase("validation"):
+                if callable(validation_rules):
+                    validation_rules = cast(
+                        Collection[type[ASTValidationRule]] | None,
+                        validation_rules(context_value, document, data),
+                    )
+
+                validation_errors = validate_query(
+                    schema,
+                    document,
+                    validation_rules,
+                    enable_introspection=introspection,
+                    query_validator=query_validator,
+                )
 
-        if callable(root_value):
-            root_value = root_value(context_value, operation_name, variables, document)
+            if validation_errors:
+                for error_ in validation_errors:  # mypy issue #5080
+                    log_error(error_, logger)
+                extension_manager.has_errors(validation_errors)
+                return (
+                    False,
+                    [error_formatter(error, debug) for error in validation_errors],
+                )
 
-            if isawaitable(root_value):
-                root_value = await root_value
+            async with extension_manager.phase("execution"):
+                if callable(root_value):
+                    root_value = root_value(
+                        context_value, operation_name, variables, document
+                    )
 
-        result = await _subscribe(
-            schema,
-            document,
-            root_value=root_value,
-            context_value=context_value,
-            variable_values=variables,
-            operation_name=operation_name,
-            **kwargs,
-        )
-    except GraphQLError as error:
-        log_error(error, logger)
-        return False, [error_formatter(error, debug)]
-
-    if isinstance(result, ExecutionResult):
-        errors = cast(list[GraphQLError], result.errors)
-        for error_ in errors:  # mypy issue #5080
-            log_error(error_, logger)
-        return False, [error_formatter(error, debug) for error in errors]
-    return True, cast(AsyncGenerator, result)
+                    if isawaitable(root_value):
+                        root_value = await root_value
+
+                result = await _subscribe(
+                    schema,
+                    document,
+                    root_value=root_value,
+                    context_value=context_value,
+                    variable_values=variables,
+                    operation_name=operation_name,
+                    **kwargs,
+                )
+        except GraphQLError as error:
+            log_error(error, logger)
+            extension_manager.has_errors([error])
+            return False, [error_formatter(error, debug)]
+
+        if isinstance(result, ExecutionResult):
+            errors = cast(list[GraphQLError], result.errors)
+            for error_ in errors:  # mypy issue #5080
+                log_error(error_, logger)
+            extension_manager.has_errors(errors)
+            return False, [error_formatter(error, debug) for error in errors]
+        return True, cast(AsyncGenerator, result)
 
 
 def handle_query_result(
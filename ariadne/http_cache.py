@@ -0,0 +1,135 @@
+from collections.abc import Callable, Sequence
+from hashlib import sha256
+from typing import Any
+
+__all__ = ["HttpCache"]
+
+CacheVersion = Callable[[Any, dict], str | None]
+
+
+class HttpCache:
+    """HTTP caching policy for results of GraphQL queries sent with `GET`.
+
+    Successful results are sent with strong `ETag` computed from response's
+    body, and `Cache-Control` and `Vary` headers. Requests with `If-None-Match`
+    header matching the result's `ETag` receive the `304 Not Modified`
+    response without a body.
+
+    Results with errors are sent with `Cache-Control: no-store` header.
+    """
+
+    def __init__(
+        self,
+        *,
+        cache_control: str | None = "no-cache",
+        vary: Sequence[str] | None = None,
+        version: CacheVersion | None = None,
+    ) -> None:
+        """Initializes the HTTP caching policy.
+
+        # Optional arguments
+
+        `cache_control`: a `str` with value of `Cache-Control` header for
+        successful results. Defaults to `no-cache`, which lets clients store
+        the result but requires them to revalidate it with server on every
+        request. Set to `None` to skip this header.
+
+        `vary`: a sequence of `str` with names of request headers to list in
+        the `Vary` header. Should include all headers that change the result,
+        like `Authorization` if it's used by resolvers.
+
+        `version`: a callable taking the request (`Request` for ASGI or
+        `environ` for WSGI) and the result `dict`, and returning a `str` with
+        version of the result or `None`. If version is returned, `ETag` is
+        computed from it and response's content type and coding instead of
+        response's body.
+        """
+        self.cache_control = cache_control
+        self.vary = ", ".join(vary) if vary else None
+        self.version = version
+
+    def get_etag(
+        self,
+        request: Any,
+        result: dict,
+        body: bytes | memoryview,
+        *,
+        content_type: str | None = None,
+        content_encoding: str | None = None,
+    ) -> str | None:
+        """Returns `ETag` for the result, or `None` if it shouldn't be cached.
+
+        # Required arguments
+
+        `request`: the request (`Request` for ASGI or `environ` for WSGI).
+
+        `result`: a `dict` with GraphQL result.
+
+        `body`: a `bytes` or `memoryview` with encoded response's body.
+
+        # Optional arguments
+
+        `content_type`: a `str` with value of response's `Content-Type` header.
+
+        `content_encoding`: a `str` with value of response's `Content-Encoding`
+        header.
+        """
+        if result.get("errors") or result.get("data") is None:
+            return None
+
+        if self.version:
+            version = self.version(request, result)
+            if version is not None:
+                # Strong ETag must differ between representations of result
+                variant = f"{content_type or ''};{content_encoding or ''}"
+                return create_etag(f"version:{version}:{variant}".encode())
+
+        return create_etag(body)
+
+    def get_headers(self, etag: str | None) -> dict[str, str]:
+        """Returns caching headers to include in the response.
+
+        # Required arguments
+
+        `etag`: a `str` with result's `ETag` or `None` if result shouldn't be
+        cached.
+        """
+        if etag is None:
+            return {"Cache-Control": "no-store"}
+
+        headers = {"ETag": etag}
+        if self.cache_control:
+            headers["Cache-Control"] = self.cache_control
+        if self.vary:
+            headers["Vary"] = self.vary
+        return headers
+
+    def is_not_modified(self, if_none_match: str | None, etag: str | None) -> bool:
+        """Tests if client's cached result is still valid.
+
+        Returns `True` if `If-None-Match` request's header matches the `ETag`.
+
+        # Required arguments
+
+        `if_none_match`: a `str` with value of `If-None-Match` header or
+        `None`.
+
+        `etag`: a `str` with result's `ETag` or `None`.
+        """
+        if not if_none_match or not etag:
+            return False
+
+        for client_etag in if_none_match.split(","):
+            client_etag = client_etag.strip()
+            if client_etag == "*":
+                return True
+            # If-None-Match uses weak comparison (RFC 9110, section 13.1.2)
+            client_etag = client_etag.removeprefix("W/")
+            if client_etag == etag:
+                return True
+
+        return False
+
+
+def create_etag(value: bytes | memoryview) -> str:
+    return f'"{sha256(value).hexdigest()[:32]}"'
@@ -0,0 +1,298 @@
+import json
+from hashlib import sha256
+from typing import Any
+from weakref import WeakKeyDictionary
+
+from graphql import (
+    DocumentNode,
+    FieldNode,
+    GraphQLSchema,
+    OperationDefinitionNode,
+    OperationType,
+    introspection_from_schema,
+    print_ast,
+)
+
+INTROSPECTION_ROOT_FIELDS = ("__schema", "__type", "__typename")
+
+_introspection_results: "WeakKeyDictionary[GraphQLSchema, dict]" = WeakKeyDictionary()
+
+
+def get_introspection_result(schema: GraphQLSchema) -> dict:
+    """Returns the result of full introspection query for the schema.
+
+    The result is computed once for every schema instance, on first call.
+    It's the same `dict` that GraphQL clients receive in `data` key of their
+    introspection query's result, and can be used by tooling (codegen, schema
+    registries) to skip executing the query.
+
+    Returned `dict` is shared between calls and shouldn't be mutated.
+
+    # Required arguments
+
+    `schema`: a `GraphQLSchema` to introspect.
+    """
+    result = _introspection_results.get(schema)
+    if result is None:
+        result = dict(introspection_from_schema(schema))
+        _introspection_results[schema] = result
+    return result
+
+
+def is_introspection_document(
+    document: DocumentNode, operation_name: str | None = None
+) -> bool:
+    """Tests if executed operation only introspects the schema.
+
+    Returns `True` if executed operation is a query without variables which
+    selects only the `__schema`, `__type` and `__typename` root fields. Result
+    of such query depends only on the schema.
+
+    # Required arguments
+
+    `document`: a `DocumentNode` with parsed GraphQL document.
+
+    # Optional arguments
+
+    `operation_name`: a `str` with name of operation to execute.
+    """
+    operation = get_executed_operation(document, operation_name)
+    if not operation or operation.operation != OperationType.QUERY:
+        return False
+    if operation.variable_definitions:
+        return False
+
+    for selection in operation.selection_set.selections:
+        if not isinstance(selection, FieldNode):
+            return False
+        if selection.name.value not in INTROSPECTION_ROOT_FIELDS:
+            return False
+
+    return True
+
+
+def get_executed_operation(
+    document: DocumentNode, operation_name: str | None
+) -> OperationDefinitionNode | None:
+    operation = None
+    for definition in document.definitions:
+        if not isinstance(definition, OperationDefinitionNode):
+            continue
+        if operation_name is None:
+            if operation:
+                return None
+            operation = definition
+        elif definition.name and definition.name.value == operation_name:
+            return definition
+    return operation
+
+
+def get_document_hash(document: DocumentNode, operation_name: str | None) -> str:
+    """Returns hash of normalized GraphQL document and operation name.
+
+    Documents differing only in whitespace, commas and comments have same hash.
+    """
+    normalized = f"{operation_name or ''}\n{print_ast(document)}"
+    return sha256(normalized.encode("utf-8")).hexdigest()
+
+
+class CachedIntrospection:
+    """Result of introspection query cached by `IntrospectionCache`.
+
+    # Attributes
+
+    `result`: a JSON-serializable `dict` with query's result.
+    """
+
+    __slots__ = ("_json", "result")
+
+    result: dict
+
+    def __init__(self, result: dict) -> None:
+        self.result = result
+        self._json: bytes | None = None
+
+    @property
+    def json(self) -> bytes:
+        """Result encoded to JSON, encoded on first access."""
+        if self._json is None:
+            self._json = json.dumps(
+                self.result,
+                ensure_ascii=False,
+                allow_nan=False,
+                separators=(",", ":"),
+            ).encode("utf-8")
+        return self._json
+
+
+class SchemaIntrospectionCache:
+    __slots__ = ("documents", "queries")
+
+    def __init__(self) -> None:
+        self.documents: dict[str, CachedIntrospection] = {}
+        self.queries: dict[tuple[str, str | None], CachedIntrospection] = {}
+
+
+class IntrospectionCache:
+    """Cache for results of introspection queries used by GraphQL servers.
+
+    Results are stored separately for every schema instance, and are discarded
+    together with the schema. Queries are matched by exact query string first,
+    and by hash of normalized document when query string is seen first time.
+
+    Only successful results of operations for which
+    `is_introspection_document` returns `True` are cached.
+
+    # Attributes
+
+    `max_size`: an `int` with maximum number of distinct queries to cache for
+    single schema.
+
+    `hits`: an `int` with number of queries answered from the cache.
+
+    `misses`: an `int` with number of introspection queries that were not in
+    the cache.
+    """
+
+    def __init__(self, max_size: int = 64) -> None:
+        """Initializes the introspection cache.
+
+        # Optional arguments
+
+        `max_size`: an `int` with maximum number of distinct queries to cache
+        for single schema. Defaults to 64.
+        """
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._schemas: WeakKeyDictionary[GraphQLSchema, SchemaIntrospectionCache] = (
+            WeakKeyDictionary()
+        )
+
+    def is_candidate(self, data: Any) -> bool:
+        """Cheaply tests if GraphQL request's data may be an introspection query.
+
+        # Required arguments
+
+        `data`: an unvalidated GraphQL request's data.
+        """
+        return (
+            isinstance(data, dict)
+            and isinstance(data.get("query"), str)
+            and "__schema" in data["query"]
+            and isinstance(data.get("operationName"), str | None)
+            and isinstance(data.get("variables"), dict | None)
+        )
+
+    def get(self, schema: GraphQLSchema, data: Any) -> CachedIntrospection | None:
+        """Returns cached result for query string from request's data.
+
+        Returns `CachedIntrospection` or `None` if query was not cached.
+
+        # Required arguments
+
+        `schema`: a `GraphQLSchema` query is executed against.
+
+        `data`: an unvalidated GraphQL request's data.
+        """
+        if not self.is_candidate(data):
+            return None
+
+        schema_cache = self._schemas.get(schema)
+        if schema_cache:
+            cached = schema_cache.queries.get(get_query_key(data))
+            if cached:
+                self.hits += 1
+                return cached
+
+        return None
+
+    def get_for_document(
+        self, schema: GraphQLSchema, data: dict, document: DocumentNode
+    ) -> CachedIntrospection | None:
+        """Returns cached result for parsed GraphQL document.
+
+        Returns `CachedIntrospection` or `None` if document's result was not
+        cached. Remembers the query string from `data` as an alias for cached
+        result.
+
+        # Required arguments
+
+        `schema`: a `GraphQLSchema` query is executed against.
+
+        `data`: a GraphQL request's data.
+
+        `document`: a `DocumentNode` with query parsed from `data`.
+        """
+        operation_name = get_operation_name(data)
+        if not is_introspection_document(document, operation_name):
+            return None
+
+        schema_cache = self._schemas.get(schema)
+        if schema_cache:
+            document_hash = get_document_hash(document, operation_name)
+            cached = schema_cache.documents.get(document_hash)
+            if cached:
+                if len(schema_cache.queries) < self.max_size:
+                    schema_cache.queries[get_query_key(data)] = cached
+                self.hits += 1
+                return cached
+
+        self.misses += 1
+        return None
+
+    def set(
+        self,
+        schema: GraphQLSchema,
+        data: dict,
+        document: DocumentNode,
+        result: dict,
+    ) -> None:
+        """Caches result of executed introspection query.
+
+        Results with errors and results for documents that are not
+        introspection-only are skipped.
+
+        # Required arguments
+
+        `schema`: a `GraphQLSchema` query was executed against.
+
+        `data`: a GraphQL request's data.
+
+        `document`: a `DocumentNode` with query parsed from `data`.
+
+        `result`: a `dict` with query's result.
+        """
+        if result.get("errors") or result.get("data") is None:
+            return
+
+        operation_name = get_operation_name(data)
+        if not is_introspection_document(document, operation_name):
+            return
+
+        schema_cache = self._schemas.get(schema)
+        if schema_cache is None:
+            schema_cache = SchemaIntrospectionCache()
+            self._schemas[schema] = schema_cache
+
+        if len(schema_cache.documents) >= self.max_size:
+            return
+
+        cached = CachedIntrospection({"data": result["data"]})
+        schema_cache.documents[get_document_hash(document, operation_name)] = cached
+        schema_cache.queries[get_query_key(data)] = cached
+
+    def clear(self) -> None:
+        """Removes all cached results."""
+        self._schemas.clear()
+
+
+def get_operation_name(data: dict) -> str | None:
+    operation_name = data.get("operationName")
+    if isinstance(operation_name, str):
+        return operation_name
+    return None
+
+
+def get_query_key(data: dict) -> tuple[str, str | None]:
+    return data["query"], get_operation_name(data)
@@ -0,0 +1,157 @@
+import json
+from collections.abc import Sequence
+from typing import Any
+
+__all__ = ["ResultNormalization"]
+
+NORMALIZED = "normalized"
+
+
+class ResultNormalization:
+    """Normalized format of GraphQL results, requested by the client.
+
+    Objects with `__typename` and key fields are moved from result's `data`
+    to the `entities` table and replaced with `{"__ref": key}` references.
+    Entity selected in many places of the result is sent only once, with its
+    fields merged from all places. Entity key is its type name and values of
+    key fields, eg. `User:1` or `Review:{"author":"1","product":"2"}`.
+
+    Objects which fields conflict with other occurrences of the same entity
+    (eg. because field was aliased to different arguments) are kept inline.
+
+    Clients request this format by sending the `GraphQL-Response-Format:
+    normalized` header. Paths of errors always point to fields in the
+    denormalized result.
+    """
+
+    def __init__(
+        self,
+        *,
+        key_fields: dict[str, str | Sequence[str]] | None = None,
+        default_key_fields: Sequence[str] = ("id",),
+        header: str = "GraphQL-Response-Format",
+    ) -> None:
+        """Initializes the result normalization.
+
+        # Optional arguments
+
+        `key_fields`: a `dict` with names of key fields for GraphQL types,
+        for types which are not identified by `default_key_fields`. Set type's
+        key fields to an empty sequence to never normalize its objects.
+
+        `default_key_fields`: a sequence of `str` with names of key fields
+        for types not listed in `key_fields`. Defaults to `("id",)`.
+
+        `header`: a `str` with name of request header used by clients to
+        request normalized results. Response with normalized result includes
+        this header with `normalized` value.
+        """
+        self.key_fields: dict[str, tuple[str, ...]] = {
+            type_name: (fields,) if isinstance(fields, str) else tuple(fields)
+            for type_name, fields in (key_fields or {}).items()
+        }
+        self.default_key_fields = tuple(default_key_fields)
+        self.header = header
+
+    def is_requested(self, header_value: str | None) -> bool:
+        """Returns `True` if client requested normalized result.
+
+        # Required arguments
+
+        `header_value`: a `str` with value of request's header or `None`.
+        """
+        if not header_value:
+            return False
+        return header_value.strip().lower() == NORMALIZED
+
+    def normalize(self, result: dict) -> dict:
+        """Returns normalized copy of GraphQL result.
+
+        Result without `data` is returned unchanged.
+
+        # Required arguments
+
+        `result`: a `dict` with GraphQL result.
+        """
+        if not isinstance(result.get("data"), dict):
+            return result
+
+        entities: dict[str, dict] = {}
+        normalized: dict[str, Any] = {}
+        for key, value in result.items():
+            if key == "data":
+                normalized["data"] = {
+                    field: self.normalize_value(field_value, entities)
+                    for field, field_value in value.items()
+                }
+                normalized["entities"] = entities
+            else:
+                normalized[key] = value
+        return normalized
+
+    def normalize_value(self, value: Any, entities: dict[str, dict]) -> Any:
+        """Returns normalized copy of value from GraphQL result.
+
+        Found entities are merged into `entities` table.
+
+        # Required arguments
+
+        `value`: a value from result's `data`.
+
+        `entities`: a `dict` with entities table.
+        """
+        if isinstance(value, list):
+            return [self.normalize_value(item, entities) for item in value]
+        if not isinstance(value, dict):
+            return value
+
+        normalized = {
+            field: self.normalize_value(field_value, entities)
+            for field, field_value in value.items()
+        }
+
+        key = self.get_entity_key(normalized)
+        if key is None:
+            return normalized
+
+        entity = entities.get(key)
+        if entity is None:
+            entities[key] = normalized
+        else:
+            for field, field_value in normalized.items():
+                if field in entity and entity[field] != field_value:
+                    return normalized
+            entity.update(normalized)
+
+        return {"__ref": key}
+
+    def get_entity_key(self, value: dict) -> str | None:
+        """Returns entity key for object from GraphQL result or `None`.
+
+        `None` is returned if object is missing `__typename` or any of its key
+        fields, or if any of key fields is `null`.
+
+        # Required arguments
+
+        `value`: a `dict` with object from result's `data`.
+        """
+        type_name = value.get("__typename")
+        if not isinstance(type_name, str):
+            return None
+
+        key_fields = self.key_fields.get(type_name, self.default_key_fields)
+        if not key_fields:
+            return None
+
+        key_values = {}
+        for field in key_fields:
+            field_value = value.get(field)
+            if field_value is None or isinstance(field_value, (dict, list)):
+                return None
+            key_values[field] = field_value
+
+        if len(key_fields) == 1:
+            return f"{type_name}:{key_values[key_fields[0]]}"
+
+        key = json.dumps(key_values, ensure_ascii=False, separators=(",", ":"))
+        return f"{type_name}:{key}"
@@ -3,7 +3,9 @@ from typing import cast
 
 from graphql.type import GraphQLNamedType, GraphQLObjectType, GraphQLSchema
 
+from .processes import set_field_cpu_bound
 from .resolvers import resolve_to
+from .threads import set_field_threaded
 from .types import Resolver, SchemaBindable
 
 
@@ -153,6 +155,8 @@ class ObjectType(SchemaBindable):
     """
 
     _resolvers: dict[str, Resolver]
+    _threaded: set[str]
+    _cpu_bound: set[str]
 
     def __init__(self, name: str) -> None:
         """Initializes the `ObjectType` with a `name`.
@@ -164,8 +168,12 @@ class ObjectType(SchemaBindable):
         """
         self.name = name
         self._resolvers = {}
+        self._threaded = set()
+        self._cpu_bound = set()
 
-    def field(self, name: str) -> Callable[[Resolver], Resolver]:
+    def field(
+        self, name: str, *, threaded: bool = False, cpu_bound: bool = False
+    ) -> Callable[[Resolver], Resolver]:
         """Return a decorator that sets decorated
         function as a resolver for named field.
 
@@ -176,11 +184,21 @@ class ObjectType(SchemaBindable):
 
         `name`: a `str` with a name of the GraphQL object's field in GraphQL schema to
         bind decorated resolver to.
+
+        # Optional arguments
+
+        `threaded`: a `bool` marking sync resolver as blocking. ASGI servers
+        configured with `ResolverThreadPool` run it in a thread instead of
+        the event loop.
+
+        `cpu_bound`: a `bool` marking sync resolver as CPU-bound. ASGI servers
+        configured with `ResolverProcessPool` run it in a separate process.
         """
         if not isinstance(name, str):
             raise ValueError(
                 'field decorator should be passed a field name: @foo.field("name")'
             )
+        self._set_execution(name, threaded, cpu_bound)
         return self.create_register_resolver(name)
 
     def create_register_resolver(self, name: str) -> Callable[[Resolver], Resolver]:
@@ -199,7 +217,14 @@ class ObjectType(SchemaBindable):
 
         return register_resolver
 
-    def set_field(self, name, resolver: Resolver) -> Resolver:
+    def set_field(
+        self,
+        name,
+        resolver: Resolver,
+        *,
+        threaded: bool = False,
+        cpu_bound: bool = False,
+    ) -> Resolver:
         """Set a resolver for the field name.
 
         # Required arguments
@@ -208,10 +233,30 @@ class ObjectType(SchemaBindable):
         set this resolver for.
 
         `resolver`: a `Resolver` function to use.
+
+        # Optional arguments
+
+        `threaded`: a `bool` marking sync resolver as blocking. ASGI servers
+        configured with `ResolverThreadPool` run it in a thread instead of
+        the event loop.
+
+        `cpu_bound`: a `bool` marking sync resolver as CPU-bound. ASGI servers
+        configured with `ResolverProcessPool` run it in a separate process.
         """
         self._resolvers[name] = resolver
+        self._set_execution(name, threaded, cpu_bound)
         return resolver
 
+    def _set_execution(self, name: str, threaded: bool, cpu_bound: bool) -> None:
+        for fields, enabled in (
+            (self._threaded, threaded),
+            (self._cpu_bound, cpu_bound),
+        ):
+            if enabled:
+                fields.add(name)
+            else:
+                fields.discard(name)
+
     def set_alias(self, name: str, to: str | Callable) -> None:
         """Set an alias resolver for the field name to given Python name.
 
@@ -259,6 +304,10 @@ class ObjectType(SchemaBindable):
                 raise ValueError(f"Field {field} is not defined on type {self.name}")
             if graphql_type.fields[field].resolve is None or replace_existing:
                 graphql_type.fields[field].resolve = resolver
+                if field in self._threaded:
+                    set_field_threaded(graphql_type.fields[field])
+                if field in self._cpu_bound:
+                    set_field_cpu_bound(graphql_type.fields[field])
 
 
 class QueryType(ObjectType):
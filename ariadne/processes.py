@@ -0,0 +1,349 @@
+from asyncio import Semaphore, get_running_loop, wait_for
+from asyncio import TimeoutError as AsyncTimeoutError
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from multiprocessing.context import BaseContext
+from threading import Lock
+from typing import Any
+from weakref import WeakKeyDictionary
+
+from graphql import (
+    GraphQLField,
+    GraphQLInterfaceType,
+    GraphQLObjectType,
+    GraphQLResolveInfo,
+)
+
+from .schema_visitor import SchemaDirectiveVisitor
+from .types import Extension, Resolver
+from .utils import is_async_callable, type_get_extension, type_set_extension
+
+__all__ = [
+    "CpuBoundDirective",
+    "ProcessResolveInfo",
+    "ProcessResolversExtension",
+    "ResolverProcessPool",
+    "cpu_bound_directive",
+    "get_field_cpu_bound",
+    "set_field_cpu_bound",
+]
+
+CPU_BOUND = "__cpu_bound__"
+
+cpu_bound_directive = """
+directive @cpuBound(maxConcurrency: Int, timeout: Float) on FIELD_DEFINITION
+"""
+
+
+def set_field_cpu_bound(
+    field: GraphQLField,
+    *,
+    max_concurrency: int | None = None,
+    timeout: float | None = None,
+) -> None:
+    """Marks field which sync resolver should be run in a separate process.
+
+    # Required arguments
+
+    `field`: a `GraphQLField` to mark.
+
+    # Optional arguments
+
+    `max_concurrency`: an `int` with maximum number of field's resolvers
+    running at same time in the pool. Overrides pool's default.
+
+    `timeout`: a `float` with number of seconds after which field's resolver
+    fails with timeout error. Overrides pool's default.
+    """
+    type_set_extension(
+        field,  # ty: ignore
+        CPU_BOUND,
+        {"max_concurrency": max_concurrency, "timeout": timeout},
+    )
+
+
+def get_field_cpu_bound(field: GraphQLField) -> dict | None:
+    """Returns a `dict` with options of CPU-bound field or `None`."""
+    return type_get_extension(field, CPU_BOUND)  # ty: ignore
+
+
+class CpuBoundDirective(SchemaDirectiveVisitor):
+    """Schema directive marking fields with CPU-bound resolvers.
+
+    Sync resolvers of fields with the `@cpuBound` directive are run in
+    processes of `ResolverProcessPool` by the ASGI servers. Directive's
+    `maxConcurrency` and `timeout` arguments override pool's defaults:
+
+    ```python
+    schema = make_executable_schema(
+        [cpu_bound_directive, type_defs],
+        query_type,
+        directives={"cpuBound": CpuBoundDirective},
+    )
+    ```
+    """
+
+    def visit_field_definition(
+        self,
+        field: GraphQLField,
+        object_type: GraphQLObjectType | GraphQLInterfaceType,
+    ) -> GraphQLField:
+        set_field_cpu_bound(
+            field,
+            max_concurrency=self.args.get("maxConcurrency"),
+            timeout=self.args.get("timeout"),
+        )
+        return field
+
+
+class ProcessResolveInfo:
+    """Picklable subset of `GraphQLResolveInfo`.
+
+    Passed to resolvers run in the worker's process instead of
+    `GraphQLResolveInfo`, which includes the schema and the context.
+
+    # Attributes
+
+    `field_name`: a `str` with name of resolved field.
+
+    `parent_type`: a `str` with name of field's parent type.
+
+    `path`: a `list` with keys and indexes of field's path in result.
+
+    `operation_name`: a `str` with name of the operation or `None`.
+
+    `variable_values`: a `dict` with values of operation's variables.
+    """
+
+    __slots__ = (
+        "field_name",
+        "operation_name",
+        "parent_type",
+        "path",
+        "variable_values",
+    )
+
+    def __init__(
+        self,
+        field_name: str,
+        parent_type: str,
+        path: list[str | int],
+        operation_name: str | None,
+        variable_values: dict[str, Any],
+    ) -> None:
+        self.field_name = field_name
+        self.parent_type = parent_type
+        self.path = path
+        self.operation_name = operation_name
+        self.variable_values = variable_values
+
+    @classmethod
+    def from_info(cls, info: GraphQLResolveInfo) -> "ProcessResolveInfo":
+        operation = info.operation
+        return cls(
+            info.field_name,
+            info.parent_type.name,
+            info.path.as_list(),
+            operation.name.value if operation.name else None,
+            info.variable_values,
+        )
+
+
+def call_resolver(
+    resolver: Resolver, obj: Any, info: ProcessResolveInfo, kwargs: dict
+) -> Any:
+    return resolver(obj, info, **kwargs)
+
+
+class ResolverProcessPool:
+    """Pool of processes running CPU-bound sync resolvers.
+
+    Resolvers doing heavy CPU work hold the GIL, blocking the event loop
+    even when run in threads. Resolvers of fields marked as CPU-bound (with
+    the `cpu_bound` option of `ObjectType.field`, or the `@cpuBound`
+    directive) are run in this pool's processes instead.
+
+    Resolver, its parent object, arguments and result are pickled, so they
+    must be picklable. Resolver is called with `ProcessResolveInfo` instead
+    of `GraphQLResolveInfo`. Resolvers of fields which aren't picklable,
+    like lambdas, fail with a pickling error.
+
+    Single instance should be shared by all requests handled by the process.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_workers: int | None = None,
+        max_concurrency: int | None = None,
+        timeout: float | None = None,
+        mp_context: BaseContext | None = None,
+        initializer: Callable[..., Any] | None = None,
+        initargs: tuple = (),
+    ) -> None:
+        """Initializes the process pool.
+
+        Processes are started by the `start` method, or when first resolver
+        is run in the pool.
+
+        # Optional arguments
+
+        `max_workers`: an `int` with maximum number of processes. Defaults to
+        the `ProcessPoolExecutor`'s default, the number of CPUs.
+
+        `max_concurrency`: an `int` with default maximum number of single
+        field's resolvers running at same time. Resolvers above the limit
+        wait in the event loop. Defaults to `None`, which doesn't limit them.
+
+        `timeout`: a `float` with default number of seconds after which the
+        field's resolver fails with timeout error. Timed out resolver keeps
+        running until it returns, but its result is discarded. Defaults to
+        `None`, which disables the timeout.
+
+        `mp_context`, `initializer` and `initargs` are passed to the
+        `ProcessPoolExecutor`.
+        """
+        self.max_workers = max_workers
+        self.max_concurrency = max_concurrency
+        self.timeout = timeout
+        self.mp_context = mp_context
+        self.initializer = initializer
+        self.initargs = initargs
+        self.extension: Callable[[], ProcessResolversExtension] = partial(
+            ProcessResolversExtension, pool=self
+        )
+
+        self._executor: ProcessPoolExecutor | None = None
+        self._lock = Lock()
+        self._fields: WeakKeyDictionary[Any, dict[str, Any]] = WeakKeyDictionary()
+        self._semaphores: dict[tuple[str, str], Semaphore] = {}
+
+    def start(self) -> None:
+        """Starts the pool's processes, if not started already."""
+        self.get_executor()
+
+    def get_executor(self) -> ProcessPoolExecutor:
+        """Returns the `ProcessPoolExecutor`, creating it on first call."""
+        if self._executor is None:
+            with self._lock:
+                if self._executor is None:
+                    self._executor = ProcessPoolExecutor(
+                        max_workers=self.max_workers,
+                        mp_context=self.mp_context,
+                        initializer=self.initializer,
+                        initargs=self.initargs,
+                    )
+        return self._executor
+
+    def get_field_options(self, info: GraphQLResolveInfo) -> dict | None:
+        """Returns `dict` with options of CPU-bound field or `None`."""
+        parent_type = info.parent_type
+        fields = self._fields.get(parent_type)
+        if fields is None:
+            fields = self._fields.setdefault(parent_type, {})
+
+        if info.field_name not in fields:
+            field = parent_type.fields.get(info.field_name)
+            options = get_field_cpu_bound(field) if field else None
+            if (
+                options
+                and field
+                and field.resolve
+                and not is_async_callable(field.resolve)
+            ):
+                fields[info.field_name] = {
+                    "max_concurrency": options["max_concurrency"]
+                    or self.max_concurrency,
+                    "timeout": options["timeout"] or self.timeout,
+                }
+            else:
+                fields[info.field_name] = None
+        return fields[info.field_name]
+
+    def get_semaphore(self, info: GraphQLResolveInfo, limit: int) -> Semaphore:
+        """Returns semaphore limiting concurrency of field's resolvers."""
+        key = (info.parent_type.name, info.field_name)
+        semaphore = self._semaphores.get(key)
+        if semaphore is None:
+            semaphore = self._semaphores.setdefault(key, Semaphore(limit))
+        return semaphore
+
+    async def run(
+        self, info: GraphQLResolveInfo, obj: Any, kwargs: dict, options: dict
+    ) -> Any:
+        """Runs field's resolver in the pool and returns its result.
+
+        # Required arguments
+
+        `info`: a `GraphQLResolveInfo` of the field.
+
+        `obj`: a parent object of the field.
+
+        `kwargs`: a `dict` with field's arguments.
+
+        `options`: a `dict` with field's options from `get_field_options`.
+        """
+        if options["max_concurrency"]:
+            async with self.get_semaphore(info, options["max_concurrency"]):
+                return await self.run_resolver(info, obj, kwargs, options["timeout"])
+        return await self.run_resolver(info, obj, kwargs, options["timeout"])
+
+    async def run_resolver(
+        self,
+        info: GraphQLResolveInfo,
+        obj: Any,
+        kwargs: dict,
+        timeout: float | None,
+    ) -> Any:
+        resolver = info.parent_type.fields[info.field_name].resolve
+        future = get_running_loop().run_in_executor(
+            self.get_executor(),
+            call_resolver,
+            resolver,
+            obj,
+            ProcessResolveInfo.from_info(info),
+            kwargs,
+        )
+        if timeout is None:
+            return await future
+
+        try:
+            return await wait_for(future, timeout)
+        except AsyncTimeoutError as error:
+            raise TimeoutError(
+                f"Resolver for {info.parent_type.name}.{info.field_name} "
+                f"timed out after {timeout} seconds."
+            ) from error
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stops pool's processes, cancelling resolvers waiting for them.
+
+        Pool starts new processes when used again.
+        """
+        with self._lock:
+            executor, self._executor = self._executor, None
+        self._semaphores.clear()
+        if executor:
+            executor.shutdown(wait=wait, cancel_futures=True)
+
+
+class ProcessResolversExtension(Extension):
+    """Extension running CPU-bound sync resolvers in `ResolverProcessPool`.
+
+    Is added to request's extensions by ASGI servers configured with
+    `resolver_process_pool`. Should be the last extension, because the
+    resolver is called directly in the worker's process. Can't be used
+    with `graphql_sync`.
+    """
+
+    def __init__(self, *, pool: ResolverProcessPool) -> None:
+        self._pool = pool
+
+    def resolve(
+        self, next_: Resolver, obj: Any, info: GraphQLResolveInfo, **kwargs
+    ) -> Any:
+        options = self._pool.get_field_options(info)
+        if options is not None:
+            return self._pool.run(info, obj, kwargs, options)
+        return next_(obj, info, **kwargs)
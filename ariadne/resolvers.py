@@ -43,6 +43,7 @@ def resolve_to(attr_name: str) -> Resolver:
         return value
 
     resolver._ariadne_alias_resolver = True  # type: ignore
+    resolver._ariadne_alias_name = attr_name  # type: ignore
     return resolver
 
 
@@ -0,0 +1,501 @@
+import json
+import logging
+from collections.abc import Callable
+from functools import partial
+from heapq import heappush, heappushpop
+from logging.handlers import QueueListener
+from queue import SimpleQueue
+from threading import Lock
+from time import perf_counter_ns
+from typing import TYPE_CHECKING, Any
+
+from graphql import (
+    FragmentDefinitionNode,
+    GraphQLError,
+    GraphQLResolveInfo,
+    GraphQLSchema,
+    OperationDefinitionNode,
+)
+from graphql.pyutils import is_awaitable
+
+from .contrib.tracing.utils import get_operation_signature, get_signature_hash
+from .extensions import PHASES, ExtensionManager
+from .resolvers import is_default_resolver
+from .types import ContextValue, Extension, Resolver
+from .validation.query_cost import get_operation_cost
+
+if TYPE_CHECKING:
+    from .contrib.tracing.memory import MemoryStats
+
+__all__ = ["SlowField", "SlowOperation", "SlowOperationExtension", "SlowOperationLog"]
+
+
+class SlowField:
+    """Field which resolver was one of the slowest in the slow operation.
+
+    # Attributes
+
+    `path`: a `str` with path of the field in result, eg. `users.0.name`.
+
+    `field`: a `str` with name of the field, eg. `User.name`.
+
+    `duration`: a `float` with duration of the field's resolver in seconds.
+    """
+
+    __slots__ = ("duration", "field", "path")
+
+    def __init__(self, path: str, field: str, duration: float) -> None:
+        self.path = path
+        self.field = field
+        self.duration = duration
+
+
+class SlowOperation:
+    """Entry of the slow-operation log.
+
+    Converted to a `str` with JSON object when logged.
+
+    # Attributes
+
+    `signature`: a `str` with operation's signature, with literals and
+    aliases removed and fields sorted, or `None` if operation failed before
+    execution.
+
+    `signature_hash`: a `str` with SHA-256 hash of the signature, or `None`.
+
+    `operation_name`: a `str` with name of the operation or `None`.
+
+    `duration`: a `float` with duration of the operation in seconds,
+    including serialization of its result.
+
+    `phases`: a `dict` with durations of operation's phases in seconds.
+
+    `resolvers`: an `int` with number of resolved fields.
+
+    `slowest_fields`: a `list` of `SlowField` with the slowest fields.
+
+    `cost`: an `int` with static cost of the operation or `None`.
+
+    `response_size`: an `int` with size of the response's body in bytes.
+
+    `errors`: an `int` with number of errors in the result.
+
+    `memory`: a `dict` with highest `peak` and `net` memory allocated by
+    profiled operations with the same signature, or `None`.
+    """
+
+    __slots__ = (
+        "cost",
+        "duration",
+        "errors",
+        "memory",
+        "operation_name",
+        "phases",
+        "resolvers",
+        "response_size",
+        "signature",
+        "signature_hash",
+        "slowest_fields",
+    )
+
+    def __init__(
+        self,
+        *,
+        signature: str | None,
+        operation_name: str | None,
+        duration: float,
+        phases: dict[str, float],
+        resolvers: int,
+        slowest_fields: list[SlowField],
+        cost: int | None,
+        response_size: int,
+        errors: int,
+        memory: dict[str, int] | None = None,
+    ) -> None:
+        self.signature = signature
+        self.signature_hash = get_signature_hash(signature) if signature else None
+        self.operation_name = operation_name
+        self.duration = duration
+        self.phases = phases
+        self.resolvers = resolvers
+        self.slowest_fields = slowest_fields
+        self.cost = cost
+        self.response_size = response_size
+        self.errors = errors
+        self.memory = memory
+
+    def __str__(self) -> str:
+        return json.dumps(self.as_dict(), separators=(",", ":"))
+
+    def as_dict(self) -> dict:
+        """Returns a JSON-serializable `dict` with the entry."""
+        return {
+            "signature": self.signature,
+            "signature_hash": self.signature_hash,
+            "operation_name": self.operation_name,
+            "duration": self.duration,
+            "phases": self.phases,
+            "resolvers": self.resolvers,
+            "slowest_fields": [
+                {"path": field.path, "field": field.field, "duration": field.duration}
+                for field in self.slowest_fields
+            ],
+            "cost": self.cost,
+            "response_size": self.response_size,
+            "errors": self.errors,
+            "memory": self.memory,
+        }
+
+
+class SlowOperationExtension(Extension):
+    """Extension gathering data for the slow-operation log.
+
+    Is added to request's extensions by GraphQL servers configured with
+    `SlowOperationLog`. Records durations of phases, counts resolved fields
+    and keeps `top_fields` slowest fields. Default resolvers and
+    introspection fields are counted but not timed unless
+    `trace_default_resolver` is set.
+    """
+
+    def __init__(self, *, top_fields: int = 5, trace_default_resolver: bool = False):
+        self._top_fields = top_fields
+        self._trace_default_resolver = trace_default_resolver
+        self._phase_start = 0
+        self._slowest_fields: list[tuple[int, str, str]] = []
+
+        self.start = 0
+        self.phases: dict[str, int] = {}
+        self.resolvers = 0
+        self.errors = 0
+        self.schema: GraphQLSchema | None = None
+        self.operation: OperationDefinitionNode | None = None
+        self.fragments: dict[str, FragmentDefinitionNode] = {}
+        self.variables: dict[str, Any] | None = None
+
+    def request_started(self, context: ContextValue) -> None:
+        self.start = perf_counter_ns()
+
+    def has_errors(self, errors: list[GraphQLError], context: ContextValue) -> None:
+        self.errors += len(errors)
+
+    def parsing_started(self, context: ContextValue) -> None:
+        self._phase_start = perf_counter_ns()
+
+    def parsing_finished(self, context: ContextValue) -> None:
+        self.phases["parsing"] = perf_counter_ns() - self._phase_start
+
+    def validation_started(self, context: ContextValue) -> None:
+        self._phase_start = perf_counter_ns()
+
+    def validation_finished(self, context: ContextValue) -> None:
+        self.phases["validation"] = perf_counter_ns() - self._phase_start
+
+    def execution_started(self, context: ContextValue) -> None:
+        self._phase_start = perf_counter_ns()
+
+    def execution_finished(self, context: ContextValue) -> None:
+        self.phases["execution"] = perf_counter_ns() - self._phase_start
+
+    def serialization_started(self, context: ContextValue) -> None:
+        self._phase_start = perf_counter_ns()
+
+    def serialization_finished(self, context: ContextValue) -> None:
+        self.phases["serialization"] = perf_counter_ns() - self._phase_start
+
+    def resolve(
+        self, next_: Resolver, obj: Any, info: GraphQLResolveInfo, **kwargs
+    ) -> Any:
+        self.resolvers += 1
+        if not self.operation:
+            self.schema = info.schema
+            self.operation = info.operation
+            self.fragments = info.fragments
+            self.variables = info.variable_values
+
+        if not self.should_time(info):
+            return next_(obj, info, **kwargs)
+
+        start = perf_counter_ns()
+        result = next_(obj, info, **kwargs)
+        if is_awaitable(result):
+            return self.resolve_async(info, start, result)
+
+        self.observe_field(info, perf_counter_ns() - start)
+        return result
+
+    async def resolve_async(
+        self, info: GraphQLResolveInfo, start: int, result: Any
+    ) -> Any:
+        try:
+            return await result
+        finally:
+            self.observe_field(info, perf_counter_ns() - start)
+
+    def should_time(self, info: GraphQLResolveInfo) -> bool:
+        parent_type = info.parent_type
+        if parent_type.name.startswith("__"):
+            return False
+
+        field = parent_type.fields.get(info.field_name)
+        if field is None:
+            return False  # __typename, __schema and __type
+
+        return self._trace_default_resolver or not is_default_resolver(field.resolve)
+
+    def observe_field(self, info: GraphQLResolveInfo, duration: int) -> None:
+        """Keeps the field if it's one of the `top_fields` slowest fields."""
+        slowest_fields = self._slowest_fields
+        if len(slowest_fields) >= self._top_fields:
+            if not self._top_fields or duration <= slowest_fields[0][0]:
+                return
+            push = heappushpop
+        else:
+            push = heappush
+
+        push(
+            slowest_fields,
+            (
+                duration,
+                ".".join(map(str, info.path.as_list())),
+                f"{info.parent_type.name}.{info.field_name}",
+            ),
+        )
+
+    def get_slowest_fields(self) -> list[tuple[int, str, str]]:
+        """Returns `list` of slowest fields' durations, paths and names."""
+        return sorted(self._slowest_fields, reverse=True)
+
+
+class LoggerHandler(logging.Handler):
+    """Handler passing records from the queue's thread to the logger."""
+
+    def __init__(self, logger: logging.Logger) -> None:
+        super().__init__()
+        self.logger = logger
+
+    def emit(self, record: logging.LogRecord) -> None:
+        self.logger.handle(record)
+
+
+class SlowOperationLog:
+    """Structured log of operations exceeding latency or resolvers thresholds.
+
+    Operation is logged once, after its result was serialized, with its
+    signature, name, durations of phases, slowest fields, static cost,
+    response's size and number of errors. Operations with the same signature
+    can be grouped together, because signatures don't include literals and
+    aliases.
+
+    Entries are logged as warnings with `SlowOperation` as message's argument
+    and a `dict` with entry in record's `slow_operation` attribute, for use
+    by JSON formatters. By default records are passed to logger's handlers
+    from the background thread, so slow handlers don't block the server.
+
+    Single instance should be shared by all requests handled by the process.
+    """
+
+    def __init__(
+        self,
+        *,
+        latency_threshold: float | None = 1.0,
+        resolver_threshold: int | None = None,
+        top_fields: int = 5,
+        trace_default_resolver: bool = False,
+        logger: None | str | logging.Logger = None,
+        non_blocking: bool = True,
+        cost_map: dict[str, dict[str, Any]] | None = None,
+        default_cost: int = 0,
+        default_complexity: int = 1,
+        memory_stats: "MemoryStats | None" = None,
+    ) -> None:
+        """Initializes the slow-operation log.
+
+        # Optional arguments
+
+        `latency_threshold`: a `float` with duration of operation in seconds
+        above which it's logged. Defaults to 1 second. `None` disables this
+        threshold.
+
+        `resolver_threshold`: an `int` with number of resolved fields above
+        which operation is logged. Defaults to `None`, which disables this
+        threshold.
+
+        `top_fields`: an `int` with number of the slowest fields to log.
+        Defaults to 5.
+
+        `trace_default_resolver`: a `bool` controlling if fields using default
+        resolvers should be timed. Defaults to `False`.
+
+        `logger`: a `str` with name of logger or logger instance to log
+        slow operations with. Defaults to `ariadne.slow_operations` logger.
+
+        `non_blocking`: a `bool` controlling if records should be handled
+        in the background thread. Defaults to `True`.
+
+        `cost_map`, `default_cost` and `default_complexity`: options used to
+        compute static cost of operation, same as in `cost_validator`.
+
+        `memory_stats`: a `MemoryStats` with memory allocations of profiled
+        operations to include in entries of operations with same signature.
+        """
+        if not logger:
+            logger = "ariadne.slow_operations"
+        if isinstance(logger, str):
+            logger = logging.getLogger(logger)
+
+        self.latency_threshold = latency_threshold
+        self.resolver_threshold = resolver_threshold
+        self.logger = logger
+        self.non_blocking = non_blocking
+        self.cost_map = cost_map
+        self.default_cost = default_cost
+        self.default_complexity = default_complexity
+        self.memory_stats = memory_stats
+        self.extension: Callable[[], SlowOperationExtension] = partial(
+            SlowOperationExtension,
+            top_fields=top_fields,
+            trace_default_resolver=trace_default_resolver,
+        )
+
+        self._queue: SimpleQueue = SimpleQueue()
+        self._listener: QueueListener | None = None
+        self._lock = Lock()
+
+    def is_slow(self, duration: float, resolvers: int) -> bool:
+        """Returns `True` if operation exceeded any of thresholds.
+
+        # Required arguments
+
+        `duration`: a `float` with duration of operation in seconds.
+
+        `resolvers`: an `int` with number of resolved fields.
+        """
+        if self.latency_threshold is not None and duration > self.latency_threshold:
+            return True
+        return self.resolver_threshold is not None and (
+            resolvers > self.resolver_threshold
+        )
+
+    def finish(
+        self, extension_manager: ExtensionManager | None, response_size: int
+    ) -> SlowOperation | None:
+        """Logs the operation if it exceeded thresholds.
+
+        Should be called by the server after response's body was created.
+        Returns logged `SlowOperation` or `None`.
+
+        # Required arguments
+
+        `extension_manager`: an `ExtensionManager` used by the operation.
+
+        `response_size`: an `int` with size of response's body in bytes.
+        """
+        if not extension_manager:
+            return None
+
+        extension = next(
+            (
+                ext
+                for ext in extension_manager.extensions
+                if isinstance(ext, SlowOperationExtension)
+            ),
+            None,
+        )
+        if not extension or not extension.start:
+            return None
+
+        duration = (perf_counter_ns() - extension.start) / 1_000_000_000
+        if not self.is_slow(duration, extension.resolvers):
+            return None
+
+        entry = self.create_entry(extension, duration, response_size)
+        self.log(entry)
+        return entry
+
+    def create_entry(
+        self, extension: SlowOperationExtension, duration: float, response_size: int
+    ) -> SlowOperation:
+        """Returns `SlowOperation` with data gathered by the extension."""
+        signature = operation_name = cost = None
+        if extension.operation and extension.schema:
+            operation = extension.operation
+            signature = get_operation_signature(operation, extension.fragments)
+            operation_name = operation.name.value if operation.name else None
+            cost = get_operation_cost(
+                extension.schema,
+                operation,
+                extension.fragments,
+                default_cost=self.default_cost,
+                default_complexity=self.default_complexity,
+                variables=extension.variables,
+                cost_map=self.cost_map,
+            )
+
+        return SlowOperation(
+            signature=signature,
+            operation_name=operation_name,
+            duration=duration,
+            phases={
+                phase: extension.phases[phase] / 1_000_000_000
+                for phase in PHASES
+                if phase in extension.phases
+            },
+            resolvers=extension.resolvers,
+            slowest_fields=[
+                SlowField(path, field, field_duration / 1_000_000_000)
+                for field_duration, path, field in extension.get_slowest_fields()
+            ],
+            cost=cost,
+            response_size=response_size,
+            errors=extension.errors,
+            memory=self.get_memory(signature),
+        )
+
+    def get_memory(self, signature: str | None) -> dict[str, int] | None:
+        """Returns memory allocated by profiled operations with the signature."""
+        if not self.memory_stats or not signature:
+            return None
+
+        key = get_signature_hash(signature)[:16]
+        operation_memory = self.memory_stats.get_operations().get(key)
+        if not operation_memory:
+            return None
+
+        return {"peak": operation_memory.max_peak, "net": operation_memory.max_net}
+
+    def log(self, entry: SlowOperation) -> None:
+        """Logs the entry, passing its record to the background thread."""
+        if not self.logger.isEnabledFor(logging.WARNING):
+            return
+
+        record = self.logger.makeRecord(
+            self.logger.name,
+            logging.WARNING,
+            __file__,
+            0,
+            "Slow GraphQL operation: %s",
+            (entry,),
+            None,
+            extra={"slow_operation": entry.as_dict()},
+        )
+
+        if not self.non_blocking:
+            self.logger.handle(record)
+            return
+
+        if not self._listener:
+            with self._lock:
+                if not self._listener:
+                    self._listener = QueueListener(
+                        self._queue, LoggerHandler(self.logger)
+                    )
+                    self._listener.start()
+
+        self._queue.put_nowait(record)
+
+    def close(self) -> None:
+        """Stops the background thread after handling all queued records."""
+        with self._lock:
+            if self._listener:
+                self._listener.stop()
+                self._listener = None
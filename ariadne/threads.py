@@ -0,0 +1,191 @@
+from asyncio import get_running_loop
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import copy_context
+from functools import partial
+from threading import Lock
+from typing import Any
+from weakref import WeakKeyDictionary
+
+from graphql import (
+    GraphQLField,
+    GraphQLInterfaceType,
+    GraphQLObjectType,
+    GraphQLResolveInfo,
+)
+from graphql.pyutils import is_awaitable
+
+from .resolvers import is_default_resolver
+from .schema_visitor import SchemaDirectiveVisitor
+from .types import Extension, Resolver
+from .utils import is_async_callable, type_get_extension, type_set_extension
+
+__all__ = [
+    "BlockingDirective",
+    "ResolverThreadPool",
+    "ThreadedResolversExtension",
+    "blocking_directive",
+    "is_field_threaded",
+    "set_field_threaded",
+]
+
+THREADED = "__threaded__"
+
+blocking_directive = """
+directive @blocking on FIELD_DEFINITION
+"""
+
+
+def set_field_threaded(field: GraphQLField) -> None:
+    """Marks field which sync resolver should be run in a thread."""
+    type_set_extension(field, THREADED, True)  # ty: ignore
+
+
+def is_field_threaded(field: GraphQLField) -> bool:
+    """Returns `True` if field's sync resolver should be run in a thread."""
+    return bool(type_get_extension(field, THREADED))  # ty: ignore
+
+
+class BlockingDirective(SchemaDirectiveVisitor):
+    """Schema directive marking fields with blocking resolvers.
+
+    Sync resolvers of fields with the `@blocking` directive are run in
+    threads of `ResolverThreadPool` by the ASGI servers:
+
+    ```python
+    schema = make_executable_schema(
+        [blocking_directive, type_defs],
+        query_type,
+        directives={"blocking": BlockingDirective},
+    )
+    ```
+    """
+
+    def visit_field_definition(
+        self,
+        field: GraphQLField,
+        object_type: GraphQLObjectType | GraphQLInterfaceType,
+    ) -> GraphQLField:
+        set_field_threaded(field)
+        return field
+
+
+class ResolverThreadPool:
+    """Bounded pool of threads running blocking sync resolvers.
+
+    Sync resolvers run directly in the event loop, blocking other requests
+    until they return. Resolvers of fields marked as threaded (with the
+    `threaded` option of `ObjectType.field`, or the `@blocking` directive)
+    are run in this pool instead. If `offload_sync_resolvers` is set, all
+    sync resolvers except default ones are run in it.
+
+    Context variables are copied to the thread running the resolver.
+
+    Single instance should be shared by all requests handled by the process.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_threads: int | None = None,
+        offload_sync_resolvers: bool = False,
+        thread_name_prefix: str = "ariadne-resolver",
+    ) -> None:
+        """Initializes the thread pool.
+
+        Threads are started when first resolver is run in the pool.
+
+        # Optional arguments
+
+        `max_threads`: an `int` with maximum number of threads. Resolvers
+        wait for a free thread when all threads are busy. Defaults to the
+        `ThreadPoolExecutor`'s default.
+
+        `offload_sync_resolvers`: a `bool` controlling if all sync resolvers
+        except default ones should be run in the pool. Defaults to `False`.
+
+        `thread_name_prefix`: a `str` with prefix of pool's threads names.
+        """
+        self.max_threads = max_threads
+        self.offload_sync_resolvers = offload_sync_resolvers
+        self.thread_name_prefix = thread_name_prefix
+        self.extension: Callable[[], ThreadedResolversExtension] = partial(
+            ThreadedResolversExtension, pool=self
+        )
+
+        self._executor: ThreadPoolExecutor | None = None
+        self._lock = Lock()
+        self._fields: WeakKeyDictionary[Any, dict[str, bool]] = WeakKeyDictionary()
+
+    def should_offload(self, info: GraphQLResolveInfo) -> bool:
+        """Returns `True` if field's resolver should be run in the pool."""
+        parent_type = info.parent_type
+        fields = self._fields.get(parent_type)
+        if fields is None:
+            fields = self._fields.setdefault(parent_type, {})
+
+        offload = fields.get(info.field_name)
+        if offload is None:
+            offload = self.is_blocking_field(parent_type.fields.get(info.field_name))
+            fields[info.field_name] = offload
+        return offload
+
+    def is_blocking_field(self, field: GraphQLField | None) -> bool:
+        """Returns `True` if field has a sync resolver to run in the pool."""
+        if field is None or field.resolve is None:
+            return False  # __typename, __schema, __type and default resolver
+        if is_async_callable(field.resolve):
+            return False
+        if is_field_threaded(field):
+            return True
+        return self.offload_sync_resolvers and not is_default_resolver(field.resolve)
+
+    def get_executor(self) -> ThreadPoolExecutor:
+        """Returns the `ThreadPoolExecutor`, creating it on first call."""
+        if self._executor is None:
+            with self._lock:
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(
+                        max_workers=self.max_threads,
+                        thread_name_prefix=self.thread_name_prefix,
+                    )
+        return self._executor
+
+    async def run(self, func: Callable, *args: Any, **kwargs: Any) -> Any:
+        """Runs `func` in the pool and returns its result.
+
+        Awaitable returned by `func` is awaited in the event loop.
+        """
+        context = copy_context()
+        result = await get_running_loop().run_in_executor(
+            self.get_executor(), partial(context.run, func, *args, **kwargs)
+        )
+        if is_awaitable(result):
+            return await result
+        return result
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stops pool's threads. Pool starts new threads when used again."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor:
+            executor.shutdown(wait=wait)
+
+
+class ThreadedResolversExtension(Extension):
+    """Extension running blocking sync resolvers in `ResolverThreadPool`.
+
+    Is added to request's extensions by ASGI servers configured with
+    `resolver_thread_pool`. Should be the last extension, so other
+    extensions run in the event loop. Can't be used with `graphql_sync`.
+    """
+
+    def __init__(self, *, pool: ResolverThreadPool) -> None:
+        self._pool = pool
+
+    def resolve(
+        self, next_: Resolver, obj: Any, info: GraphQLResolveInfo, **kwargs
+    ) -> Any:
+        if self._pool.should_offload(info):
+            return self._pool.run(next_, obj, info, **kwargs)
+        return next_(obj, info, **kwargs)
@@ -533,6 +533,12 @@ class Extension:
 
     Subclasses of this class should override default methods to run
     custom logic during Query execution.
+
+    Phase hooks (`parsing_started`, `validation_finished`, etc.) are only
+    called for extensions overriding them, so unused hooks don't slow down
+    query execution. Synchronous servers call only synchronous hooks. Async
+    servers call `*_async` hooks, which call synchronous ones by default.
+    Serialization hooks are called by HTTP servers, after `request_finished`.
     """
 
     def request_started(self, context: ContextValue) -> None:
@@ -541,6 +547,103 @@ class Extension:
     def request_finished(self, context: ContextValue) -> None:
         """Extension hook executed at request's end."""
 
+    def request_cancelled(self, context: ContextValue) -> None:
+        """Extension hook executed after request's execution was cancelled.
+
+        Called by ASGI servers when the client disconnected before the
+        query's execution completed, after `request_finished`. Can be used
+        to release resources that are normally released after the response
+        is sent.
+        """
+
+    def parsing_started(self, context: ContextValue) -> None:
+        """Extension hook executed at query parsing's start."""
+
+    def parsing_finished(self, context: ContextValue) -> None:
+        """Extension hook executed at query parsing's end."""
+
+    async def parsing_started_async(self, context: ContextValue) -> None:
+        """Async extension hook executed at query parsing's start.
+
+        Called instead of `parsing_started` by async servers. Defaults to
+        calling `parsing_started`.
+        """
+        self.parsing_started(context)
+
+    async def parsing_finished_async(self, context: ContextValue) -> None:
+        """Async extension hook executed at query parsing's end.
+
+        Called instead of `parsing_finished` by async servers. Defaults to
+        calling `parsing_finished`.
+        """
+        self.parsing_finished(context)
+
+    def validation_started(self, context: ContextValue) -> None:
+        """Extension hook executed at query validation's start."""
+
+    def validation_finished(self, context: ContextValue) -> None:
+        """Extension hook executed at query validation's end."""
+
+    async def validation_started_async(self, context: ContextValue) -> None:
+        """Async extension hook executed at query validation's start.
+
+        Called instead of `validation_started` by async servers. Defaults to
+        calling `validation_started`.
+        """
+        self.validation_started(context)
+
+    async def validation_finished_async(self, context: ContextValue) -> None:
+        """Async extension hook executed at query validation's end.
+
+        Called instead of `validation_finished` by async servers. Defaults to
+        calling `validation_finished`.
+        """
+        self.validation_finished(context)
+
+    def execution_started(self, context: ContextValue) -> None:
+        """Extension hook executed at query execution's start."""
+
+    def execution_finished(self, context: ContextValue) -> None:
+        """Extension hook executed at query execution's end."""
+
+    async def execution_started_async(self, context: ContextValue) -> None:
+        """Async extension hook executed at query execution's start.
+
+        Called instead of `execution_started` by async servers. Defaults to
+        calling `execution_started`.
+        """
+        self.execution_started(context)
+
+    async def execution_finished_async(self, context: ContextValue) -> None:
+        """Async extension hook executed at query execution's end.
+
+        Called instead of `execution_finished` by async servers. Defaults to
+        calling `execution_finished`.
+        """
+        self.execution_finished(context)
+
+    def serialization_started(self, context: ContextValue) -> None:
+        """Extension hook executed at result serialization's start."""
+
+    def serialization_finished(self, context: ContextValue) -> None:
+        """Extension hook executed at result serialization's end."""
+
+    async def serialization_started_async(self, context: ContextValue) -> None:
+        """Async extension hook executed at result serialization's start.
+
+        Called instead of `serialization_started` by async servers. Defaults to
+        calling `serialization_started`.
+        """
+        self.serialization_started(context)
+
+    async def serialization_finished_async(self, context: ContextValue) -> None:
+        """Async extension hook executed at result serialization's end.
+
+        Called instead of `serialization_finished` by async servers. Defaults to
+        calling `serialization_finished`.
+        """
+        self.serialization_finished(context)
+
     def resolve(
         self, next_: Resolver, obj: Any, info: GraphQLResolveInfo, **kwargs
     ) -> Any:
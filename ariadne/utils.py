@@ -217,3 +217,27 @@ def is_async_callable(obj: Any) -> bool:
     return inspect.iscoroutinefunction(obj) or (
         callable(obj) and inspect.iscoroutinefunction(obj.__call__)
     )
+
+
+def parse_header_qualities(value: str) -> dict[str, float]:
+    """Parses values of `Accept` and `Accept-Encoding` headers.
+
+    Returns a `dict` with lowercased values and their quality factors.
+    """
+    qualities: dict[str, float] = {}
+    for item in value.split(","):
+        name, *params = item.split(";")
+        name = name.strip().lower()
+        if not name:
+            continue
+
+        quality = 1.0
+        for param in params:
+            param_name, _, param_value = param.strip().partition("=")
+            if param_name == "q":
+                try:
+                    quality = float(param_value)
+                except ValueError:
+                    quality = 0.0
+        qualities[name] = max(quality, qualities.get(name, 0.0))
+    return qualities
@@ -1,3 +1,3 @@
-from .query_cost import cost_directive, cost_validator
+from .query_cost import cost_directive, cost_validator, get_operation_cost
 
-__all__ = ["cost_directive", "cost_validator"]
+__all__ = ["cost_directive", "cost_validator", "get_operation_cost"]
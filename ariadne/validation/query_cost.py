@@ -12,6 +12,7 @@ from graphql import (
 from graphql.execution.values import get_argument_values
 from graphql.language import (
     BooleanValueNode,
+    DocumentNode,
     FieldNode,
     FragmentDefinitionNode,
     FragmentSpreadNode,
@@ -24,6 +25,7 @@ from graphql.language import (
     StringValueNode,
 )
 from graphql.type import GraphQLFieldMap
+from graphql.utilities import TypeInfo
 from graphql.validation import ValidationContext
 from graphql.validation.rules import ASTValidationRule, ValidationRule
 
@@ -366,3 +368,34 @@ def cost_validator(
             )
 
     return cast(type[ASTValidationRule], _CostValidator)
+
+
+def get_operation_cost(
+    schema: GraphQLSchema,
+    operation: OperationDefinitionNode,
+    fragments: dict[str, FragmentDefinitionNode] | None = None,
+    *,
+    default_cost: int = 0,
+    default_complexity: int = 1,
+    variables: dict | None = None,
+    cost_map: dict[str, dict[str, Any]] | None = None,
+) -> int:
+    """Returns static cost of already validated operation.
+
+    Cost is computed the same way as by the validator created with
+    `cost_validator`, but without limiting it.
+    """
+    document = DocumentNode(definitions=(operation, *(fragments or {}).values()))
+    context = ValidationContext(
+        schema, document, TypeInfo(schema), on_error=lambda _: None
+    )
+    validator = CostValidator(
+        context,
+        maximum_cost=0,
+        default_cost=default_cost,
+        default_complexity=default_complexity,
+        variables=variables,
+        cost_map=cost_map,
+    )
+    validator.enter_operation_definition(operation, None, None, None, [])
+    return validator.cost
@@ -11,6 +11,9 @@ from graphql import (
     MiddlewareManager,
 )
 
+from .codecs import Codec, get_codec_for_content_type, negotiate_codec
+from .compression import ResponseCompression
+from .concurrency import ConcurrencyLimits
 from .constants import (
     CONTENT_TYPE_JSON,
     CONTENT_TYPE_TEXT_HTML,
@@ -19,14 +22,22 @@ from .constants import (
     DATA_TYPE_MULTIPART,
     HttpStatusResponse,
 )
+from .deadlines import OperationDeadlines
+from .event_loop import BackgroundEventLoop
 from .exceptions import HttpBadRequestError, HttpError
 from .explorer import Explorer, ExplorerGraphiQL
+from .extensions import NO_PHASE_HOOKS, ExtensionManager
 from .file_uploads import combine_multipart_data
 from .format_error import format_error
-from .graphql import graphql_sync
+from .graphql import graphql, graphql_sync, parse_query
+from .http_cache import HttpCache
+from .introspection import CachedIntrospection, IntrospectionCache
+from .normalization import NORMALIZED, ResultNormalization
+from .slow_log import SlowOperationLog
 from .types import (
     ContextValue,
     ErrorFormatter,
+    Extension,
     ExtensionList,
     GraphQLResult,
     MiddlewareList,
@@ -75,6 +86,15 @@ class GraphQL:
         middleware: Middlewares | None = None,
         middleware_manager_class: type[MiddlewareManager] | None = None,
         execution_context_class: type[ExecutionContext] | None = None,
+        introspection_cache: bool = False,
+        http_cache: HttpCache | None = None,
+        compression: ResponseCompression | None = None,
+        codecs: list[Codec] | None = None,
+        normalization: ResultNormalization | None = None,
+        slow_operation_log: SlowOperationLog | None = None,
+        event_loop: BackgroundEventLoop | None = None,
+        concurrency_limits: ConcurrencyLimits | None = None,
+        operation_deadlines: OperationDeadlines | None = None,
     ) -> None:
         """Initializes the WSGI app.
 
@@ -140,6 +160,44 @@ class GraphQL:
         `execution_context_class`: custom `ExecutionContext` type to use by
         this server to execute the GraphQL queries. Defaults to standard
         context type implemented by the `graphql`.
+
+        `introspection_cache`: a `bool` controlling if results of introspection
+        queries should be cached and served without executing them again.
+        Cached results skip the context, extensions, middleware and custom
+        validation rules, so this shouldn't be enabled if introspection
+        availability depends on the request. Defaults to `False`.
+
+        `http_cache`: a `HttpCache` with HTTP caching policy for results of
+        queries sent with `GET` method. Defaults to `None`, which disables
+        HTTP caching.
+
+        `compression`: a `ResponseCompression` to use for compressing JSON and
+        explorer's HTML responses. Defaults to `None`, which disables
+        the compression.
+
+        `codecs`: a list of `Codec` instances with binary wire formats, like
+        MessagePack or CBOR, supported by the server in addition to JSON.
+        Format of request's body is selected using the `Content-Type` header,
+        and format of response's body is negotiated using the `Accept` header.
+
+        `normalization`: a `ResultNormalization` to use for results of clients
+        requesting the normalized format. Defaults to `None`, which disables
+        the normalized format.
+
+        `slow_operation_log`: a `SlowOperationLog` to log operations exceeding
+        its thresholds with. Defaults to `None`, which disables the log.
+
+        `event_loop`: a `BackgroundEventLoop` to execute queries in, allowing
+        resolvers to be async. Request's thread waits for the query's result.
+        Defaults to `None`, which executes queries with `graphql_sync`.
+
+        `concurrency_limits`: a `ConcurrencyLimits` to limit number of async
+        resolvers running at same time with. Requires the `event_loop`.
+        Defaults to `None`, which doesn't limit them.
+
+        `operation_deadlines`: an `OperationDeadlines` with deadlines of
+        operations and timeouts of fields. Defaults to `None`, which doesn't
+        limit execution time.
         """
 
         self.context_value = context_value
@@ -157,6 +215,17 @@ class GraphQL:
         self.middleware_manager_class = middleware_manager_class or MiddlewareManager
         self.execution_context_class = execution_context_class
         self.schema = schema
+        self.introspection_cache: IntrospectionCache | None = (
+            IntrospectionCache() if introspection_cache else None
+        )
+        self.http_cache = http_cache
+        self.compression = compression
+        self.codecs: list[Codec] = codecs or []
+        self.normalization = normalization
+        self.slow_operation_log = slow_operation_log
+        self.event_loop = event_loop
+        self.concurrency_limits = concurrency_limits
+        self.operation_deadlines = operation_deadlines
 
         if explorer:
             self.explorer = explorer
@@ -264,8 +333,52 @@ class GraphQL:
         self, environ: dict, start_response, query_params: dict
     ) -> list[bytes]:
         data = self.extract_data_from_get(query_params)
-        result = self.execute_query(environ, data)
-        return self.return_response_from_result(start_response, result)
+        normalize = self.is_normalized_result_requested(environ)
+        if normalize:
+            cached_introspection = None
+        else:
+            cached_introspection = self.get_cached_introspection(data)
+        codec = self.get_response_codec(environ)
+        if codec:
+            if cached_introspection:
+                result = True, cached_introspection.result
+            else:
+                result = self.execute_query(environ, data, normalize=normalize)
+            if self.http_cache:
+                with self.get_serialization_phase(environ):
+                    body = codec.encode(result[1])
+                return self.return_cacheable_response(
+                    environ,
+                    start_response,
+                    result,
+                    body,
+                    content_type=codec.media_type,
+                )
+            return self.return_encoded_response(environ, start_response, result, codec)
+
+        if self.http_cache:
+            if cached_introspection:
+                result = True, cached_introspection.result
+                body = cached_introspection.json
+            else:
+                result = self.execute_query(environ, data, normalize=normalize)
+                # Same encoding as cached introspection for stable ETags
+                with self.get_serialization_phase(environ):
+                    body = json.dumps(
+                        result[1],
+                        ensure_ascii=False,
+                        allow_nan=False,
+                        separators=(",", ":"),
+                    ).encode("utf-8")
+            return self.return_cacheable_response(environ, start_response, result, body)
+
+        if cached_introspection:
+            return self.return_cached_introspection(
+                environ, start_response, cached_introspection
+            )
+
+        result = self.execute_query(environ, data, normalize=normalize)
+        return self.return_response_from_result(start_response, result, environ=environ)
 
     def extract_data_from_get(self, query_params: dict) -> dict:
         """Extracts GraphQL data from GET request's querystring.
@@ -313,10 +426,12 @@ class GraphQL:
         if not explorer_html:
             return self.handle_not_allowed_method(environ, start_response)
 
-        start_response(
-            HttpStatusResponse.OK.value, [("Content-Type", CONTENT_TYPE_TEXT_HTML)]
+        headers = [("Content-Type", CONTENT_TYPE_TEXT_HTML)]
+        body = self.compress_response_body(
+            environ, cast(str, explorer_html).encode("utf-8"), headers
         )
-        return [cast(str, explorer_html).encode("utf-8")]
+        start_response(HttpStatusResponse.OK.value, headers)
+        return [body]
 
     def handle_post(self, environ: dict, start_response: Callable) -> list[bytes]:
         """Handles WSGI HTTP POST request and returns a a response to the client.
@@ -330,8 +445,26 @@ class GraphQL:
         `start_response`: a callable used to begin new HTTP response.
         """
         data = self.get_request_data(environ)
-        result = self.execute_query(environ, data)
-        return self.return_response_from_result(start_response, result)
+        normalize = self.is_normalized_result_requested(environ)
+        if normalize:
+            cached_introspection = None
+        else:
+            cached_introspection = self.get_cached_introspection(data)
+        codec = self.get_response_codec(environ)
+        if codec:
+            if cached_introspection:
+                result = True, cached_introspection.result
+            else:
+                result = self.execute_query(environ, data, normalize=normalize)
+            return self.return_encoded_response(environ, start_response, result, codec)
+
+        if cached_introspection:
+            return self.return_cached_introspection(
+                environ, start_response, cached_introspection
+            )
+
+        result = self.execute_query(environ, data, normalize=normalize)
+        return self.return_response_from_result(start_response, result, environ=environ)
 
     def get_request_data(self, environ: dict) -> Any:
         """Extracts GraphQL request data from request.
@@ -349,6 +482,9 @@ class GraphQL:
             return self.extract_data_from_json_request(environ)
         if content_type == DATA_TYPE_MULTIPART:
             return self.extract_data_from_multipart_request(environ)
+        codec = get_codec_for_content_type(self.codecs, content_type)
+        if codec:
+            return self.extract_data_from_encoded_request(environ, codec)
 
         raise HttpBadRequestError(
             f"Posted content must be of type {DATA_TYPE_JSON} or {DATA_TYPE_MULTIPART}"
@@ -371,6 +507,27 @@ class GraphQL:
         except ValueError as ex:
             raise HttpBadRequestError("Request body is not a valid JSON") from ex
 
+    def extract_data_from_encoded_request(self, environ: dict, codec: Codec) -> Any:
+        """Extracts GraphQL data from request with body in binary wire format.
+
+        Returns GraphQL query data that was not yet validated.
+
+        # Required arguments
+
+        `environ`: a WSGI environment dictionary.
+
+        `codec`: a `Codec` to decode request's body with.
+        """
+        request_content_length = self.get_request_content_length(environ)
+        request_body = self.get_request_body(environ, request_content_length)
+
+        try:
+            return codec.decode(request_body)
+        except ValueError as ex:
+            raise HttpBadRequestError(
+                f"Request body is not a valid {codec.media_type}"
+            ) from ex
+
     def get_request_content_length(self, environ: dict) -> int:
         """Validates and returns value from `Content-length` header.
 
@@ -444,7 +601,9 @@ class GraphQL:
 
         return combine_multipart_data(operations, files_map, form.files)
 
-    def execute_query(self, environ: dict, data: Any) -> GraphQLResult:
+    def execute_query(
+        self, environ: dict, data: Any, *, normalize: bool = False
+    ) -> GraphQLResult:
         """Executes GraphQL query and returns its result.
 
         Returns a `GraphQLResult`, a two items long `tuple` with `bool` for
@@ -455,29 +614,108 @@ class GraphQL:
         `environ`: a WSGI environment dictionary.
 
         `data`: a GraphQL data.
+
+        # Optional arguments
+
+        `normalize`: a `bool` controlling if result should be returned in
+        normalized format. Requires `normalization` option to be set.
         """
+        if normalize and self.normalization:
+            success, result = self.execute_query(environ, data)
+            return success, self.normalization.normalize(result)
+
+        cached_introspection = self.get_cached_introspection(data)
+        if cached_introspection:
+            return True, dict(cached_introspection.result)
+
         context_value = self.get_context_for_request(environ, data)
         extensions = self.get_extensions_for_request(environ, context_value)
+        if self.slow_operation_log:
+            extensions = [self.slow_operation_log.extension, *(extensions or [])]
+        if self.operation_deadlines:
+            extensions = [
+                *(extensions or []),
+                self.get_deadline_extension(environ, self.operation_deadlines),
+            ]
+        if self.concurrency_limits:
+            extensions = [*(extensions or []), self.concurrency_limits.extension]
         middleware = self.get_middleware_for_request(environ, context_value)
 
-        return graphql_sync(
-            self.schema,
-            data,
-            context_value=context_value,
-            root_value=self.root_value,
-            query_parser=self.query_parser,
-            query_validator=self.query_validator,
-            validation_rules=self.validation_rules,
-            require_query=environ["REQUEST_METHOD"] == "GET",
-            debug=self.debug,
-            introspection=self.introspection,
-            logger=self.logger,
-            error_formatter=self.error_formatter,
-            extensions=extensions,
-            middleware=middleware,
-            middleware_manager_class=self.middleware_manager_class,
-            execution_context_class=self.execution_context_class,
-        )
+        query_document = None
+        introspection_cache = self.get_introspection_cache(data)
+        if introspection_cache:
+            try:
+                query_document = parse_query(context_value, self.query_parser, data)
+            except GraphQLError:
+                pass  # graphql_sync() will report the syntax error
+        if introspection_cache and query_document:
+            cached_introspection = introspection_cache.get_for_document(
+                self.schema, data, query_document
+            )
+            if cached_introspection:
+                return True, dict(cached_introspection.result)
+
+        extension_manager = ExtensionManager(extensions, context_value)
+        environ["ariadne.extension_manager"] = extension_manager
+
+        options: dict[str, Any] = {
+            "context_value": context_value,
+            "root_value": self.root_value,
+            "query_parser": self.query_parser,
+            "query_validator": self.query_validator,
+            "query_document": query_document,
+            "validation_rules": self.validation_rules,
+            "require_query": environ["REQUEST_METHOD"] == "GET",
+            "debug": self.debug,
+            "introspection": self.introspection,
+            "logger": self.logger,
+            "error_formatter": self.error_formatter,
+            "extension_manager": extension_manager,
+            "middleware": middleware,
+            "middleware_manager_class": self.middleware_manager_class,
+            "execution_context_class": self.execution_context_class,
+        }
+        if self.event_loop:
+            success, result = self.event_loop.run(graphql(self.schema, data, **options))
+        else:
+            success, result = graphql_sync(self.schema, data, **options)
+
+        if success and introspection_cache and query_document:
+            introspection_cache.set(self.schema, data, query_document, result)
+
+        return success, result
+
+    def get_introspection_cache(self, data: Any) -> IntrospectionCache | None:
+        """Returns `IntrospectionCache` to use for GraphQL request's data.
+
+        Returns `None` if introspection cache is disabled or `data` can't
+        be an introspection query.
+
+        # Required arguments
+
+        `data`: a GraphQL data.
+        """
+        if (
+            self.introspection_cache
+            and self.introspection
+            and self.introspection_cache.is_candidate(data)
+        ):
+            return self.introspection_cache
+        return None
+
+    def get_cached_introspection(self, data: Any) -> CachedIntrospection | None:
+        """Returns cached result of introspection query from request's data.
+
+        Returns `CachedIntrospection` or `None` if query's result is not cached.
+
+        # Required arguments
+
+        `data`: a GraphQL data.
+        """
+        introspection_cache = self.get_introspection_cache(data)
+        if introspection_cache:
+            return introspection_cache.get(self.schema, data)
+        return None
 
     def get_context_for_request(self, environ: dict, data: Any) -> ContextValue | None:
         """Returns GraphQL context value for HTTP request.
@@ -527,13 +765,17 @@ class GraphQL:
         """
         middleware = self.middleware
         if callable(middleware):
-            middleware = middleware(environ, context)  # ty: ignore
+            middleware = middleware(environ, context)
         if middleware:
             return cast(MiddlewareList, middleware)
         return None
 
     def return_response_from_result(
-        self, start_response: Callable, result: GraphQLResult
+        self,
+        start_response: Callable,
+        result: GraphQLResult,
+        *,
+        environ: dict | None = None,
     ) -> list[bytes]:
         """Returns WSGI response from GraphQL result.
 
@@ -544,14 +786,268 @@ class GraphQL:
         `start_response`: a WSGI callable that initiates new response.
 
         `result`: a `GraphQLResult` for this request.
+
+        # Optional arguments
+
+        `environ`: a WSGI environment dictionary. Required for response
+        compression.
+        """
+        success, response = result
+        if success or response.get("data") is not None:
+            status_str = HttpStatusResponse.OK.value
+        else:
+            status_str = HttpStatusResponse.BAD_REQUEST.value
+        headers = self.get_response_headers(CONTENT_TYPE_JSON, environ)
+        with self.get_serialization_phase(environ):
+            body = json.dumps(response).encode("utf-8")
+        body = self.compress_response_body(environ, body, headers)
+        self.log_slow_operation(environ, body)
+        start_response(status_str, headers)
+        return [body]
+
+    def return_cacheable_response(
+        self,
+        environ: dict,
+        start_response: Callable,
+        result: GraphQLResult,
+        body: bytes,
+        *,
+        content_type: str = CONTENT_TYPE_JSON,
+    ) -> list[bytes]:
+        """Returns WSGI response from GraphQL result with HTTP caching headers.
+
+        Returns a list of bytes with response body, or an empty list for
+        `304 Not Modified` response if client's cached result is still valid.
+        Response has no caching headers if `http_cache` is not set.
+
+        # Required arguments
+
+        `environ`: a WSGI environment dictionary.
+
+        `start_response`: a WSGI callable that initiates new response.
+
+        `result`: a `GraphQLResult` for this request.
+
+        `body`: a `bytes` with encoded result.
+
+        # Optional arguments
+
+        `content_type`: a `str` with value of response's `Content-Type` header.
+        """
+        success, response = result
+        headers = self.get_response_headers(content_type, environ)
+        body = self.compress_response_body(environ, body, headers)
+        self.log_slow_operation(environ, body)
+
+        if self.http_cache:
+            response_headers = dict(headers)
+            etag = self.http_cache.get_etag(
+                environ,
+                response,
+                body,
+                content_type=response_headers.get("Content-Type"),
+                content_encoding=response_headers.get("Content-Encoding"),
+            )
+            for header, value in self.http_cache.get_headers(etag).items():
+                if header == "Vary":
+                    add_vary_header(headers, value)
+                else:
+                    headers.append((header, value))
+
+            if_none_match = environ.get("HTTP_IF_NONE_MATCH")
+            if self.http_cache.is_not_modified(if_none_match, etag):
+                start_response(
+                    HttpStatusResponse.NOT_MODIFIED.value,
+                    [
+                        (header, value)
+                        for header, value in headers
+                        if header in ("Cache-Control", "ETag", "Vary")
+                    ],
+                )
+                return []
+
+        if success or response.get("data") is not None:
+            status_str = HttpStatusResponse.OK.value
+        else:
+            status_str = HttpStatusResponse.BAD_REQUEST.value
+        start_response(status_str, headers)
+        return [body]
+
+    def return_cached_introspection(
+        self,
+        environ: dict,
+        start_response: Callable,
+        cached_introspection: CachedIntrospection,
+    ) -> list[bytes]:
+        """Returns WSGI response with cached result of introspection query.
+
+        Returns a list of bytes with response body.
+
+        # Required arguments
+
+        `environ`: a WSGI environment dictionary.
+
+        `start_response`: a WSGI callable that initiates new response.
+
+        `cached_introspection`: a `CachedIntrospection` to return.
+        """
+        headers = self.get_response_headers(CONTENT_TYPE_JSON, environ)
+        body = self.compress_response_body(environ, cached_introspection.json, headers)
+        start_response(HttpStatusResponse.OK.value, headers)
+        return [body]
+
+    def return_encoded_response(
+        self,
+        environ: dict,
+        start_response: Callable,
+        result: GraphQLResult,
+        codec: Codec,
+    ) -> list[bytes]:
+        """Returns WSGI response from GraphQL result in binary wire format.
+
+        Returns a list of bytes with response body.
+
+        # Required arguments
+
+        `environ`: a WSGI environment dictionary.
+
+        `start_response`: a WSGI callable that initiates new response.
+
+        `result`: a `GraphQLResult` for this request.
+
+        `codec`: a `Codec` to encode the result with.
         """
         success, response = result
         if success or response.get("data") is not None:
             status_str = HttpStatusResponse.OK.value
         else:
             status_str = HttpStatusResponse.BAD_REQUEST.value
-        start_response(status_str, [("Content-Type", CONTENT_TYPE_JSON)])
-        return [json.dumps(response).encode("utf-8")]
+        headers = self.get_response_headers(codec.media_type, environ)
+        with self.get_serialization_phase(environ):
+            body = codec.encode(response)
+        body = self.compress_response_body(environ, body, headers)
+        self.log_slow_operation(environ, body)
+        start_response(status_str, headers)
+        return [body]
+
+    def get_serialization_phase(self, environ: dict | None) -> Any:
+        """Returns a context manager running extensions' serialization hooks.
+
+        # Required arguments
+
+        `environ`: a WSGI environment dictionary or `None`.
+        """
+        if environ and "ariadne.extension_manager" in environ:
+            return environ["ariadne.extension_manager"].phase("serialization")
+        return NO_PHASE_HOOKS
+
+    def get_deadline_extension(
+        self, environ: dict, operation_deadlines: OperationDeadlines
+    ) -> Callable[[], Extension]:
+        """Returns extension enforcing request's deadline.
+
+        # Required arguments
+
+        `environ`: a WSGI environment dictionary.
+
+        `operation_deadlines`: an `OperationDeadlines` of the application.
+        """
+        requested_timeout = None
+        if operation_deadlines.header:
+            header = operation_deadlines.header.upper().replace("-", "_")
+            requested_timeout = environ.get(f"HTTP_{header}")
+        return operation_deadlines.get_extension(requested_timeout)
+
+    def log_slow_operation(self, environ: dict | None, body: bytes) -> None:
+        """Logs the operation if it exceeded thresholds of `slow_operation_log`.
+
+        # Required arguments
+
+        `environ`: a WSGI environment dictionary or `None`.
+
+        `body`: a `bytes` with response's body.
+        """
+        if self.slow_operation_log and environ:
+            self.slow_operation_log.finish(
+                environ.get("ariadne.extension_manager"), len(body)
+            )
+
+    def get_response_codec(self, environ: dict) -> Codec | None:
+        """Returns `Codec` to encode response's body with or `None` for JSON.
+
+        # Required arguments
+
+        `environ`: a WSGI environment dictionary.
+        """
+        if not self.codecs:
+            return None
+
+        content_type = environ.get("CONTENT_TYPE", "").split(";")[0]
+        request_codec = get_codec_for_content_type(self.codecs, content_type)
+        return negotiate_codec(self.codecs, environ.get("HTTP_ACCEPT"), request_codec)
+
+    def is_normalized_result_requested(self, environ: dict) -> bool:
+        """Returns `True` if client requested result in normalized format.
+
+        # Required arguments
+
+        `environ`: a WSGI environment dictionary.
+        """
+        if not self.normalization:
+            return False
+
+        header = "HTTP_" + self.normalization.header.upper().replace("-", "_")
+        return self.normalization.is_requested(environ.get(header))
+
+    def get_response_headers(
+        self, content_type: str, environ: dict | None = None
+    ) -> list[tuple[str, str]]:
+        """Returns a list of headers for response with GraphQL result.
+
+        # Required arguments
+
+        `content_type`: a `str` with value of response's `Content-Type` header.
+
+        # Optional arguments
+
+        `environ`: a WSGI environment dictionary.
+        """
+        headers = [("Content-Type", content_type)]
+        if self.codecs:
+            headers.append(("Vary", "Accept"))
+        if self.normalization:
+            add_vary_header(headers, self.normalization.header)
+            if environ is not None and self.is_normalized_result_requested(environ):
+                headers.append((self.normalization.header, NORMALIZED))
+        return headers
+
+    def compress_response_body(
+        self, environ: dict | None, body: bytes, headers: list[tuple[str, str]]
+    ) -> bytes:
+        """Compresses response's body with encoding accepted by the client.
+
+        Returns compressed body and adds `Content-Encoding` and `Vary` headers
+        to `headers`. Returns unchanged body if compression is disabled,
+        client doesn't accept supported encodings or the body is too small.
+
+        # Required arguments
+
+        `environ`: a WSGI environment dictionary or `None`.
+
+        `body`: a `bytes` with response's body.
+
+        `headers`: a `list` of response's headers.
+        """
+        if not self.compression or environ is None:
+            return body
+
+        add_vary_header(headers, "Accept-Encoding")
+        body, encoding = self.compression.compress_body(
+            body, environ.get("HTTP_ACCEPT_ENCODING")
+        )
+        if encoding:
+            headers.append(("Content-Encoding", encoding))
+        return body
 
     def handle_not_allowed_method(
         self, environ: dict, start_response: Callable
@@ -640,6 +1136,14 @@ class GraphQLMiddleware:
         return self.graphql_app(environ, start_response)
 
 
+def add_vary_header(headers: list[tuple[str, str]], value: str) -> None:
+    for i, (header, current_value) in enumerate(headers):
+        if header == "Vary":
+            headers[i] = (header, f"{current_value}, {value}")
+            return
+    headers.append(("Vary", value))
+
+
 def parse_query_string(environ: dict) -> dict | None:
     query_string = environ.get("QUERY_STRING")
     if not query_string:
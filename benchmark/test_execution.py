@@ -0,0 +1,26 @@
+from http import HTTPStatus
+
+from starlette.testclient import TestClient
+
+from ariadne.asgi import GraphQL
+from ariadne.execution import FastExecutionContext
+
+from .schema import schema
+
+
+def test_query_with_fast_execution_context(benchmark, benchmark_query):
+    app = GraphQL(schema, execution_context_class=FastExecutionContext)
+    client = TestClient(app)
+
+    def api_call():
+        return client.post(
+            "/",
+            json={
+                "operationName": "GetThreads",
+                "query": benchmark_query,
+            },
+        )
+
+    result = benchmark(api_call)
+    assert result.status_code == HTTPStatus.OK
+    assert not result.json().get("errors")
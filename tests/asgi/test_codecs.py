@@ -0,0 +1,138 @@
+from http import HTTPStatus
+
+import pytest
+from starlette.testclient import TestClient
+
+from ariadne.asgi import GraphQL
+from ariadne.asgi.handlers import GraphQLHTTPHandler, GraphQLTransportWSHandler
+from ariadne.codecs import CBORCodec, MessagePackCodec
+
+msgpack = pytest.importorskip("msgpack")
+cbor2 = pytest.importorskip("cbor2")
+
+
+@pytest.fixture
+def client(schema):
+    http_handler = GraphQLHTTPHandler(codecs=[MessagePackCodec(), CBORCodec()])
+    return TestClient(GraphQL(schema, http_handler=http_handler))
+
+
+def test_msgpack_request_is_answered_with_msgpack(client):
+    response = client.post(
+        "/",
+        content=msgpack.packb({"query": '{ hello(name: "Bob") }'}),
+        headers={"Content-Type": "application/msgpack"},
+    )
+    assert response.status_code == HTTPStatus.OK
+    assert response.headers["Content-Type"] == "application/msgpack"
+    assert response.headers["Vary"] == "Accept"
+    assert msgpack.unpackb(response.content) == {"data": {"hello": "Hello, Bob!"}}
+
+
+def test_cbor_request_is_answered_with_cbor(client):
+    response = client.post(
+        "/",
+        content=cbor2.dumps({"query": "{ status }"}),
+        headers={"Content-Type": "application/cbor", "Accept": "application/cbor"},
+    )
+    assert response.headers["Content-Type"] == "application/cbor"
+    assert cbor2.loads(response.content) == {"data": {"status": True}}
+
+
+def test_json_request_is_answered_with_accepted_binary_format(client):
+    response = client.post(
+        "/", json={"query": "{ status }"}, headers={"Accept": "application/msgpack"}
+    )
+    assert response.headers["Content-Type"] == "application/msgpack"
+    assert msgpack.unpackb(response.content) == {"data": {"status": True}}
+
+
+def test_binary_request_is_answered_with_json_if_client_accepts_json(client):
+    response = client.post(
+        "/",
+        content=msgpack.packb({"query": "{ status }"}),
+        headers={"Content-Type": "application/msgpack", "Accept": "application/json"},
+    )
+    assert response.headers["Content-Type"] == "application/json"
+    assert response.json() == {"data": {"status": True}}
+
+
+def test_invalid_binary_request_returns_bad_request(client):
+    response = client.post(
+        "/", content=b"\xc1", headers={"Content-Type": "application/msgpack"}
+    )
+    assert response.status_code == HTTPStatus.BAD_REQUEST
+    assert response.text == "Request body is not a valid application/msgpack"
+
+
+def test_binary_error_response_has_bad_request_status(client):
+    response = client.post(
+        "/",
+        content=msgpack.packb({"query": "{ unknown }"}),
+        headers={"Content-Type": "application/msgpack"},
+    )
+    assert response.status_code == HTTPStatus.BAD_REQUEST
+    assert msgpack.unpackb(response.content)["errors"]
+
+
+def test_binary_formats_are_not_supported_by_default(schema):
+    client = TestClient(GraphQL(schema))
+    response = client.post(
+        "/",
+        content=msgpack.packb({"query": "{ status }"}),
+        headers={"Content-Type": "application/msgpack"},
+    )
+    assert response.status_code == HTTPStatus.BAD_REQUEST
+
+
+def test_cached_introspection_is_encoded_with_binary_format(schema):
+    http_handler = GraphQLHTTPHandler(
+        codecs=[MessagePackCodec()], introspection_cache=True
+    )
+    client = TestClient(GraphQL(schema, http_handler=http_handler))
+    query = {"query": "{ __schema { queryType { name } } }"}
+    client.post("/", json=query)
+    response = client.post("/", json=query, headers={"Accept": "application/msgpack"})
+    assert msgpack.unpackb(response.content) == {
+        "data": {"__schema": {"queryType": {"name": "Query"}}}
+    }
+
+
+@pytest.fixture
+def websocket_client(schema):
+    websocket_handler = GraphQLTransportWSHandler(codecs=[MessagePackCodec()])
+    return TestClient(GraphQL(schema, websocket_handler=websocket_handler))
+
+
+def test_field_can_be_subscribed_using_binary_subprotocol(websocket_client):
+    with websocket_client.websocket_connect(
+        "/", ["graphql-transport-ws+msgpack"]
+    ) as ws:
+        assert ws.accepted_subprotocol == "graphql-transport-ws+msgpack"
+        ws.send_bytes(
+            msgpack.packb({"type": GraphQLTransportWSHandler.GQL_CONNECTION_INIT})
+        )
+        ws.send_bytes(
+            msgpack.packb(
+                {
+                    "type": GraphQLTransportWSHandler.GQL_SUBSCRIBE,
+                    "id": "test1",
+                    "payload": {"query": "subscription { ping }"},
+                }
+            )
+        )
+        response = msgpack.unpackb(ws.receive_bytes())
+        assert response["type"] == GraphQLTransportWSHandler.GQL_CONNECTION_ACK
+        response = msgpack.unpackb(ws.receive_bytes())
+        assert response["type"] == GraphQLTransportWSHandler.GQL_NEXT
+        assert response["payload"]["data"] == {"ping": "pong"}
+        response = msgpack.unpackb(ws.receive_bytes())
+        assert response["type"] == GraphQLTransportWSHandler.GQL_COMPLETE
+
+
+def test_json_subprotocol_is_used_when_requested_with_codecs(websocket_client):
+    with websocket_client.websocket_connect("/", ["graphql-transport-ws"]) as ws:
+        assert ws.accepted_subprotocol == "graphql-transport-ws"
+        ws.send_json({"type": GraphQLTransportWSHandler.GQL_CONNECTION_INIT})
+        response = ws.receive_json()
+        assert response["type"] == GraphQLTransportWSHandler.GQL_CONNECTION_ACK
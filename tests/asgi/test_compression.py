@@ -0,0 +1,129 @@
+import gzip
+from http import HTTPStatus
+
+import pytest
+from starlette.testclient import TestClient
+
+from ariadne.asgi import GraphQL
+from ariadne.asgi.handlers import GraphQLHTTPHandler
+from ariadne.compression import CompressionStats, ResponseCompression, StreamCompressor
+from ariadne.contrib.sse import ServerSentEventResponse, SSESubscriptionHandler
+from ariadne.http_cache import HttpCache
+
+long_name = "a" * 2000
+
+
+def create_client(schema, **kwargs):
+    http_handler = GraphQLHTTPHandler(**kwargs)
+    app = GraphQL(schema, http_handler=http_handler, execute_get_queries=True)
+    return TestClient(app)
+
+
+def test_json_response_is_compressed(schema):
+    client = create_client(schema, compression=ResponseCompression(encodings=["gzip"]))
+    response = client.post(
+        "/",
+        json={"query": f'{{ hello(name: "{long_name}") }}'},
+        headers={"Accept-Encoding": "gzip"},
+    )
+    assert response.status_code == HTTPStatus.OK
+    assert response.headers["Content-Encoding"] == "gzip"
+    assert response.headers["Vary"] == "Accept-Encoding"
+    assert response.json() == {"data": {"hello": f"Hello, {long_name}!"}}
+
+
+def test_small_json_response_is_not_compressed(schema):
+    client = create_client(schema, compression=ResponseCompression())
+    response = client.post(
+        "/", json={"query": "{ status }"}, headers={"Accept-Encoding": "gzip"}
+    )
+    assert "Content-Encoding" not in response.headers
+    assert response.headers["Vary"] == "Accept-Encoding"
+
+
+def test_json_response_is_not_compressed_if_client_doesnt_accept_encoding(schema):
+    client = create_client(schema, compression=ResponseCompression(minimum_size=0))
+    response = client.post(
+        "/", json={"query": "{ status }"}, headers={"Accept-Encoding": "identity"}
+    )
+    assert "Content-Encoding" not in response.headers
+    assert response.json() == {"data": {"status": True}}
+
+
+def test_json_response_is_not_compressed_by_default(schema):
+    client = create_client(schema)
+    response = client.post(
+        "/", json={"query": "{ status }"}, headers={"Accept-Encoding": "gzip"}
+    )
+    assert "Content-Encoding" not in response.headers
+
+
+def test_explorer_html_is_compressed(schema):
+    client = create_client(schema, compression=ResponseCompression(encodings=["gzip"]))
+    response = client.get("/", headers={"Accept-Encoding": "gzip"})
+    assert response.headers["Content-Encoding"] == "gzip"
+    assert "<html" in response.text.lower()
+
+
+def test_compressed_get_query_response_has_caching_headers(schema):
+    client = create_client(
+        schema,
+        compression=ResponseCompression(minimum_size=0, encodings=["gzip"]),
+        http_cache=HttpCache(vary=["Authorization"]),
+    )
+    response = client.get(
+        "/", params={"query": "{ status }"}, headers={"Accept-Encoding": "gzip"}
+    )
+    assert response.headers["Content-Encoding"] == "gzip"
+    assert response.headers["Vary"] == "Accept-Encoding, Authorization"
+
+    response = client.get(
+        "/",
+        params={"query": "{ status }"},
+        headers={
+            "Accept-Encoding": "gzip",
+            "If-None-Match": response.headers["ETag"],
+        },
+    )
+    assert response.status_code == HTTPStatus.NOT_MODIFIED
+    assert response.headers["Vary"] == "Accept-Encoding, Authorization"
+
+
+def test_sse_stream_is_compressed(schema):
+    compression = ResponseCompression(encodings=["gzip"])
+    http_handler = GraphQLHTTPHandler(
+        subscription_handlers=[SSESubscriptionHandler(compression=compression)]
+    )
+    client = TestClient(GraphQL(schema, http_handler=http_handler))
+    with client.stream(
+        "POST",
+        "/",
+        json={"query": "subscription { ping }"},
+        headers={"Accept": "text/event-stream", "Accept-Encoding": "gzip"},
+    ) as response:
+        assert response.headers["Content-Encoding"] == "gzip"
+        body = gzip.decompress(b"".join(response.iter_raw()))
+
+    assert b'{"ping": "pong"}' in body
+    assert b"event: complete" in body
+    assert compression.stats["gzip", 6].responses == 1
+
+
+@pytest.mark.parametrize(
+    ("headers", "vary"),
+    [
+        (None, "Accept-Encoding"),
+        ({"Vary": "Authorization"}, "Authorization, Accept-Encoding"),
+        ({"Vary": "accept-encoding"}, "accept-encoding"),
+    ],
+)
+def test_sse_stream_vary_header_is_merged_with_response_headers(headers, vary):
+    async def generator():
+        yield None
+
+    response = ServerSentEventResponse(
+        generator=generator(),
+        headers=headers,
+        compressor=StreamCompressor("gzip", 6, CompressionStats()),
+    )
+    assert response.headers["Vary"] == vary
@@ -0,0 +1,41 @@
+import asyncio
+
+from starlette.testclient import TestClient
+
+from ariadne import ObjectType, QueryType, make_executable_schema
+from ariadne.asgi import GraphQL
+from ariadne.asgi.handlers import GraphQLHTTPHandler
+from ariadne.concurrency import ConcurrencyLimits
+
+
+def test_asgi_handler_limits_async_resolvers():
+    running = 0
+    max_running = 0
+
+    query_type = QueryType()
+    query_type.set_field("items", lambda *_: list(range(5)))
+
+    item_type = ObjectType("Item")
+
+    @item_type.field("value")
+    async def resolve_value(obj, *_):
+        nonlocal running, max_running
+        running += 1
+        max_running = max(max_running, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+        return obj
+
+    schema = make_executable_schema(
+        "type Query { items: [Item!]! } type Item { value: Int! }",
+        query_type,
+        item_type,
+    )
+    limits = ConcurrencyLimits(field_limits={"Item.value": 2})
+    http_handler = GraphQLHTTPHandler(concurrency_limits=limits)
+    client = TestClient(GraphQL(schema, http_handler=http_handler))
+    response = client.post("/", json={"query": "{ items { value } }"})
+
+    assert response.json()["data"]["items"] == [{"value": i} for i in range(5)]
+    assert max_running == 2
+    assert limits.stats["Item.value"].waited == 3
@@ -0,0 +1,40 @@
+import asyncio
+
+from starlette.testclient import TestClient
+
+from ariadne import QueryType, make_executable_schema
+from ariadne.asgi import GraphQL
+from ariadne.asgi.handlers import GraphQLHTTPHandler
+from ariadne.deadlines import OperationDeadlines
+
+query_type = QueryType()
+
+
+@query_type.field("slow")
+async def resolve_slow(*_):
+    await asyncio.sleep(0.2)
+    return True
+
+
+schema = make_executable_schema("type Query { slow: Boolean }", query_type)
+
+
+def test_asgi_handler_cancels_resolvers_at_deadline():
+    http_handler = GraphQLHTTPHandler(
+        operation_deadlines=OperationDeadlines(timeout=0.05)
+    )
+    client = TestClient(GraphQL(schema, http_handler=http_handler))
+    response = client.post("/", json={"query": "{ slow }"})
+    assert response.json()["data"] == {"slow": None}
+    assert response.json()["errors"][0]["message"] == (
+        "Operation exceeded its deadline of 0.05 seconds."
+    )
+
+
+def test_asgi_handler_uses_timeout_from_header():
+    http_handler = GraphQLHTTPHandler(operation_deadlines=OperationDeadlines())
+    client = TestClient(GraphQL(schema, http_handler=http_handler))
+    response = client.post(
+        "/", json={"query": "{ slow }"}, headers={"X-Request-Timeout": "0.05"}
+    )
+    assert response.json()["data"] == {"slow": None}
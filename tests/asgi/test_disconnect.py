@@ -0,0 +1,109 @@
+import asyncio
+import json
+
+import pytest
+from starlette.testclient import TestClient
+
+from ariadne import QueryType, make_executable_schema
+from ariadne.asgi import GraphQL
+from ariadne.asgi.handlers import GraphQLHTTPHandler
+from ariadne.types import Extension
+
+resolver_started = asyncio.Event()
+hooks = []
+
+
+class HooksExtension(Extension):
+    def request_finished(self, context):
+        hooks.append("request_finished")
+
+    def request_cancelled(self, context):
+        hooks.append("request_cancelled")
+
+
+query_type = QueryType()
+query_type.set_field("fast", lambda *_: True)
+
+
+@query_type.field("slow")
+async def resolve_slow(*_):
+    resolver_started.set()
+    try:
+        await asyncio.sleep(10)
+    except asyncio.CancelledError:
+        hooks.append("resolver_cancelled")
+        raise
+    return True
+
+
+schema = make_executable_schema(
+    "type Query { slow: Boolean fast: Boolean }", query_type
+)
+
+
+@pytest.fixture(autouse=True)
+def reset_hooks():
+    global resolver_started
+    hooks.clear()
+    resolver_started = asyncio.Event()
+
+
+def create_app(**kwargs):
+    return GraphQL(
+        schema,
+        http_handler=GraphQLHTTPHandler(extensions=[HooksExtension], **kwargs),
+    )
+
+
+async def send_request(app, query):
+    messages = [
+        {
+            "type": "http.request",
+            "body": json.dumps({"query": query}).encode(),
+            "more_body": False,
+        }
+    ]
+
+    async def receive():
+        if messages:
+            return messages.pop(0)
+        await resolver_started.wait()
+        return {"type": "http.disconnect"}
+
+    sent = []
+
+    async def send(message):
+        sent.append(message)
+
+    scope = {
+        "type": "http",
+        "method": "POST",
+        "path": "/",
+        "root_path": "",
+        "query_string": b"",
+        "headers": [(b"content-type", b"application/json")],
+    }
+    await asyncio.wait_for(app(scope, receive, send), 1)
+    return sent
+
+
+@pytest.mark.asyncio
+async def test_execution_is_cancelled_when_client_disconnects():
+    sent = await send_request(create_app(cancel_on_disconnect=True), "{ slow }")
+    assert sent[0]["status"] == 499
+    assert hooks == ["resolver_cancelled", "request_finished", "request_cancelled"]
+
+
+@pytest.mark.asyncio
+async def test_execution_is_not_cancelled_by_default():
+    resolver_started.set()
+    sent = await send_request(create_app(), "{ fast }")
+    assert sent[0]["status"] == 200
+    assert hooks == ["request_finished"]
+
+
+def test_result_is_returned_if_client_is_connected():
+    client = TestClient(create_app(cancel_on_disconnect=True))
+    response = client.post("/", json={"query": "{ fast }"})
+    assert response.json() == {"data": {"fast": True}}
+    assert hooks == ["request_finished"]
@@ -0,0 +1,100 @@
+from http import HTTPStatus
+
+from starlette.testclient import TestClient
+
+from ariadne.asgi import GraphQL
+from ariadne.asgi.handlers import GraphQLHTTPHandler
+from ariadne.compression import ResponseCompression
+from ariadne.http_cache import HttpCache
+
+
+def create_client(schema, **kwargs):
+    http_handler = GraphQLHTTPHandler(**kwargs)
+    app = GraphQL(schema, http_handler=http_handler, execute_get_queries=True)
+    return TestClient(app)
+
+
+def test_get_query_response_includes_caching_headers(schema):
+    client = create_client(
+        schema,
+        http_cache=HttpCache(cache_control="public, max-age=60", vary=["Accept"]),
+    )
+    response = client.get("/", params={"query": "{ status }"})
+    assert response.status_code == HTTPStatus.OK
+    assert response.json() == {"data": {"status": True}}
+    assert response.headers["ETag"]
+    assert response.headers["Cache-Control"] == "public, max-age=60"
+    assert response.headers["Vary"] == "Accept"
+
+
+def test_not_modified_response_is_returned_for_matching_etag(schema):
+    client = create_client(schema, http_cache=HttpCache())
+    response = client.get("/", params={"query": "{ status }"})
+    etag = response.headers["ETag"]
+
+    response = client.get(
+        "/", params={"query": "{ status }"}, headers={"If-None-Match": etag}
+    )
+    assert response.status_code == HTTPStatus.NOT_MODIFIED
+    assert response.content == b""
+    assert response.headers["ETag"] == etag
+
+
+def test_full_response_is_returned_for_different_etag(schema):
+    client = create_client(schema, http_cache=HttpCache())
+    response = client.get(
+        "/", params={"query": "{ status }"}, headers={"If-None-Match": '"other"'}
+    )
+    assert response.status_code == HTTPStatus.OK
+    assert response.json() == {"data": {"status": True}}
+
+
+def test_etag_is_computed_from_version(schema):
+    http_cache = HttpCache(version=lambda request, result: "v1")
+    client = create_client(schema, http_cache=http_cache)
+    response = client.get("/", params={"query": "{ status }"})
+    other_response = client.get("/", params={"query": '{ hello(name: "Bob") }'})
+    assert response.headers["ETag"] == other_response.headers["ETag"]
+
+
+def test_etag_computed_from_version_differs_for_compressed_response(schema):
+    http_cache = HttpCache(version=lambda request, result: "v1")
+    client = create_client(
+        schema, http_cache=http_cache, compression=ResponseCompression(minimum_size=0)
+    )
+    query = {"query": "{ status }"}
+    response = client.get("/", params=query, headers={"Accept-Encoding": "gzip"})
+    other_response = client.get(
+        "/", params=query, headers={"Accept-Encoding": "identity"}
+    )
+    assert response.headers["Content-Encoding"] == "gzip"
+    assert "Content-Encoding" not in other_response.headers
+    assert response.headers["ETag"] != other_response.headers["ETag"]
+
+
+def test_result_with_errors_is_not_cached(schema):
+    client = create_client(schema, http_cache=HttpCache())
+    response = client.get("/", params={"query": "{ testError }"})
+    assert "ETag" not in response.headers
+    assert response.headers["Cache-Control"] == "no-store"
+
+
+def test_post_query_response_has_no_caching_headers(schema):
+    client = create_client(schema, http_cache=HttpCache())
+    response = client.post("/", json={"query": "{ status }"})
+    assert "ETag" not in response.headers
+    assert "Cache-Control" not in response.headers
+
+
+def test_get_query_response_has_no_caching_headers_by_default(schema):
+    client = create_client(schema)
+    response = client.get("/", params={"query": "{ status }"})
+    assert "ETag" not in response.headers
+
+
+def test_cached_introspection_is_returned_with_caching_headers(schema):
+    client = create_client(schema, http_cache=HttpCache(), introspection_cache=True)
+    query = "{ __schema { queryType { name } } }"
+    etag = client.get("/", params={"query": query}).headers["ETag"]
+    response = client.get("/", params={"query": query}, headers={"If-None-Match": etag})
+    assert response.status_code == HTTPStatus.NOT_MODIFIED
@@ -0,0 +1,31 @@
+from starlette.testclient import TestClient
+
+from ariadne.asgi import EventLoopMonitor, GraphQL
+from ariadne.asgi.handlers import GraphQLHTTPHandler
+from ariadne.processes import ResolverProcessPool
+from ariadne.threads import ResolverThreadPool
+
+
+def test_pools_are_started_and_stopped_with_lifespan(schema):
+    process_pool = ResolverProcessPool(max_workers=1)
+    thread_pool = ResolverThreadPool()
+    thread_pool.get_executor()
+    http_handler = GraphQLHTTPHandler(
+        resolver_process_pool=process_pool, resolver_thread_pool=thread_pool
+    )
+    app = GraphQL(schema, http_handler=http_handler)
+
+    with TestClient(app) as client:
+        assert process_pool._executor is not None
+        response = client.post("/", json={"query": "{ status }"})
+        assert response.json() == {"data": {"status": True}}
+
+    assert process_pool._executor is None
+    assert thread_pool._executor is None
+
+
+def test_loop_monitor_is_stopped_on_lifespan_shutdown(schema):
+    monitor = EventLoopMonitor()
+    with TestClient(GraphQL(schema, loop_monitor=monitor)):
+        assert monitor._loop is not None
+    assert monitor._loop is None
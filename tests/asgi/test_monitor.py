@@ -0,0 +1,118 @@
+import asyncio
+import time
+
+import pytest
+import pytest_asyncio
+from starlette.testclient import TestClient
+
+from ariadne import QueryType, graphql, make_executable_schema
+from ariadne.asgi import EventLoopMonitor, GraphQL
+from ariadne.contrib.tracing.metrics import GraphQLMetrics
+
+
+@pytest.fixture
+def blocking_schema():
+    query = QueryType()
+
+    @query.field("blocking")
+    def resolve_blocking(*_):
+        time.sleep(0.2)
+        return True
+
+    @query.field("blockingAsync")
+    async def resolve_blocking_async(*_):
+        await asyncio.sleep(0)
+        time.sleep(0.2)
+        return True
+
+    @query.field("fast")
+    async def resolve_fast(*_):
+        return True
+
+    return make_executable_schema(
+        "type Query { blocking: Boolean, blockingAsync: Boolean, fast: Boolean }",
+        query,
+    )
+
+
+@pytest_asyncio.fixture
+async def monitor():
+    monitor = EventLoopMonitor(threshold=0.05, interval=0.01)
+    monitor.ensure_started()
+    await asyncio.sleep(0.02)
+    yield monitor
+    monitor.stop()
+
+
+async def execute(schema, query):
+    await graphql(schema, {"query": query})
+    await asyncio.sleep(0.05)  # Let the late heartbeat run
+
+
+@pytest.mark.asyncio
+async def test_monitor_attributes_stall_to_blocking_sync_resolver(
+    monitor, blocking_schema
+):
+    await execute(blocking_schema, "{ fast blocking }")
+
+    stall = monitor.stalls[-1]
+    assert stall.duration >= 0.1
+    assert stall.field == ("Query", "blocking")
+    assert stall.path == "blocking"
+    assert stall.location.startswith(__file__)
+
+
+@pytest.mark.asyncio
+async def test_monitor_attributes_stall_to_blocking_async_resolver(
+    monitor, blocking_schema
+):
+    await execute(blocking_schema, "{ blockingAsync }")
+    assert monitor.stalls[-1].field == ("Query", "blockingAsync")
+
+
+@pytest.mark.asyncio
+async def test_monitor_reports_stall_outside_of_resolvers(monitor):
+    time.sleep(0.2)
+    await asyncio.sleep(0.05)
+
+    stall = monitor.stalls[-1]
+    assert stall.field is None
+    assert stall.location.startswith(__file__)
+
+
+@pytest.mark.asyncio
+async def test_monitor_doesnt_report_fast_operations(monitor, blocking_schema):
+    await execute(blocking_schema, "{ fast }")
+    assert not monitor.stalls
+
+
+@pytest.mark.asyncio
+async def test_monitor_logs_stalls(monitor, blocking_schema, caplog):
+    await execute(blocking_schema, "{ blocking }")
+    assert "blocked" in caplog.text
+    assert "Query.blocking resolver (path: blocking" in caplog.text
+
+
+@pytest.mark.asyncio
+async def test_monitor_records_stalls_in_metrics(monitor, blocking_schema):
+    metrics = GraphQLMetrics()
+    monitor.metrics = metrics
+    await execute(blocking_schema, "{ blocking }")
+
+    histograms = metrics.get_event_loop_stalls()
+    assert histograms[("Query", "blocking")].count == 1
+    assert (
+        'ariadne_event_loop_stall_duration_seconds_count{type="Query",'
+        'field="blocking"} 1' in metrics.render_prometheus()
+    )
+
+
+def test_asgi_app_starts_monitor_on_first_request(blocking_schema):
+    monitor = EventLoopMonitor()
+    app = GraphQL(blocking_schema, loop_monitor=monitor)
+    try:
+        response = TestClient(app).post("/", json={"query": "{ fast }"})
+        assert response.json() == {"data": {"fast": True}}
+        assert monitor._loop is not None
+    finally:
+        monitor.stop()
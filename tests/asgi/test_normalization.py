@@ -0,0 +1,108 @@
+import pytest
+from starlette.testclient import TestClient
+
+from ariadne import QueryType, make_executable_schema
+from ariadne.asgi import GraphQL
+from ariadne.asgi.handlers import GraphQLHTTPHandler
+from ariadne.normalization import ResultNormalization
+
+type_defs = """
+    type Query {
+        threads: [Thread!]!
+    }
+
+    type Thread {
+        id: ID!
+        starter: User!
+        lastPoster: User!
+    }
+
+    type User {
+        id: ID!
+        name: String!
+    }
+"""
+
+query_type = QueryType()
+
+
+@query_type.field("threads")
+def resolve_threads(*_):
+    bob = {"id": "1", "name": "Bob"}
+    return [{"id": "1", "starter": bob, "lastPoster": bob}]
+
+
+query = "{ threads { id starter { __typename id name } lastPoster { __typename id } } }"
+
+
+@pytest.fixture
+def client():
+    schema = make_executable_schema(type_defs, query_type)
+    http_handler = GraphQLHTTPHandler(normalization=ResultNormalization())
+    return TestClient(GraphQL(schema, http_handler=http_handler))
+
+
+def test_normalized_result_is_returned_when_requested(client):
+    response = client.post(
+        "/", json={"query": query}, headers={"GraphQL-Response-Format": "normalized"}
+    )
+    assert response.status_code == 200
+    assert response.headers["GraphQL-Response-Format"] == "normalized"
+    assert response.headers["Vary"] == "GraphQL-Response-Format"
+    assert response.json() == {
+        "data": {
+            "threads": [
+                {
+                    "id": "1",
+                    "starter": {"__ref": "User:1"},
+                    "lastPoster": {"__ref": "User:1"},
+                }
+            ]
+        },
+        "entities": {"User:1": {"__typename": "User", "id": "1", "name": "Bob"}},
+    }
+
+
+def test_result_is_not_normalized_when_not_requested(client):
+    response = client.post("/", json={"query": query})
+    assert "GraphQL-Response-Format" not in response.headers
+    assert response.headers["Vary"] == "GraphQL-Response-Format"
+    assert response.json() == {
+        "data": {
+            "threads": [
+                {
+                    "id": "1",
+                    "starter": {"__typename": "User", "id": "1", "name": "Bob"},
+                    "lastPoster": {"__typename": "User", "id": "1"},
+                }
+            ]
+        }
+    }
+
+
+def test_result_is_not_normalized_when_normalization_is_disabled():
+    schema = make_executable_schema(type_defs, query_type)
+    client = TestClient(GraphQL(schema))
+    response = client.post(
+        "/", json={"query": query}, headers={"GraphQL-Response-Format": "normalized"}
+    )
+    assert "entities" not in response.json()
+
+
+def test_cached_introspection_is_normalized_when_requested():
+    schema = make_executable_schema(type_defs, query_type)
+    http_handler = GraphQLHTTPHandler(
+        introspection_cache=True, normalization=ResultNormalization()
+    )
+    client = TestClient(GraphQL(schema, http_handler=http_handler))
+    introspection_query = {"query": "{ __schema { queryType { name } } }"}
+    client.post("/", json=introspection_query)
+    response = client.post(
+        "/",
+        json=introspection_query,
+        headers={"GraphQL-Response-Format": "normalized"},
+    )
+    assert response.json() == {
+        "data": {"__schema": {"queryType": {"name": "Query"}}},
+        "entities": {},
+    }
@@ -255,3 +255,68 @@ def test_schema_not_set(client, snapshot):
         )
         assert response.status_code == HTTPStatus.OK
         assert snapshot == response.json()
+
+
+class CountingExtension(Extension):
+    calls = 0
+
+    def request_started(self, context):
+        CountingExtension.calls += 1
+
+
+introspection_query = "{ __schema { queryType { name } } }"
+
+
+def test_introspection_query_result_is_cached(schema):
+    CountingExtension.calls = 0
+    http_handler = GraphQLHTTPHandler(
+        extensions=[CountingExtension], introspection_cache=True
+    )
+    client = TestClient(GraphQL(schema, http_handler=http_handler))
+    for _ in range(2):
+        response = client.post("/", json={"query": introspection_query})
+        assert response.status_code == HTTPStatus.OK
+        assert response.json() == {
+            "data": {"__schema": {"queryType": {"name": "Query"}}}
+        }
+    assert CountingExtension.calls == 1
+    assert http_handler.introspection_cache.hits == 1
+
+
+def test_cached_introspection_result_is_used_for_equivalent_query(schema):
+    http_handler = GraphQLHTTPHandler(introspection_cache=True)
+    client = TestClient(GraphQL(schema, http_handler=http_handler))
+    client.post("/", json={"query": introspection_query})
+    response = client.post(
+        "/", json={"query": "query {\n  __schema { queryType { name } }\n}"}
+    )
+    assert response.json() == {"data": {"__schema": {"queryType": {"name": "Query"}}}}
+    assert http_handler.introspection_cache.hits == 1
+
+
+def test_cached_introspection_result_is_returned_for_get_query(schema):
+    http_handler = GraphQLHTTPHandler(introspection_cache=True)
+    app = GraphQL(schema, http_handler=http_handler, execute_get_queries=True)
+    client = TestClient(app)
+    client.get("/", params={"query": introspection_query})
+    response = client.get("/", params={"query": introspection_query})
+    assert response.status_code == HTTPStatus.OK
+    assert response.json() == {"data": {"__schema": {"queryType": {"name": "Query"}}}}
+    assert http_handler.introspection_cache.hits == 1
+
+
+def test_introspection_query_result_is_not_cached_by_default(schema):
+    CountingExtension.calls = 0
+    http_handler = GraphQLHTTPHandler(extensions=[CountingExtension])
+    client = TestClient(GraphQL(schema, http_handler=http_handler))
+    for _ in range(2):
+        client.post("/", json={"query": introspection_query})
+    assert CountingExtension.calls == 2
+
+
+def test_introspection_cache_is_not_used_when_introspection_is_disabled(schema):
+    http_handler = GraphQLHTTPHandler(introspection_cache=True)
+    client = TestClient(GraphQL(schema, http_handler=http_handler, introspection=False))
+    for _ in range(2):
+        response = client.post("/", json={"query": introspection_query})
+        assert response.json()["errors"]
@@ -0,0 +1,27 @@
+import threading
+
+from starlette.testclient import TestClient
+
+from ariadne import QueryType, make_executable_schema
+from ariadne.asgi import GraphQL
+from ariadne.asgi.handlers import GraphQLHTTPHandler
+from ariadne.threads import ResolverThreadPool
+
+
+def test_asgi_handler_runs_threaded_resolvers_in_pool():
+    query_type = QueryType()
+
+    @query_type.field("thread", threaded=True)
+    def resolve_thread(*_):
+        return threading.current_thread().name
+
+    schema = make_executable_schema("type Query { thread: String! }", query_type)
+    pool = ResolverThreadPool(thread_name_prefix="test-pool")
+    http_handler = GraphQLHTTPHandler(resolver_thread_pool=pool)
+    try:
+        client = TestClient(GraphQL(schema, http_handler=http_handler))
+        response = client.post("/", json={"query": "{ thread }"})
+    finally:
+        pool.shutdown()
+
+    assert response.json()["data"]["thread"].startswith("test-pool")
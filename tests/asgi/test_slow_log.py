@@ -0,0 +1,128 @@
+import asyncio
+import json
+import logging
+
+import pytest
+from starlette.testclient import TestClient
+
+from ariadne import QueryType, make_executable_schema
+from ariadne.asgi import GraphQL
+from ariadne.asgi.handlers import GraphQLHTTPHandler
+from ariadne.slow_log import SlowOperationLog
+from ariadne.validation import cost_directive
+
+type_defs = (
+    cost_directive
+    + """
+    type Query {
+        users(first: Int!): [User!]! @cost(complexity: 2, multipliers: ["first"])
+        fast: Boolean!
+    }
+
+    type User {
+        name: String!
+        avatar: String!
+    }
+"""
+)
+
+query_type = QueryType()
+
+
+@query_type.field("users")
+async def resolve_users(*_, first):
+    await asyncio.sleep(0.05)
+    return [{"name": f"User {i}"} for i in range(first)]
+
+
+@query_type.field("fast")
+def resolve_fast(*_):
+    return True
+
+
+schema = make_executable_schema(type_defs, query_type)
+
+
+def create_client(slow_operation_log):
+    http_handler = GraphQLHTTPHandler(slow_operation_log=slow_operation_log)
+    return TestClient(GraphQL(schema, http_handler=http_handler))
+
+
+@pytest.fixture
+def slow_log():
+    slow_log = SlowOperationLog(latency_threshold=0.03)
+    yield slow_log
+    slow_log.close()
+
+
+def get_entries(caplog, slow_log):
+    slow_log.close()  # Handle queued records
+    return [
+        record.slow_operation
+        for record in caplog.records
+        if record.name == "ariadne.slow_operations"
+    ]
+
+
+def test_slow_operation_is_logged(caplog, slow_log):
+    caplog.set_level(logging.WARNING)
+    response = create_client(slow_log).post(
+        "/",
+        json={
+            "query": "query Users($first: Int!) { users(first: $first) { name } }",
+            "variables": {"first": 3},
+        },
+    )
+    assert response.status_code == 200
+
+    (entry,) = get_entries(caplog, slow_log)
+    assert (
+        entry["signature"]
+        == "query Users($first: Int!) { users(first: $first) { name } }"
+    )
+    assert entry["operation_name"] == "Users"
+    assert entry["duration"] >= 0.05
+    assert set(entry["phases"]) == {
+        "parsing",
+        "validation",
+        "execution",
+        "serialization",
+    }
+    assert entry["resolvers"] == 4
+    assert entry["slowest_fields"][0]["path"] == "users"
+    assert entry["slowest_fields"][0]["field"] == "Query.users"
+    assert entry["slowest_fields"][0]["duration"] >= 0.05
+    assert entry["cost"] == 6
+    assert entry["response_size"] == len(response.content)
+    assert entry["errors"] == 0
+
+
+def test_logged_message_contains_entry_as_json(caplog, slow_log):
+    caplog.set_level(logging.WARNING)
+    create_client(slow_log).post("/", json={"query": "{ users(first: 1) { name } }"})
+    slow_log.close()
+
+    (record,) = [r for r in caplog.records if r.name == "ariadne.slow_operations"]
+    message = record.getMessage()
+    assert message.startswith("Slow GraphQL operation: ")
+    assert json.loads(message.split(": ", 1)[1]) == record.slow_operation
+
+
+def test_fast_operation_is_not_logged(caplog, slow_log):
+    caplog.set_level(logging.WARNING)
+    create_client(slow_log).post("/", json={"query": "{ fast }"})
+    assert not get_entries(caplog, slow_log)
+
+
+def test_operation_exceeding_resolver_threshold_is_logged(caplog):
+    caplog.set_level(logging.WARNING)
+    slow_log = SlowOperationLog(
+        latency_threshold=None, resolver_threshold=10, non_blocking=False
+    )
+    client = create_client(slow_log)
+    client.post("/", json={"query": "{ users(first: 5) { name } }"})
+    client.post("/", json={"query": "{ users(first: 10) { name } }"})
+
+    (entry,) = get_entries(caplog, slow_log)
+    assert entry["signature"] == "{ users(first: 0) { name } }"
+    assert entry["resolvers"] == 11
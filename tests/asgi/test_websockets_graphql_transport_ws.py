@@ -7,7 +7,7 @@ from starlette.testclient import TestClient
 from starlette.websockets import WebSocketDisconnect
 
 from ariadne.asgi import GraphQL
-from ariadne.asgi.handlers import GraphQLTransportWSHandler
+from ariadne.asgi.handlers import GraphQLHTTPHandler, GraphQLTransportWSHandler
 from ariadne.exceptions import WebSocketConnectionError
 from ariadne.utils import get_operation_type
 
@@ -301,6 +301,37 @@ def test_custom_query_parser_is_used_for_query_over_websocket_transport_ws(
         assert response["id"] == "test2"
 
 
+def test_introspection_query_result_is_cached_for_websocket_transport_ws(schema):
+    http_handler = GraphQLHTTPHandler(introspection_cache=True)
+    app = GraphQL(
+        schema,
+        http_handler=http_handler,
+        websocket_handler=GraphQLTransportWSHandler(),
+    )
+
+    with TestClient(app).websocket_connect("/", ["graphql-transport-ws"]) as ws:
+        ws.send_json({"type": GraphQLTransportWSHandler.GQL_CONNECTION_INIT})
+        response = ws.receive_json()
+        assert response["type"] == GraphQLTransportWSHandler.GQL_CONNECTION_ACK
+        for operation_id in ("test1", "test2"):
+            ws.send_json(
+                {
+                    "type": GraphQLTransportWSHandler.GQL_SUBSCRIBE,
+                    "id": operation_id,
+                    "payload": {"query": "{ __schema { queryType { name } } }"},
+                }
+            )
+            response = ws.receive_json()
+            assert response["type"] == GraphQLTransportWSHandler.GQL_NEXT
+            assert response["payload"] == {
+                "data": {"__schema": {"queryType": {"name": "Query"}}}
+            }
+            response = ws.receive_json()
+            assert response["type"] == GraphQLTransportWSHandler.GQL_COMPLETE
+
+    assert http_handler.introspection_cache.hits == 1
+
+
 def test_immediate_disconnect_on_invalid_type_graphql_transport_ws(
     client_graphql_transport_ws,
 ):
@@ -5,7 +5,7 @@ from graphql import GraphQLError, parse
 from starlette.testclient import TestClient
 
 from ariadne.asgi import GraphQL
-from ariadne.asgi.handlers import GraphQLWSHandler
+from ariadne.asgi.handlers import GraphQLHTTPHandler, GraphQLWSHandler
 from ariadne.exceptions import WebSocketConnectionError
 
 from .websocket_utils import wait_for_condition
@@ -111,6 +111,34 @@ def test_query_can_be_executed_using_websocket_connection(client):
         ws.send_json({"type": GraphQLWSHandler.GQL_CONNECTION_TERMINATE})
 
 
+def test_introspection_query_result_is_cached_for_websocket_connection(schema):
+    http_handler = GraphQLHTTPHandler(introspection_cache=True)
+    app = GraphQL(
+        schema, http_handler=http_handler, websocket_handler=GraphQLWSHandler()
+    )
+
+    with TestClient(app).websocket_connect("/", ["graphql-ws"]) as ws:
+        ws.send_json({"type": GraphQLWSHandler.GQL_CONNECTION_INIT})
+        response = ws.receive_json()
+        assert response["type"] == GraphQLWSHandler.GQL_CONNECTION_ACK
+        for operation_id in ("test1", "test2"):
+            ws.send_json(
+                {
+                    "type": GraphQLWSHandler.GQL_START,
+                    "id": operation_id,
+                    "payload": {"query": "{ __schema { queryType { name } } }"},
+                }
+            )
+            response = ws.receive_json()
+            assert response["type"] == GraphQLWSHandler.GQL_DATA
+            assert response["payload"] == {
+                "data": {"__schema": {"queryType": {"name": "Query"}}}
+            }
+        ws.send_json({"type": GraphQLWSHandler.GQL_CONNECTION_TERMINATE})
+
+    assert http_handler.introspection_cache.hits == 1
+
+
 def test_mutation_can_be_executed_using_websocket_connection(client):
     with client.websocket_connect("/", ["graphql-ws"]) as ws:
         ws.send_json({"type": GraphQLWSHandler.GQL_CONNECTION_INIT})
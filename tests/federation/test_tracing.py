@@ -0,0 +1,171 @@
+from base64 import b64decode
+
+import pytest
+from starlette.testclient import TestClient
+
+from ariadne import QueryType, graphql, graphql_sync
+from ariadne.asgi import GraphQL
+from ariadne.asgi.handlers import GraphQLHTTPHandler
+from ariadne.contrib.federation import (
+    FederatedTracingExtension,
+    make_federated_schema,
+)
+from ariadne.contrib.federation.tracing import TraceNode, encode_trace
+
+TRACE_ENVIRON = {"HTTP_APOLLO_FEDERATION_INCLUDE_TRACE": "ftv1"}
+
+
+def decode_message(data: bytes) -> dict[int, list]:
+    fields: dict[int, list] = {}
+    position = 0
+    while position < len(data):
+        key, position = decode_varint(data, position)
+        if key & 7 == 0:
+            value, position = decode_varint(data, position)
+        else:
+            size, position = decode_varint(data, position)
+            value = data[position : position + size]
+            position += size
+        fields.setdefault(key >> 3, []).append(value)
+    return fields
+
+
+def decode_varint(data: bytes, position: int) -> tuple[int, int]:
+    value = shift = 0
+    while True:
+        byte = data[position]
+        position += 1
+        value |= (byte & 0x7F) << shift
+        shift += 7
+        if not byte & 0x80:
+            return value, position
+
+
+def get_children(node: dict[int, list]) -> dict:
+    children = {}
+    for child_data in node.get(12, []):
+        child = decode_message(child_data)
+        key = child[1][0].decode() if 1 in child else child[2][0] if 2 in child else 0
+        children[key] = child
+    return children
+
+
+@pytest.fixture
+def federated_schema():
+    query = QueryType()
+    query.set_field("hello", lambda *_: "Hello!")
+    query.set_field("numbers", lambda *_: [1, 2])
+
+    @query.field("fail")
+    def resolve_fail(*_):
+        raise ValueError("Failed!")
+
+    return make_federated_schema(
+        "type Query { hello: String, numbers: [Int!], fail: String }", query
+    )
+
+
+def get_trace(result: dict) -> dict[int, list]:
+    return decode_message(b64decode(result["extensions"]["ftv1"]))
+
+
+def test_trace_is_not_included_without_header(federated_schema):
+    _, result = graphql_sync(
+        federated_schema,
+        {"query": "{ hello }"},
+        context_value={"request": {}},
+        extensions=[FederatedTracingExtension],
+    )
+    assert result == {"data": {"hello": "Hello!"}}
+
+
+def test_trace_is_included_when_requested_with_header(federated_schema):
+    _, result = graphql_sync(
+        federated_schema,
+        {"query": "{ greeting: hello numbers }"},
+        context_value={"request": TRACE_ENVIRON},
+        extensions=[FederatedTracingExtension],
+    )
+    assert result["data"] == {"greeting": "Hello!", "numbers": [1, 2]}
+
+    trace = get_trace(result)
+    assert trace[11][0] > 0  # duration
+    start = decode_message(trace[4][0])
+    end = decode_message(trace[3][0])
+    assert (start[1][0], start.get(2, [0])[0]) <= (end[1][0], end.get(2, [0])[0])
+
+    fields = get_children(decode_message(trace[14][0]))
+    assert set(fields) == {"greeting", "numbers"}
+
+    greeting = fields["greeting"]
+    assert greeting[3] == [b"String"]
+    assert greeting[13] == [b"Query"]
+    assert greeting[14] == [b"hello"]
+    assert greeting[8][0] <= greeting[9][0]
+
+    numbers = fields["numbers"]
+    assert numbers[3] == [b"[Int!]"]
+    assert 14 not in numbers
+
+
+def test_trace_includes_errors_at_field_nodes(federated_schema):
+    _, result = graphql_sync(
+        federated_schema,
+        {"query": "{ fail }"},
+        context_value={"request": TRACE_ENVIRON},
+        extensions=[FederatedTracingExtension],
+    )
+    fail = get_children(decode_message(get_trace(result)[14][0]))["fail"]
+    error = decode_message(fail[11][0])
+    assert error[1] == [b"Failed!"]
+    assert decode_message(error[2][0]) == {1: [1], 2: [3]}
+
+
+@pytest.mark.asyncio
+async def test_trace_is_included_for_async_query(federated_schema):
+    _, result = await graphql(
+        federated_schema,
+        {"query": "{ hello }"},
+        context_value={"request": TRACE_ENVIRON},
+        extensions=[FederatedTracingExtension],
+    )
+    fields = get_children(decode_message(get_trace(result)[14][0]))
+    assert set(fields) == {"hello"}
+
+
+def test_trace_creates_nodes_for_list_items():
+    root = TraceNode()
+    field = TraceNode("users")
+    item = TraceNode(1)
+    field.children.append(item)
+    item.children.append(TraceNode("name"))
+    root.children.append(field)
+
+    trace = decode_message(encode_trace(root, 1_500_000_000, 2_000_000_000, 10))
+    users = get_children(decode_message(trace[14][0]))["users"]
+    assert set(get_children(get_children(users)[1])) == {"name"}
+    assert decode_message(trace[4][0]) == {1: [1], 2: [500_000_000]}
+    assert decode_message(trace[3][0]) == {1: [2]}
+
+
+def test_trace_encodes_index_of_first_list_item():
+    assert TraceNode(0).encode() == b"\x10\x00"
+    assert decode_message(TraceNode(0).encode()) == {2: [0]}
+
+
+def test_trace_is_requested_by_gateway_with_http_header(federated_schema):
+    app = GraphQL(
+        federated_schema,
+        http_handler=GraphQLHTTPHandler(extensions=[FederatedTracingExtension]),
+    )
+    client = TestClient(app)
+
+    response = client.post("/", json={"query": "{ hello }"})
+    assert "extensions" not in response.json()
+
+    response = client.post(
+        "/",
+        json={"query": "{ hello }"},
+        headers={"apollo-federation-include-trace": "ftv1"},
+    )
+    assert "ftv1" in response.json()["extensions"]
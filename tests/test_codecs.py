@@ -0,0 +1,100 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from ariadne.codecs import (
+    CBORCodec,
+    MessagePackCodec,
+    get_codec_for_content_type,
+    get_codec_for_subprotocol,
+    negotiate_codec,
+)
+
+msgpack = pytest.importorskip("msgpack")
+cbor2 = pytest.importorskip("cbor2")
+
+result = {"data": {"items": [{"id": 1, "name": "Łódź", "price": 1.5, "tag": None}]}}
+
+
+def test_msgpack_codec_encodes_and_decodes_value():
+    codec = MessagePackCodec()
+    data = codec.encode(result)
+    assert msgpack.unpackb(data) == result
+    assert codec.decode(data) == result
+
+
+def test_cbor_codec_encodes_and_decodes_value():
+    codec = CBORCodec()
+    data = codec.encode(result)
+    assert cbor2.loads(data) == result
+    assert codec.decode(data) == result
+
+
+@pytest.mark.parametrize("codec", [MessagePackCodec(), CBORCodec()])
+def test_codec_encodes_values_in_threads(codec):
+    values = [{"data": {"id": i, "items": list(range(i))}} for i in range(200)]
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        encoded = list(executor.map(codec.encode, values))
+    assert [codec.decode(data) for data in encoded] == values
+
+
+@pytest.mark.parametrize("codec", [MessagePackCodec(), CBORCodec()])
+def test_codec_raises_value_error_for_invalid_data(codec):
+    with pytest.raises(ValueError):
+        codec.decode(b"\xc1\xff\xff")
+
+
+def test_codec_is_found_for_content_type():
+    codecs = [MessagePackCodec(), CBORCodec()]
+    assert get_codec_for_content_type(codecs, "application/cbor") is codecs[1]
+    assert get_codec_for_content_type(codecs, "application/json") is None
+
+
+def test_codec_is_negotiated_from_accept_header():
+    codecs = [MessagePackCodec(), CBORCodec()]
+    assert negotiate_codec(codecs, "application/msgpack") is codecs[0]
+    assert (
+        negotiate_codec(codecs, "application/json;q=0.5, application/cbor") is codecs[1]
+    )
+
+
+def test_json_is_negotiated_if_it_has_same_or_higher_quality():
+    codecs = [MessagePackCodec()]
+    assert negotiate_codec(codecs, "application/msgpack;q=0.5, */*") is None
+    assert negotiate_codec(codecs, "application/json, application/msgpack") is None
+    assert (
+        negotiate_codec(codecs, "application/json, application/msgpack;q=0.9") is None
+    )
+
+
+def test_default_codec_is_returned_for_missing_or_wildcard_accept_header():
+    codecs = [MessagePackCodec()]
+    assert negotiate_codec(codecs, None, codecs[0]) is codecs[0]
+    assert negotiate_codec(codecs, "*/*", codecs[0]) is codecs[0]
+    assert negotiate_codec(codecs, "application/json", codecs[0]) is None
+
+
+def test_binary_subprotocol_is_negotiated():
+    codecs = [MessagePackCodec(), CBORCodec()]
+    assert get_codec_for_subprotocol(
+        codecs, "graphql-transport-ws", ["graphql-transport-ws+cbor"]
+    ) == ("graphql-transport-ws+cbor", codecs[1])
+
+
+def test_first_requested_subprotocol_is_negotiated():
+    codecs = [MessagePackCodec()]
+    assert get_codec_for_subprotocol(
+        codecs,
+        "graphql-transport-ws",
+        ["graphql-transport-ws", "graphql-transport-ws+msgpack"],
+    ) == ("graphql-transport-ws", None)
+
+
+def test_no_subprotocol_is_negotiated_for_unsupported_subprotocols():
+    codecs = [MessagePackCodec()]
+    assert (
+        get_codec_for_subprotocol(
+            codecs, "graphql-transport-ws", ["graphql-transport-ws+cbor"]
+        )
+        is None
+    )
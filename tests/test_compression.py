@@ -0,0 +1,138 @@
+import gzip
+import zlib
+
+import pytest
+
+from ariadne.compression import ResponseCompression, get_available_encodings
+
+body = b'{"data":{"items":[' + b'{"name":"item"},' * 200 + b'{"name":"item"}]}}'
+
+
+def test_gzip_is_always_available():
+    assert "gzip" in get_available_encodings()
+
+
+def test_gzip_is_selected_when_accepted_by_client():
+    compression = ResponseCompression(encodings=["gzip"])
+    assert compression.get_encoding("gzip, deflate") == "gzip"
+
+
+def test_no_encoding_is_selected_without_accept_encoding_header():
+    compression = ResponseCompression()
+    assert compression.get_encoding(None) is None
+    assert compression.get_encoding("") is None
+
+
+def test_no_encoding_is_selected_if_client_accepts_unsupported_encodings():
+    compression = ResponseCompression()
+    assert compression.get_encoding("deflate, identity") is None
+
+
+def test_encoding_with_zero_quality_is_not_selected():
+    compression = ResponseCompression(encodings=["gzip"])
+    assert compression.get_encoding("gzip;q=0, deflate") is None
+
+
+def test_encoding_with_highest_quality_is_selected():
+    compression = ResponseCompression(encodings=["br", "gzip"])
+    assert compression.get_encoding("br;q=0.5, gzip;q=0.8") == "gzip"
+
+
+def test_encodings_order_is_used_for_equal_quality():
+    compression = ResponseCompression(encodings=["gzip"])
+    assert compression.get_encoding("*") == "gzip"
+
+
+def test_unavailable_encodings_are_skipped():
+    compression = ResponseCompression(encodings=["unknown", "gzip"])
+    assert compression.encodings == ["gzip"]
+
+
+def test_body_is_compressed_with_gzip():
+    compression = ResponseCompression(encodings=["gzip"])
+    compressed, encoding = compression.compress_body(body, "gzip")
+    assert encoding == "gzip"
+    assert len(compressed) < len(body)
+    assert gzip.decompress(compressed) == body
+
+
+def test_body_smaller_than_minimum_size_is_not_compressed():
+    compression = ResponseCompression(minimum_size=len(body) + 1)
+    assert compression.compress_body(body, "gzip") == (body, None)
+
+
+def test_compression_level_is_configurable():
+    compression = ResponseCompression(levels={"gzip": 1})
+    compression.compress_body(body, "gzip")
+    assert list(compression.stats) == [("gzip", 1)]
+
+
+def test_compression_stats_are_recorded_per_encoding_and_level():
+    compression = ResponseCompression(encodings=["gzip"])
+    compressed, _ = compression.compress_body(body, "gzip")
+    compression.compress_body(body, "gzip")
+
+    stats = compression.stats["gzip", 6]
+    assert stats.responses == 2
+    assert stats.input_size == len(body) * 2
+    assert stats.output_size == len(compressed) * 2
+    assert stats.cpu_time >= 0
+    assert stats.ratio < 1
+    assert stats.cpu_time_per_mb >= 0
+
+
+def test_stream_is_compressed_with_flushed_chunks():
+    compression = ResponseCompression(encodings=["gzip"])
+    compressor = compression.create_stream_compressor("gzip")
+    decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS)
+
+    first_chunk = compressor.compress(b"event: next\r\n\r\n")
+    assert decompressor.decompress(first_chunk) == b"event: next\r\n\r\n"
+    second_chunk = compressor.compress(b"event: complete\r\n\r\n")
+    assert decompressor.decompress(second_chunk) == b"event: complete\r\n\r\n"
+    assert decompressor.decompress(compressor.finish()) == b""
+    assert decompressor.eof
+
+
+def test_stream_compressor_is_not_created_without_accepted_encoding():
+    compression = ResponseCompression()
+    assert compression.create_stream_compressor("identity") is None
+
+
+def test_body_is_compressed_with_brotli():
+    brotli = pytest.importorskip("brotli")
+
+    compression = ResponseCompression()
+    compressed, encoding = compression.compress_body(body, "br, gzip")
+    assert encoding == "br"
+    assert brotli.decompress(compressed) == body
+
+
+def test_body_is_compressed_with_zstd():
+    zstandard = pytest.importorskip("zstandard")
+
+    compression = ResponseCompression()
+    compressed, encoding = compression.compress_body(body, "gzip, br, zstd")
+    assert encoding == "zstd"
+    assert zstandard.ZstdDecompressor().decompress(compressed) == body
+
+
+def test_zstd_stream_is_compressed_with_flushed_chunks():
+    zstandard = pytest.importorskip("zstandard")
+
+    compression = ResponseCompression()
+    compressor = compression.create_stream_compressor("zstd")
+    decompressor = zstandard.ZstdDecompressor().decompressobj()
+    assert decompressor.decompress(compressor.compress(b"event")) == b"event"
+    decompressor.decompress(compressor.finish())
+
+
+def test_brotli_stream_is_compressed_with_flushed_chunks():
+    brotli = pytest.importorskip("brotli")
+
+    compression = ResponseCompression(encodings=["br"])
+    compressor = compression.create_stream_compressor("br")
+    decompressor = brotli.Decompressor()
+    assert decompressor.process(compressor.compress(b"event")) == b"event"
+    decompressor.process(compressor.finish())
+    assert decompressor.is_finished()
@@ -0,0 +1,158 @@
+import asyncio
+
+import pytest
+
+from ariadne import ObjectType, QueryType, graphql, make_executable_schema
+from ariadne.concurrency import (
+    ConcurrencyLimitDirective,
+    ConcurrencyLimits,
+    concurrency_limit_directive,
+    get_field_concurrency_limit,
+)
+
+type_defs = """
+    type Query {
+        items: [Item!]!
+        sync: Boolean!
+    }
+
+    type Item {
+        value: Int!
+        limited: Int! @concurrencyLimit(limit: 2)
+        perRequest: Int! @concurrencyLimit(limit: 1, perRequest: true)
+    }
+"""
+
+
+class Counter:
+    def __init__(self):
+        self.running = 0
+        self.max_running = 0
+
+    async def run(self, value):
+        self.running += 1
+        self.max_running = max(self.max_running, self.running)
+        await asyncio.sleep(0.01)
+        self.running -= 1
+        return value
+
+
+@pytest.fixture
+def counter():
+    return Counter()
+
+
+@pytest.fixture
+def schema(counter):
+    query_type = QueryType()
+    query_type.set_field("items", lambda *_: list(range(5)))
+    query_type.set_field("sync", lambda *_: True)
+
+    item_type = ObjectType("Item")
+
+    @item_type.field("value")
+    @item_type.field("limited")
+    @item_type.field("perRequest")
+    async def resolve_value(obj, *_):
+        return await counter.run(obj)
+
+    return make_executable_schema(
+        [concurrency_limit_directive, type_defs],
+        query_type,
+        item_type,
+        directives={"concurrencyLimit": ConcurrencyLimitDirective},
+    )
+
+
+async def execute(schema, limits, query):
+    success, result = await graphql(
+        schema, {"query": query}, extensions=[limits.extension]
+    )
+    assert success, result
+    return result
+
+
+def test_directive_sets_field_limit(schema):
+    field = schema.type_map["Item"].fields["perRequest"]
+    assert get_field_concurrency_limit(field) == {"limit": 1, "per_request": True}
+
+
+@pytest.mark.asyncio
+async def test_global_limit_limits_all_async_resolvers(schema, counter):
+    limits = ConcurrencyLimits(global_limit=3)
+    result = await execute(schema, limits, "{ items { value } sync }")
+    assert result["data"]["items"] == [{"value": i} for i in range(5)]
+    assert counter.max_running == 3
+
+    stats = limits.stats["global"]
+    assert stats.limit == 3
+    assert stats.active == 0
+    assert stats.waiting == 0
+    assert stats.max_waiting == 2
+    assert stats.waited == 2
+    assert stats.wait_time > 0
+
+
+@pytest.mark.asyncio
+async def test_field_limit_is_set_with_coordinate(schema, counter):
+    limits = ConcurrencyLimits(field_limits={"Item.value": 1})
+    await execute(schema, limits, "{ items { value } }")
+    assert counter.max_running == 1
+    assert limits.stats["Item.value"].waited == 4
+
+
+@pytest.mark.asyncio
+async def test_field_limit_is_set_with_directive(schema, counter):
+    limits = ConcurrencyLimits()
+    await execute(schema, limits, "{ items { limited } }")
+    assert counter.max_running == 2
+
+
+@pytest.mark.asyncio
+async def test_field_limit_is_shared_by_requests(schema, counter):
+    limits = ConcurrencyLimits()
+    await asyncio.gather(
+        execute(schema, limits, "{ items { limited } }"),
+        execute(schema, limits, "{ items { limited } }"),
+    )
+    assert counter.max_running == 2
+
+
+@pytest.mark.asyncio
+async def test_per_request_field_limit_is_not_shared_by_requests(schema, counter):
+    limits = ConcurrencyLimits()
+    await asyncio.gather(
+        execute(schema, limits, "{ items { perRequest } }"),
+        execute(schema, limits, "{ items { perRequest } }"),
+    )
+    assert counter.max_running == 2
+    assert limits.stats["Item.perRequest"].max_waiting == 8
+
+
+@pytest.mark.asyncio
+async def test_request_limit_is_not_shared_by_requests(schema, counter):
+    limits = ConcurrencyLimits(request_limit=2)
+    await asyncio.gather(
+        execute(schema, limits, "{ items { value } }"),
+        execute(schema, limits, "{ items { value } }"),
+    )
+    assert counter.max_running == 4
+
+
+@pytest.mark.asyncio
+async def test_coordinate_limit_overrides_directive_limit(schema, counter):
+    limits = ConcurrencyLimits(field_limits={"Item.limited": 4})
+    await execute(schema, limits, "{ items { limited } }")
+    assert counter.max_running == 4
+
+
+@pytest.mark.asyncio
+async def test_reset_stats_resets_counters(schema):
+    limits = ConcurrencyLimits(global_limit=1)
+    await execute(schema, limits, "{ items { value } }")
+    limits.reset_stats()
+
+    stats = limits.stats["global"]
+    assert stats.max_waiting == 0
+    assert stats.waited == 0
+    assert stats.wait_time == 0
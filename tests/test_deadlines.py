@@ -0,0 +1,200 @@
+import asyncio
+import time
+
+import pytest
+
+from ariadne import (
+    MutationType,
+    QueryType,
+    graphql,
+    graphql_sync,
+    make_executable_schema,
+)
+from ariadne.deadlines import (
+    Deadline,
+    DeadlineExceededError,
+    OperationDeadlines,
+    TimeoutDirective,
+    get_current_deadline,
+    get_field_timeout,
+    timeout_directive,
+)
+
+type_defs = """
+    type Query {
+        slow: Boolean
+        slowSync: Boolean
+        fast: Boolean
+        limited: Boolean @timeout(seconds: 0.05)
+        remaining: Float!
+        contextDeadline: Boolean!
+    }
+
+    type Mutation {
+        slow: Boolean
+    }
+"""
+
+cancelled = []
+
+
+async def resolve_slow(*_):
+    try:
+        await asyncio.sleep(0.2)
+    except asyncio.CancelledError:
+        cancelled.append(True)
+        raise
+    return True
+
+
+def resolve_slow_sync(*_):
+    time.sleep(0.1)
+    return True
+
+
+@pytest.fixture
+def schema():
+    query_type = QueryType()
+    query_type.set_field("slow", resolve_slow)
+    query_type.set_field("limited", resolve_slow)
+    query_type.set_field("slowSync", resolve_slow_sync)
+    query_type.set_field("fast", lambda *_: True)
+    query_type.set_field("remaining", lambda *_: get_current_deadline().remaining())
+    query_type.set_field(
+        "contextDeadline",
+        lambda _, info: info.context["deadline"] is get_current_deadline(),
+    )
+
+    mutation_type = MutationType()
+    mutation_type.set_field("slow", resolve_slow)
+
+    return make_executable_schema(
+        [timeout_directive, type_defs],
+        query_type,
+        mutation_type,
+        directives={"timeout": TimeoutDirective},
+    )
+
+
+@pytest.fixture(autouse=True)
+def reset_cancelled():
+    cancelled.clear()
+
+
+def test_deadline_returns_remaining_time():
+    deadline = Deadline(10)
+    assert 9 < deadline.remaining() <= 10
+    assert not deadline.expired
+    deadline.check()
+
+
+def test_expired_deadline_raises_error_on_check():
+    deadline = Deadline(1, started_at=time.monotonic() - 2)
+    assert deadline.remaining() == 0
+    assert deadline.expired
+    with pytest.raises(DeadlineExceededError):
+        deadline.check()
+
+
+def test_operation_type_timeout_overrides_default_timeout():
+    deadlines = OperationDeadlines(timeout=5, mutation_timeout=10)
+    assert deadlines.get_timeout("query", None) == 5
+    assert deadlines.get_timeout("mutation", None) == 10
+
+
+def test_requested_timeout_only_shortens_timeout():
+    deadlines = OperationDeadlines(timeout=5)
+    assert deadlines.get_timeout("query", 1) == 1
+    assert deadlines.get_timeout("query", 10) == 5
+
+
+@pytest.mark.parametrize("value", [None, "", "abc", "0", "-1", "nan"])
+def test_invalid_requested_timeout_is_ignored(value):
+    assert OperationDeadlines().parse_requested_timeout(value) is None
+
+
+def test_directive_sets_field_timeout(schema):
+    assert get_field_timeout(schema.query_type.fields["limited"]) == 0.05
+
+
+@pytest.mark.asyncio
+async def test_async_resolver_is_cancelled_at_deadline(schema):
+    deadlines = OperationDeadlines(timeout=0.05)
+    _, result = await graphql(
+        schema,
+        {"query": "{ fast slow }"},
+        context_value={},
+        extensions=[deadlines.get_extension()],
+    )
+    assert result["data"] == {"fast": True, "slow": None}
+    assert result["errors"][0]["message"] == (
+        "Operation exceeded its deadline of 0.05 seconds."
+    )
+    assert cancelled == [True]
+
+
+@pytest.mark.asyncio
+async def test_requested_timeout_is_used(schema):
+    deadlines = OperationDeadlines(timeout=10)
+    _, result = await graphql(
+        schema,
+        {"query": "{ slow }"},
+        context_value={},
+        extensions=[deadlines.get_extension("0.05")],
+    )
+    assert result["data"] == {"slow": None}
+    assert cancelled == [True]
+
+
+@pytest.mark.asyncio
+async def test_mutation_timeout_is_used_for_mutations(schema):
+    deadlines = OperationDeadlines(timeout=10, mutation_timeout=0.05)
+    _, result = await graphql(
+        schema,
+        {"query": "mutation { slow }"},
+        context_value={},
+        extensions=[deadlines.get_extension()],
+    )
+    assert result["data"] == {"slow": None}
+    assert cancelled == [True]
+
+
+@pytest.mark.asyncio
+async def test_async_resolver_is_cancelled_after_field_timeout(schema):
+    deadlines = OperationDeadlines()
+    _, result = await graphql(
+        schema,
+        {"query": "{ limited }"},
+        context_value={},
+        extensions=[deadlines.get_extension()],
+    )
+    assert result["data"] == {"limited": None}
+    assert result["errors"][0]["message"] == (
+        "Resolver for Query.limited timed out after 0.05 seconds."
+    )
+    assert cancelled == [True]
+
+
+def test_fields_resolved_after_deadline_fail(schema):
+    deadlines = OperationDeadlines(timeout=0.05)
+    _, result = graphql_sync(
+        schema,
+        {"query": "{ slowSync fast }"},
+        context_value={},
+        extensions=[deadlines.get_extension()],
+    )
+    assert result["data"] == {"slowSync": True, "fast": None}
+    assert result["errors"][0]["path"] == ["fast"]
+
+
+def test_deadline_is_set_in_context(schema):
+    deadlines = OperationDeadlines(timeout=5)
+    _, result = graphql_sync(
+        schema,
+        {"query": "{ remaining contextDeadline }"},
+        context_value={},
+        extensions=[deadlines.get_extension()],
+    )
+    assert 4 < result["data"]["remaining"] <= 5
+    assert result["data"]["contextDeadline"] is True
+    assert get_current_deadline() is None
@@ -0,0 +1,90 @@
+import asyncio
+import threading
+from concurrent.futures import CancelledError, ThreadPoolExecutor
+from contextvars import ContextVar
+
+import pytest
+
+from ariadne.event_loop import BackgroundEventLoop
+
+request_id: ContextVar[str] = ContextVar("request_id", default="")
+
+
+@pytest.fixture
+def event_loop():
+    background_loop = BackgroundEventLoop()
+    yield background_loop
+    background_loop.stop()
+
+
+async def get_thread_name():
+    return threading.current_thread().name
+
+
+def test_coroutine_is_run_in_background_thread(event_loop):
+    assert event_loop.run(get_thread_name()) == "ariadne-event-loop"
+
+
+def test_same_loop_is_used_by_all_threads(event_loop):
+    async def get_loop():
+        return asyncio.get_running_loop()
+
+    with ThreadPoolExecutor(4) as executor:
+        loops = list(executor.map(lambda _: event_loop.run(get_loop()), range(4)))
+    assert set(loops) == {event_loop.loop}
+
+
+def test_coroutines_of_threads_run_concurrently(event_loop):
+    started = 0
+    all_started = asyncio.Event()
+
+    async def wait_for_others():
+        nonlocal started
+        started += 1
+        if started == 3:
+            event_loop.loop.call_soon(all_started.set)
+        await asyncio.wait_for(all_started.wait(), 1)
+        return True
+
+    with ThreadPoolExecutor(3) as executor:
+        results = list(
+            executor.map(lambda _: event_loop.run(wait_for_others()), range(3))
+        )
+    assert results == [True, True, True]
+
+
+def test_coroutine_error_is_raised_in_calling_thread(event_loop):
+    async def fail():
+        raise ValueError("Test error")
+
+    with pytest.raises(ValueError, match="Test error"):
+        event_loop.run(fail())
+
+
+def test_context_variables_are_copied_to_coroutine(event_loop):
+    async def get_request_id():
+        return request_id.get()
+
+    request_id.set("req-1")
+    assert event_loop.run(get_request_id()) == "req-1"
+
+
+def test_stop_cancels_running_coroutines(event_loop):
+    started = threading.Event()
+
+    async def run_forever():
+        started.set()
+        await asyncio.sleep(60)
+
+    with ThreadPoolExecutor(1) as executor:
+        future = executor.submit(event_loop.run, run_forever())
+        started.wait(1)
+        event_loop.stop(timeout=1)
+        with pytest.raises(CancelledError):
+            future.result(1)
+
+
+def test_loop_is_restarted_after_stop(event_loop):
+    event_loop.run(get_thread_name())
+    event_loop.stop()
+    assert event_loop.run(get_thread_name()) == "ariadne-event-loop"
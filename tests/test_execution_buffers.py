@@ -0,0 +1,149 @@
+from array import array
+
+import pytest
+from graphql import ExecutionContext
+
+from ariadne import QueryType, graphql_sync, make_executable_schema
+from ariadne.execution import BufferListExecutionContext
+
+type_defs = """
+    type Query {
+        floats: [Float]
+        strictFloats: [Float!]
+        ints: [Int]
+        strictInts: [Int!]!
+        strings: [String]
+    }
+"""
+
+
+def create_schema(**resolvers):
+    query_type = QueryType()
+    for field, value in resolvers.items():
+        query_type.set_field(field, lambda *_, value=value: value)
+    return make_executable_schema(type_defs, query_type)
+
+
+def execute(schema, query, execution_context_class=BufferListExecutionContext):
+    _, result = graphql_sync(
+        schema,
+        {"query": query},
+        execution_context_class=execution_context_class,
+    )
+    return result
+
+
+def test_float_list_is_completed_from_array():
+    schema = create_schema(floats=array("d", [1.5, 2.0, -3.25]))
+    result = execute(schema, "{ floats }")
+    assert result == {"data": {"floats": [1.5, 2.0, -3.25]}}
+
+
+def test_float_list_is_completed_from_memoryview():
+    schema = create_schema(floats=memoryview(array("f", [1.5, 2.0])))
+    result = execute(schema, "{ floats }")
+    assert result == {"data": {"floats": [1.5, 2.0]}}
+
+
+def test_float_list_is_completed_from_integers_array():
+    schema = create_schema(floats=array("q", [1, 2]))
+    result = execute(schema, "{ floats }")
+    assert result == {"data": {"floats": [1.0, 2.0]}}
+    assert isinstance(result["data"]["floats"][0], float)
+
+
+def test_int_list_is_completed_from_array():
+    schema = create_schema(strictInts=array("i", [1, -2, 3]))
+    result = execute(schema, "{ strictInts }")
+    assert result == {"data": {"strictInts": [1, -2, 3]}}
+
+
+def test_empty_buffer_is_completed_to_empty_list():
+    schema = create_schema(strictInts=array("i"))
+    result = execute(schema, "{ strictInts }")
+    assert result == {"data": {"strictInts": []}}
+
+
+def test_int_list_from_integral_floats_array_is_completed_per_item():
+    schema = create_schema(strictInts=array("d", [1.0, 2.0]))
+    result = execute(schema, "{ strictInts }")
+    assert result == {"data": {"strictInts": [1, 2]}}
+    assert isinstance(result["data"]["strictInts"][0], int)
+
+
+def test_int_list_with_values_out_of_range_reports_errors():
+    schema = create_schema(ints=array("q", [1, 2**40]))
+    result = execute(schema, "{ ints }")
+    assert result["data"] == {"ints": [1, None]}
+    assert result["errors"][0]["path"] == ["ints", 1]
+    assert "32-bit" in result["errors"][0]["message"]
+
+
+def test_non_finite_floats_are_reported_as_errors_by_default():
+    schema = create_schema(floats=array("d", [1.0, float("nan")]))
+    result = execute(schema, "{ floats }")
+    assert result["data"] == {"floats": [1.0, None]}
+    assert result["errors"][0]["path"] == ["floats", 1]
+
+
+class NullNonFiniteExecutionContext(BufferListExecutionContext):
+    non_finite_policy = "null"
+
+
+def test_non_finite_floats_are_nulled_by_null_policy():
+    schema = create_schema(floats=array("d", [float("inf"), 1.0, float("nan")]))
+    result = execute(schema, "{ floats }", NullNonFiniteExecutionContext)
+    assert result == {"data": {"floats": [None, 1.0, None]}}
+
+
+def test_null_policy_is_not_used_for_non_nullable_items():
+    schema = create_schema(strictFloats=array("d", [1.0, float("nan")]))
+    result = execute(schema, "{ strictFloats }", NullNonFiniteExecutionContext)
+    assert result["data"] == {"strictFloats": None}
+    assert result["errors"][0]["path"] == ["strictFloats", 1]
+
+
+def test_multi_dimensional_buffer_is_not_completed_as_list():
+    matrix = memoryview(array("d", [1.0, 2.0])).cast("B").cast("d", [1, 2])
+    schema = create_schema(floats=matrix)
+    result = execute(schema, "{ floats }")
+    assert result["data"] == {"floats": None}
+
+
+def test_lists_of_non_numeric_types_are_not_read_from_buffers():
+    schema = create_schema(strings=["a", "b"])
+    result = execute(schema, "{ strings }")
+    assert result == {"data": {"strings": ["a", "b"]}}
+
+
+@pytest.mark.parametrize("value", [b"\x01\x02", bytearray(b"\x01\x02")])
+def test_bytes_are_not_completed_as_int_lists(value):
+    schema = create_schema(ints=value)
+    result = execute(schema, "{ ints }")
+    assert result["data"] == {"ints": None}
+    assert result == execute(schema, "{ ints }", ExecutionContext)
+
+
+def test_python_lists_are_completed_by_default_logic():
+    schema = create_schema(floats=[1, 2.5, None])
+    result = execute(schema, "{ floats }")
+    assert result == {"data": {"floats": [1.0, 2.5, None]}}
+
+
+def test_numpy_arrays_are_completed_as_lists():
+    numpy = pytest.importorskip("numpy")
+
+    schema = create_schema(
+        floats=numpy.array([1.5, 2.5], dtype=">f8"),
+        strictInts=numpy.arange(3, dtype="uint8"),
+    )
+    result = execute(schema, "{ floats strictInts }")
+    assert result == {"data": {"floats": [1.5, 2.5], "strictInts": [0, 1, 2]}}
+
+
+def test_numpy_non_finite_floats_are_nulled_by_null_policy():
+    numpy = pytest.importorskip("numpy")
+
+    schema = create_schema(floats=numpy.array([numpy.nan, 2.0]))
+    result = execute(schema, "{ floats }", NullNonFiniteExecutionContext)
+    assert result == {"data": {"floats": [None, 2.0]}}
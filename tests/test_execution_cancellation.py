@@ -0,0 +1,141 @@
+import asyncio
+import time
+
+import pytest
+from graphql import ExecutionContext
+
+from ariadne import ObjectType, QueryType, graphql, make_executable_schema
+from ariadne.execution import CancellingExecutionContext
+
+type_defs = """
+    type Query {
+        parent: Parent
+        strictFail: String!
+        slow: String
+        fast: String
+    }
+
+    type Parent {
+        strictFail: String!
+        fail: String
+        slow: String
+        child: Child
+        items: [Child!]
+    }
+
+    type Child {
+        slow: String
+        strictFail: String!
+    }
+"""
+
+cancelled = []
+
+
+async def resolve_slow(*_):
+    try:
+        await asyncio.sleep(0.3)
+    except asyncio.CancelledError:
+        cancelled.append(True)
+        raise
+    return "slow"
+
+
+async def resolve_strict_fail(*_):
+    await asyncio.sleep(0.01)
+    raise ValueError("Strict")
+
+
+async def resolve_fail(*_):
+    raise ValueError("Nullable")
+
+
+@pytest.fixture(autouse=True)
+def reset_cancelled():
+    cancelled.clear()
+
+
+@pytest.fixture
+def schema():
+    query_type = QueryType()
+    query_type.set_field("parent", lambda *_: {})
+    query_type.set_field("strictFail", resolve_strict_fail)
+    query_type.set_field("slow", resolve_slow)
+    query_type.set_field("fast", lambda *_: "fast")
+
+    parent_type = ObjectType("Parent")
+    parent_type.set_field("strictFail", resolve_strict_fail)
+    parent_type.set_field("fail", resolve_fail)
+    parent_type.set_field("slow", resolve_slow)
+    parent_type.set_field("child", lambda *_: {})
+    parent_type.set_field("items", lambda *_: [{}, {}])
+
+    child_type = ObjectType("Child")
+    child_type.set_field("slow", resolve_slow)
+    child_type.set_field("strictFail", resolve_strict_fail)
+
+    return make_executable_schema(type_defs, query_type, parent_type, child_type)
+
+
+async def execute(schema, query, execution_context_class=CancellingExecutionContext):
+    _, result = await graphql(
+        schema,
+        {"query": query},
+        execution_context_class=execution_context_class,
+    )
+    return result
+
+
+@pytest.mark.asyncio
+async def test_siblings_of_failed_non_nullable_field_are_cancelled(schema):
+    start = time.monotonic()
+    result = await execute(schema, "{ parent { strictFail slow } fast }")
+    assert time.monotonic() - start < 0.2
+    assert result["data"] == {"parent": None, "fast": "fast"}
+    assert [error["message"] for error in result["errors"]] == ["Strict"]
+    assert cancelled == [True]
+
+
+@pytest.mark.asyncio
+async def test_nested_fields_of_nulled_parent_are_cancelled(schema):
+    result = await execute(schema, "{ parent { strictFail child { slow } } }")
+    assert result["data"] == {"parent": None}
+    assert cancelled == [True]
+
+
+@pytest.mark.asyncio
+async def test_siblings_of_failed_list_item_are_cancelled(schema):
+    result = await execute(schema, "{ parent { items { strictFail slow } } }")
+    assert result["data"] == {"parent": {"items": None}}
+    assert len(result["errors"]) == 1
+    assert cancelled == [True, True]
+
+
+@pytest.mark.asyncio
+async def test_failed_non_nullable_root_field_cancels_all_fields(schema):
+    result = await execute(schema, "{ strictFail slow parent { slow } }")
+    assert result["data"] is None
+
+    await asyncio.sleep(0)  # Let cancelled tasks handle the cancellation
+    assert cancelled == [True, True]
+
+
+@pytest.mark.asyncio
+async def test_siblings_of_failed_nullable_field_are_not_cancelled(schema):
+    result = await execute(schema, "{ parent { fail slow } }")
+    assert result["data"] == {"parent": {"fail": None, "slow": "slow"}}
+    assert not cancelled
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "query",
+    [
+        "{ parent { strictFail slow fail } fast }",
+        "{ parent { fail child { slow } items { slow } } }",
+        "{ parent { items { strictFail } } slow }",
+    ],
+)
+async def test_result_is_same_as_result_of_default_context(schema, query):
+    result = await execute(schema, query)
+    assert result == await execute(schema, query, ExecutionContext)
@@ -0,0 +1,284 @@
+import sys
+from enum import Enum
+
+import pytest
+from graphql import ExecutionContext
+
+from ariadne import (
+    EnumType,
+    InterfaceType,
+    ObjectType,
+    QueryType,
+    ScalarType,
+    UnionType,
+    graphql,
+    graphql_sync,
+    make_executable_schema,
+)
+from ariadne.execution import FastExecutionContext
+
+type_defs = """
+    type Query {
+        user: User
+        users: [User!]
+        strictUser: User!
+        search: [SearchResult!]!
+        node: Node
+        asyncUser: User
+    }
+
+    type User implements Node {
+        id: ID!
+        name: String
+        fullName: String
+        bio: String
+        score: Int
+        rating: Float
+        isActive: Boolean
+        role: Role
+        birthday: Date
+        greeting: String
+        strictName: String!
+        tags: [String!]
+        friend: User
+        strictFriend: User!
+        lazyName: String
+        awaitedName: String
+        error: String
+        posts(first: Int): [Post!]
+    }
+
+    type Post implements Node {
+        id: ID!
+        title: String
+    }
+
+    interface Node {
+        id: ID!
+    }
+
+    union SearchResult = User | Post
+
+    enum Role {
+        ADMIN
+        USER
+    }
+
+    scalar Date
+"""
+
+
+class Role(Enum):
+    ADMIN = "admin"
+    USER = "user"
+
+
+class User:
+    def __init__(self, id, name, **kwargs):
+        self.id = id
+        self.name = name
+        self.full_name = kwargs.get("full_name")
+        self.profile = kwargs.get("profile")
+        self.score = kwargs.get("score")
+        self.rating = kwargs.get("rating")
+        self.is_active = kwargs.get("is_active")
+        self.role = kwargs.get("role")
+        self.birthday = kwargs.get("birthday")
+        self.strict_name = kwargs.get("strict_name")
+        self.tags = kwargs.get("tags")
+        self.friend = kwargs.get("friend")
+        self.strict_friend = kwargs.get("strict_friend")
+        self.posts = kwargs.get("posts")
+        self.awaited_name = kwargs.get("awaited_name")
+        self.error = kwargs.get("error")
+
+    def greeting(self, info):
+        return f"Hello, {self.name}!"
+
+    @property
+    def lazy_name(self):
+        raise ValueError("Lazy name failed")
+
+
+def create_user(**kwargs):
+    friend = User(
+        "2",
+        "Bob",
+        full_name="Bob Smith",
+        strict_name="Bob",
+        strict_friend={"id": "3", "name": "Carol", "strictName": "Carol"},
+    )
+    options = {
+        "full_name": "Alice Smith",
+        "profile": {"bio": "Bio"},
+        "score": 42,
+        "rating": 4.5,
+        "is_active": True,
+        "role": Role.ADMIN,
+        "birthday": "2001-02-03",
+        "strict_name": "Alice",
+        "tags": ["a", "b"],
+        "friend": friend,
+        "strict_friend": friend,
+        "posts": [{"id": "1", "title": "Post"}],
+        "error": ValueError("Field failed"),
+    }
+    options.update(kwargs)
+    return User("1", "Alice", **options)
+
+
+async def get_name():
+    return "Awaited"
+
+
+date_scalar = ScalarType("Date")
+
+
+@date_scalar.serializer
+def serialize_date(value):
+    return f"date:{value}"
+
+
+@pytest.fixture
+def schema():
+    query_type = QueryType()
+    query_type.set_field("user", lambda *_: create_user())
+    query_type.set_field(
+        "users", lambda *_: [create_user(), create_user(strict_name=None)]
+    )
+    query_type.set_field("strictUser", lambda *_: create_user(strict_name=None))
+    query_type.set_field(
+        "search", lambda *_: [create_user(), {"__typename": "Post", "id": "1"}]
+    )
+    query_type.set_field("node", lambda *_: {"__typename": "Post", "id": "2"})
+
+    @query_type.field("asyncUser")
+    async def resolve_async_user(*_):
+        return create_user(awaited_name=get_name())
+
+    user_type = ObjectType("User")
+    user_type.set_alias("bio", "profile.bio")
+
+    def resolve_type(obj, *_):
+        if isinstance(obj, User):
+            return "User"
+        return obj["__typename"]
+
+    return make_executable_schema(
+        type_defs,
+        query_type,
+        user_type,
+        EnumType("Role", Role),
+        date_scalar,
+        InterfaceType("Node", resolve_type),
+        UnionType("SearchResult", resolve_type),
+        convert_names_case=True,
+    )
+
+
+USER_FIELDS = """
+    id name fullName bio score rating isActive role birthday greeting
+    strictName tags error lazyName posts { id title }
+    friend { id name fullName strictName strictFriend { name strictName } }
+"""
+
+QUERIES = [
+    f"{{ user {{ {USER_FIELDS} }} }}",
+    "{ user { renamed: name other: fullName name } }",
+    f"{{ users {{ {USER_FIELDS} }} }}",
+    "{ strictUser { name strictName } }",
+    "{ user { friend { strictFriend { strictFriend { name } } } } }",
+    "{ search { ... on User { name role } ... on Post { id } } }",
+    "{ node { id __typename ... on Post { title } } }",
+    "{ user { __typename posts(first: 1) { id } } }",
+    "{ asyncUser { name awaitedName friend { name } } }",
+]
+
+
+async def execute(schema, query, **kwargs):
+    _, result = await graphql(schema, {"query": query}, **kwargs)
+    return result
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("query", QUERIES)
+async def test_result_is_same_as_result_of_default_context(schema, query):
+    result = await execute(schema, query, execution_context_class=FastExecutionContext)
+    assert result == await execute(
+        schema, query, execution_context_class=ExecutionContext
+    )
+
+
+@pytest.mark.parametrize("query", QUERIES[:-1])
+def test_sync_result_is_same_as_result_of_default_context(schema, query):
+    _, result = graphql_sync(
+        schema, {"query": query}, execution_context_class=FastExecutionContext
+    )
+    _, default_result = graphql_sync(
+        schema, {"query": query}, execution_context_class=ExecutionContext
+    )
+    assert result == default_result
+
+
+@pytest.mark.asyncio
+async def test_fields_using_default_resolvers_are_completed_without_info(schema):
+    built_info = []
+
+    class TestExecutionContext(FastExecutionContext):
+        def build_resolve_info(self, field_def, field_nodes, parent_type, path):
+            built_info.append(f"{parent_type.name}.{field_nodes[0].name.value}")
+            return super().build_resolve_info(field_def, field_nodes, parent_type, path)
+
+    result = await execute(
+        schema,
+        "{ user { name fullName bio role greeting friend { name } } }",
+        execution_context_class=TestExecutionContext,
+    )
+    assert not result.get("errors")
+    assert built_info == ["Query.user", "User.greeting"]
+
+
+@pytest.mark.asyncio
+async def test_middleware_is_called_for_fields_using_default_resolvers(schema):
+    resolved_fields = []
+
+    def middleware(next_, obj, info, **kwargs):
+        resolved_fields.append(info.field_name)
+        return next_(obj, info, **kwargs)
+
+    result = await execute(
+        schema,
+        "{ user { name fullName } }",
+        execution_context_class=FastExecutionContext,
+        middleware=[middleware],
+    )
+    assert result == {"data": {"user": {"name": "Alice", "fullName": "Alice Smith"}}}
+    assert resolved_fields == ["user", "name", "fullName"]
+
+
+@pytest.mark.skipif(sys.version_info < (3, 12), reason="requires eager tasks")
+@pytest.mark.asyncio
+async def test_async_fields_are_started_before_their_siblings_are_resolved():
+    calls = []
+    query_type = QueryType()
+
+    @query_type.field("asyncField")
+    async def resolve_async_field(*_):
+        calls.append("asyncField")
+        return "async"
+
+    @query_type.field("syncField")
+    def resolve_sync_field(*_):
+        calls.append("syncField")
+        return "sync"
+
+    schema = make_executable_schema(
+        "type Query { asyncField: String syncField: String }", query_type
+    )
+    result = await execute(
+        schema,
+        "{ asyncField syncField }",
+        execution_context_class=FastExecutionContext,
+    )
+    assert result == {"data": {"asyncField": "async", "syncField": "sync"}}
+    assert calls == ["asyncField", "syncField"]
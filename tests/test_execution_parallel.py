@@ -0,0 +1,193 @@
+import threading
+import time
+from contextvars import ContextVar
+
+import pytest
+
+from ariadne import (
+    MutationType,
+    ObjectType,
+    QueryType,
+    graphql_sync,
+    make_executable_schema,
+)
+from ariadne.execution import parallel_execution_context
+
+type_defs = """
+    type Query {
+        a: String
+        b: String
+        c: String
+        failing(delay: Float!, message: String!): String
+        thread: String
+        request: String
+        nested: Nested
+        default: String
+    }
+
+    type Mutation {
+        first: String
+        second: String
+    }
+
+    type Nested {
+        strictFailing: String!
+        failing: String
+        items: [Nested!]
+        thread: String
+    }
+"""
+
+request_id: ContextVar[str] = ContextVar("request_id", default="")
+calls: list[str] = []
+
+
+def sleep_and_return(value, delay=0.1):
+    def resolver(*_):
+        time.sleep(delay)
+        return value
+
+    return resolver
+
+
+def record_call(name):
+    def resolver(*_):
+        calls.append(f"{name} started")
+        time.sleep(0.05)
+        calls.append(f"{name} finished")
+        return name
+
+    return resolver
+
+
+def get_thread_name(*_):
+    return threading.current_thread().name
+
+
+@pytest.fixture(scope="module")
+def schema():
+    query_type = QueryType()
+    query_type.set_field("a", sleep_and_return("A"))
+    query_type.set_field("b", sleep_and_return("B"))
+    query_type.set_field("c", sleep_and_return("C"))
+    query_type.set_field("thread", get_thread_name)
+    query_type.set_field("request", lambda *_: request_id.get())
+    query_type.set_field("nested", lambda *_: {"items": [{}, {}, {}]})
+
+    @query_type.field("failing")
+    def resolve_failing(*_, delay, message):
+        time.sleep(delay)
+        raise ValueError(message)
+
+    mutation_type = MutationType()
+    mutation_type.set_field("first", record_call("first"))
+    mutation_type.set_field("second", record_call("second"))
+
+    nested_type = ObjectType("Nested")
+    nested_type.set_field("thread", get_thread_name)
+
+    @nested_type.field("strictFailing")
+    def resolve_strict_failing(*_):
+        time.sleep(0.05)
+        raise ValueError("Strict")
+
+    @nested_type.field("failing")
+    def resolve_nested_failing(*_):
+        raise ValueError("Nullable")
+
+    return make_executable_schema(type_defs, query_type, mutation_type, nested_type)
+
+
+@pytest.fixture(scope="module")
+def execution_context_class():
+    context_class = parallel_execution_context(max_workers=4)
+    yield context_class
+    context_class.executor.shutdown()
+
+
+def execute(schema, execution_context_class, query, **kwargs):
+    _, result = graphql_sync(
+        schema,
+        {"query": query},
+        execution_context_class=execution_context_class,
+        **kwargs,
+    )
+    return result
+
+
+def test_sibling_fields_are_resolved_concurrently(schema, execution_context_class):
+    start = time.monotonic()
+    result = execute(schema, execution_context_class, "{ c a b }")
+    assert time.monotonic() - start < 0.25
+    assert result == {"data": {"c": "C", "a": "A", "b": "B"}}
+    assert list(result["data"]) == ["c", "a", "b"]
+
+
+def test_default_resolvers_are_run_in_calling_thread(schema, execution_context_class):
+    result = execute(
+        schema,
+        execution_context_class,
+        "{ default thread a }",
+        root_value={"default": "value"},
+    )
+    assert result["data"]["default"] == "value"
+    assert result["data"]["thread"] == threading.current_thread().name
+
+
+def test_errors_are_reported_in_fields_order(schema, execution_context_class):
+    result = execute(
+        schema,
+        execution_context_class,
+        """
+        {
+            first: failing(delay: 0.1, message: "First")
+            a
+            second: failing(delay: 0, message: "Second")
+        }
+        """,
+    )
+    assert result["data"] == {"first": None, "a": "A", "second": None}
+    assert [error["message"] for error in result["errors"]] == ["First", "Second"]
+
+
+def test_error_of_non_nullable_field_discards_errors_of_next_fields(
+    schema, execution_context_class
+):
+    result = execute(
+        schema, execution_context_class, "{ nested { strictFailing failing } }"
+    )
+    assert result["data"] == {"nested": None}
+    assert [error["message"] for error in result["errors"]] == ["Strict"]
+
+
+def test_mutation_root_fields_are_resolved_serially(schema, execution_context_class):
+    calls.clear()
+    result = execute(schema, execution_context_class, "mutation { first second }")
+    assert result == {"data": {"first": "first", "second": "second"}}
+    assert calls == [
+        "first started",
+        "first finished",
+        "second started",
+        "second finished",
+    ]
+
+
+def test_context_variables_are_copied_to_threads(schema, execution_context_class):
+    request_id.set("req-1")
+    result = execute(schema, execution_context_class, "{ a request }")
+    assert result["data"]["request"] == "req-1"
+
+
+def test_nested_selection_sets_dont_exhaust_threads(schema):
+    execution_context_class = parallel_execution_context(max_workers=1)
+    try:
+        result = execute(
+            schema,
+            execution_context_class,
+            "{ a b nested { items { thread items { thread } } } }",
+        )
+    finally:
+        execution_context_class.executor.shutdown()
+
+    assert result["data"]["a"] == "A"
+    assert len(result["data"]["nested"]["items"]) == 3
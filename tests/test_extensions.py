@@ -1,8 +1,10 @@
 from unittest.mock import Mock
 
 import pytest
+from graphql import parse
 
-from ariadne import ExtensionManager, graphql
+from ariadne import ExtensionManager, graphql, graphql_sync, subscribe
+from ariadne.extensions import NO_PHASE_HOOKS
 from ariadne.types import Extension
 
 context = {}
@@ -60,3 +62,158 @@ async def test_default_extension_hooks_dont_interrupt_query_execution(schema):
         schema, {"query": "{ status }"}, extensions=[BaseExtension]
     )
     assert response["data"] == {"status": True}
+
+
+class PhasesExtension(Extension):
+    def __init__(self, calls):
+        self.calls = calls
+
+    def request_started(self, context):
+        self.calls.append("request_started")
+
+    def request_finished(self, context):
+        self.calls.append("request_finished")
+
+    def parsing_started(self, context):
+        self.calls.append("parsing_started")
+
+    def parsing_finished(self, context):
+        self.calls.append("parsing_finished")
+
+    def validation_started(self, context):
+        self.calls.append("validation_started")
+
+    def validation_finished(self, context):
+        self.calls.append("validation_finished")
+
+    def execution_started(self, context):
+        self.calls.append("execution_started")
+
+    def execution_finished(self, context):
+        self.calls.append("execution_finished")
+
+
+class AsyncPhasesExtension(Extension):
+    def __init__(self, calls):
+        self.calls = calls
+
+    async def parsing_started_async(self, context):
+        self.calls.append("parsing_started_async")
+
+    async def parsing_finished_async(self, context):
+        self.calls.append("parsing_finished_async")
+
+
+phases_calls = [
+    "request_started",
+    "parsing_started",
+    "parsing_finished",
+    "validation_started",
+    "validation_finished",
+    "execution_started",
+    "execution_finished",
+    "request_finished",
+]
+
+
+def test_phase_hooks_are_called_by_graphql_sync(schema):
+    calls = []
+    graphql_sync(
+        schema,
+        {"query": "{ status }"},
+        extensions=[lambda: PhasesExtension(calls)],
+    )
+    assert calls == phases_calls
+
+
+@pytest.mark.asyncio
+async def test_phase_hooks_are_called_by_graphql(schema):
+    calls = []
+    await graphql(
+        schema,
+        {"query": "{ status }"},
+        extensions=[lambda: PhasesExtension(calls)],
+    )
+    assert calls == phases_calls
+
+
+@pytest.mark.asyncio
+async def test_async_phase_hooks_are_called_by_graphql(schema):
+    calls = []
+    await graphql(
+        schema,
+        {"query": "{ status }"},
+        extensions=[lambda: AsyncPhasesExtension(calls)],
+    )
+    assert calls == ["parsing_started_async", "parsing_finished_async"]
+
+
+def test_async_phase_hooks_are_not_called_by_graphql_sync(schema):
+    calls = []
+    graphql_sync(
+        schema,
+        {"query": "{ status }"},
+        extensions=[lambda: AsyncPhasesExtension(calls)],
+    )
+    assert not calls
+
+
+def test_phase_finished_hook_is_called_on_error(schema):
+    calls = []
+    graphql_sync(
+        schema,
+        {"query": "{ status"},
+        extensions=[lambda: PhasesExtension(calls)],
+    )
+    assert calls == [
+        "request_started",
+        "parsing_started",
+        "parsing_finished",
+        "request_finished",
+    ]
+
+
+def test_validation_phase_ends_before_errors_are_reported(schema):
+    calls = []
+    graphql_sync(
+        schema,
+        {"query": "{ unknown }"},
+        extensions=[lambda: PhasesExtension(calls)],
+    )
+    assert calls == phases_calls[:5] + ["request_finished"]
+
+
+def test_parsing_phase_is_skipped_for_parsed_document(schema):
+    calls = []
+    graphql_sync(
+        schema,
+        {"query": "{ status }"},
+        query_document=parse("{ status }"),
+        extensions=[lambda: PhasesExtension(calls)],
+    )
+    assert "parsing_started" not in calls
+
+
+@pytest.mark.asyncio
+async def test_phase_hooks_are_called_by_subscribe(schema):
+    calls = []
+    success, _ = await subscribe(
+        schema,
+        {"query": "subscription { ping }"},
+        extensions=[lambda: PhasesExtension(calls)],
+    )
+    assert success
+    assert calls == phases_calls
+
+
+def test_extension_manager_skips_phases_without_hooks():
+    manager = ExtensionManager([BaseExtension, Mock(return_value=Mock())], context)
+    assert manager.phase("parsing") is NO_PHASE_HOOKS
+
+
+def test_extension_manager_runs_phase_hooks_of_extensions_overriding_them():
+    calls = []
+    manager = ExtensionManager([BaseExtension, lambda: PhasesExtension(calls)])
+    with manager.phase("parsing"):
+        calls.append("parse")
+    assert calls == ["parsing_started", "parse", "parsing_finished"]
@@ -0,0 +1,84 @@
+from ariadne.http_cache import HttpCache
+
+result = {"data": {"hello": "world"}}
+body = b'{"data":{"hello":"world"}}'
+
+
+def test_etag_is_computed_from_response_body():
+    http_cache = HttpCache()
+    etag = http_cache.get_etag(None, result, body)
+    assert etag.startswith('"')
+    assert etag.endswith('"')
+    assert http_cache.get_etag(None, result, body) == etag
+    assert http_cache.get_etag(None, result, b"{}") != etag
+
+
+def test_etag_is_computed_from_version():
+    http_cache = HttpCache(version=lambda request, result: "v1")
+    etag = http_cache.get_etag(None, result, body)
+    assert http_cache.get_etag(None, result, b"{}") == etag
+    assert etag != HttpCache().get_etag(None, result, body)
+
+
+def test_etag_computed_from_version_differs_between_representations():
+    http_cache = HttpCache(version=lambda request, result: "v1")
+    etags = {
+        http_cache.get_etag(
+            None,
+            result,
+            body,
+            content_type=content_type,
+            content_encoding=content_encoding,
+        )
+        for content_type in ("application/json", "application/msgpack")
+        for content_encoding in (None, "gzip", "br")
+    }
+    assert len(etags) == 6
+
+
+def test_etag_is_computed_from_body_if_version_is_none():
+    http_cache = HttpCache(version=lambda request, result: None)
+    assert http_cache.get_etag(None, result, body) == HttpCache().get_etag(
+        None, result, body
+    )
+
+
+def test_etag_is_not_computed_for_result_with_errors():
+    http_cache = HttpCache()
+    result_with_errors = {"data": None, "errors": [{"message": "Error"}]}
+    assert http_cache.get_etag(None, result_with_errors, body) is None
+
+
+def test_caching_headers_are_returned_for_etag():
+    http_cache = HttpCache(
+        cache_control="public, max-age=60", vary=["Accept", "Authorization"]
+    )
+    assert http_cache.get_headers('"abc"') == {
+        "ETag": '"abc"',
+        "Cache-Control": "public, max-age=60",
+        "Vary": "Accept, Authorization",
+    }
+
+
+def test_optional_caching_headers_are_skipped():
+    http_cache = HttpCache(cache_control=None)
+    assert http_cache.get_headers('"abc"') == {"ETag": '"abc"'}
+
+
+def test_no_store_header_is_returned_for_uncacheable_result():
+    assert HttpCache().get_headers(None) == {"Cache-Control": "no-store"}
+
+
+def test_matching_etag_is_not_modified():
+    http_cache = HttpCache()
+    assert http_cache.is_not_modified('"abc"', '"abc"')
+    assert http_cache.is_not_modified('"other", "abc"', '"abc"')
+    assert http_cache.is_not_modified('W/"abc"', '"abc"')
+    assert http_cache.is_not_modified("*", '"abc"')
+
+
+def test_different_etag_is_modified():
+    http_cache = HttpCache()
+    assert not http_cache.is_not_modified('"other"', '"abc"')
+    assert not http_cache.is_not_modified(None, '"abc"')
+    assert not http_cache.is_not_modified("*", None)
@@ -0,0 +1,160 @@
+import json
+
+from graphql import get_introspection_query, parse
+
+from ariadne import graphql_sync, make_executable_schema
+from ariadne.introspection import (
+    IntrospectionCache,
+    get_introspection_result,
+    is_introspection_document,
+)
+
+type_defs = """
+    type Query {
+        hello: String
+    }
+"""
+
+introspection_query = get_introspection_query()
+
+
+def test_introspection_result_is_computed_once_per_schema():
+    schema = make_executable_schema(type_defs)
+    result = get_introspection_result(schema)
+    assert "__schema" in result
+    assert get_introspection_result(schema) is result
+
+
+def test_introspection_result_describes_schema():
+    schema = make_executable_schema(type_defs)
+    result = get_introspection_result(schema)
+    assert result["__schema"]["queryType"] == {"name": "Query", "kind": "OBJECT"}
+    type_names = [schema_type["name"] for schema_type in result["__schema"]["types"]]
+    assert "Query" in type_names
+
+
+def test_query_selecting_only_introspection_fields_is_introspection_document():
+    document = parse("{ __schema { queryType { name } } __typename }")
+    assert is_introspection_document(document)
+
+
+def test_query_selecting_schema_fields_is_not_introspection_document():
+    document = parse("{ __schema { queryType { name } } hello }")
+    assert not is_introspection_document(document)
+
+
+def test_query_with_variables_is_not_introspection_document():
+    document = parse("query Q($name: String!) { __type(name: $name) { name } }")
+    assert not is_introspection_document(document)
+
+
+def test_query_with_fragment_on_root_is_not_introspection_document():
+    document = parse("{ ...Root } fragment Root on Query { hello }")
+    assert not is_introspection_document(document)
+
+
+def test_mutation_is_not_introspection_document():
+    document = parse("mutation { __typename }")
+    assert not is_introspection_document(document)
+
+
+def test_executed_operation_is_selected_by_name():
+    document = parse("query A { __typename } query B { hello }")
+    assert is_introspection_document(document, "A")
+    assert not is_introspection_document(document, "B")
+    assert not is_introspection_document(document)
+
+
+def test_cache_returns_result_stored_for_query_string():
+    schema = make_executable_schema(type_defs)
+    data = {"query": introspection_query}
+    document = parse(introspection_query)
+    _, result = graphql_sync(schema, data)
+
+    cache = IntrospectionCache()
+    assert cache.get(schema, data) is None
+
+    cache.set(schema, data, document, result)
+    cached = cache.get(schema, data)
+    assert cached.result == result
+    assert json.loads(cached.json) == result
+    assert cache.hits == 1
+
+
+def test_cache_returns_result_stored_for_equivalent_document():
+    schema = make_executable_schema(type_defs)
+    query = "{ __schema { queryType { name } } }"
+    other_query = "# Comment\n{\n  __schema {\n    queryType { name }\n  }\n}"
+    cache = IntrospectionCache()
+    cache.set(
+        schema,
+        {"query": query},
+        parse(query),
+        {"data": {"__schema": {"queryType": {"name": "Query"}}}},
+    )
+
+    other_data = {"query": other_query}
+    assert cache.get(schema, other_data) is None
+    cached = cache.get_for_document(schema, other_data, parse(other_query))
+    assert cached.result == {"data": {"__schema": {"queryType": {"name": "Query"}}}}
+    assert cache.get(schema, other_data) is cached
+
+
+def test_cache_is_separate_for_every_schema():
+    schema = make_executable_schema(type_defs)
+    other_schema = make_executable_schema(type_defs)
+    data = {"query": introspection_query}
+    cache = IntrospectionCache()
+    cache.set(schema, data, parse(introspection_query), {"data": {"__schema": {}}})
+    assert cache.get(other_schema, data) is None
+
+
+def test_cache_skips_results_with_errors():
+    schema = make_executable_schema(type_defs)
+    data = {"query": "{ __schema { queryType { name } } }"}
+    cache = IntrospectionCache()
+    cache.set(
+        schema,
+        data,
+        parse(data["query"]),
+        {"data": None, "errors": [{"message": "Error"}]},
+    )
+    assert cache.get(schema, data) is None
+
+
+def test_cache_skips_results_of_queries_selecting_schema_fields():
+    schema = make_executable_schema(type_defs)
+    data = {"query": "{ __schema { queryType { name } } hello }"}
+    cache = IntrospectionCache()
+    cache.set(schema, data, parse(data["query"]), {"data": {"hello": "World"}})
+    assert cache.get(schema, data) is None
+
+
+def test_cache_stops_storing_results_after_max_size_is_reached():
+    schema = make_executable_schema(type_defs)
+    cache = IntrospectionCache(max_size=1)
+    for query in (
+        "{ __schema { queryType { name } } }",
+        "{ __schema { queryType { kind } } }",
+    ):
+        cache.set(schema, {"query": query}, parse(query), {"data": {"__schema": {}}})
+
+    assert cache.get(schema, {"query": "{ __schema { queryType { name } } }"})
+    assert not cache.get(schema, {"query": "{ __schema { queryType { kind } } }"})
+
+
+def test_cache_counts_misses_for_introspection_documents():
+    schema = make_executable_schema(type_defs)
+    data = {"query": introspection_query}
+    cache = IntrospectionCache()
+    assert cache.get_for_document(schema, data, parse(introspection_query)) is None
+    assert cache.misses == 1
+
+
+def test_only_valid_introspection_request_data_is_cache_candidate():
+    cache = IntrospectionCache()
+    assert cache.is_candidate({"query": introspection_query})
+    assert not cache.is_candidate({"query": introspection_query, "variables": []})
+    assert not cache.is_candidate({"query": introspection_query, "operationName": 1})
+    assert not cache.is_candidate({"query": "{ hello }"})
+    assert not cache.is_candidate([{"query": introspection_query}])
@@ -0,0 +1,153 @@
+from ariadne.normalization import ResultNormalization
+
+
+def test_entities_are_moved_to_entities_table():
+    result = {
+        "data": {
+            "threads": [
+                {
+                    "id": "1",
+                    "starter": {"__typename": "User", "id": "1", "name": "Bob"},
+                    "lastPoster": {"__typename": "User", "id": "1", "name": "Bob"},
+                },
+                {
+                    "id": "2",
+                    "starter": {"__typename": "User", "id": "2", "name": "Alice"},
+                    "lastPoster": {"__typename": "User", "id": "1", "name": "Bob"},
+                },
+            ]
+        }
+    }
+
+    assert ResultNormalization().normalize(result) == {
+        "data": {
+            "threads": [
+                {
+                    "id": "1",
+                    "starter": {"__ref": "User:1"},
+                    "lastPoster": {"__ref": "User:1"},
+                },
+                {
+                    "id": "2",
+                    "starter": {"__ref": "User:2"},
+                    "lastPoster": {"__ref": "User:1"},
+                },
+            ]
+        },
+        "entities": {
+            "User:1": {"__typename": "User", "id": "1", "name": "Bob"},
+            "User:2": {"__typename": "User", "id": "2", "name": "Alice"},
+        },
+    }
+
+
+def test_fields_of_entity_are_merged():
+    result = {
+        "data": {
+            "a": {"__typename": "User", "id": "1", "name": "Bob"},
+            "b": {"__typename": "User", "id": "1", "avatar": "bob.png"},
+        }
+    }
+
+    normalized = ResultNormalization().normalize(result)
+    assert normalized["entities"] == {
+        "User:1": {
+            "__typename": "User",
+            "id": "1",
+            "name": "Bob",
+            "avatar": "bob.png",
+        }
+    }
+
+
+def test_nested_entities_are_normalized():
+    result = {
+        "data": {
+            "post": {
+                "__typename": "Post",
+                "id": "1",
+                "poster": {"__typename": "User", "id": "1"},
+            }
+        }
+    }
+
+    assert ResultNormalization().normalize(result) == {
+        "data": {"post": {"__ref": "Post:1"}},
+        "entities": {
+            "User:1": {"__typename": "User", "id": "1"},
+            "Post:1": {"__typename": "Post", "id": "1", "poster": {"__ref": "User:1"}},
+        },
+    }
+
+
+def test_conflicting_occurrence_of_entity_is_kept_inline():
+    result = {
+        "data": {
+            "a": {"__typename": "User", "id": "1", "name": "Bob"},
+            "b": {"__typename": "User", "id": "1", "name": "BOB"},
+        }
+    }
+
+    assert ResultNormalization().normalize(result) == {
+        "data": {
+            "a": {"__ref": "User:1"},
+            "b": {"__typename": "User", "id": "1", "name": "BOB"},
+        },
+        "entities": {"User:1": {"__typename": "User", "id": "1", "name": "Bob"}},
+    }
+
+
+def test_objects_without_typename_or_key_are_kept_inline():
+    result = {
+        "data": {
+            "a": {"id": "1", "name": "Bob"},
+            "b": {"__typename": "User", "name": "Bob"},
+            "c": {"__typename": "User", "id": None},
+        }
+    }
+
+    assert ResultNormalization().normalize(result) == {**result, "entities": {}}
+
+
+def test_custom_key_fields_are_used_for_type():
+    result = {
+        "data": {
+            "review": {"__typename": "Review", "author": "1", "product": "2"},
+            "category": {"__typename": "Category", "slug": "news"},
+            "user": {"__typename": "User", "id": "1"},
+        }
+    }
+
+    normalization = ResultNormalization(
+        key_fields={"Review": ["author", "product"], "Category": "slug", "User": []}
+    )
+    assert normalization.normalize(result)["data"] == {
+        "review": {"__ref": 'Review:{"author":"1","product":"2"}'},
+        "category": {"__ref": "Category:news"},
+        "user": {"__typename": "User", "id": "1"},
+    }
+
+
+def test_errors_and_extensions_are_kept():
+    result = {
+        "data": {"user": {"__typename": "User", "id": "1"}},
+        "errors": [{"message": "Error", "path": ["user", "name"]}],
+        "extensions": {"cost": 1},
+    }
+
+    normalized = ResultNormalization().normalize(result)
+    assert normalized["errors"] == result["errors"]
+    assert normalized["extensions"] == result["extensions"]
+
+
+def test_result_without_data_is_returned_unchanged():
+    result = {"data": None, "errors": [{"message": "Error"}]}
+    assert ResultNormalization().normalize(result) is result
+
+
+def test_normalized_format_is_requested_with_header_value():
+    normalization = ResultNormalization()
+    assert normalization.is_requested("normalized")
+    assert normalization.is_requested(" Normalized ")
+    assert not normalization.is_requested("json")
+    assert not normalization.is_requested(None)
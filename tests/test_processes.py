@@ -0,0 +1,164 @@
+import os
+import pickle
+import time
+
+import pytest
+
+from ariadne import QueryType, graphql, make_executable_schema
+from ariadne.processes import (
+    CpuBoundDirective,
+    ProcessResolveInfo,
+    ResolverProcessPool,
+    cpu_bound_directive,
+    get_field_cpu_bound,
+)
+
+type_defs = """
+    type Query {
+        pid(value: Int!): [Int!]!
+        local: Int!
+        slow: Int!
+        span: [Float!]!
+        failing: Int
+        unpicklable: Int
+        info: String!
+    }
+"""
+
+
+def resolve_pid(obj, info, *, value):
+    return [os.getpid(), obj["base"] + value]
+
+
+def resolve_slow(*_):
+    time.sleep(0.5)
+    return 1
+
+
+def resolve_span(*_):
+    start = time.monotonic()
+    time.sleep(0.1)
+    return [start, time.monotonic()]
+
+
+def resolve_failing(*_):
+    raise ValueError("Failed in process")
+
+
+def resolve_info(_, info):
+    assert isinstance(info, ProcessResolveInfo)
+    return f"{info.operation_name} {info.parent_type}.{info.field_name} {info.path}"
+
+
+@pytest.fixture
+def schema():
+    query_type = QueryType()
+    query_type.set_field("pid", resolve_pid, cpu_bound=True)
+    query_type.set_field("local", lambda *_: os.getpid())
+    query_type.set_field("slow", resolve_slow, cpu_bound=True)
+    query_type.set_field("span", resolve_span, cpu_bound=True)
+    query_type.set_field("failing", resolve_failing, cpu_bound=True)
+    query_type.set_field("unpicklable", lambda *_: 1, cpu_bound=True)
+    query_type.set_field("info", resolve_info, cpu_bound=True)
+    return make_executable_schema(type_defs, query_type)
+
+
+@pytest.fixture
+def pool():
+    pool = ResolverProcessPool(max_workers=2)
+    yield pool
+    pool.shutdown()
+
+
+def test_process_resolve_info_is_picklable():
+    info = ProcessResolveInfo("field", "Query", ["field"], "Op", {"a": 1})
+    unpickled = pickle.loads(pickle.dumps(info))
+    assert unpickled.field_name == "field"
+    assert unpickled.variable_values == {"a": 1}
+
+
+def test_object_type_marks_cpu_bound_fields(schema):
+    assert get_field_cpu_bound(schema.query_type.fields["pid"])
+    assert get_field_cpu_bound(schema.query_type.fields["local"]) is None
+
+
+def test_cpu_bound_directive_sets_field_options():
+    schema = make_executable_schema(
+        [
+            cpu_bound_directive,
+            "type Query { report: Int @cpuBound(maxConcurrency: 2, timeout: 1.5) }",
+        ],
+        directives={"cpuBound": CpuBoundDirective},
+    )
+    assert get_field_cpu_bound(schema.query_type.fields["report"]) == {
+        "max_concurrency": 2,
+        "timeout": 1.5,
+    }
+
+
+@pytest.mark.asyncio
+async def test_cpu_bound_resolvers_are_run_in_pool_processes(schema, pool):
+    _, result = await graphql(
+        schema,
+        {"query": "{ pid(value: 2) local }"},
+        root_value={"base": 40},
+        extensions=[pool.extension],
+    )
+    assert result["data"]["local"] == os.getpid()
+    pid, value = result["data"]["pid"]
+    assert pid != os.getpid()
+    assert value == 42
+
+
+@pytest.mark.asyncio
+async def test_cpu_bound_resolver_receives_process_resolve_info(schema, pool):
+    _, result = await graphql(
+        schema, {"query": "query Op { info }"}, extensions=[pool.extension]
+    )
+    assert result["data"]["info"] == "Op Query.info ['info']"
+
+
+@pytest.mark.asyncio
+async def test_errors_raised_in_pool_processes_are_reported(schema, pool):
+    _, result = await graphql(
+        schema, {"query": "{ failing }"}, extensions=[pool.extension]
+    )
+    assert result["errors"][0]["message"] == "Failed in process"
+
+
+@pytest.mark.asyncio
+async def test_unpicklable_resolver_fails_with_error(schema, pool):
+    _, result = await graphql(
+        schema, {"query": "{ unpicklable }"}, extensions=[pool.extension]
+    )
+    assert result["data"] == {"unpicklable": None}
+    assert "pickle" in result["errors"][0]["message"].lower()
+
+
+@pytest.mark.asyncio
+async def test_cpu_bound_resolver_times_out(schema):
+    pool = ResolverProcessPool(max_workers=1, timeout=0.05)
+    try:
+        _, result = await graphql(
+            schema, {"query": "{ slow }"}, extensions=[pool.extension]
+        )
+    finally:
+        pool.shutdown()
+
+    assert result["errors"][0]["message"] == (
+        "Resolver for Query.slow timed out after 0.05 seconds."
+    )
+
+
+@pytest.mark.asyncio
+async def test_cpu_bound_resolver_concurrency_is_limited(schema):
+    pool = ResolverProcessPool(max_workers=2, max_concurrency=1)
+    try:
+        _, result = await graphql(
+            schema, {"query": "{ a: span b: span }"}, extensions=[pool.extension]
+        )
+    finally:
+        pool.shutdown()
+
+    (a_start, a_end), (b_start, b_end) = sorted(result["data"].values())
+    assert a_end <= b_start
@@ -4,7 +4,7 @@ from graphql.language import parse
 from graphql.validation import validate
 
 from ariadne import make_executable_schema
-from ariadne.validation import cost_validator
+from ariadne.validation import cost_validator, get_operation_cost
 
 cost_directive = """
 directive @cost(
@@ -651,3 +651,28 @@ def test_child_fragment_cost_defined_in_directive_is_multiplied_by_values_from_l
             extensions={"cost": {"requestedQueryCost": 20, "maximumAvailable": 3}},
         )
     ]
+
+
+def test_operation_cost_is_computed_without_limit(schema_with_costs):
+    query = """
+        fragment child on Child {
+          online
+        }
+        query Child($value: Int!) {
+          child(value: $value) {
+            ...child
+          }
+        }
+    """
+    operation, fragment = parse(query).definitions[::-1]
+    assert (
+        get_operation_cost(
+            schema_with_costs, operation, {"child": fragment}, variables={"value": 5}
+        )
+        == 20
+    )
+
+
+def test_operation_cost_is_computed_using_cost_map(schema):
+    (operation,) = parse("{ child(value: 5) { name } }").definitions
+    assert get_operation_cost(schema, operation, cost_map=cost_map) == 5
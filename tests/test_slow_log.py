@@ -0,0 +1,87 @@
+from ariadne import QueryType, graphql_sync, make_executable_schema
+from ariadne.contrib.tracing.memory import MemoryStats
+from ariadne.extensions import ExtensionManager
+from ariadne.slow_log import SlowOperationExtension, SlowOperationLog
+
+type_defs = """
+    type Query {
+        items: [Item!]!
+    }
+
+    type Item {
+        id: Int!
+    }
+"""
+
+query_type = QueryType()
+
+
+@query_type.field("items")
+def resolve_items(*_):
+    return [{"id": i} for i in range(5)]
+
+
+schema = make_executable_schema(type_defs, query_type)
+
+
+def execute(slow_log, query):
+    extension_manager = ExtensionManager([slow_log.extension])
+    graphql_sync(schema, {"query": query}, extension_manager=extension_manager)
+    return extension_manager
+
+
+def test_slow_operation_log_returns_entry_for_slow_operation():
+    slow_log = SlowOperationLog(latency_threshold=0, non_blocking=False)
+    extension_manager = execute(slow_log, "{ items { id } }")
+    entry = slow_log.finish(extension_manager, 100)
+    assert entry
+    assert entry.signature == "{ items { id } }"
+    assert entry.resolvers == 6
+    assert entry.response_size == 100
+
+
+def test_slow_operation_log_skips_operation_below_thresholds():
+    slow_log = SlowOperationLog(latency_threshold=10, resolver_threshold=10)
+    extension_manager = execute(slow_log, "{ items { id } }")
+    assert slow_log.finish(extension_manager, 100) is None
+
+
+def test_slow_operation_log_skips_requests_without_extension():
+    slow_log = SlowOperationLog(latency_threshold=0)
+    assert slow_log.finish(None, 100) is None
+    assert slow_log.finish(ExtensionManager(), 100) is None
+
+
+def test_extension_keeps_only_top_slowest_fields():
+    slow_log = SlowOperationLog(
+        latency_threshold=0, top_fields=2, trace_default_resolver=True
+    )
+    extension_manager = execute(slow_log, "{ items { id } }")
+    (extension,) = extension_manager.extensions
+    assert isinstance(extension, SlowOperationExtension)
+
+    fields = extension.get_slowest_fields()
+    assert len(fields) == 2
+    assert fields[0][0] >= fields[1][0]
+
+
+def test_slow_operation_entry_includes_operation_without_execution():
+    slow_log = SlowOperationLog(latency_threshold=0, non_blocking=False)
+    extension_manager = execute(slow_log, "{ unknown }")
+    entry = slow_log.finish(extension_manager, 10)
+    assert entry
+    assert entry.signature is None
+    assert entry.errors == 1
+    assert "validation" in entry.phases
+
+
+def test_slow_operation_entry_includes_memory_stats():
+    memory_stats = MemoryStats()
+    memory_stats.observe("{ items { id } }", None, 2048, 1024, [])
+
+    slow_log = SlowOperationLog(
+        latency_threshold=0, non_blocking=False, memory_stats=memory_stats
+    )
+    entry = slow_log.finish(execute(slow_log, "{ items { id } }"), 10)
+    assert entry
+    assert entry.memory == {"peak": 2048, "net": 1024}
@@ -0,0 +1,144 @@
+import threading
+from contextvars import ContextVar
+
+import pytest
+
+from ariadne import InterfaceType, QueryType, graphql, make_executable_schema
+from ariadne.threads import (
+    BlockingDirective,
+    ResolverThreadPool,
+    blocking_directive,
+    is_field_threaded,
+)
+
+type_defs = """
+    type Query {
+        blocking: String!
+        marked: String!
+        sync: String!
+        asyncField: String!
+        default: String!
+    }
+"""
+
+request_id: ContextVar[str] = ContextVar("request_id", default="")
+
+
+def get_thread_name(*_):
+    return threading.current_thread().name
+
+
+@pytest.fixture
+def schema():
+    query_type = QueryType()
+    query_type.set_field("blocking", get_thread_name, threaded=True)
+    query_type.set_field("sync", get_thread_name)
+
+    @query_type.field("marked", threaded=True)
+    def resolve_marked(*_):
+        return f"{request_id.get()} {threading.current_thread().name}"
+
+    @query_type.field("asyncField", threaded=True)
+    async def resolve_async_field(*_):
+        return threading.current_thread().name
+
+    return make_executable_schema(type_defs, query_type)
+
+
+@pytest.fixture
+def pool():
+    pool = ResolverThreadPool(max_threads=2)
+    yield pool
+    pool.shutdown()
+
+
+def test_object_type_marks_threaded_fields(schema):
+    fields = schema.query_type.fields
+    assert is_field_threaded(fields["blocking"])
+    assert is_field_threaded(fields["marked"])
+    assert not is_field_threaded(fields["sync"])
+
+
+def test_set_field_without_threaded_option_unmarks_field():
+    query_type = QueryType()
+    query_type.set_field("blocking", get_thread_name, threaded=True)
+    query_type.set_field("blocking", get_thread_name)
+    schema = make_executable_schema(type_defs, query_type)
+    assert not is_field_threaded(schema.query_type.fields["blocking"])
+
+
+def test_interface_type_marks_threaded_fields_of_implementing_types():
+    node_type = InterfaceType("Node")
+    node_type.set_field("id", get_thread_name, threaded=True)
+    schema = make_executable_schema(
+        """
+        type Query { node: Node }
+        interface Node { id: ID! }
+        type User implements Node { id: ID! }
+        """,
+        node_type,
+    )
+    assert is_field_threaded(schema.type_map["User"].fields["id"])
+
+
+def test_blocking_directive_marks_field():
+    schema = make_executable_schema(
+        [blocking_directive, "type Query { blocking: String @blocking, sync: String }"],
+        directives={"blocking": BlockingDirective},
+    )
+    assert is_field_threaded(schema.query_type.fields["blocking"])
+    assert not is_field_threaded(schema.query_type.fields["sync"])
+
+
+@pytest.mark.asyncio
+async def test_threaded_sync_resolvers_are_run_in_pool(schema, pool):
+    _, result = await graphql(
+        schema,
+        {"query": "{ blocking sync asyncField }"},
+        extensions=[pool.extension],
+    )
+    main_thread = threading.current_thread().name
+    assert result["data"]["blocking"].startswith("ariadne-resolver")
+    assert result["data"]["sync"] == main_thread
+    assert result["data"]["asyncField"] == main_thread
+
+
+@pytest.mark.asyncio
+async def test_context_variables_are_copied_to_pool_threads(schema, pool):
+    request_id.set("req-1")
+    _, result = await graphql(
+        schema, {"query": "{ marked }"}, extensions=[pool.extension]
+    )
+    assert result["data"]["marked"].startswith("req-1 ariadne-resolver")
+
+
+@pytest.mark.asyncio
+async def test_all_sync_resolvers_are_run_in_pool_if_policy_is_set(schema):
+    pool = ResolverThreadPool(offload_sync_resolvers=True)
+    try:
+        _, result = await graphql(
+            schema,
+            {"query": "{ sync default }"},
+            root_value={"default": "value"},
+            extensions=[pool.extension],
+        )
+    finally:
+        pool.shutdown()
+
+    assert result["data"]["sync"].startswith("ariadne-resolver")
+    assert result["data"]["default"] == "value"
+
+
+@pytest.mark.asyncio
+async def test_errors_raised_in_pool_threads_are_reported(pool):
+    query_type = QueryType()
+
+    @query_type.field("blocking", threaded=True)
+    def resolve_blocking(*_):
+        raise ValueError("Failed in thread")
+
+    schema = make_executable_schema("type Query { blocking: String }", query_type)
+    _, result = await graphql(
+        schema, {"query": "{ blocking }"}, extensions=[pool.extension]
+    )
+    assert result["errors"][0]["message"] == "Failed in thread"
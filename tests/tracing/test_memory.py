@@ -0,0 +1,149 @@
+import tracemalloc
+
+import pytest
+
+from ariadne import QueryType, graphql, graphql_sync, make_executable_schema
+from ariadne.contrib.tracing.memory import (
+    MemoryStats,
+    memory_profiling_extension,
+)
+from ariadne.contrib.tracing.metrics import GraphQLMetrics
+from ariadne.contrib.tracing.profiling import ProfilingRateLimit, profiling_extension
+
+retained = []
+
+
+@pytest.fixture
+def memory_schema():
+    query = QueryType()
+
+    @query.field("allocate")
+    def resolve_allocate(*_, size):
+        data = [bytearray(1024) for _ in range(size)]
+        retained.append(data)
+        return len(data)
+
+    @query.field("allocateAsync")
+    async def resolve_allocate_async(*_, size):
+        data = [bytearray(1024) for _ in range(size)]
+        retained.append(data)
+        return len(data)
+
+    yield make_executable_schema(
+        "type Query { allocate(size: Int!): Int!, allocateAsync(size: Int!): Int! }",
+        query,
+    )
+    retained.clear()
+
+
+def test_memory_is_not_profiled_for_requests_not_sampled(memory_schema, mocker):
+    mocker.patch("ariadne.contrib.tracing.memory.random", return_value=0.5)
+    stats = MemoryStats()
+    graphql_sync(
+        memory_schema,
+        {"query": "{ allocate(size: 10) }"},
+        extensions=[memory_profiling_extension(stats, sample_every=10)],
+    )
+    assert not stats.get_operations()
+    assert not tracemalloc.is_tracing()
+
+
+def test_memory_allocations_are_recorded_for_operation_signature(memory_schema):
+    stats = MemoryStats()
+    graphql_sync(
+        memory_schema,
+        {"query": "query Allocate { allocate(size: 500) }"},
+        extensions=[memory_profiling_extension(stats, sample_every=1)],
+    )
+    assert not tracemalloc.is_tracing()
+
+    operations = list(stats.get_operations().values())
+    assert len(operations) == 1
+
+    operation = operations[0]
+    assert operation.signature == "query Allocate { allocate(size: 0) }"
+    assert operation.operation_name == "Allocate"
+    assert operation.profiles == 1
+    assert operation.max_net >= 500 * 1024
+    assert operation.max_peak >= operation.max_net
+
+    top_site = operation.sites[0]
+    assert top_site.filename == __file__
+    assert top_site.field == "Query.allocate"
+    assert top_site.size >= 500 * 1024
+
+
+@pytest.mark.asyncio
+async def test_memory_allocations_are_attributed_to_async_resolvers(memory_schema):
+    stats = MemoryStats()
+    await graphql(
+        memory_schema,
+        {"query": "{ allocateAsync(size: 500) }"},
+        extensions=[memory_profiling_extension(stats, sample_every=1)],
+    )
+    (operation,) = stats.get_operations().values()
+    assert operation.sites[0].field == "Query.allocateAsync"
+
+
+def test_operations_with_same_signature_are_grouped(memory_schema):
+    stats = MemoryStats()
+    extension = memory_profiling_extension(stats, sample_every=1)
+    for size in (10, 20):
+        graphql_sync(
+            memory_schema,
+            {"query": f"{{ allocate(size: {size}) }}"},
+            extensions=[extension],
+        )
+    (operation,) = stats.get_operations().values()
+    assert operation.profiles == 2
+
+
+def test_memory_profiling_is_rate_limited(memory_schema):
+    stats = MemoryStats()
+    extension = memory_profiling_extension(
+        stats,
+        sample_every=1,
+        rate_limit=ProfilingRateLimit(max_profiles=1, period=60),
+    )
+    for _ in range(2):
+        graphql_sync(
+            memory_schema, {"query": "{ allocate(size: 1) }"}, extensions=[extension]
+        )
+    (operation,) = stats.get_operations().values()
+    assert operation.profiles == 1
+
+
+def test_memory_profiling_shares_rate_limit_with_profiling(memory_schema, tmp_path):
+    stats = MemoryStats()
+    rate_limit = ProfilingRateLimit(max_profiles=2, period=60)
+    extensions = [
+        profiling_extension(
+            output_dir=str(tmp_path), sample_every=1, rate_limit=rate_limit
+        ),
+        memory_profiling_extension(stats, sample_every=1, rate_limit=rate_limit),
+    ]
+    for _ in range(3):
+        graphql_sync(
+            memory_schema, {"query": "{ allocate(size: 1) }"}, extensions=extensions
+        )
+    assert len(list(tmp_path.glob("*/*.prof"))) == 2
+    assert not stats.get_operations()
+
+
+def test_memory_stats_are_rendered_in_prometheus_format(memory_schema):
+    stats = MemoryStats()
+    graphql_sync(
+        memory_schema,
+        {"query": "query Allocate { allocate(size: 10) }"},
+        extensions=[memory_profiling_extension(stats, sample_every=1)],
+    )
+
+    metrics = GraphQLMetrics()
+    metrics.track_memory(stats)
+    output = metrics.render_prometheus()
+
+    (key,) = stats.get_operations()
+    labels = f'signature="{key}",operation="Allocate"'
+    assert f"ariadne_operation_memory_profiles_total{{{labels}}} 1" in output
+    assert f"ariadne_operation_memory_peak_bytes{{{labels}}} " in output
+    assert f"ariadne_operation_memory_net_bytes{{{labels}}} " in output
@@ -0,0 +1,248 @@
+import gc
+from threading import Thread
+
+import pytest
+from starlette.testclient import TestClient
+from werkzeug.test import Client
+from werkzeug.wrappers import Response
+
+from ariadne import graphql, graphql_sync
+from ariadne.compression import ResponseCompression
+from ariadne.concurrency import ConcurrencyLimits
+from ariadne.contrib.tracing.metrics import (
+    GraphQLMetrics,
+    Histogram,
+    MetricsExtension,
+    PrometheusASGIApp,
+    PrometheusWSGIApp,
+    metrics_extension,
+)
+from ariadne.introspection import IntrospectionCache
+
+
+def test_histogram_counts_observations_in_buckets():
+    histogram = Histogram((10, 100))
+    histogram.observe(5)
+    histogram.observe(10)
+    histogram.observe(50)
+    histogram.observe(500)
+    assert histogram.counts == [2, 1, 1]
+    assert histogram.sum == 565
+    assert histogram.count == 4
+
+
+def test_metrics_extension_records_sync_resolvers(schema):
+    metrics = GraphQLMetrics()
+    _, result = graphql_sync(
+        schema,
+        {"query": '{ status hello(name: "Bob") }'},
+        extensions=[metrics_extension(metrics)],
+    )
+    assert result == {"data": {"hello": "Hello, Bob!", "status": True}}
+
+    histograms = metrics.get_field_histograms()
+    assert set(histograms) == {("Query", "status"), ("Query", "hello")}
+    assert histograms["Query", "status"].count == 1
+    assert metrics.get_phase_histograms()["request"].count == 1
+    assert metrics.get_requests() == (1, 0)
+
+
+@pytest.mark.asyncio
+async def test_metrics_extension_records_async_resolvers(async_schema):
+    metrics = GraphQLMetrics()
+    for _ in range(2):
+        await graphql(
+            async_schema,
+            {"query": '{ status hello(name: "Bob") }'},
+            extensions=[metrics_extension(metrics)],
+        )
+
+    histograms = metrics.get_field_histograms()
+    assert histograms["Query", "hello"].count == 2
+    assert histograms["Query", "status"].count == 2
+    assert metrics.get_requests() == (2, 0)
+
+
+def test_metrics_extension_counts_errors(schema):
+    metrics = GraphQLMetrics()
+    graphql_sync(
+        schema,
+        {"query": "{ testError }"},
+        extensions=[metrics_extension(metrics)],
+    )
+    assert metrics.get_field_errors() == {("Query", "testError"): 1}
+    assert metrics.get_requests() == (1, 1)
+
+
+@pytest.mark.asyncio
+async def test_metrics_extension_counts_async_errors(async_schema):
+    metrics = GraphQLMetrics()
+    await graphql(
+        async_schema,
+        {"query": "{ testError }"},
+        extensions=[metrics_extension(metrics)],
+    )
+    assert metrics.get_field_errors() == {("Query", "testError"): 1}
+
+
+def test_metrics_extension_skips_introspection_and_default_resolvers(schema):
+    metrics = GraphQLMetrics()
+    graphql_sync(
+        schema,
+        {"query": "{ __typename __schema { queryType { name } } }"},
+        extensions=[metrics_extension(metrics)],
+    )
+    assert metrics.get_field_histograms() == {}
+
+
+def test_metrics_extension_can_record_default_resolvers(schema):
+    metrics = GraphQLMetrics()
+    graphql_sync(
+        schema,
+        {"query": "{ testRoot }"},
+        root_value={"testRoot": "root"},
+        extensions=[
+            lambda: MetricsExtension(metrics=metrics, trace_default_resolver=True)
+        ],
+    )
+    assert ("Query", "testRoot") in metrics.get_field_histograms()
+
+
+def test_metrics_are_merged_from_all_threads():
+    metrics = GraphQLMetrics()
+
+    def observe():
+        for _ in range(100):
+            metrics.observe_field(("Query", "hello"), 1000, False)
+
+    threads = [Thread(target=observe) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert metrics.get_field_histograms()["Query", "hello"].count == 400
+
+
+def test_shards_of_finished_threads_are_merged():
+    metrics = GraphQLMetrics()
+
+    def observe():
+        metrics.observe_field(("Query", "hello"), 1000, True)
+        metrics.observe_request(1000, 1)
+
+    for _ in range(10):
+        thread = Thread(target=observe)
+        thread.start()
+        thread.join()
+    gc.collect()
+
+    assert len(metrics._shards) == 1
+    assert metrics.get_field_histograms()["Query", "hello"].count == 10
+    assert metrics.get_field_errors() == {("Query", "hello"): 10}
+    assert metrics.get_requests() == (10, 10)
+
+
+def test_metrics_are_rendered_in_prometheus_format(snapshot):
+    metrics = GraphQLMetrics(buckets=[0.001, 0.01])
+    metrics.observe_field(("Query", "hello"), 500_000, False)
+    metrics.observe_field(("Query", "hello"), 5_000_000, True)
+    metrics.observe_request(20_000_000, 1)
+
+    assert metrics.render_prometheus() == snapshot
+
+
+def test_introspection_cache_stats_are_rendered():
+    cache = IntrospectionCache()
+    cache.hits = 3
+    cache.misses = 1
+    metrics = GraphQLMetrics()
+    metrics.track_introspection_cache(cache)
+
+    output = metrics.render_prometheus()
+    assert 'ariadne_cache_hits_total{cache="introspection"} 3\n' in output
+    assert 'ariadne_cache_misses_total{cache="introspection"} 1\n' in output
+
+
+def test_compression_stats_are_rendered():
+    compression = ResponseCompression(encodings=["gzip"], levels={"gzip": 5})
+    compression.compress(b"a" * 1000, "gzip")
+    metrics = GraphQLMetrics()
+    metrics.track_compression(compression)
+
+    output = metrics.render_prometheus()
+    assert (
+        'ariadne_compression_input_bytes_total{encoding="gzip",level="5"} 1000\n'
+        in output
+    )
+
+
+def test_concurrency_stats_are_rendered():
+    limits = ConcurrencyLimits(global_limit=10)
+    stats = limits.get_stats("global", 10)
+    stats.active = 10
+    stats.waiting = 2
+    stats.max_waiting = 5
+    stats.waited = 7
+    stats.wait_time = 0.5
+    metrics = GraphQLMetrics()
+    metrics.track_concurrency(limits)
+
+    output = metrics.render_prometheus()
+    assert "# TYPE ariadne_concurrency_waiting gauge\n" in output
+    assert 'ariadne_concurrency_limit{limit="global"} 10\n' in output
+    assert 'ariadne_concurrency_active{limit="global"} 10\n' in output
+    assert 'ariadne_concurrency_waiting{limit="global"} 2\n' in output
+    assert 'ariadne_concurrency_max_waiting{limit="global"} 5\n' in output
+    assert 'ariadne_concurrency_waited_total{limit="global"} 7\n' in output
+    assert 'ariadne_concurrency_wait_seconds_total{limit="global"} 0.5\n' in output
+
+
+def test_prometheus_asgi_app_returns_metrics():
+    metrics = GraphQLMetrics()
+    metrics.observe_request(1000, 0)
+    client = TestClient(PrometheusASGIApp(metrics))
+    response = client.get("/")
+    assert response.status_code == 200
+    assert response.headers["Content-Type"].startswith("text/plain; version=0.0.4")
+    assert response.text == metrics.render_prometheus()
+
+
+def test_prometheus_wsgi_app_returns_metrics():
+    metrics = GraphQLMetrics()
+    metrics.observe_request(1000, 0)
+    client = Client(PrometheusWSGIApp(metrics), Response)
+    response = client.get("/")
+    assert response.status_code == 200
+    assert response.headers["Content-Type"].startswith("text/plain; version=0.0.4")
+    assert response.text == metrics.render_prometheus()
+
+
+def test_metrics_are_exported_to_opentelemetry(mocker):
+    meter = mocker.Mock()
+    metrics = GraphQLMetrics()
+    metrics.observe_field(("Query", "hello"), 2_000_000_000, True)
+    metrics.export_to_opentelemetry(meter)
+
+    callbacks = {
+        call.args[0]: call.kwargs["callbacks"][0]
+        for call in meter.create_observable_counter.call_args_list
+    }
+    (duration,) = callbacks["ariadne.field.duration"](None)
+    assert duration.value == 2.0
+    assert duration.attributes == {"graphql.type": "Query", "graphql.field": "hello"}
+    (errors,) = callbacks["ariadne.field.errors"](None)
+    assert errors.value == 1
+
+
+def test_metrics_extension_records_request_phases(schema):
+    metrics = GraphQLMetrics()
+    graphql_sync(
+        schema, {"query": "{ status }"}, extensions=[metrics_extension(metrics)]
+    )
+    assert set(metrics.get_phase_histograms()) == {
+        "request",
+        "parsing",
+        "validation",
+        "execution",
+    }
@@ -5,7 +5,13 @@ import pytest
 from graphql import get_introspection_query
 from starlette.datastructures import UploadFile
 
-from ariadne import graphql, graphql_sync
+from ariadne import (
+    ObjectType,
+    QueryType,
+    graphql,
+    graphql_sync,
+    make_executable_schema,
+)
 from ariadne.contrib.tracing.opentelemetry import (
     OpenTelemetryExtension,
     copy_args_for_tracing,
@@ -393,3 +399,203 @@ def test_resolver_args_with_uploaded_files_from_wsgi_are_copied_for_tracing():
             ],
         },
     } == result
+
+
+@pytest.mark.asyncio
+async def test_opentelemetry_extension_skips_spans_for_unsampled_request(
+    schema, get_tracer_mock
+):
+    _, result = await graphql(
+        schema,
+        {"query": '{ status hello(name: "Bob") }'},
+        extensions=[opentelemetry_extension(sampler=0.0)],
+    )
+    assert result == {"data": {"hello": "Hello, Bob!", "status": True}}
+    get_tracer_mock.return_value.start_span.assert_not_called()
+    get_tracer_mock.return_value.start_as_current_span.assert_not_called()
+
+
+def test_opentelemetry_extension_creates_spans_for_sampled_request(
+    schema, get_tracer_mock
+):
+    graphql_sync(
+        schema,
+        {"query": "{ status }"},
+        extensions=[opentelemetry_extension(sampler=1.0)],
+    )
+    get_tracer_mock.return_value.start_span.assert_called_once_with(
+        "GraphQL Operation", context=None
+    )
+    get_tracer_mock.return_value.start_as_current_span.assert_any_call(
+        "status", context=ANY
+    )
+
+
+def test_opentelemetry_extension_calls_sampler_with_context(schema, get_tracer_mock):
+    sampled_contexts = []
+
+    def sampler(context):
+        sampled_contexts.append(context)
+        return False
+
+    graphql_sync(
+        schema,
+        {"query": "{ status }"},
+        context_value={"sample": False},
+        extensions=[opentelemetry_extension(sampler=sampler)],
+    )
+    assert sampled_contexts == [{"sample": False}]
+    get_tracer_mock.return_value.start_span.assert_not_called()
+
+
+def test_opentelemetry_extension_drops_fast_successful_request_in_tail_sampling(
+    schema, get_tracer_mock
+):
+    graphql_sync(
+        schema,
+        {"query": "{ status }"},
+        extensions=[opentelemetry_extension(latency_threshold=60)],
+    )
+    get_tracer_mock.return_value.start_span.assert_not_called()
+    get_tracer_mock.return_value.start_as_current_span.assert_not_called()
+
+
+def test_opentelemetry_extension_keeps_slow_request_in_tail_sampling(
+    schema, get_tracer_mock
+):
+    graphql_sync(
+        schema,
+        {"query": '{ status hello(name: "Bob") }'},
+        extensions=[opentelemetry_extension(latency_threshold=0)],
+    )
+    start_span = get_tracer_mock.return_value.start_span
+    assert start_span.call_args_list == [
+        call("GraphQL Operation", context=None, start_time=ANY),
+        call("status", context=ANY, start_time=ANY),
+        call("hello", context=ANY, start_time=ANY),
+    ]
+    span = start_span.return_value
+    span.set_attribute.assert_any_call("graphql.path", "hello")
+    span.set_attribute.assert_any_call("graphql.arg[name]", "Bob")
+    assert span.end.call_count == 3
+    get_tracer_mock.return_value.start_as_current_span.assert_not_called()
+
+
+def test_opentelemetry_extension_keeps_failed_request_in_tail_sampling(
+    schema, get_tracer_mock
+):
+    graphql_sync(
+        schema,
+        {"query": "{ testError }"},
+        extensions=[opentelemetry_extension(tail_sampling=True)],
+    )
+    start_span = get_tracer_mock.return_value.start_span
+    assert start_span.call_args_list == [
+        call("GraphQL Operation", context=None, start_time=ANY),
+        call("testError", context=ANY, start_time=ANY),
+    ]
+    span = start_span.return_value
+    span.record_exception.assert_called_once()
+    assert span.set_status.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_opentelemetry_extension_records_async_resolvers_in_tail_sampling(
+    async_schema, get_tracer_mock
+):
+    _, result = await graphql(
+        async_schema,
+        {"query": '{ status hello(name: "Bob") }'},
+        extensions=[opentelemetry_extension(latency_threshold=0)],
+    )
+    assert result == {"data": {"hello": "Hello, Bob!", "status": True}}
+
+    start_span = get_tracer_mock.return_value.start_span
+    assert start_span.call_count == 3
+
+    root_start = start_span.call_args_list[0].kwargs["start_time"]
+    for end_call in start_span.return_value.end.call_args_list:
+        assert end_call.kwargs["end_time"] >= root_start
+
+
+@pytest.fixture
+def list_schema():
+    query = QueryType()
+    query.set_field("users", lambda *_: [{"id": i} for i in range(5)])
+
+    user = ObjectType("User")
+
+    @user.field("name")
+    def resolve_name(obj, *_):
+        if obj["id"] == 3:
+            raise ValueError("Invalid user")
+        return f"User {obj['id']}"
+
+    return make_executable_schema(
+        "type Query { users: [User!] } type User { id: ID!, name: String }",
+        [query, user],
+    )
+
+
+def test_opentelemetry_extension_aggregates_spans_of_list_items(
+    list_schema, get_tracer_mock
+):
+    _, result = graphql_sync(
+        list_schema,
+        {"query": "{ users { id name } }"},
+        extensions=[opentelemetry_extension(aggregate_lists=True)],
+    )
+    assert len(result["data"]["users"]) == 5
+
+    tracer = get_tracer_mock.return_value
+    assert tracer.start_as_current_span.call_args_list == [
+        call("users", context=ANY),
+        call("resolve sync", context=ANY),
+    ]
+    assert tracer.start_span.call_args_list == [
+        call("GraphQL Operation", context=None),
+        call("name", context=ANY, start_time=ANY),
+    ]
+
+    span = tracer.start_span.return_value
+    span.set_attribute.assert_any_call("graphql.path", "users.[].name")
+    span.set_attribute.assert_any_call("graphql.count", 5)
+    span.record_exception.assert_called_once()
+
+    attributes = {
+        attr_call.args[0]: attr_call.args[1]
+        for attr_call in span.set_attribute.call_args_list
+    }
+    assert (
+        attributes["graphql.duration.min"]
+        <= attributes["graphql.duration.max"]
+        <= attributes["graphql.duration.total"]
+    )
+
+
+@pytest.mark.asyncio
+async def test_opentelemetry_extension_aggregates_spans_of_list_items_in_async_context(
+    list_schema, get_tracer_mock
+):
+    await graphql(
+        list_schema,
+        {"query": "{ users { name } }"},
+        extensions=[opentelemetry_extension(aggregate_lists=True)],
+    )
+    span = get_tracer_mock.return_value.start_span.return_value
+    span.set_attribute.assert_any_call("graphql.count", 5)
+
+
+def test_opentelemetry_extension_aggregates_spans_of_list_items_in_tail_sampling(
+    list_schema, get_tracer_mock
+):
+    graphql_sync(
+        list_schema,
+        {"query": "{ users { name } }"},
+        extensions=[opentelemetry_extension(aggregate_lists=True, tail_sampling=True)],
+    )
+    assert get_tracer_mock.return_value.start_span.call_args_list == [
+        call("GraphQL Operation", context=None, start_time=ANY),
+        call("users", context=ANY, start_time=ANY),
+        call("name", context=ANY, start_time=ANY),
+    ]
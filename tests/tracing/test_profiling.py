@@ -0,0 +1,150 @@
+import pstats
+
+import pytest
+from graphql import parse
+
+from ariadne import graphql, graphql_sync
+from ariadne.contrib.tracing.profiling import (
+    ProfilingRateLimit,
+    SamplingProfiler,
+    profiling_extension,
+)
+from ariadne.contrib.tracing.utils import (
+    create_debug_token,
+    get_operation_signature,
+    get_signature_hash,
+)
+
+
+def get_signature(query: str, operation_name: str | None = None) -> str:
+    document = parse(query)
+    fragments = {}
+    operations = {}
+    for definition in document.definitions:
+        if definition.kind == "fragment_definition":
+            fragments[definition.name.value] = definition
+        else:
+            name = definition.name.value if definition.name else None
+            operations[name] = definition
+    return get_operation_signature(operations[operation_name], fragments)
+
+
+def test_operation_signature_hides_literals_and_aliases():
+    assert get_signature('{ greeting: hello(name: "Bob", times: [1, 2]) }') == (
+        '{ hello(name: "", times: []) }'
+    )
+
+
+def test_operation_signature_sorts_fields_and_arguments():
+    assert get_signature("query Q { b(y: 1, x: 2) a { d c } }", "Q") == (
+        "query Q { a { c d } b(x: 0, y: 0) }"
+    )
+
+
+def test_operation_signature_includes_only_used_fragments():
+    signature = get_signature(
+        """
+        query Q { user { ...UserFields } }
+        fragment Unused on User { id }
+        fragment UserFields on User { name ...Nested }
+        fragment Nested on User { email }
+        """,
+        "Q",
+    )
+    assert signature == (
+        "query Q { user { ...UserFields } } "
+        "fragment Nested on User { email } "
+        "fragment UserFields on User { name ...Nested }"
+    )
+
+
+def test_signature_hash_is_same_for_equivalent_operations():
+    assert get_signature_hash(get_signature("{ a b }")) == get_signature_hash(
+        get_signature("{\n  b\n  a\n}")
+    )
+
+
+def get_profiles(tmp_path, suffix):
+    return list(tmp_path.glob(f"*/*{suffix}"))
+
+
+def test_request_is_not_profiled_by_default(tmp_path, schema):
+    graphql_sync(
+        schema,
+        {"query": "{ status }"},
+        extensions=[profiling_extension(output_dir=str(tmp_path))],
+    )
+    assert not list(tmp_path.iterdir())
+
+
+def test_sampled_request_is_profiled_with_cprofile(tmp_path, schema):
+    graphql_sync(
+        schema,
+        {"query": '{ hello(name: "Bob") }'},
+        extensions=[profiling_extension(output_dir=str(tmp_path), sample_every=1)],
+    )
+    profiles = get_profiles(tmp_path, ".prof")
+    assert len(profiles) == 1
+    assert pstats.Stats(str(profiles[0])).total_calls > 0
+
+    signature_path = profiles[0].parent / "signature.graphql"
+    assert signature_path.read_text() == '{ hello(name: "") }'
+    assert profiles[0].parent.name == get_signature_hash('{ hello(name: "") }')[:16]
+
+
+@pytest.mark.asyncio
+async def test_request_with_signed_header_is_profiled(tmp_path, async_schema):
+    await graphql(
+        async_schema,
+        {"query": "{ status }"},
+        context_value={"request": {"HTTP_X_ARIADNE_PROFILE": create_debug_token("s")}},
+        extensions=[profiling_extension(output_dir=str(tmp_path), secret="s")],
+    )
+    assert len(get_profiles(tmp_path, ".prof")) == 1
+
+
+def test_request_is_profiled_with_sampling_profiler(tmp_path, schema):
+    graphql_sync(
+        schema,
+        {"query": "{ status }"},
+        extensions=[
+            profiling_extension(
+                output_dir=str(tmp_path),
+                sample_every=1,
+                profiler=lambda: SamplingProfiler(interval=0.0001),
+            )
+        ],
+    )
+    assert len(get_profiles(tmp_path, ".folded")) == 1
+
+
+def test_profiled_requests_are_rate_limited(tmp_path, schema):
+    extension = profiling_extension(
+        output_dir=str(tmp_path),
+        rate_limit=ProfilingRateLimit(max_profiles=2, period=60),
+        sample_every=1,
+    )
+    for _ in range(3):
+        graphql_sync(schema, {"query": "{ status }"}, extensions=[extension])
+    assert len(get_profiles(tmp_path, ".prof")) == 2
+
+
+def test_rate_limit_allows_single_profile_at_time():
+    rate_limit = ProfilingRateLimit()
+    assert rate_limit.acquire()
+    assert not rate_limit.acquire()
+    rate_limit.release()
+    assert rate_limit.acquire()
+
+
+def test_rate_limit_allows_profiles_after_period(mocker):
+    monotonic = mocker.patch(
+        "ariadne.contrib.tracing.profiling.monotonic", return_value=100.0
+    )
+    rate_limit = ProfilingRateLimit(max_profiles=1, period=10)
+    assert rate_limit.acquire()
+    rate_limit.release()
+    assert not rate_limit.acquire()
+
+    monotonic.return_value = 111.0
+    assert rate_limit.acquire()
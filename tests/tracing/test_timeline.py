@@ -0,0 +1,155 @@
+import asyncio
+import json
+
+import pytest
+
+from ariadne import QueryType, graphql, graphql_sync, make_executable_schema
+from ariadne.contrib.tracing.timeline import (
+    TimelineExtension,
+    timeline_extension,
+    timeline_span,
+)
+from ariadne.contrib.tracing.utils import create_debug_token, verify_debug_token
+
+
+@pytest.fixture
+def timeline_schema():
+    query = QueryType()
+
+    @query.field("first")
+    async def resolve_first(*_):
+        await asyncio.sleep(0.01)
+        return "first"
+
+    @query.field("second")
+    async def resolve_second(*_):
+        with timeline_span("UserLoader", "dataloader"):
+            await asyncio.sleep(0.01)
+        return "second"
+
+    @query.field("sync")
+    def resolve_sync(*_):
+        return "sync"
+
+    return make_executable_schema(
+        "type Query { first: String, second: String, sync: String }", query
+    )
+
+
+def read_timeline(tmp_path):
+    files = list(tmp_path.iterdir())
+    assert len(files) == 1
+    with open(files[0], encoding="utf-8") as fp:
+        return files[0].name, json.load(fp)
+
+
+def test_timeline_is_not_recorded_by_default(tmp_path, timeline_schema):
+    graphql_sync(
+        timeline_schema,
+        {"query": "{ sync }"},
+        extensions=[timeline_extension(output_dir=str(tmp_path))],
+    )
+    assert not tmp_path.exists() or not list(tmp_path.iterdir())
+
+
+def test_timeline_is_recorded_for_sampled_request(tmp_path, timeline_schema):
+    graphql_sync(
+        timeline_schema,
+        {"query": "query Test { sync }"},
+        extensions=[timeline_extension(output_dir=str(tmp_path), sampler=1)],
+    )
+    file_name, data = read_timeline(tmp_path)
+    assert file_name.endswith(".json")
+    assert "-Test-" in file_name
+
+    events = [event for event in data["traceEvents"] if event["ph"] == "X"]
+    assert [event["name"] for event in events] == ["request", "Query.sync"]
+    assert events[1]["args"] == {"path": "sync", "kind": "sync"}
+
+
+@pytest.mark.asyncio
+async def test_timeline_is_recorded_for_request_with_signed_header(
+    tmp_path, timeline_schema
+):
+    headers = {"HTTP_X_ARIADNE_TIMELINE": create_debug_token("secret")}
+    await graphql(
+        timeline_schema,
+        {"query": "{ first second }"},
+        context_value={"request": headers},
+        extensions=[timeline_extension(output_dir=str(tmp_path), secret="secret")],
+    )
+    _, data = read_timeline(tmp_path)
+    events = {
+        event["name"]: event for event in data["traceEvents"] if event["ph"] == "X"
+    }
+    assert set(events) == {"request", "Query.first", "Query.second", "UserLoader"}
+
+    first = events["Query.first"]
+    assert first["args"]["kind"] == "async"
+    assert first["args"]["awaiting_ns"] > first["args"]["running_ns"]
+
+    # Concurrent resolvers are put in separate lanes
+    assert first["tid"] != events["Query.second"]["tid"]
+    assert events["UserLoader"]["cat"] == "dataloader"
+    assert events["UserLoader"]["tid"] == events["Query.second"]["tid"]
+
+
+def test_timeline_is_not_recorded_for_request_with_invalid_token(
+    tmp_path, timeline_schema
+):
+    headers = {"HTTP_X_ARIADNE_TIMELINE": create_debug_token("other")}
+    graphql_sync(
+        timeline_schema,
+        {"query": "{ sync }"},
+        context_value={"request": headers},
+        extensions=[timeline_extension(output_dir=str(tmp_path), secret="secret")],
+    )
+    assert not tmp_path.exists() or not list(tmp_path.iterdir())
+
+
+@pytest.mark.asyncio
+async def test_timeline_is_written_in_speedscope_format(tmp_path, timeline_schema):
+    await graphql(
+        timeline_schema,
+        {"query": "{ first second }"},
+        extensions=[
+            timeline_extension(
+                output_dir=str(tmp_path), output_format="speedscope", sampler=1
+            )
+        ],
+    )
+    file_name, data = read_timeline(tmp_path)
+    assert file_name.endswith(".speedscope.json")
+
+    frames = [frame["name"] for frame in data["shared"]["frames"]]
+    assert set(frames) == {"request", "Query.first", "Query.second", "UserLoader"}
+    for profile in data["profiles"]:
+        assert profile["unit"] == "nanoseconds"
+        events = profile["events"]
+        assert [event["at"] for event in events] == sorted(
+            event["at"] for event in events
+        )
+        assert sum(1 if event["type"] == "O" else -1 for event in events) == 0
+
+
+def test_timeline_extension_raises_error_for_unsupported_format(tmp_path):
+    with pytest.raises(ValueError):
+        TimelineExtension(output_dir=str(tmp_path), output_format="pprof")
+
+
+def test_timeline_span_does_nothing_outside_of_recorded_request():
+    with timeline_span("test"):
+        pass
+
+
+def test_debug_token_is_verified_with_secret():
+    token = create_debug_token("secret")
+    assert verify_debug_token("secret", token)
+    assert not verify_debug_token("other", token)
+    assert not verify_debug_token("secret", None)
+    assert not verify_debug_token("secret", "invalid")
+
+
+def test_expired_debug_token_is_not_verified():
+    token = create_debug_token("secret", expires_in=-10)
+    assert not verify_debug_token("secret", token)
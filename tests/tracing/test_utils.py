@@ -1,7 +1,12 @@
 from unittest.mock import Mock
 
+from graphql import ResponsePath
+
+from ariadne import QueryType, make_executable_schema
 from ariadne.contrib.tracing.utils import (
+    format_aggregated_path,
     format_path,
+    get_traced_fields,
     is_introspection_field,
     should_trace,
 )
@@ -76,3 +81,39 @@ def test_field_with_custom_resolver_is_included_in_tracing():
         parent_type=Mock(fields={"name": Mock(resolve=True)}),
     )
     assert should_trace(info)
+
+
+def test_util_formats_path_of_list_item_field_with_indexes_replaced():
+    path = ResponsePath(
+        ResponsePath(ResponsePath(None, "users", "User"), 2, None), "name", "User"
+    )
+    assert format_aggregated_path(path) == "users.[].name"
+
+
+def test_util_returns_none_for_aggregated_path_of_field_outside_list():
+    path = ResponsePath(ResponsePath(None, "user", "User"), "name", "User")
+    assert format_aggregated_path(path) is None
+
+
+def get_test_schema():
+    query = QueryType()
+    query.set_field("hello", lambda *_: "Hello!")
+    return make_executable_schema(
+        "type Query { hello: String, status: Boolean }", query
+    )
+
+
+def test_traced_fields_exclude_default_resolvers_and_introspection_types():
+    traced_fields = get_traced_fields(get_test_schema())
+    assert traced_fields["Query"] == frozenset(["hello"])
+    assert "__Type" not in traced_fields
+
+
+def test_traced_fields_include_default_resolvers_when_set():
+    traced_fields = get_traced_fields(get_test_schema(), True)
+    assert traced_fields["Query"] == frozenset(["hello", "status"])
+
+
+def test_traced_fields_are_computed_once_per_schema():
+    schema = get_test_schema()
+    assert get_traced_fields(schema) is get_traced_fields(schema)
@@ -0,0 +1,73 @@
+import pytest
+from werkzeug.test import Client
+from werkzeug.wrappers import Response
+
+from ariadne.codecs import CBORCodec, MessagePackCodec
+from ariadne.http_cache import HttpCache
+from ariadne.wsgi import GraphQL
+
+msgpack = pytest.importorskip("msgpack")
+cbor2 = pytest.importorskip("cbor2")
+
+
+@pytest.fixture
+def client(schema):
+    app = GraphQL(
+        schema,
+        codecs=[MessagePackCodec(), CBORCodec()],
+        execute_get_queries=True,
+        http_cache=HttpCache(),
+    )
+    return Client(app, Response)
+
+
+def test_msgpack_request_is_answered_with_msgpack(client):
+    response = client.post(
+        "/",
+        data=msgpack.packb({"query": '{ hello(name: "Bob") }'}),
+        content_type="application/msgpack",
+    )
+    assert response.status_code == 200
+    assert response.headers["Content-Type"] == "application/msgpack"
+    assert response.headers["Vary"] == "Accept"
+    assert msgpack.unpackb(response.data) == {"data": {"hello": "Hello, Bob!"}}
+
+
+def test_json_request_is_answered_with_accepted_cbor(client):
+    response = client.post(
+        "/", json={"query": "{ status }"}, headers={"Accept": "application/cbor"}
+    )
+    assert response.headers["Content-Type"] == "application/cbor"
+    assert cbor2.loads(response.data) == {"data": {"status": True}}
+
+
+def test_json_response_varies_by_accept_header(client):
+    response = client.post("/", json={"query": "{ status }"})
+    assert response.headers["Vary"] == "Accept"
+    assert response.json == {"data": {"status": True}}
+
+
+def test_invalid_binary_request_returns_bad_request(client):
+    response = client.post("/", data=b"\xc1", content_type="application/msgpack")
+    assert response.status_code == 400
+    assert response.text == "Request body is not a valid application/msgpack"
+
+
+def test_get_query_is_answered_with_cacheable_binary_response(client):
+    response = client.get(
+        "/",
+        query_string={"query": "{ status }"},
+        headers={"Accept": "application/msgpack"},
+    )
+    assert response.headers["Content-Type"] == "application/msgpack"
+    assert msgpack.unpackb(response.data) == {"data": {"status": True}}
+
+    response = client.get(
+        "/",
+        query_string={"query": "{ status }"},
+        headers={
+            "Accept": "application/msgpack",
+            "If-None-Match": response.headers["ETag"],
+        },
+    )
+    assert response.status_code == 304
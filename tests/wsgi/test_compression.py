@@ -0,0 +1,91 @@
+import gzip
+
+from werkzeug.test import Client
+from werkzeug.wrappers import Response
+
+from ariadne.compression import ResponseCompression
+from ariadne.http_cache import HttpCache
+from ariadne.wsgi import GraphQL
+
+long_name = "a" * 2000
+
+
+def create_client(schema, **kwargs):
+    app = GraphQL(schema, execute_get_queries=True, **kwargs)
+    return Client(app, Response)
+
+
+def test_json_response_is_compressed(schema):
+    client = create_client(schema, compression=ResponseCompression(encodings=["gzip"]))
+    response = client.post(
+        "/",
+        json={"query": f'{{ hello(name: "{long_name}") }}'},
+        headers={"Accept-Encoding": "gzip"},
+    )
+    assert response.status_code == 200
+    assert response.headers["Content-Encoding"] == "gzip"
+    assert response.headers["Vary"] == "Accept-Encoding"
+    assert gzip.decompress(response.data) == (
+        b'{"data": {"hello": "Hello, ' + long_name.encode() + b'!"}}'
+    )
+
+
+def test_small_json_response_is_not_compressed(schema):
+    client = create_client(schema, compression=ResponseCompression())
+    response = client.post(
+        "/", json={"query": "{ status }"}, headers={"Accept-Encoding": "gzip"}
+    )
+    assert "Content-Encoding" not in response.headers
+    assert response.json == {"data": {"status": True}}
+
+
+def test_json_response_is_not_compressed_by_default(schema):
+    client = create_client(schema)
+    response = client.post(
+        "/", json={"query": "{ status }"}, headers={"Accept-Encoding": "gzip"}
+    )
+    assert "Content-Encoding" not in response.headers
+    assert "Vary" not in response.headers
+
+
+def test_explorer_html_is_compressed(schema):
+    client = create_client(schema, compression=ResponseCompression(encodings=["gzip"]))
+    response = client.get("/", headers={"Accept-Encoding": "gzip"})
+    assert response.headers["Content-Encoding"] == "gzip"
+    assert b"<html" in gzip.decompress(response.data).lower()
+
+
+def test_cached_introspection_is_compressed(schema):
+    client = create_client(
+        schema,
+        compression=ResponseCompression(minimum_size=0, encodings=["gzip"]),
+        introspection_cache=True,
+    )
+    query = {"query": "{ __schema { queryType { name } } }"}
+    for _ in range(2):
+        response = client.post("/", json=query, headers={"Accept-Encoding": "gzip"})
+        assert response.headers["Content-Encoding"] == "gzip"
+
+
+def test_compressed_get_query_response_has_caching_headers(schema):
+    client = create_client(
+        schema,
+        compression=ResponseCompression(minimum_size=0, encodings=["gzip"]),
+        http_cache=HttpCache(vary=["Authorization"]),
+    )
+    response = client.get(
+        "/", query_string={"query": "{ status }"}, headers={"Accept-Encoding": "gzip"}
+    )
+    assert response.headers["Content-Encoding"] == "gzip"
+    assert response.headers["Vary"] == "Accept-Encoding, Authorization"
+
+    response = client.get(
+        "/",
+        query_string={"query": "{ status }"},
+        headers={
+            "Accept-Encoding": "gzip",
+            "If-None-Match": response.headers["ETag"],
+        },
+    )
+    assert response.status_code == 304
+    assert response.headers["Vary"] == "Accept-Encoding, Authorization"
@@ -396,6 +396,33 @@ def test_extensions_function_result_is_passed_to_query_executor(schema):
     assert response.json == {"data": {"hello": "hello, bob!"}}
 
 
+class SerializationExtension(Extension):
+    def __init__(self, calls):
+        self.calls = calls
+
+    def request_finished(self, context):
+        self.calls.append("request_finished")
+
+    def serialization_started(self, context):
+        self.calls.append("serialization_started")
+
+    def serialization_finished(self, context):
+        self.calls.append("serialization_finished")
+
+
+def test_serialization_hooks_are_called_by_server(schema):
+    calls = []
+    app = GraphQL(schema, extensions=[lambda: SerializationExtension(calls)])
+    client = TestClient(app)
+    response = client.post("/", json={"query": "{ status }"})
+    assert response.json == {"data": {"status": True}}
+    assert calls == [
+        "request_finished",
+        "serialization_started",
+        "serialization_finished",
+    ]
+
+
 def middleware(next_fn, *args, **kwargs):
     value = next_fn(*args, **kwargs)
     return f"**{value}**"
@@ -0,0 +1,40 @@
+import time
+
+from werkzeug.test import Client
+from werkzeug.wrappers import Response
+
+from ariadne import QueryType, make_executable_schema
+from ariadne.deadlines import OperationDeadlines
+from ariadne.wsgi import GraphQL
+
+query_type = QueryType()
+
+
+@query_type.field("slow")
+def resolve_slow(*_):
+    time.sleep(0.1)
+    return True
+
+
+@query_type.field("fast")
+def resolve_fast(*_):
+    return True
+
+
+schema = make_executable_schema(
+    "type Query { slow: Boolean fast: Boolean }", query_type
+)
+
+
+def test_fields_resolved_after_deadline_fail():
+    app = GraphQL(schema, operation_deadlines=OperationDeadlines(timeout=0.05))
+    response = Client(app, Response).post("/", json={"query": "{ slow fast }"})
+    assert response.json["data"] == {"slow": True, "fast": None}
+
+
+def test_timeout_from_header_is_used():
+    app = GraphQL(schema, operation_deadlines=OperationDeadlines())
+    response = Client(app, Response).post(
+        "/", json={"query": "{ slow fast }"}, headers={"X-Request-Timeout": "0.05"}
+    )
+    assert response.json["data"] == {"slow": True, "fast": None}
@@ -0,0 +1,59 @@
+import asyncio
+
+import pytest
+from werkzeug.test import Client
+from werkzeug.wrappers import Response
+
+from ariadne import QueryType, make_executable_schema
+from ariadne.event_loop import BackgroundEventLoop
+from ariadne.wsgi import GraphQL
+
+type_defs = """
+    type Query {
+        hello(name: String!): String!
+        sync: Boolean!
+        error: Boolean
+    }
+"""
+
+query_type = QueryType()
+
+
+@query_type.field("hello")
+async def resolve_hello(*_, name):
+    await asyncio.sleep(0)
+    return f"Hello, {name}!"
+
+
+@query_type.field("sync")
+def resolve_sync(*_):
+    return True
+
+
+@query_type.field("error")
+async def resolve_error(*_):
+    raise ValueError("Test error")
+
+
+schema = make_executable_schema(type_defs, query_type)
+
+
+@pytest.fixture
+def event_loop():
+    background_loop = BackgroundEventLoop()
+    yield background_loop
+    background_loop.stop()
+
+
+def test_async_resolvers_are_executed_in_event_loop(event_loop):
+    client = Client(GraphQL(schema, event_loop=event_loop), Response)
+    response = client.post("/", json={"query": '{ hello(name: "Bob") sync }'})
+    assert response.status_code == 200
+    assert response.json == {"data": {"hello": "Hello, Bob!", "sync": True}}
+
+
+def test_async_resolver_error_is_returned(event_loop):
+    client = Client(GraphQL(schema, event_loop=event_loop), Response)
+    response = client.post("/", json={"query": "{ error }"})
+    assert response.json["data"] == {"error": None}
+    assert response.json["errors"][0]["message"] == "Test error"
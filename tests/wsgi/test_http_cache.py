@@ -0,0 +1,99 @@
+from unittest.mock import Mock
+
+from werkzeug.test import Client
+from werkzeug.wrappers import Response
+
+from ariadne.compression import ResponseCompression
+from ariadne.http_cache import HttpCache
+from ariadne.wsgi import GraphQL
+
+
+def create_client(schema, **kwargs):
+    app = GraphQL(schema, execute_get_queries=True, **kwargs)
+    return Client(app, Response)
+
+
+def test_get_query_response_includes_caching_headers(schema):
+    client = create_client(
+        schema,
+        http_cache=HttpCache(cache_control="public, max-age=60", vary=["Accept"]),
+    )
+    response = client.get("/", query_string={"query": "{ status }"})
+    assert response.status_code == 200
+    assert response.json == {"data": {"status": True}}
+    assert response.headers["ETag"]
+    assert response.headers["Cache-Control"] == "public, max-age=60"
+    assert response.headers["Vary"] == "Accept"
+
+
+def test_not_modified_response_is_returned_for_matching_etag(schema):
+    client = create_client(schema, http_cache=HttpCache())
+    response = client.get("/", query_string={"query": "{ status }"})
+    etag = response.headers["ETag"]
+
+    response = client.get(
+        "/", query_string={"query": "{ status }"}, headers={"If-None-Match": etag}
+    )
+    assert response.status_code == 304
+    assert response.data == b""
+    assert response.headers["ETag"] == etag
+
+
+def test_full_response_is_returned_for_different_etag(schema):
+    client = create_client(schema, http_cache=HttpCache())
+    response = client.get(
+        "/", query_string={"query": "{ status }"}, headers={"If-None-Match": '"other"'}
+    )
+    assert response.status_code == 200
+    assert response.json == {"data": {"status": True}}
+
+
+def test_etag_computed_from_version_differs_for_compressed_response(schema):
+    client = create_client(
+        schema,
+        http_cache=HttpCache(version=lambda request, result: "v1"),
+        compression=ResponseCompression(minimum_size=0),
+    )
+    query = {"query": "{ status }"}
+    response = client.get("/", query_string=query, headers={"Accept-Encoding": "gzip"})
+    other_response = client.get(
+        "/", query_string=query, headers={"Accept-Encoding": "identity"}
+    )
+    assert response.headers["Content-Encoding"] == "gzip"
+    assert "Content-Encoding" not in other_response.headers
+    assert response.headers["ETag"] != other_response.headers["ETag"]
+
+
+def test_result_with_errors_is_not_cached(schema):
+    client = create_client(schema, http_cache=HttpCache())
+    response = client.get("/", query_string={"query": "{ testError }"})
+    assert "ETag" not in response.headers
+    assert response.headers["Cache-Control"] == "no-store"
+
+
+def test_post_query_response_has_no_caching_headers(schema):
+    client = create_client(schema, http_cache=HttpCache())
+    response = client.post("/", json={"query": "{ status }"})
+    assert "ETag" not in response.headers
+
+
+def test_cached_introspection_is_returned_with_caching_headers(schema):
+    client = create_client(schema, http_cache=HttpCache(), introspection_cache=True)
+    query = "{ __schema { queryType { name } } }"
+    etag = client.get("/", query_string={"query": query}).headers["ETag"]
+    response = client.get(
+        "/", query_string={"query": query}, headers={"If-None-Match": etag}
+    )
+    assert response.status_code == 304
+
+
+def test_cacheable_response_has_no_caching_headers_without_http_cache(schema):
+    app = GraphQL(schema)
+    start_response = Mock()
+    body = app.return_cacheable_response(
+        {}, start_response, (True, {"data": {"status": True}}), b'{"data":{}}'
+    )
+    assert body == [b'{"data":{}}']
+    status, headers = start_response.call_args[0]
+    assert status == "200 OK"
+    assert "ETag" not in dict(headers)
@@ -0,0 +1,89 @@
+import pytest
+from werkzeug.test import Client
+from werkzeug.wrappers import Response
+
+from ariadne import QueryType, make_executable_schema
+from ariadne.http_cache import HttpCache
+from ariadne.normalization import ResultNormalization
+from ariadne.wsgi import GraphQL
+
+type_defs = """
+    type Query {
+        threads: [Thread!]!
+    }
+
+    type Thread {
+        id: ID!
+        starter: User!
+        lastPoster: User!
+    }
+
+    type User {
+        id: ID!
+        name: String!
+    }
+"""
+
+query_type = QueryType()
+
+
+@query_type.field("threads")
+def resolve_threads(*_):
+    bob = {"id": "1", "name": "Bob"}
+    return [{"id": "1", "starter": bob, "lastPoster": bob}]
+
+
+query = "{ threads { id starter { __typename id name } lastPoster { __typename id } } }"
+
+normalized_result = {
+    "data": {
+        "threads": [
+            {
+                "id": "1",
+                "starter": {"__ref": "User:1"},
+                "lastPoster": {"__ref": "User:1"},
+            }
+        ]
+    },
+    "entities": {"User:1": {"__typename": "User", "id": "1", "name": "Bob"}},
+}
+
+
+@pytest.fixture
+def client():
+    schema = make_executable_schema(type_defs, query_type)
+    app = GraphQL(
+        schema,
+        execute_get_queries=True,
+        http_cache=HttpCache(),
+        normalization=ResultNormalization(),
+    )
+    return Client(app, Response)
+
+
+def test_normalized_result_is_returned_when_requested(client):
+    response = client.post(
+        "/", json={"query": query}, headers={"GraphQL-Response-Format": "normalized"}
+    )
+    assert response.status_code == 200
+    assert response.headers["GraphQL-Response-Format"] == "normalized"
+    assert response.headers["Vary"] == "GraphQL-Response-Format"
+    assert response.json == normalized_result
+
+
+def test_result_is_not_normalized_when_not_requested(client):
+    response = client.post("/", json={"query": query})
+    assert "GraphQL-Response-Format" not in response.headers
+    assert "entities" not in response.json
+
+
+def test_normalized_get_query_result_is_cacheable(client):
+    headers = {"GraphQL-Response-Format": "normalized"}
+    response = client.get("/", query_string={"query": query}, headers=headers)
+    assert response.json == normalized_result
+    assert response.headers["GraphQL-Response-Format"] == "normalized"
+    assert "GraphQL-Response-Format" in response.headers["Vary"]
+
+    headers["If-None-Match"] = response.headers["ETag"]
+    response = client.get("/", query_string={"query": query}, headers=headers)
+    assert response.status_code == 304
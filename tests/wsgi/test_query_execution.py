@@ -246,3 +246,54 @@ def test_middlewares_and_extensions_are_combined_in_correct_order(schema):
     client = TestClient(app)
     response = client.post("/", json={"query": '{ hello(name: "BOB") }'})
     assert response.json == {"data": {"hello": "=*Hello, BOB!*="}}
+
+
+class CountingExtension(Extension):
+    calls = 0
+
+    def request_started(self, context):
+        CountingExtension.calls += 1
+
+
+introspection_query = "{ __schema { queryType { name } } }"
+
+
+def test_introspection_query_result_is_cached(schema):
+    CountingExtension.calls = 0
+    app = GraphQL(schema, extensions=[CountingExtension], introspection_cache=True)
+    client = TestClient(app)
+    for _ in range(2):
+        response = client.post("/", json={"query": introspection_query})
+        assert response.status_code == 200
+        assert response.json == {"data": {"__schema": {"queryType": {"name": "Query"}}}}
+    assert CountingExtension.calls == 1
+    assert app.introspection_cache.hits == 1
+
+
+def test_cached_introspection_result_is_used_for_equivalent_query(schema):
+    app = GraphQL(schema, introspection_cache=True)
+    client = TestClient(app)
+    client.post("/", json={"query": introspection_query})
+    response = client.post(
+        "/", json={"query": "query {\n  __schema { queryType { name } }\n}"}
+    )
+    assert response.json == {"data": {"__schema": {"queryType": {"name": "Query"}}}}
+    assert app.introspection_cache.hits == 1
+
+
+def test_cached_introspection_result_is_returned_for_get_query(schema):
+    app = GraphQL(schema, execute_get_queries=True, introspection_cache=True)
+    client = TestClient(app)
+    client.get("/", query_string={"query": introspection_query})
+    response = client.get("/", query_string={"query": introspection_query})
+    assert response.status_code == 200
+    assert response.json == {"data": {"__schema": {"queryType": {"name": "Query"}}}}
+    assert app.introspection_cache.hits == 1
+
+
+def test_introspection_query_result_is_not_cached_by_default(schema):
+    CountingExtension.calls = 0
+    client = TestClient(GraphQL(schema, extensions=[CountingExtension]))
+    for _ in range(2):
+        client.post("/", json={"query": introspection_query})
+    assert CountingExtension.calls == 2
@@ -0,0 +1,85 @@
+import logging
+import time
+
+import pytest
+from werkzeug.test import Client
+from werkzeug.wrappers import Response
+
+from ariadne import QueryType, make_executable_schema
+from ariadne.http_cache import HttpCache
+from ariadne.slow_log import SlowOperationLog
+from ariadne.wsgi import GraphQL
+
+type_defs = """
+    type Query {
+        slow: Boolean!
+        fast: Boolean!
+    }
+"""
+
+query_type = QueryType()
+
+
+@query_type.field("slow")
+def resolve_slow(*_):
+    time.sleep(0.05)
+    return True
+
+
+@query_type.field("fast")
+def resolve_fast(*_):
+    return True
+
+
+schema = make_executable_schema(type_defs, query_type)
+
+
+@pytest.fixture
+def slow_log():
+    return SlowOperationLog(latency_threshold=0.03, non_blocking=False)
+
+
+def get_entries(caplog):
+    return [
+        record.slow_operation
+        for record in caplog.records
+        if record.name == "ariadne.slow_operations"
+    ]
+
+
+def test_slow_operation_is_logged(caplog, slow_log):
+    caplog.set_level(logging.WARNING)
+    client = Client(GraphQL(schema, slow_operation_log=slow_log), Response)
+    response = client.post("/", json={"query": "query Slow { fast slow }"})
+    assert response.status_code == 200
+
+    (entry,) = get_entries(caplog)
+    assert entry["signature"] == "query Slow { fast slow }"
+    assert entry["operation_name"] == "Slow"
+    assert entry["duration"] >= 0.05
+    assert "serialization" in entry["phases"]
+    assert entry["resolvers"] == 2
+    assert [field["field"] for field in entry["slowest_fields"]] == [
+        "Query.slow",
+        "Query.fast",
+    ]
+    assert entry["response_size"] == len(response.data)
+
+
+def test_fast_operation_is_not_logged(caplog, slow_log):
+    caplog.set_level(logging.WARNING)
+    client = Client(GraphQL(schema, slow_operation_log=slow_log), Response)
+    client.post("/", json={"query": "{ fast }"})
+    assert not get_entries(caplog)
+
+
+def test_slow_get_operation_with_http_cache_is_logged(caplog, slow_log):
+    caplog.set_level(logging.WARNING)
+    app = GraphQL(
+        schema,
+        execute_get_queries=True,
+        http_cache=HttpCache(),
+        slow_operation_log=slow_log,
+    )
+    Client(app, Response).get("/?query={ slow }")
+    assert len(get_entries(caplog)) == 1